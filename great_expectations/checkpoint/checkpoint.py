@@ -16,6 +16,11 @@ from great_expectations.checkpoint.util import (
     substitute_runtime_config,
     substitute_template_config,
 )
+from great_expectations.checkpoint.validation_work_unit import (
+    ValidationWorkUnit,
+    deserialize_run_results,
+    run_validation_work_unit,
+)
 from great_expectations.core import RunIdentifier
 from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import (
@@ -31,6 +36,7 @@ from great_expectations.core.usage_statistics.usage_statistics import (
 )
 from great_expectations.core.util import get_datetime_string_from_strftime_format
 from great_expectations.data_asset import DataAsset
+from great_expectations.data_context.store import InMemoryStoreBackend
 from great_expectations.data_context.types.base import CheckpointConfig
 from great_expectations.data_context.types.resource_identifiers import GeCloudIdentifier
 from great_expectations.data_context.util import (
@@ -146,9 +152,16 @@ class BaseCheckpoint(ConfigPeer):
         # Use AsyncExecutor to speed up I/O bound validations by running them in parallel with multithreading (if
         # concurrency is enabled in the data context configuration) -- please see the below arguments used to initialize
         # AsyncExecutor and the corresponding AsyncExecutor docstring for more details on when multiple threads are
-        # used.
+        # used. With the "process" concurrency backend, CPU-bound validations are run by warm worker processes instead,
+        # each of them executing a picklable ValidationWorkUnit (not supported in GE Cloud mode, nor with in-memory
+        # stores, which worker processes do not share).
         with AsyncExecutor(
-            self.data_context.concurrency, max_workers=len(validations)
+            self.data_context.concurrency,
+            max_workers=len(validations),
+            allow_processes=self._can_run_validations_in_processes(
+                substituted_runtime_config=substituted_runtime_config,
+                validations=validations,
+            ),
         ) as async_executor:
             # noinspection PyUnresolvedReferences
             async_validation_operator_results: List[
@@ -176,9 +189,16 @@ class BaseCheckpoint(ConfigPeer):
 
             run_results: dict = {}
             for async_validation_operator_result in async_validation_operator_results:
-                run_results.update(
-                    async_validation_operator_result.result().run_results
-                )
+                if async_executor.execute_in_processes:
+                    run_results.update(
+                        deserialize_run_results(
+                            serialized_run_results=async_validation_operator_result.result()
+                        )
+                    )
+                else:
+                    run_results.update(
+                        async_validation_operator_result.result().run_results
+                    )
 
         return CheckpointResult(
             run_id=run_id,
@@ -186,6 +206,55 @@ class BaseCheckpoint(ConfigPeer):
             checkpoint_config=self.config,
         )
 
+    def _can_run_validations_in_processes(
+        self, substituted_runtime_config: dict, validations: List[dict]
+    ) -> bool:
+        """Whether or not validations may be run by worker processes, which rebuild the Data Context from its
+        configuration: the stores they read from and write to must then be persisted, rather than held in memory."""
+        if self.data_context.ge_cloud_mode:
+            return False
+
+        concurrency = self.data_context.concurrency
+        if concurrency is None or concurrency.backend != "process":
+            return True
+
+        store_names: List[str] = [
+            self.data_context.expectations_store_name,
+            self.data_context.validations_store_name,
+            self.data_context.evaluation_parameter_store_name,
+        ]
+        action_lists: List[list] = [
+            substituted_runtime_config.get("action_list") or []
+        ] + [
+            validation_dict.get("action_list") or []
+            for validation_dict in validations
+        ]
+        for action_list in action_lists:
+            for action in action_list:
+                target_store_name: Optional[str] = action.get("action", {}).get(
+                    "target_store_name"
+                )
+                if target_store_name is not None:
+                    store_names.append(target_store_name)
+
+        in_memory_store_names: List[str] = [
+            store_name
+            for store_name in dict.fromkeys(store_names)
+            if store_name in self.data_context.stores
+            and isinstance(
+                self.data_context.stores[store_name].store_backend,
+                InMemoryStoreBackend,
+            )
+        ]
+        if in_memory_store_names:
+            logger.warning(
+                f'Checkpoint "{self.name}" runs its validations in threads instead of worker processes, because worker '
+                f"processes cannot share the in-memory stores {in_memory_store_names}."
+            )
+            return False
+
+        return True
+
     def get_substituted_config(
         self,
         runtime_kwargs: Optional[dict] = None,
@@ -305,20 +374,6 @@ class BaseCheckpoint(ConfigPeer):
                 "expectation_suite_ge_cloud_id"
             )
 
-            validator: Validator = self.data_context.get_validator(
-                batch_request=batch_request,
-                expectation_suite_name=(
-                    expectation_suite_name
-                    if not self.data_context.ge_cloud_mode
-                    else None
-                ),
-                expectation_suite_ge_cloud_id=(
-                    expectation_suite_ge_cloud_id
-                    if self.data_context.ge_cloud_mode
-                    else None
-                ),
-            )
-
             action_list: list = substituted_validation_dict.get("action_list")
             runtime_configuration_validation = substituted_validation_dict.get(
                 "runtime_configuration", {}
@@ -334,12 +389,50 @@ class BaseCheckpoint(ConfigPeer):
             if result_format is None:
                 result_format = {"result_format": "SUMMARY"}
 
+            operator_name: str = f"{self.name}-checkpoint-validation[{idx}]"
+
+            if async_executor.execute_in_processes:
+                async_validation_operator_results.append(
+                    async_executor.submit(
+                        run_validation_work_unit,
+                        work_unit=ValidationWorkUnit(
+                            project_config=self.data_context.config.to_yaml_str(),
+                            context_root_dir=self.data_context.root_directory,
+                            batch_request=batch_request,
+                            expectation_suite_name=expectation_suite_name,
+                            action_list=action_list,
+                            operator_name=operator_name,
+                            run_id=run_id,
+                            result_format=result_format,
+                            evaluation_parameters=substituted_validation_dict.get(
+                                "evaluation_parameters"
+                            ),
+                            catch_exceptions=catch_exceptions_validation,
+                        ),
+                    )
+                )
+                return
+
+            validator: Validator = self.data_context.get_validator(
+                batch_request=batch_request,
+                expectation_suite_name=(
+                    expectation_suite_name
+                    if not self.data_context.ge_cloud_mode
+                    else None
+                ),
+                expectation_suite_ge_cloud_id=(
+                    expectation_suite_ge_cloud_id
+                    if self.data_context.ge_cloud_mode
+                    else None
+                ),
+            )
+
             action_list_validation_operator: ActionListValidationOperator = (
                 ActionListValidationOperator(
                     data_context=self.data_context,
                     action_list=action_list,
                     result_format=result_format,
-                    name=f"{self.name}-checkpoint-validation[{idx}]",
+                    name=operator_name,
                 )
             )
             checkpoint_identifier = None
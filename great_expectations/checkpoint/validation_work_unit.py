@@ -0,0 +1,137 @@
+"""
+Picklable units of Checkpoint validation work, for execution by worker processes.
+
+When the Data Context is configured with the "process" concurrency backend, each validation of a Checkpoint run is
+described by a ValidationWorkUnit, which only holds plain configuration (Data Context YAML configuration, batch request,
+Expectation Suite name, action list and runtime configuration). Worker processes rebuild (and keep) their own Data
+Context from that configuration, validate the batch, run the actions, and send back serialized validation results.
+
+WARNING: This module is experimental.
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+
+from ruamel.yaml import YAML
+
+from great_expectations.core.batch import BatchRequest, RuntimeBatchRequest
+from great_expectations.core.expectation_validation_result import (
+    expectationSuiteValidationResultSchema,
+)
+from great_expectations.core.run_identifier import RunIdentifier
+
+yaml = YAML()
+
+# Data Contexts rebuilt by this (worker) process, by Data Context configuration, so that warm workers reuse them.
+_data_contexts_by_config: dict = {}
+
+
+class ValidationWorkUnit:
+    """Everything a worker process needs in order to run one validation of a Checkpoint.
+
+    WARNING: This class is experimental.
+    """
+
+    def __init__(
+        self,
+        project_config: str,
+        context_root_dir: Optional[str],
+        batch_request: Union[BatchRequest, RuntimeBatchRequest, dict],
+        expectation_suite_name: str,
+        action_list: List[dict],
+        operator_name: str,
+        run_id: RunIdentifier,
+        result_format: dict,
+        evaluation_parameters: Optional[dict] = None,
+        catch_exceptions: Optional[bool] = None,
+    ):
+        self.project_config = project_config
+        self.context_root_dir = context_root_dir
+        self.batch_request = batch_request
+        self.expectation_suite_name = expectation_suite_name
+        self.action_list = action_list
+        self.operator_name = operator_name
+        self.run_id = run_id
+        self.result_format = result_format
+        self.evaluation_parameters = evaluation_parameters
+        self.catch_exceptions = catch_exceptions
+
+
+def _get_data_context(project_config: str, context_root_dir: Optional[str]):
+    # Importing here avoids circular imports (the Data Context module imports the Checkpoint package).
+    from great_expectations.data_context import BaseDataContext
+    from great_expectations.data_context.types.base import DataContextConfig
+
+    key: Tuple[str, Optional[str]] = (project_config, context_root_dir)
+    data_context = _data_contexts_by_config.get(key)
+    if data_context is None:
+        data_context_config: DataContextConfig = DataContextConfig.from_commented_map(
+            commented_map=yaml.load(project_config)
+        )
+        # Usage statistics are already reported by the Data Context that runs the Checkpoint.
+        data_context_config.anonymous_usage_statistics.enabled = False
+        data_context = BaseDataContext(
+            project_config=data_context_config,
+            context_root_dir=context_root_dir,
+        )
+        _data_contexts_by_config[key] = data_context
+
+    return data_context
+
+
+def run_validation_work_unit(work_unit: ValidationWorkUnit) -> Dict:
+    """Validate the batch of one validation work unit and run its actions (this is executed by a worker process).
+
+    Returns:
+        The run results of the validation, with validation results serialized to JSON dictionaries (see
+        deserialize_run_results)
+    """
+    # Importing here avoids circular imports (the validation operators import the Checkpoint package).
+    from great_expectations.validation_operators import ActionListValidationOperator
+
+    data_context = _get_data_context(
+        project_config=work_unit.project_config,
+        context_root_dir=work_unit.context_root_dir,
+    )
+    validator = data_context.get_validator(
+        batch_request=work_unit.batch_request,
+        expectation_suite_name=work_unit.expectation_suite_name,
+    )
+    action_list_validation_operator = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=work_unit.action_list,
+        result_format=work_unit.result_format,
+        name=work_unit.operator_name,
+    )
+
+    operator_run_kwargs = {}
+    if work_unit.catch_exceptions is not None:
+        operator_run_kwargs["catch_exceptions"] = work_unit.catch_exceptions
+
+    validation_operator_result = action_list_validation_operator.run(
+        assets_to_validate=[validator],
+        run_id=work_unit.run_id,
+        evaluation_parameters=work_unit.evaluation_parameters,
+        result_format=work_unit.result_format,
+        **operator_run_kwargs,
+    )
+
+    return {
+        validation_result_identifier: {
+            "validation_result": run_result["validation_result"].to_json_dict(),
+            "actions_results": run_result["actions_results"],
+        }
+        for validation_result_identifier, run_result in validation_operator_result.run_results.items()
+    }
+
+
+def deserialize_run_results(serialized_run_results: Dict) -> Dict:
+    """Rebuild the validation results of run results returned by run_validation_work_unit."""
+    return {
+        validation_result_identifier: {
+            "validation_result": expectationSuiteValidationResultSchema.load(
+                run_result["validation_result"]
+            ),
+            "actions_results": run_result["actions_results"],
+        }
+        for validation_result_identifier, run_result in serialized_run_results.items()
+    }
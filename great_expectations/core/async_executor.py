@@ -5,9 +5,12 @@ for both when concurrency is enabled and disabled.
 WARNING: This module is experimental.
 """
 
-from concurrent.futures import Future, ThreadPoolExecutor
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
 from contextlib import AbstractContextManager
-from typing import Any, Optional
+from threading import BoundedSemaphore, Event, Lock
+from typing import Any, Dict, List, Optional
 
 from urllib3 import connectionpool, poolmanager
 
@@ -25,16 +28,67 @@ class AsyncResult:
         """AsyncResult instances are created by AsyncExecutor.submit() and should not otherwise be created directly."""
         self._future = future
         self._value = value
+        self._started = Event()
+        self._started_at: Optional[float] = None
 
-    def result(self):
+    def _mark_started(self):
+        self._started_at = time.monotonic()
+        self._started.set()
+
+    @property
+    def started_at(self) -> Optional[float]:
+        """time.monotonic() when the submitted call started executing, or None if it is still queued (e.g. behind
+        max_workers or max_pending_tasks)."""
+        return self._started_at
+
+    def wait_until_started(self) -> float:
+        """Block until the submitted call has started executing and return started_at."""
+        self._started.wait()
+        return self._started_at
+
+    def result(self, timeout: Optional[float] = None):
         """Return the value corresponding to the AsyncExecutor.submit() call, blocking if necessary until the execution
         finishes.
+
+        Args:
+            timeout: The maximum number of seconds to wait for a concurrently executing call to finish. If the call
+                does not finish in time, concurrent.futures.TimeoutError is raised. None (the default) waits without a
+                time limit. Ignored when the call was executed synchronously.
         """
-        return self._future.result() if self._future is not None else self._value
+        return (
+            self._future.result(timeout=timeout)
+            if self._future is not None
+            else self._value
+        )
+
+
+# Process pools are expensive to start (each worker process imports Great Expectations and rebuilds its own state), so
+# they are shared by all AsyncExecutor instances and kept warm between calls (e.g. between checkpoint runs).
+_process_pool_executors: Dict[int, ProcessPoolExecutor] = {}
+_process_pool_executors_lock = Lock()
+
+
+def get_process_pool_executor(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared ProcessPoolExecutor with the given number of worker processes, creating it if necessary.
+
+    A pool that has become unusable (e.g. because a worker process was terminated abruptly) is replaced by a new one.
+
+    WARNING: This function is experimental.
+    """
+    with _process_pool_executors_lock:
+        process_pool_executor: Optional[
+            ProcessPoolExecutor
+        ] = _process_pool_executors.get(max_workers)
+        # noinspection PyProtectedMember
+        if process_pool_executor is None or process_pool_executor._broken:
+            process_pool_executor = ProcessPoolExecutor(max_workers=max_workers)
+            _process_pool_executors[max_workers] = process_pool_executor
+
+        return process_pool_executor
 
 
 class AsyncExecutor(AbstractContextManager):
-    """Wrapper around ThreadPoolExecutor to facilitate single code path
+    """Wrapper around ThreadPoolExecutor (or a shared ProcessPoolExecutor) to facilitate single code path
     for both when concurrency is enabled and disabled.
 
     WARNING: This class is experimental.
@@ -44,6 +98,8 @@ class AsyncExecutor(AbstractContextManager):
         self,
         concurrency_config: Optional[ConcurrencyConfig],
         max_workers: int,
+        max_pending_tasks: Optional[int] = None,
+        allow_processes: bool = False,
     ):
         """Initializes a new AsyncExecutor instance used to organize code for multithreaded execution.
 
@@ -62,6 +118,13 @@ class AsyncExecutor(AbstractContextManager):
                 disabled or max_workers is 1, all work will be done synchronously (e.g. on the main thread) during the
                 call to submit. Note that the maximum number of threads is also limited by
                 concurrency_config.max_database_query_concurrency.
+            max_pending_tasks: The maximum number of submitted calls that may be queued or running at the same time
+                when executing concurrently. Once the limit is reached, submit blocks until a previously submitted
+                call finishes. None (the default) places no limit on the number of pending calls.
+            allow_processes: Whether or not the caller only submits picklable module-level callables with picklable
+                arguments and results, so that they can be executed in worker processes. If True and
+                concurrency_config.backend is "process", work is executed by a shared pool of warm worker processes
+                (limited to concurrency_config.max_process_concurrency) instead of threads.
         """
         if concurrency_config is None:
             concurrency_config = ConcurrencyConfig()
@@ -69,14 +132,33 @@ class AsyncExecutor(AbstractContextManager):
         # Only enable concurrent execution if it is enabled in the config AND there is more than 1 max worker specified.
         self._execute_concurrently = concurrency_config.enabled and max_workers > 1
 
-        self._thread_pool_executor = (
-            ThreadPoolExecutor(
+        self._execute_in_processes = (
+            self._execute_concurrently
+            and allow_processes
+            and concurrency_config.backend == "process"
+        )
+
+        self._executor: Optional[Executor]
+        if self._execute_in_processes:
+            self._executor = get_process_pool_executor(
+                max_workers=concurrency_config.max_process_concurrency
+            )
+        elif self._execute_concurrently:
+            self._executor = ThreadPoolExecutor(
                 max_workers=min(
                     concurrency_config.max_database_query_concurrency,
                     max_workers,
                 )
             )
-            if self._execute_concurrently
+        else:
+            self._executor = None
+
+        # Futures of the calls submitted to the shared process pool, which are waited for on shutdown.
+        self._process_pool_futures: List[Future] = []
+
+        self._pending_tasks_semaphore = (
+            BoundedSemaphore(max_pending_tasks)
+            if self._execute_concurrently and max_pending_tasks is not None
             else None
         )
 
@@ -93,26 +175,70 @@ class AsyncExecutor(AbstractContextManager):
         on how the AsyncExecutor instance was initialized.
         """
         if self._execute_concurrently:
-            return AsyncResult(
-                future=self._thread_pool_executor.submit(fn, *args, **kwargs)
-            )
+            async_result = AsyncResult()
+            if self._execute_in_processes:
+                # Calls executed in worker processes must be picklable, so they are considered started once submitted.
+                async_result._mark_started()
+                submitted_fn = fn
+            else:
+
+                def submitted_fn(*fn_args, **fn_kwargs):
+                    async_result._mark_started()
+                    return fn(*fn_args, **fn_kwargs)
+
+            if self._pending_tasks_semaphore is not None:
+                self._pending_tasks_semaphore.acquire()
+            try:
+                future: Future = self._executor.submit(submitted_fn, *args, **kwargs)
+            except Exception:
+                if self._pending_tasks_semaphore is not None:
+                    self._pending_tasks_semaphore.release()
+                raise
+
+            if self._pending_tasks_semaphore is not None:
+                future.add_done_callback(
+                    lambda _: self._pending_tasks_semaphore.release()
+                )
+            if self._execute_in_processes:
+                self._process_pool_futures.append(future)
+            async_result._future = future
+            return async_result
         else:
-            return AsyncResult(value=fn(*args, **kwargs))
+            async_result = AsyncResult()
+            async_result._mark_started()
+            async_result._value = fn(*args, **kwargs)
+            return async_result
 
-    def shutdown(self):
+    def shutdown(self, wait: bool = True):
         """Clean-up the resources associated with the AsyncExecutor and blocks until all running async results finish
         executing.
 
         It is preferable to not call this method explicitly, and instead use the `with` statement to ensure shutdown is
         called.
+
+        The shared process pool is not shut down, so that its worker processes stay warm for later use; only the
+        async results submitted through this AsyncExecutor are waited for.
+
+        Args:
+            wait: Whether or not to block until all running async results finish executing. Calls that are still
+                running when wait is False are left to finish in the background.
         """
-        if self._thread_pool_executor is not None:
-            self._thread_pool_executor.shutdown()
+        if self._execute_in_processes:
+            if wait:
+                wait_for_futures(self._process_pool_futures)
+            return
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
 
     @property
     def execute_concurrently(self) -> bool:
         return self._execute_concurrently
 
+    @property
+    def execute_in_processes(self) -> bool:
+        return self._execute_in_processes
+
 
 def patch_https_connection_pool(concurrency_config: ConcurrencyConfig):
     """Patch urllib3 to enable a higher default max pool size to reduce concurrency bottlenecks.
@@ -201,12 +201,19 @@ def build_evaluation_parameters(
     evaluation_parameters: Optional[dict] = None,
     interactive_evaluation: bool = True,
     data_context=None,
+    deep_copy: bool = True,
 ) -> Tuple[dict, dict]:
     """Build a dictionary of parameters to evaluate, using the provided evaluation_parameters,
     AND mutate expectation_args by removing any parameter values passed in as temporary values during
     exploratory work.
+
+    If deep_copy is False, the returned dictionary shares the values of expectation_args which are not evaluation
+    parameters, instead of copying them.
     """
-    evaluation_args = copy.deepcopy(expectation_args)
+    if deep_copy:
+        evaluation_args = copy.deepcopy(expectation_args)
+    else:
+        evaluation_args = dict(expectation_args)
     substituted_parameters = {}
 
     # Iterate over arguments, and replace $PARAMETER-defined args with their
@@ -222,7 +229,12 @@ def build_evaluation_parameters(
             param_key = f"$PARAMETER.{value['$PARAMETER']}"
             if param_key in value:
                 evaluation_args[key] = evaluation_args[key][param_key]
-                del expectation_args[key][param_key]
+                # The parameter dictionary may be shared with other configurations, so it is replaced, not modified.
+                expectation_args[key] = {
+                    param: param_value
+                    for param, param_value in expectation_args[key].items()
+                    if param != param_key
+                }
 
             # If not, try to parse the evaluation parameter and substitute, which will raise
             # an exception if we do not have a value
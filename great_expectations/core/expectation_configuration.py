@@ -1,6 +1,8 @@
 import copy
+import functools
 import json
 import logging
+import weakref
 from copy import deepcopy
 from typing import Any, Dict, Optional, Union
 
@@ -55,15 +57,65 @@ def parse_result_format(result_format: Union[str, dict]) -> dict:
                 "When using `include_unexpected_rows`, `result_format` must be explicitly specified"
             )
 
-        if "partial_unexpected_count" not in result_format:
-            result_format["partial_unexpected_count"] = 20
-
-        if "include_unexpected_rows" not in result_format:
-            result_format["include_unexpected_rows"] = False
+        # The dictionary may be shared with an expectation configuration, so defaults are added to a copy.
+        result_format = dict(result_format)
+        result_format.setdefault("partial_unexpected_count", 20)
+        result_format.setdefault("include_unexpected_rows", False)
 
     return result_format
 
 
+class _ExpectationKwargs(dict):
+    """The kwargs of an ExpectationConfiguration, which notify the objects listening to them (i.e., the indexes of the
+    expectation suites holding the configuration) of their modifications, by calling their invalidate() method.
+
+    Only the kwargs themselves are watched, not the lists or dictionaries they hold.
+    """
+
+    _modification_listeners: Optional[weakref.WeakSet] = None
+
+    def add_modification_listener(self, listener) -> None:
+        if self._modification_listeners is None:
+            self._modification_listeners = weakref.WeakSet()
+        self._modification_listeners.add(listener)
+
+    def notify_modification(self) -> None:
+        if self._modification_listeners:
+            for listener in list(self._modification_listeners):
+                listener.invalidate()
+
+    def __reduce_ex__(self, protocol):
+        # Copies (and unpickled kwargs) are not listened to.
+        return self.__class__, (), None, None, iter(self.items())
+
+
+def _notify_modification(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.notify_modification()
+        return result
+
+    return wrapper
+
+
+for _method_name in (
+    "__setitem__",
+    "__delitem__",
+    "__ior__",
+    "clear",
+    "pop",
+    "popitem",
+    "setdefault",
+    "update",
+):
+    setattr(
+        _ExpectationKwargs,
+        _method_name,
+        _notify_modification(getattr(dict, _method_name)),
+    )
+
+
 class ExpectationContext(SerializableDictDot):
     def __init__(self, description: Optional[str] = None):
         self._description = description
@@ -503,7 +555,13 @@ class ExpectationConfiguration(SerializableDictDot):
         },
         "expect_column_median_to_be_between": {
             "domain_kwargs": ["column", "row_condition", "condition_parser"],
-            "success_kwargs": ["min_value", "max_value", "strict_min", "strict_max"],
+            "success_kwargs": [
+                "min_value",
+                "max_value",
+                "strict_min",
+                "strict_max",
+                "approximation_relative_error",
+            ],
             "default_kwarg_values": {
                 "row_condition": None,
                 "condition_parser": "pandas",
@@ -511,6 +569,7 @@ class ExpectationConfiguration(SerializableDictDot):
                 "max_value": None,
                 "strict_min": False,
                 "strict_max": False,
+                "approximation_relative_error": None,
                 "result_format": "BASIC",
                 "include_config": True,
                 "catch_exceptions": False,
@@ -518,11 +577,16 @@ class ExpectationConfiguration(SerializableDictDot):
         },
         "expect_column_quantile_values_to_be_between": {
             "domain_kwargs": ["column", "row_condition", "condition_parser"],
-            "success_kwargs": ["quantile_ranges", "allow_relative_error"],
+            "success_kwargs": [
+                "quantile_ranges",
+                "allow_relative_error",
+                "approximation_relative_error",
+            ],
             "default_kwarg_values": {
                 "row_condition": None,
                 "condition_parser": "pandas",
                 "allow_relative_error": False,
+                "approximation_relative_error": None,
                 "result_format": "BASIC",
                 "include_config": True,
                 "catch_exceptions": False,
@@ -545,12 +609,17 @@ class ExpectationConfiguration(SerializableDictDot):
         },
         "expect_column_unique_value_count_to_be_between": {
             "domain_kwargs": ["column", "row_condition", "condition_parser"],
-            "success_kwargs": ["min_value", "max_value"],
+            "success_kwargs": [
+                "min_value",
+                "max_value",
+                "approximation_relative_error",
+            ],
             "default_kwarg_values": {
                 "row_condition": None,
                 "condition_parser": "pandas",
                 "min_value": None,
                 "max_value": None,
+                "approximation_relative_error": None,
                 "result_format": "BASIC",
                 "include_config": True,
                 "catch_exceptions": False,
@@ -558,7 +627,13 @@ class ExpectationConfiguration(SerializableDictDot):
         },
         "expect_column_proportion_of_unique_values_to_be_between": {
             "domain_kwargs": ["column", "row_condition", "condition_parser"],
-            "success_kwargs": ["min_value", "max_value", "strict_min", "strict_max"],
+            "success_kwargs": [
+                "min_value",
+                "max_value",
+                "strict_min",
+                "strict_max",
+                "approximation_relative_error",
+            ],
             "default_kwarg_values": {
                 "row_condition": None,
                 "condition_parser": "pandas",
@@ -566,6 +641,7 @@ class ExpectationConfiguration(SerializableDictDot):
                 "max_value": None,
                 "strict_min": False,
                 "strict_max": False,
+                "approximation_relative_error": None,
                 "result_format": "BASIC",
                 "include_config": True,
                 "catch_exceptions": False,
@@ -989,6 +1065,7 @@ class ExpectationConfiguration(SerializableDictDot):
             evaluation_parameters,
             interactive_evaluation,
             data_context,
+            deep_copy=False,
         )
 
         self._raw_kwargs = self._kwargs
@@ -996,6 +1073,23 @@ class ExpectationConfiguration(SerializableDictDot):
         if len(substituted_parameters) > 0:
             self.meta["substituted_parameters"] = substituted_parameters
 
+    def copy_with_kwargs(
+        self, kwargs_overlay: Optional[dict] = None
+    ) -> "ExpectationConfiguration":
+        """Return a shallow copy of this configuration, with kwargs_overlay applied on top of a copy of its kwargs.
+
+        Only the kwargs and meta dictionaries are copied: their values (e.g., a large "value_set") are shared with this
+        configuration and must not be modified in place.  Use deepcopy for a fully independent configuration.
+        """
+        configuration = copy.copy(self)
+        kwargs = _ExpectationKwargs(self._kwargs)
+        if kwargs_overlay:
+            kwargs.update(kwargs_overlay)
+        # The copy is not held by any expectation suite, so that giving it its own kwargs concerns no index.
+        configuration.__dict__["_kwargs"] = kwargs
+        configuration.meta = dict(self.meta)
+        return configuration
+
     def get_raw_configuration(self) -> "ExpectationConfiguration":
         # return configuration without substituted evaluation parameters
         raw_config = deepcopy(self)
@@ -1060,6 +1154,24 @@ class ExpectationConfiguration(SerializableDictDot):
     def kwargs(self) -> dict:
         return self._kwargs
 
+    @kwargs.setter
+    def kwargs(self, value: dict) -> None:
+        self._kwargs = value
+
+    @property
+    def _kwargs(self) -> _ExpectationKwargs:
+        return self.__dict__["_kwargs"]
+
+    @_kwargs.setter
+    def _kwargs(self, value: dict) -> None:
+        previous_kwargs: Optional[_ExpectationKwargs] = self.__dict__.get("_kwargs")
+        if not isinstance(value, _ExpectationKwargs):
+            value = _ExpectationKwargs(value)
+        self.__dict__["_kwargs"] = value
+        if previous_kwargs is not None and previous_kwargs is not value:
+            # Indexes of expectation suites holding this configuration find it through its previous kwargs.
+            previous_kwargs.notify_modification()
+
     def _get_default_custom_kwargs(self) -> dict:
         # NOTE: this is a holdover until class-first expectations control their
         # defaults, and so defaults are inherited.
@@ -1181,7 +1293,7 @@ class ExpectationConfiguration(SerializableDictDot):
             runtime_keys = self.runtime_kwargs
 
         success_kwargs = self.get_success_kwargs()
-        lookup_kwargs = deepcopy(self.kwargs)
+        lookup_kwargs = dict(self.kwargs)
         if runtime_configuration:
             lookup_kwargs.update(runtime_configuration)
         runtime_kwargs = {
@@ -1,4 +1,5 @@
 import datetime
+import functools
 import json
 import logging
 import uuid
@@ -37,6 +38,167 @@ from great_expectations.types import SerializableDictDot
 logger = logging.getLogger(__name__)
 
 
+class _ExpectationConfigurationList(list):
+    """A list of ExpectationConfigurations, which counts its modifications so that the index of an ExpectationSuite can
+    tell whether it is up to date with the expectations of the suite."""
+
+    modification_count = 0
+
+
+def _count_modifications(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.modification_count += 1
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _method_name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(
+        _ExpectationConfigurationList,
+        _method_name,
+        _count_modifications(getattr(list, _method_name)),
+    )
+
+
+def _to_hashable(value):
+    if isinstance(value, dict):
+        return tuple(sorted((key, _to_hashable(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_hashable(val) for val in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_to_hashable(val) for val in value)
+    return value
+
+
+def _get_expectation_index_key(
+    expectation_configuration: ExpectationConfiguration,
+) -> Optional[tuple]:
+    # Equal domain kwargs always yield equal keys.  Configurations whose domain kwargs cannot be hashed, or hold lists,
+    # dictionaries or sets (which could be modified in place without the index noticing), are not indexed.
+    try:
+        domain_kwargs: dict = expectation_configuration.get_domain_kwargs()
+        if any(
+            isinstance(value, (list, dict, set)) for value in domain_kwargs.values()
+        ):
+            return None
+        key = (
+            expectation_configuration.expectation_type,
+            _to_hashable(domain_kwargs),
+        )
+        hash(key)
+    except Exception:
+        return None
+    return key
+
+
+class _ExpectationSuiteIndex:
+    """Positions of the expectations of a suite by expectation_type and domain kwargs.
+
+    ExpectationConfiguration.isEquivalentTo requires equal expectation types and equal domain kwargs for every
+    match_type, so only the expectations sharing the key of a configuration (and those which could not be indexed) can
+    be equivalent to it.  The index is kept up to date by the methods of the suite adding, replacing and removing
+    expectations, and is rebuilt when the list of expectations is modified otherwise, or when the kwargs of
+    one of its expectations are modified (or replaced) in place, which they report through invalidate().
+    """
+
+    def __init__(self, expectations: _ExpectationConfigurationList):
+        self._expectations = expectations
+        self._modification_count = expectations.modification_count
+        self._invalidated = False
+        self._keys: List[Optional[tuple]] = []
+        self._positions: Dict[tuple, List[int]] = {}
+        self._unindexed_positions: List[int] = []
+        for expectation in expectations:
+            self._add(expectation)
+
+    def is_current(self, expectations: List[ExpectationConfiguration]) -> bool:
+        return (
+            expectations is self._expectations
+            and expectations.modification_count == self._modification_count
+            and not self._invalidated
+        )
+
+    def invalidate(self) -> None:
+        self._invalidated = True
+
+    def get_candidate_positions(
+        self, expectation_configuration: ExpectationConfiguration
+    ) -> List[int]:
+        key = _get_expectation_index_key(expectation_configuration)
+        if key is None:
+            return list(range(len(self._expectations)))
+        return sorted(self._positions.get(key, []) + self._unindexed_positions)
+
+    def appended(self, expectation_configuration: ExpectationConfiguration) -> None:
+        self._add(expectation_configuration)
+        self._modification_count = self._expectations.modification_count
+
+    def replaced(
+        self, position: int, expectation_configuration: ExpectationConfiguration
+    ) -> None:
+        self._discard(position)
+
+        key = _get_expectation_index_key(expectation_configuration)
+        expectation_configuration.kwargs.add_modification_listener(self)
+        self._keys[position] = key
+        if key is None:
+            self._unindexed_positions.append(position)
+            self._unindexed_positions.sort()
+        else:
+            positions = self._positions.setdefault(key, [])
+            positions.append(position)
+            positions.sort()
+        self._modification_count = self._expectations.modification_count
+
+    def removed(self, position: int) -> None:
+        self._discard(position)
+        del self._keys[position]
+
+        # The positions of the expectations following the removed one move down by one.
+        positions: List[int]
+        for positions in [*self._positions.values(), self._unindexed_positions]:
+            positions[:] = [
+                other_position - 1 if other_position > position else other_position
+                for other_position in positions
+            ]
+        self._modification_count = self._expectations.modification_count
+
+    def _add(self, expectation_configuration: ExpectationConfiguration) -> None:
+        position = len(self._keys)
+        key = _get_expectation_index_key(expectation_configuration)
+        expectation_configuration.kwargs.add_modification_listener(self)
+        self._keys.append(key)
+        if key is None:
+            self._unindexed_positions.append(position)
+        else:
+            self._positions.setdefault(key, []).append(position)
+
+    def _discard(self, position: int) -> None:
+        key = self._keys[position]
+        if key is None:
+            self._unindexed_positions.remove(position)
+        else:
+            positions = self._positions[key]
+            positions.remove(position)
+            if not positions:
+                del self._positions[key]
+
+
 class ExpectationSuite(SerializableDictDot):
     """
     This ExpectationSuite object has create, read, update, and delete functionality for its expectations:
@@ -46,6 +208,8 @@ class ExpectationSuite(SerializableDictDot):
         -delete: self.remove_expectation()
     """
 
+    _expectation_index: Optional[_ExpectationSuiteIndex] = None
+
     def __init__(
         self,
         expectation_suite_name,
@@ -63,12 +227,12 @@ class ExpectationSuite(SerializableDictDot):
 
         if expectations is None:
             expectations = []
-        self.expectations = [
+        self.expectations = _ExpectationConfigurationList(
             ExpectationConfiguration(**expectation)
             if isinstance(expectation, dict)
             else expectation
             for expectation in expectations
-        ]
+        )
         if evaluation_parameters is None:
             evaluation_parameters = {}
         self.evaluation_parameters = evaluation_parameters
@@ -270,6 +434,31 @@ class ExpectationSuite(SerializableDictDot):
 
     # CRUD methods #
 
+    def _get_expectation_index(self) -> _ExpectationSuiteIndex:
+        if not isinstance(self.expectations, _ExpectationConfigurationList):
+            self.expectations = _ExpectationConfigurationList(self.expectations)
+        if self._expectation_index is None or not self._expectation_index.is_current(
+            self.expectations
+        ):
+            self._expectation_index = _ExpectationSuiteIndex(self.expectations)
+        return self._expectation_index
+
+    def _get_current_expectation_index(self) -> Optional[_ExpectationSuiteIndex]:
+        """Return the index if it is up to date, so that it can be updated along with a modification of the suite."""
+        if self._expectation_index is not None and self._expectation_index.is_current(
+            self.expectations
+        ):
+            return self._expectation_index
+        return None
+
+    def _set_expectation(
+        self, index: int, expectation_configuration: ExpectationConfiguration
+    ) -> None:
+        expectation_index = self._get_current_expectation_index()
+        self.expectations[index] = expectation_configuration
+        if expectation_index is not None:
+            expectation_index.replaced(index, expectation_configuration)
+
     def append_expectation(self, expectation_config):
         """Appends an expectation.
 
@@ -280,7 +469,17 @@ class ExpectationSuite(SerializableDictDot):
            Notes:
                May want to add type-checking in the future.
         """
+        expectation_index = self._get_current_expectation_index()
         self.expectations.append(expectation_config)
+        if expectation_index is not None:
+            expectation_index.appended(expectation_config)
+
+    def _pop_expectation(self, index: int) -> ExpectationConfiguration:
+        expectation_index = self._get_current_expectation_index()
+        expectation_configuration = self.expectations.pop(index)
+        if expectation_index is not None:
+            expectation_index.removed(index)
+        return expectation_configuration
 
     def remove_expectation(
         self,
@@ -322,7 +521,7 @@ class ExpectationSuite(SerializableDictDot):
             if remove_multiple_matches:
                 removed_expectations = []
                 for index in sorted(found_expectation_indexes, reverse=True):
-                    removed_expectations.append(self.expectations.pop(index))
+                    removed_expectations.append(self._pop_expectation(index))
                 return removed_expectations
             else:
                 raise ValueError(
@@ -331,7 +530,7 @@ class ExpectationSuite(SerializableDictDot):
                 )
 
         else:
-            return [self.expectations.pop(found_expectation_indexes[0])]
+            return [self._pop_expectation(found_expectation_indexes[0])]
 
     def remove_all_expectations_of_type(
         self, expectation_types: Union[List[str], str]
@@ -388,12 +587,17 @@ class ExpectationSuite(SerializableDictDot):
                 "Ensure that expectation configuration is valid."
             )
         match_indexes = []
-        for idx, expectation in enumerate(self.expectations):
-            if ge_cloud_id is not None:
+        if ge_cloud_id is not None:
+            for idx, expectation in enumerate(self.expectations):
                 if str(expectation.ge_cloud_id) == str(ge_cloud_id):
                     match_indexes.append(idx)
-            else:
-                if expectation.isEquivalentTo(expectation_configuration, match_type):
+        else:
+            for idx in self._get_expectation_index().get_candidate_positions(
+                expectation_configuration
+            ):
+                if self.expectations[idx].isEquivalentTo(
+                    expectation_configuration, match_type
+                ):
                     match_indexes.append(idx)
 
         return match_indexes
@@ -477,7 +681,9 @@ class ExpectationSuite(SerializableDictDot):
         elif len(found_expectation_indexes) == 0:
             raise ValueError("No matching Expectation was found.")
 
-        self.expectations[found_expectation_indexes[0]] = new_expectation_configuration
+        self._set_expectation(
+            found_expectation_indexes[0], new_expectation_configuration
+        )
 
     def patch_expectation(
         self,
@@ -516,8 +722,10 @@ class ExpectationSuite(SerializableDictDot):
                 "criteria"
             )
 
-        self.expectations[found_expectation_indexes[0]].patch(op, path, value)
-        return self.expectations[found_expectation_indexes[0]]
+        expectation_configuration = self.expectations[found_expectation_indexes[0]]
+        # Patching the kwargs invalidates the index, which is rebuilt on the next lookup.
+        expectation_configuration.patch(op, path, value)
+        return expectation_configuration
 
     def _add_expectation(
         self,
@@ -572,9 +780,9 @@ class ExpectationSuite(SerializableDictDot):
                     expectation_configuration.ge_cloud_id = (
                         existing_expectation_ge_cloud_id
                     )
-                self.expectations[
-                    found_expectation_indexes[0]
-                ] = expectation_configuration
+                self._set_expectation(
+                    found_expectation_indexes[0], expectation_configuration
+                )
             else:
                 if send_usage_event:
                     self.send_usage_event(success=False)
@@ -180,8 +180,7 @@ class ExpectationValidationResult(SerializableDictDot):
         myself = expectationValidationResultSchema.dump(self)
         # NOTE - JPC - 20191031: migrate to expectation-specific schemas that subclass result with properly-typed
         # schemas to get serialization all-the-way down via dump
-        if "result" in myself:
-            myself["result"] = convert_to_json_serializable(myself["result"])
+        # NOTE: "result" is already converted by ExpectationValidationResultSchema.convert_result_to_serializable().
         if "meta" in myself:
             myself["meta"] = convert_to_json_serializable(myself["meta"])
         if "exception_info" in myself:
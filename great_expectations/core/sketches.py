@@ -0,0 +1,516 @@
+"""
+Mergeable sketches, which summarize column values in bounded memory for approximate statistics.
+
+HyperLogLogSketch estimates the number of distinct values, and KllQuantileSketch estimates quantiles; ColumnSketch
+combines them with exact counts, extrema and moments of the values of a column.  Sketches of separate chunks (or
+batches) of data can be merged into the sketch of their union, and are JSON serializable.
+
+WARNING: This module is experimental.
+"""
+
+import math
+from numbers import Number
+from typing import Any, List, Optional, Sequence, Set
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.core.util import convert_to_json_serializable
+
+
+class HyperLogLogSketch:
+    """HyperLogLog cardinality (number of distinct values) sketch.
+
+    The relative standard error of the estimate is about 1.04 / sqrt(2 ** precision).
+
+    WARNING: This class is experimental.
+    """
+
+    MIN_PRECISION: int = 4
+    MAX_PRECISION: int = 18
+
+    def __init__(self, precision: int = 14, registers: Optional[Sequence[int]] = None):
+        if not self.MIN_PRECISION <= precision <= self.MAX_PRECISION:
+            raise ValueError(
+                f"HyperLogLogSketch precision must be between {self.MIN_PRECISION} and {self.MAX_PRECISION}."
+            )
+
+        self._precision = precision
+        if registers is None:
+            self._registers = np.zeros(2**precision, dtype=np.uint8)
+        else:
+            self._registers = np.array(registers, dtype=np.uint8)
+
+    @classmethod
+    def for_relative_error(cls, relative_error: float) -> "HyperLogLogSketch":
+        """Build the smallest sketch whose relative standard error does not exceed "relative_error"."""
+        precision: int = math.ceil(2 * math.log2(1.04 / relative_error))
+        return cls(precision=min(max(precision, cls.MIN_PRECISION), cls.MAX_PRECISION))
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def update(self, values: Any) -> None:
+        """Add values (e.g., a pandas Series or a numpy array) to the sketch; null values are ignored."""
+        values = pd.Series(values).dropna()
+        if len(values) == 0:
+            return
+
+        hashes: np.ndarray = pd.util.hash_pandas_object(values, index=False).values
+        suffix_bits: int = 64 - self._precision
+        register_indices: np.ndarray = (hashes >> np.uint64(suffix_bits)).astype(
+            np.int64
+        )
+        suffixes: np.ndarray = hashes & np.uint64((1 << suffix_bits) - 1)
+        # The rank of a hash is the position of the leftmost 1-bit of its suffix.
+        ranks: np.ndarray = suffix_bits - _bit_lengths(suffixes) + 1
+        np.maximum.at(self._registers, register_indices, ranks.astype(np.uint8))
+
+    def merge(self, other: "HyperLogLogSketch") -> None:
+        """Add the values summarized by another sketch (of the same precision) to this sketch."""
+        if other.precision != self._precision:
+            raise ValueError(
+                "Only HyperLogLogSketch objects of the same precision can be merged."
+            )
+
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def estimate(self) -> int:
+        """Estimated number of distinct values added to the sketch."""
+        num_registers: int = len(self._registers)
+        alpha: float = 0.7213 / (1 + 1.079 / num_registers)
+        estimate: float = (
+            alpha
+            * num_registers**2
+            / np.sum(np.power(2.0, -self._registers.astype(np.float64)))
+        )
+        num_empty_registers: int = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * num_registers and num_empty_registers > 0:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = num_registers * math.log(num_registers / num_empty_registers)
+
+        return int(round(estimate))
+
+    def to_json_dict(self) -> dict:
+        return {
+            "precision": self._precision,
+            "registers": self._registers.tolist(),
+        }
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict) -> "HyperLogLogSketch":
+        return cls(precision=json_dict["precision"], registers=json_dict["registers"])
+
+
+class KllQuantileSketch:
+    """KLL quantile sketch.
+
+    Values are kept in a hierarchy of compactors: each time a compactor exceeds its capacity, its sorted values are
+    halved (every other value is promoted to the next compactor, with twice the weight).  The rank error of quantiles
+    is about 1.7 / k (as a fraction of the number of values); quantiles are exact until compaction begins.
+
+    WARNING: This class is experimental.
+    """
+
+    MIN_K: int = 8
+
+    def __init__(
+        self,
+        k: int = 200,
+        compactors: Optional[List[Sequence[Any]]] = None,
+        count: int = 0,
+        seed: int = 0,
+    ):
+        if k < self.MIN_K:
+            raise ValueError(f"KllQuantileSketch k must be at least {self.MIN_K}.")
+
+        self._k = k
+        self._compactors: List[np.ndarray] = [
+            np.asarray(compactor) for compactor in (compactors or [])
+        ]
+        self._count = count
+        # A fixed seed keeps estimates reproducible.
+        self._random = np.random.default_rng(seed)
+
+    @classmethod
+    def for_relative_error(cls, relative_error: float) -> "KllQuantileSketch":
+        """Build the smallest sketch whose rank error does not exceed "relative_error"."""
+        return cls(k=max(math.ceil(1.7 / relative_error), cls.MIN_K))
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def relative_error(self) -> float:
+        return 1.7 / self._k
+
+    def update(self, values: Any) -> None:
+        """Add values (e.g., a pandas Series or a numpy array) to the sketch; null values are ignored."""
+        values = pd.Series(values).dropna().values
+        if len(values) == 0:
+            return
+
+        self._add_to_compactor(level=0, values=values)
+        self._count += len(values)
+        self._compress()
+
+    def merge(self, other: "KllQuantileSketch") -> None:
+        """Add the values summarized by another sketch to this sketch."""
+        for level, compactor in enumerate(other._compactors):
+            self._add_to_compactor(level=level, values=compactor)
+
+        self._count += other.count
+        self._compress()
+
+    def quantiles(self, quantiles: Sequence[float]) -> List[Any]:
+        """Estimated values at the given quantiles (None for an empty sketch)."""
+        if self._count == 0:
+            return [None for _ in quantiles]
+
+        values: np.ndarray = np.concatenate(self._compactors)
+        weights: np.ndarray = np.concatenate(
+            [
+                np.full(len(compactor), 2**level, dtype=np.int64)
+                for level, compactor in enumerate(self._compactors)
+            ]
+        )
+        order: np.ndarray = np.argsort(values, kind="stable")
+        values = values[order]
+        cumulative_weights: np.ndarray = np.cumsum(weights[order])
+        total_weight: int = int(cumulative_weights[-1])
+        return [
+            values[
+                min(
+                    int(
+                        np.searchsorted(
+                            cumulative_weights, max(quantile * total_weight, 1)
+                        )
+                    ),
+                    len(values) - 1,
+                )
+            ]
+            for quantile in quantiles
+        ]
+
+    def to_json_dict(self) -> dict:
+        return {
+            "k": self._k,
+            "count": self._count,
+            "compactors": [
+                convert_to_json_serializable(compactor.tolist())
+                for compactor in self._compactors
+            ],
+        }
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict) -> "KllQuantileSketch":
+        return cls(
+            k=json_dict["k"],
+            compactors=json_dict["compactors"],
+            count=json_dict["count"],
+        )
+
+    def _add_to_compactor(self, level: int, values: np.ndarray) -> None:
+        while len(self._compactors) <= level:
+            self._compactors.append(values[:0])
+
+        self._compactors[level] = np.concatenate([self._compactors[level], values])
+
+    def _capacity(self, level: int) -> int:
+        depth: int = len(self._compactors) - level - 1
+        return max(int(math.ceil(self._k * (2.0 / 3.0) ** depth)), 2)
+
+    def _compress(self) -> None:
+        level: int = 0
+        while level < len(self._compactors):
+            compactor: np.ndarray = self._compactors[level]
+            if len(compactor) > self._capacity(level=level):
+                compactor = np.sort(compactor, kind="stable")
+                # An odd value out stays at this level.
+                num_kept: int = len(compactor) % 2
+                offset: int = int(self._random.integers(2))
+                self._add_to_compactor(
+                    level=level + 1, values=compactor[num_kept + offset :: 2]
+                )
+                self._compactors[level] = compactor[:num_kept]
+            else:
+                level += 1
+
+
+class ColumnSketch:
+    """Summary of the values of a column: row and null counts, distinct values and, for numeric columns, extrema,
+    moments and quantiles.
+
+    Null counts, extrema, mean and standard deviation are exact; distinct value counts and quantiles are estimates (see
+    "can_get_metric_value()").
+
+    WARNING: This class is experimental.
+    """
+
+    # Metrics, whose values are derived from the summary exactly.
+    EXACT_METRIC_NAMES: Set[str] = {
+        "column_values.nonnull.unexpected_count",
+        "column_values.null.unexpected_count",
+        "column.min",
+        "column.max",
+        "column.mean",
+        "column.standard_deviation",
+    }
+    # Metrics, whose values are estimated, provided that they allow (via "approximation_relative_error") the error of
+    # sketches.
+    APPROXIMATE_METRIC_NAMES: Set[str] = {
+        "column.distinct_values.count",
+        "column.median",
+        "column.quantile_values",
+    }
+
+    def __init__(
+        self,
+        row_count: int = 0,
+        null_count: int = 0,
+        is_numeric: bool = True,
+        min_value: Optional[Number] = None,
+        max_value: Optional[Number] = None,
+        mean: float = 0.0,
+        sum_of_squared_deviations: float = 0.0,
+        distinct_values: Optional[HyperLogLogSketch] = None,
+        quantiles: Optional[KllQuantileSketch] = None,
+    ):
+        self._row_count = row_count
+        self._null_count = null_count
+        self._is_numeric = is_numeric
+        self._min_value = min_value
+        self._max_value = max_value
+        self._mean = mean
+        self._sum_of_squared_deviations = sum_of_squared_deviations
+        self._distinct_values = distinct_values or HyperLogLogSketch()
+        self._quantiles = quantiles or KllQuantileSketch()
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    @property
+    def null_count(self) -> int:
+        return self._null_count
+
+    @property
+    def nonnull_count(self) -> int:
+        return self._row_count - self._null_count
+
+    @property
+    def is_numeric(self) -> bool:
+        """Whether or not all non-null values are numbers (extrema, moments and quantiles are only kept if so)."""
+        return self._is_numeric
+
+    def update(self, values: Any) -> None:
+        """Add values (e.g., a pandas Series, a numpy array, or a list of column values fetched from a database)."""
+        values = pd.Series(values, dtype=None if len(values) > 0 else object)
+        nonnull_values: pd.Series = values.dropna()
+
+        other: ColumnSketch = ColumnSketch(
+            row_count=len(values),
+            null_count=len(values) - len(nonnull_values),
+            distinct_values=HyperLogLogSketch(
+                precision=self._distinct_values.precision
+            ),
+            quantiles=KllQuantileSketch(k=self._quantiles.k),
+        )
+        if len(nonnull_values) > 0:
+            other._distinct_values.update(nonnull_values)
+            numeric_values: Optional[pd.Series] = _get_numeric_values(
+                values=nonnull_values
+            )
+            if numeric_values is None:
+                other._set_non_numeric()
+            else:
+                other._min_value = numeric_values.min()
+                other._max_value = numeric_values.max()
+                other._mean = float(numeric_values.mean())
+                other._sum_of_squared_deviations = float(
+                    ((numeric_values - other._mean) ** 2).sum()
+                )
+                other._quantiles.update(numeric_values)
+
+        self.merge(other=other)
+
+    def merge(self, other: "ColumnSketch") -> None:
+        """Add the values summarized by another sketch (e.g., of another chunk of the same column) to this sketch."""
+        if self._is_numeric and other.is_numeric:
+            if other.nonnull_count > 0:
+                self._merge_numeric_statistics(other=other)
+        else:
+            self._set_non_numeric()
+
+        self._distinct_values.merge(other._distinct_values)
+        self._row_count += other.row_count
+        self._null_count += other.null_count
+
+    def can_get_metric_value(
+        self, metric_name: str, metric_value_kwargs: Optional[dict] = None
+    ) -> bool:
+        """Whether or not the value of the metric can be derived from the summary.
+
+        Estimates are only used if the metric allows (via "approximation_relative_error") at least the relative error
+        of the corresponding sketch.
+        """
+        metric_value_kwargs = metric_value_kwargs or {}
+        if metric_name in self.EXACT_METRIC_NAMES:
+            if metric_name.startswith("column_values."):
+                return True
+
+            return self._is_numeric and not metric_value_kwargs.get(
+                "parse_strings_as_datetimes"
+            )
+
+        if metric_name not in self.APPROXIMATE_METRIC_NAMES:
+            return False
+
+        approximation_relative_error: Optional[float] = metric_value_kwargs.get(
+            "approximation_relative_error"
+        )
+        if approximation_relative_error is None:
+            return False
+
+        if metric_name == "column.distinct_values.count":
+            return approximation_relative_error >= self._distinct_values.relative_error
+
+        return (
+            self._is_numeric
+            and approximation_relative_error >= self._quantiles.relative_error
+        )
+
+    def get_metric_value(
+        self, metric_name: str, metric_value_kwargs: Optional[dict] = None
+    ) -> Any:
+        """Value of the metric, derived from the summary (provided that "can_get_metric_value()" returns True)."""
+        metric_value_kwargs = metric_value_kwargs or {}
+        if metric_name == "column_values.nonnull.unexpected_count":
+            return self._null_count
+
+        if metric_name == "column_values.null.unexpected_count":
+            return self.nonnull_count
+
+        if metric_name == "column.distinct_values.count":
+            return self._distinct_values.estimate()
+
+        if metric_name == "column.min":
+            return self._min_value
+
+        if metric_name == "column.max":
+            return self._max_value
+
+        if metric_name == "column.mean":
+            return self._mean if self.nonnull_count > 0 else np.nan
+
+        if metric_name == "column.standard_deviation":
+            if self.nonnull_count < 2:
+                return np.nan
+
+            return math.sqrt(self._sum_of_squared_deviations / (self.nonnull_count - 1))
+
+        if metric_name == "column.median":
+            return self._quantiles.quantiles([0.5])[0]
+
+        if metric_name == "column.quantile_values":
+            return self._quantiles.quantiles(metric_value_kwargs["quantiles"])
+
+        raise ValueError(
+            f'The value of the metric "{metric_name}" cannot be derived from a ColumnSketch.'
+        )
+
+    def to_json_dict(self) -> dict:
+        return convert_to_json_serializable(
+            {
+                "row_count": self._row_count,
+                "null_count": self._null_count,
+                "is_numeric": self._is_numeric,
+                "min_value": self._min_value,
+                "max_value": self._max_value,
+                "mean": self._mean,
+                "sum_of_squared_deviations": self._sum_of_squared_deviations,
+                "distinct_values": self._distinct_values.to_json_dict(),
+                "quantiles": self._quantiles.to_json_dict(),
+            }
+        )
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict) -> "ColumnSketch":
+        return cls(
+            row_count=json_dict["row_count"],
+            null_count=json_dict["null_count"],
+            is_numeric=json_dict["is_numeric"],
+            min_value=json_dict["min_value"],
+            max_value=json_dict["max_value"],
+            mean=json_dict["mean"],
+            sum_of_squared_deviations=json_dict["sum_of_squared_deviations"],
+            distinct_values=HyperLogLogSketch.from_json_dict(
+                json_dict["distinct_values"]
+            ),
+            quantiles=KllQuantileSketch.from_json_dict(json_dict["quantiles"]),
+        )
+
+    def _merge_numeric_statistics(self, other: "ColumnSketch") -> None:
+        count: int = self.nonnull_count
+        if count == 0:
+            self._min_value = other._min_value
+            self._max_value = other._max_value
+        else:
+            self._min_value = min(self._min_value, other._min_value)
+            self._max_value = max(self._max_value, other._max_value)
+
+        # Means and sums of squared deviations are combined as in the parallel variance algorithm of Chan et al.
+        total_count: int = count + other.nonnull_count
+        delta: float = other._mean - self._mean
+        self._mean += delta * other.nonnull_count / total_count
+        self._sum_of_squared_deviations += (
+            other._sum_of_squared_deviations
+            + delta**2 * count * other.nonnull_count / total_count
+        )
+        self._quantiles.merge(other._quantiles)
+
+    def _set_non_numeric(self) -> None:
+        self._is_numeric = False
+        self._min_value = None
+        self._max_value = None
+        self._mean = 0.0
+        self._sum_of_squared_deviations = 0.0
+        self._quantiles = KllQuantileSketch(k=self._quantiles.k)
+
+
+def _get_numeric_values(values: pd.Series) -> Optional[pd.Series]:
+    # Numeric (non-boolean) values as a numeric Series (e.g., "Decimal" values fetched from a database), or None.
+    if pd.api.types.is_bool_dtype(values):
+        return None
+
+    if pd.api.types.is_numeric_dtype(values):
+        return values
+
+    if pd.api.types.is_object_dtype(values) and all(
+        isinstance(value, Number) and not isinstance(value, bool) for value in values
+    ):
+        return values.astype(float)
+
+    return None
+
+
+def _bit_lengths(values: np.ndarray) -> np.ndarray:
+    # Number of bits needed to represent each (unsigned 64-bit) value, computed by binary search.
+    bit_lengths: np.ndarray = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        shifted_values: np.ndarray = values >> np.uint64(shift)
+        is_wider: np.ndarray = shifted_values != 0
+        bit_lengths[is_wider] += shift
+        values = np.where(is_wider, shifted_values, values)
+
+    return bit_lengths + (values != 0)
@@ -0,0 +1,239 @@
+"""
+Process-wide registry of SqlAlchemy Engines.
+
+Execution engines of Datasources and DatabaseStoreBackends, which connect to the same database (i.e. have the same
+normalized URL and the same create_engine arguments), share a single Engine, and so a single connection pool, rather
+than each opening connections of their own.  Execution engines of dialects, whose temporary tables only persist within
+a connection (so that they keep a connection checked out for their whole life), get Engines of their own instead, which
+keeps them from exhausting a shared connection pool.  Engines are reference counted: SqlAlchemyExecutionEngine.close() releases
+its Engine, which is disposed once it is no longer used.  Engines that are never released are disposed of when they are
+garbage collected, as before.
+
+WARNING: This module is experimental.
+"""
+
+import json
+import logging
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple, Union
+
+from great_expectations.util import import_make_url
+
+try:
+    import sqlalchemy as sa
+    from sqlalchemy import event
+    from sqlalchemy.pool import QueuePool
+
+    make_url = import_make_url()
+except ImportError:
+    sa = None
+    event = None
+    QueuePool = None
+    make_url = None
+
+logger = logging.getLogger(__name__)
+
+
+class SqlAlchemyEngineRegistry:
+    """Shares SqlAlchemy Engines, keyed on their normalized URL and create_engine arguments, and counts connection pool
+    events of each shared Engine.
+
+    Pool metrics of an Engine are:
+        checkouts: number of connections checked out of the pool;
+        connects: number of new database connections opened by the pool;
+        saturated_checkouts: number of checkouts, which left no connection (including overflow) available in the pool,
+            so that a concurrent checkout had to wait for a connection to be returned;
+        peak_checked_out: maximum number of connections checked out at the same time;
+        peak_overflow: maximum number of overflow connections (beyond "pool_size") open at the same time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines: "weakref.WeakValueDictionary[str, sa.engine.Engine]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._reference_counts: Dict[str, int] = {}
+        self._pool_metrics: Dict[str, Dict[str, int]] = {}
+
+    def acquire_engine(
+        self,
+        url: Union[str, "sa.engine.url.URL"],
+        default_pool_size: Optional[int] = None,
+        default_max_overflow: Optional[int] = None,
+        shared: bool = True,
+        **create_engine_kwargs,
+    ) -> "sa.engine.Engine":
+        """Return the shared Engine for the given URL and create_engine arguments (creating it, if necessary), and
+        increment its reference count.
+
+        Args:
+            url: SqlAlchemy URL (or connection string) of the database.
+            default_pool_size: "pool_size" of the Engine, unless given in create_engine_kwargs; only applied to
+                databases, whose Engines pool connections with a QueuePool.
+            default_max_overflow: "max_overflow" of the Engine, unless given in create_engine_kwargs; only applied to
+                databases, whose Engines pool connections with a QueuePool.
+            shared: Whether the Engine is shared with other users of the same URL and create_engine arguments; users,
+                which keep a connection checked out for their whole life, must not share the pool of their Engine.
+            create_engine_kwargs: arguments of sqlalchemy.create_engine().
+
+        Returns:
+            SqlAlchemy Engine
+        """
+        parsed_url: "sa.engine.url.URL" = make_url(url)
+        if _uses_queue_pool(parsed_url=parsed_url, **create_engine_kwargs):
+            if default_pool_size is not None:
+                create_engine_kwargs.setdefault("pool_size", default_pool_size)
+            if default_max_overflow is not None:
+                create_engine_kwargs.setdefault("max_overflow", default_max_overflow)
+
+        if not shared or _is_in_memory_database(parsed_url=parsed_url):
+            # Every Engine of an in-memory database is a separate database, and so must not be shared.
+            return sa.create_engine(url, **create_engine_kwargs)
+
+        key: str = _get_engine_key(parsed_url=parsed_url, **create_engine_kwargs)
+        with self._lock:
+            engine: Optional["sa.engine.Engine"] = self._engines.get(key)
+            if engine is None:
+                engine = sa.create_engine(url, **create_engine_kwargs)
+                self._engines[key] = engine
+                self._reference_counts[key] = 0
+                self._pool_metrics[key] = self._listen_to_pool_events(engine=engine)
+                weakref.finalize(engine, self._forget_collected_engine, key)
+            self._reference_counts[key] += 1
+
+        return engine
+
+    def release_engine(self, engine: "sa.engine.Engine") -> None:
+        """Decrement the reference count of a shared Engine, and dispose of it once it is no longer used.  Engines,
+        which are not shared through the registry, are disposed of immediately."""
+        with self._lock:
+            key: Optional[str] = self._get_key(engine=engine)
+            if key is not None:
+                self._reference_counts[key] -= 1
+                if self._reference_counts[key] > 0:
+                    return
+
+                del self._engines[key]
+                self._forget_engine(key)
+
+        engine.dispose()
+
+    def get_pool_metrics(self, engine: "sa.engine.Engine") -> Optional[Dict[str, int]]:
+        """Return the pool metrics (see the class docstring) of a shared Engine (None, if the Engine is not shared)."""
+        with self._lock:
+            key: Optional[str] = self._get_key(engine=engine)
+            if key is None:
+                return None
+
+            return dict(self._pool_metrics[key])
+
+    def get_reference_count(self, engine: "sa.engine.Engine") -> int:
+        with self._lock:
+            key: Optional[str] = self._get_key(engine=engine)
+            if key is None:
+                return 0
+
+            return self._reference_counts[key]
+
+    def _get_key(self, engine: "sa.engine.Engine") -> Optional[str]:
+        key: str
+        shared_engine: "sa.engine.Engine"
+        for key, shared_engine in self._engines.items():
+            if shared_engine is engine:
+                return key
+
+        return None
+
+    def _forget_engine(self, key: str) -> None:
+        self._reference_counts.pop(key, None)
+        self._pool_metrics.pop(key, None)
+
+    def _forget_collected_engine(self, key: str) -> None:
+        # Called by the garbage collector (so the lock is not acquired); the key may have been reused by a new Engine.
+        if key not in self._engines:
+            self._forget_engine(key)
+
+    @staticmethod
+    def _listen_to_pool_events(engine: "sa.engine.Engine") -> Dict[str, int]:
+        pool_metrics: Dict[str, int] = {
+            "checkouts": 0,
+            "connects": 0,
+            "saturated_checkouts": 0,
+            "peak_checked_out": 0,
+            "peak_overflow": 0,
+        }
+
+        # The listeners must not keep the Engine alive.
+        engine_reference: "weakref.ReferenceType[sa.engine.Engine]" = weakref.ref(
+            engine
+        )
+
+        def on_connect(dbapi_connection, connection_record):
+            pool_metrics["connects"] += 1
+
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            pool_metrics["checkouts"] += 1
+            checked_out_engine: Optional["sa.engine.Engine"] = engine_reference()
+            if checked_out_engine is None or not isinstance(
+                checked_out_engine.pool, QueuePool
+            ):
+                return
+
+            pool: QueuePool = checked_out_engine.pool
+
+            pool_metrics["peak_checked_out"] = max(
+                pool_metrics["peak_checked_out"], pool.checkedout()
+            )
+            pool_metrics["peak_overflow"] = max(
+                pool_metrics["peak_overflow"], pool.overflow()
+            )
+            max_overflow: int = getattr(pool, "_max_overflow", -1)
+            if (
+                max_overflow > -1
+                and pool.checkedin() == 0
+                and pool.overflow() >= max_overflow
+            ):
+                pool_metrics["saturated_checkouts"] += 1
+
+        event.listen(engine, "connect", on_connect)
+        event.listen(engine, "checkout", on_checkout)
+        return pool_metrics
+
+
+def _is_in_memory_database(parsed_url: "sa.engine.url.URL") -> bool:
+    return parsed_url.drivername.startswith("sqlite") and parsed_url.database in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def _uses_queue_pool(parsed_url: "sa.engine.url.URL", **create_engine_kwargs) -> bool:
+    pool_class = create_engine_kwargs.get("poolclass")
+    if pool_class is None:
+        try:
+            pool_class = parsed_url.get_dialect().get_pool_class(parsed_url)
+        except Exception:
+            # The dialect is not installed; create_engine() will report it.
+            return False
+
+    return isinstance(pool_class, type) and issubclass(pool_class, QueuePool)
+
+
+def _get_engine_key(parsed_url: "sa.engine.url.URL", **create_engine_kwargs) -> str:
+    normalized_url: Tuple[Any, ...] = (
+        parsed_url.drivername.lower(),
+        parsed_url.username,
+        parsed_url.password,
+        (parsed_url.host or "").lower(),
+        parsed_url.port,
+        parsed_url.database,
+        sorted((str(name), str(value)) for name, value in parsed_url.query.items()),
+    )
+    return json.dumps(
+        [normalized_url, create_engine_kwargs], sort_keys=True, default=repr
+    )
+
+
+sqlalchemy_engine_registry = SqlAlchemyEngineRegistry()
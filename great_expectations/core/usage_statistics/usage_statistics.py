@@ -59,6 +59,10 @@ class UsageStatisticsHandler:
         self._worker = threading.Thread(target=self._requests_worker, daemon=True)
         self._worker.start()
 
+        # Durations of events being emitted, set by usage_statistics_enabled_method() for build_envelope(); they are
+        # kept per thread, because the handler is shared by concurrent calls (e.g., from multiple threads).
+        self._event_durations = threading.local()
+
         # As usage stats are central to many core GE features, dynamically importing at runtime reduces
         # the risk of cyclic import issues. If these anonymizers have been imported at any earlier point
         # in the program's lifetime, retrieval of the import will be O(1) and not impact performance.
@@ -187,8 +191,8 @@ class UsageStatisticsHandler:
         event_duration_property_name: str = f'{message["event"]}.duration'.replace(
             ".", "_"
         )
-        if hasattr(self, event_duration_property_name):
-            delta_t: int = getattr(self, event_duration_property_name)
+        if hasattr(self._event_durations, event_duration_property_name):
+            delta_t: int = getattr(self._event_durations, event_duration_property_name)
             message["event_duration"] = delta_t
 
         return message
@@ -315,9 +319,13 @@ def usage_statistics_enabled_method(
                     event_duration_property_name: str = (
                         f"{event_name}.duration".replace(".", "_")
                     )
-                    setattr(handler, event_duration_property_name, delta_t)
+                    # noinspection PyProtectedMember
+                    setattr(
+                        handler._event_durations, event_duration_property_name, delta_t
+                    )
                     handler.emit(message)
-                    delattr(handler, event_duration_property_name)
+                    # noinspection PyProtectedMember
+                    delattr(handler._event_durations, event_duration_property_name)
 
             return result
 
@@ -34,17 +34,16 @@ def send_usage_message(
 
 def aggregate_all_core_expectation_types() -> Set[str]:
     from great_expectations.dataset.dataset import Dataset
-    from great_expectations.expectations.registry import (
-        list_registered_expectation_implementations,
-    )
+    from great_expectations.expectations.registry_manifest import EXPECTATION_MODULES
 
     v2_batchkwargs_api_supported_expectation_types: List[str] = [
         el for el in Dataset.__dict__.keys() if el.startswith("expect_")
     ]
 
-    v3_batchrequest_api_supported_expectation_types: List[
-        str
-    ] = list_registered_expectation_implementations()
+    # Core Expectations are imported lazily, so that their types are taken from the manifest of their modules.
+    v3_batchrequest_api_supported_expectation_types: List[str] = list(
+        EXPECTATION_MODULES.keys()
+    )
 
     return set(v2_batchkwargs_api_supported_expectation_types).union(
         set(v3_batchrequest_api_supported_expectation_types)
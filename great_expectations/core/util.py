@@ -8,7 +8,7 @@ import sys
 import uuid
 from collections import OrderedDict
 from collections.abc import Mapping
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 from urllib.parse import urlparse
 
 import dateutil.parser
@@ -141,6 +141,14 @@ def convert_to_json_serializable(data):
         test_obj may also be converted in place.
     """
 
+    # Common types (including those of already converted data) are converted by their exact type, without going through
+    # the chain of checks below.
+    converter: Optional[Callable[[Any], Any]] = _JSON_SERIALIZABLE_CONVERTERS.get(
+        type(data)
+    )
+    if converter is not None:
+        return converter(data)
+
     # If it's one of our types, we use our own conversion; this can move to full schema
     # once nesting goes all the way down
     if isinstance(data, (SerializableDictDot, SerializableDotDict)):
@@ -155,25 +163,16 @@ def convert_to_json_serializable(data):
         return data
 
     if isinstance(data, dict):
-        new_dict = {}
-        for key in data:
-            # A pandas index can be numeric, and a dict key can be numeric, but a json key must be a string
-            new_dict[str(key)] = convert_to_json_serializable(data[key])
-
-        return new_dict
+        return _convert_dict_to_json_serializable(data)
 
     if isinstance(data, (list, tuple, set)):
-        new_list = []
-        for val in data:
-            new_list.append(convert_to_json_serializable(val))
-
-        return new_list
+        return _convert_collection_to_json_serializable(data)
 
     if isinstance(data, (np.ndarray, pd.Index)):
         # test_obj[key] = test_obj[key].tolist()
         # If we have an array or index, convert it first to a list--causing coercion to float--and then round
         # to the number of digits for which the string representation will equal the float representation
-        return [convert_to_json_serializable(x) for x in data.tolist()]
+        return _convert_array_to_json_serializable(data)
 
     if isinstance(data, np.int64):
         return int(data)
@@ -216,17 +215,7 @@ def convert_to_json_serializable(data):
         pass
 
     if isinstance(data, pd.Series):
-        # Converting a series is tricky since the index may not be a string, but all json
-        # keys must be strings. So, we use a very ugly serialization strategy
-        index_name = data.index.name or "index"
-        value_name = data.name or "value"
-        return [
-            {
-                index_name: convert_to_json_serializable(idx),
-                value_name: convert_to_json_serializable(val),
-            }
-            for idx, val in data.iteritems()
-        ]
+        return _convert_series_to_json_serializable(data)
 
     if isinstance(data, pd.DataFrame):
         return convert_to_json_serializable(data.to_dict(orient="records"))
@@ -258,6 +247,125 @@ def convert_to_json_serializable(data):
         )
 
 
+# Types of values, which are serializable as they are.
+_JSON_NATIVE_TYPES = frozenset([str, int, bool, type(None)])
+
+
+def _convert_dict_to_json_serializable(data: dict) -> dict:
+    # A pandas index can be numeric, and a dict key can be numeric, but a json key must be a string
+    return {
+        str(key): value
+        if type(value) in _JSON_NATIVE_TYPES
+        else convert_to_json_serializable(value)
+        for key, value in data.items()
+    }
+
+
+def _convert_collection_to_json_serializable(data: Iterable) -> list:
+    return [
+        value
+        if type(value) in _JSON_NATIVE_TYPES
+        else convert_to_json_serializable(value)
+        for value in data
+    ]
+
+
+def _convert_float_to_json_serializable(data: float) -> Optional[float]:
+    # NaN is the only value, which is not equal to itself.
+    return None if data != data else data
+
+
+def _convert_array_to_json_serializable(
+    data: Union[np.ndarray, pd.Index, pd.Series]
+) -> list:
+    """Convert the values of an array, an index, or a series to a list, at once for arrays of numbers and strings."""
+    values: np.ndarray
+    if isinstance(data, np.ndarray):
+        values = data
+    elif isinstance(data.dtype, np.dtype) and data.dtype.kind in "biufU":
+        values = data.to_numpy()
+    else:
+        # Values of other types (e.g., datetimes) are converted from their pandas representations (e.g., Timestamps).
+        return _convert_collection_to_json_serializable(data.tolist())
+
+    if values.dtype.kind in "biuU":
+        return values.tolist()
+
+    if values.dtype.kind == "f":
+        nan_mask: np.ndarray = np.isnan(values)
+        if nan_mask.any():
+            values = values.astype(object)
+            values[nan_mask] = None
+        return values.tolist()
+
+    return _convert_collection_to_json_serializable(values.tolist())
+
+
+def _convert_series_to_json_serializable(data: pd.Series) -> List[dict]:
+    # Converting a series is tricky since the index may not be a string, but all json
+    # keys must be strings. So, we use a very ugly serialization strategy
+    index_name = data.index.name or "index"
+    value_name = data.name or "value"
+    return [
+        {index_name: idx, value_name: val}
+        for idx, val in zip(
+            _convert_array_to_json_serializable(data.index),
+            _convert_array_to_json_serializable(data),
+        )
+    ]
+
+
+def _convert_small_float_to_json_serializable(data: np.floating) -> float:
+    return float(round(data, sys.float_info.dig))
+
+
+def _get_json_serializable_converters() -> Dict[type, Callable[[Any], Any]]:
+    converters: Dict[type, Callable[[Any], Any]] = {
+        native_type: lambda data: data for native_type in _JSON_NATIVE_TYPES
+    }
+    converters.update(
+        {
+            float: _convert_float_to_json_serializable,
+            np.float64: _convert_float_to_json_serializable,
+            np.bool_: bool,
+            dict: _convert_dict_to_json_serializable,
+            OrderedDict: _convert_dict_to_json_serializable,
+            list: _convert_collection_to_json_serializable,
+            tuple: _convert_collection_to_json_serializable,
+            set: _convert_collection_to_json_serializable,
+            np.ndarray: _convert_array_to_json_serializable,
+            pd.Series: _convert_series_to_json_serializable,
+            datetime.datetime: lambda data: data.isoformat(),
+            datetime.date: lambda data: data.isoformat(),
+            pd.Timestamp: lambda data: data.isoformat(),
+            uuid.UUID: str,
+        }
+    )
+    for integer_type in [
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.longlong,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+        np.ulonglong,
+    ]:
+        converters[integer_type] = int
+    for float_type in [np.float16, np.float32, np.longdouble]:
+        # np.longdouble is np.float64 on some platforms.
+        converters.setdefault(float_type, _convert_small_float_to_json_serializable)
+
+    return converters
+
+
+_JSON_SERIALIZABLE_CONVERTERS: Dict[
+    type, Callable[[Any], Any]
+] = _get_json_serializable_converters()
+
+
 def ensure_json_serializable(data):
     """
     Helper function to convert an object to one that is json serializable
@@ -929,6 +929,11 @@ class DataAsset:
             for col in columns:
                 expectations_to_evaluate.extend(columns[col])
 
+            self._prepare_validation(
+                expectations=expectations_to_evaluate,
+                evaluation_parameters=runtime_evaluation_parameters,
+            )
+
             for expectation in expectations_to_evaluate:
 
                 try:
@@ -1034,6 +1039,7 @@ class DataAsset:
                 )
             raise
         finally:
+            self._finish_validation()
             self._active_validation = False
 
         if getattr(data_context, "_usage_statistics_handler", None):
@@ -1045,6 +1051,21 @@ class DataAsset:
             )
         return result
 
+    def _prepare_validation(
+        self,
+        expectations: List[ExpectationConfiguration],
+        evaluation_parameters: dict,
+    ) -> None:
+        """Called by validate() before the expectations are evaluated (one at a time), so that data assets can compute
+        what the expectations share ahead of time (e.g., bundle their queries).  The base implementation does nothing.
+        """
+        pass
+
+    def _finish_validation(self) -> None:
+        """Called by validate() once all expectations are evaluated, to release state set up by _prepare_validation().
+        The base implementation does nothing."""
+        pass
+
     def get_evaluation_parameter(self, parameter_name, default_value=None):
         """Get an evaluation parameter value that has been stored in meta.
 
@@ -96,6 +96,7 @@ from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
 from great_expectations.data_context.util import (
+    DatasourceDict,
     PasswordMasker,
     build_store_from_config,
     file_relative_path,
@@ -384,7 +385,7 @@ class BaseDataContext(ConfigPeer):
         # Store cached datasources but don't init them
         self._cached_datasources = {}
 
-        # Build the datasources we know about and have access to
+        # Datasources are built on first use (see "get_datasource()"), except in cloud mode (see "_init_datasources()")
         self._init_datasources(self.project_config_with_variables_substituted)
 
         # Init validation operators
@@ -463,7 +464,11 @@ class BaseDataContext(ConfigPeer):
             self._build_store_from_config(store_name, store_config)
 
     def _init_datasources(self, config: DataContextConfig) -> None:
-        if not config.datasources:
+        """Build all configured Datasources when running in cloud mode, so that misconfigured Datasources are reported
+        at initialization time.  Otherwise, Datasources (and their ExecutionEngines and DataConnectors, which may open
+        connections) are built by "get_datasource()" when they are first used.
+        """
+        if not (config.datasources and self._ge_cloud_mode):
             return
         for datasource_name in config.datasources:
             try:
@@ -472,15 +477,9 @@ class BaseDataContext(ConfigPeer):
                 )
             except ge_exceptions.DatasourceInitializationError as e:
                 logger.warning(f"Cannot initialize datasource {datasource_name}: {e}")
-                # this error will happen if our configuration contains datasources that GE can no longer connect to.
-                # this is ok, as long as we don't use it to retrieve a batch. If we try to do that, the error will be
-                # caught at the context.get_batch() step. So we just pass here.
-                if self._ge_cloud_mode:
-                    # when running in cloud mode, we want to know if a datasource has been improperly configured at
-                    # init time.
-                    raise
-                else:
-                    pass
+                # when running in cloud mode, we want to know if a datasource has been improperly configured at init
+                # time.
+                raise
 
     def _apply_global_config_overrides(self):
         # check for global usage statistics opt out
@@ -860,8 +859,8 @@ class BaseDataContext(ConfigPeer):
 
     @property
     def datasources(self) -> Dict[str, Union[LegacyDatasource, BaseDatasource]]:
-        """A single holder for all Datasources in this context"""
-        return self._cached_datasources
+        """A single holder for all Datasources in this context (each Datasource is built when it is first looked up)"""
+        return DatasourceDict(data_context=self)
 
     @property
     def checkpoint_store_name(self):
@@ -20,6 +20,7 @@ from .metric_store import (  # isort:skip
     EvaluationParameterStore,
     MetricStore,
 )
+from .metric_sketch_store import MetricSketchStore  # isort:skip
 from .expectations_store import ExpectationsStore  # isort:skip
 from .validations_store import ValidationsStore  # isort:skip
 from .query_store import SqlAlchemyQueryStore  # isort:skip
@@ -35,6 +36,7 @@ for module_name in (
     ".html_site_store",
     ".profiler_store",
     ".metric_store",
+    ".metric_sketch_store",
     ".checkpoint_store",
     ".store_backend",
     ".tuple_store_backend",
@@ -1,9 +1,12 @@
 import logging
 import uuid
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.sqlalchemy_engine_registry import (
+    sqlalchemy_engine_registry,
+)
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.util import (
     filter_properties_dict,
@@ -72,49 +75,27 @@ class DatabaseStoreBackend(StoreBackend):
         elif credentials is not None:
             self.engine = self._build_engine(credentials=credentials, **kwargs)
         elif connection_string is not None:
-            self.engine = sa.create_engine(connection_string, **kwargs)
+            self.engine = sqlalchemy_engine_registry.acquire_engine(
+                connection_string, **kwargs
+            )
         elif url is not None:
             parsed_url = make_url(url)
             self.drivername = parsed_url.drivername
-            self.engine = sa.create_engine(url, **kwargs)
+            self.engine = sqlalchemy_engine_registry.acquire_engine(url, **kwargs)
         else:
             raise ge_exceptions.InvalidConfigError(
                 "Credentials, url, connection_string, or an engine are required for a DatabaseStoreBackend."
             )
 
-        meta = MetaData(schema=self._schema_name)
+        self._table_name = table_name
         self.key_columns = key_columns
-        # Dynamically construct a SQLAlchemy table with the name and column names we'll use
-        cols = []
         for column in key_columns:
             if column == "value":
                 raise ge_exceptions.InvalidConfigError(
                     "'value' cannot be used as a key_element name"
                 )
-            cols.append(Column(column, String, primary_key=True))
-        cols.append(Column("value", String))
-        try:
-            table = Table(table_name, meta, autoload=True, autoload_with=self.engine)
-            # We do a "light" check: if the columns' names match, we will proceed, otherwise, create the table
-            if {str(col.name).lower() for col in table.columns} != (
-                set(key_columns) | {"value"}
-            ):
-                raise ge_exceptions.StoreBackendError(
-                    f"Unable to use table {table_name}: it exists, but does not have the expected schema."
-                )
-        except NoSuchTableError:
-            table = Table(table_name, meta, *cols)
-            try:
-                if self._schema_name:
-                    self.engine.execute(
-                        f"CREATE SCHEMA IF NOT EXISTS {self._schema_name};"
-                    )
-                meta.create_all(self.engine)
-            except SQLAlchemyError as e:
-                raise ge_exceptions.StoreBackendError(
-                    f"Unable to connect to table {table_name} because of an error. It is possible your table needs to be migrated to a new schema.  SqlAlchemyError: {str(e)}"
-                )
-        self._table = table
+        # The table is reflected (or created) on first use, so that no connection is opened at initialization time.
+        self._sa_table: Optional["Table"] = None
         # Initialize with store_backend_id
         self._store_backend_id = None
         self._store_backend_id = self.store_backend_id
@@ -156,6 +137,44 @@ class DatabaseStoreBackend(StoreBackend):
             self._store_backend_id = f"{self.STORE_BACKEND_ID_PREFIX}{store_id}"
         return self._store_backend_id.replace(self.STORE_BACKEND_ID_PREFIX, "")
 
+    @property
+    def _table(self) -> "Table":
+        if self._sa_table is None:
+            self._sa_table = self._build_table()
+        return self._sa_table
+
+    def _build_table(self) -> "Table":
+        table_name: str = self._table_name
+        key_columns: List[str] = self.key_columns
+        meta = MetaData(schema=self._schema_name)
+        # Dynamically construct a SQLAlchemy table with the name and column names we'll use
+        cols = []
+        for column in key_columns:
+            cols.append(Column(column, String, primary_key=True))
+        cols.append(Column("value", String))
+        try:
+            table = Table(table_name, meta, autoload=True, autoload_with=self.engine)
+            # We do a "light" check: if the columns' names match, we will proceed, otherwise, create the table
+            if {str(col.name).lower() for col in table.columns} != (
+                set(key_columns) | {"value"}
+            ):
+                raise ge_exceptions.StoreBackendError(
+                    f"Unable to use table {table_name}: it exists, but does not have the expected schema."
+                )
+        except NoSuchTableError:
+            table = Table(table_name, meta, *cols)
+            try:
+                if self._schema_name:
+                    self.engine.execute(
+                        f"CREATE SCHEMA IF NOT EXISTS {self._schema_name};"
+                    )
+                meta.create_all(self.engine)
+            except SQLAlchemyError as e:
+                raise ge_exceptions.StoreBackendError(
+                    f"Unable to connect to table {table_name} because of an error. It is possible your table needs to be migrated to a new schema.  SqlAlchemyError: {str(e)}"
+                )
+        return table
+
     def _build_engine(self, credentials, **kwargs) -> "sa.engine.Engine":
         """
         Using a set of given credentials, constructs an Execution Engine , connecting to a database using a URL or a
@@ -178,7 +197,9 @@ class DatabaseStoreBackend(StoreBackend):
 
         self.drivername = drivername
 
-        engine = sa.create_engine(options, **create_engine_kwargs)
+        engine = sqlalchemy_engine_registry.acquire_engine(
+            options, **create_engine_kwargs
+        )
         return engine
 
     def _get_sqlalchemy_key_pair_auth_url(
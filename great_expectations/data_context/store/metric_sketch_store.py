@@ -0,0 +1,53 @@
+import json
+
+from great_expectations.core.sketches import ColumnSketch
+from great_expectations.data_context.store.store import Store
+from great_expectations.data_context.types.resource_identifiers import (
+    ColumnSketchIdentifier,
+)
+from great_expectations.util import filter_properties_dict
+
+
+class MetricSketchStore(Store):
+    """
+    A MetricSketchStore stores ColumnSketch summaries of columns of batches, so that metrics of batches, which do not
+    change (e.g., historical partitions), are derived from the summaries, rather than computed from data on every run.
+
+    Summaries are keyed on batch identifiers and fingerprints of all of the batch data (e.g., the "full" or "incremental"
+    "pandas_data_fingerprint" batch marker), so changed data gets a new summary.  Batches without such a fingerprint
+    (e.g., SQL and Spark batches, and pandas batches with "sampled" or "file" fingerprints) are not summarized, since
+    their data can change under the same batch identifier and fingerprint.
+
+    WARNING: This class is experimental.
+    """
+
+    _key_class = ColumnSketchIdentifier
+
+    def __init__(self, store_backend=None, runtime_environment=None, store_name=None):
+        super().__init__(
+            store_backend=store_backend,
+            runtime_environment=runtime_environment,
+            store_name=store_name,
+        )
+
+        # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
+        # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
+        self._config = {
+            "store_backend": store_backend,
+            "runtime_environment": runtime_environment,
+            "store_name": store_name,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+
+    def serialize(self, key, value):
+        return json.dumps(value.to_json_dict())
+
+    def deserialize(self, key, value):
+        if value:
+            return ColumnSketch.from_json_dict(json.loads(value))
+
+    @property
+    def config(self) -> dict:
+        return self._config
@@ -1006,13 +1006,20 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             )
 
     def _get(self, key):
+        from azure.core.exceptions import ResourceNotFoundError
+
         az_blob_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
-        return (
-            self._get_container_client()
-            .download_blob(az_blob_key)
-            .readall()
-            .decode("utf-8")
-        )
+        try:
+            return (
+                self._get_container_client()
+                .download_blob(az_blob_key)
+                .readall()
+                .decode("utf-8")
+            )
+        except ResourceNotFoundError:
+            raise InvalidKeyError(
+                f"Unable to retrieve object from TupleAzureBlobStoreBackend with the following Key: {az_blob_key}"
+            )
 
     def _set(self, key, value, content_encoding="utf-8", **kwargs):
 
@@ -1,27 +1,49 @@
+import copy
+import json
+import logging
 import random
 import uuid
-from typing import Dict
+from typing import Dict, Optional
 
+import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationSuiteValidationResultSchema,
 )
+from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
 from great_expectations.data_context.store.store import Store
+from great_expectations.data_context.store.store_backend import (
+    InMemoryStoreBackend,
+    StoreBackend,
+)
 from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     GeCloudIdentifier,
     ValidationResultIdentifier,
 )
-from great_expectations.data_context.util import load_class
+from great_expectations.data_context.util import (
+    instantiate_class_from_config,
+    load_class,
+)
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
 )
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    logger.debug(
+        "Unable to load orjson; install optional orjson dependency for faster serialization of validation results"
+    )
+
 
 class ValidationsStore(Store):
     """
@@ -94,11 +116,28 @@ class ValidationsStore(Store):
 
     _key_class = ValidationResultIdentifier
 
-    def __init__(self, store_backend=None, runtime_environment=None, store_name=None):
+    # Appended to the filepath_suffix of tuple store backends to name the summary record of each validation result
+    SUMMARY_FILEPATH_SUFFIX = ".summary"
+
+    def __init__(
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        store_name=None,
+        use_orjson=False,
+        store_summaries=False,
+    ):
         self._expectationSuiteValidationResultSchema = (
             ExpectationSuiteValidationResultSchema()
         )
 
+        # orjson encodes the (large) validation results much faster than the json module, with the same layout.
+        if use_orjson and orjson is None:
+            raise ge_exceptions.DataContextError(
+                "ModuleNotFoundError: No module named 'orjson'"
+            )
+        self._use_orjson = use_orjson
+
         if store_backend is not None:
             store_backend_module_name = store_backend.get(
                 "module_name", "great_expectations.data_context.store"
@@ -137,17 +176,58 @@ class ValidationsStore(Store):
             store_name=store_name,
         )
 
+        # A small summary record (success, statistics, meta) is written next to each validation result, so that
+        # listings (e.g., the Data Docs index page) do not have to deserialize every expectation validation result.
+        # The summary record is rewritten along with its validation result and removed by remove_key(); validation
+        # results written or removed other than through a store with store_summaries leave stale summary records behind.
+        self._summary_store_backend = None
+        if store_summaries:
+            self._summary_store_backend = self._build_summary_store_backend(
+                store_backend=store_backend, runtime_environment=runtime_environment
+            )
+
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
         self._config = {
             "store_backend": store_backend,
             "runtime_environment": runtime_environment,
             "store_name": store_name,
+            "use_orjson": use_orjson,
+            "store_summaries": store_summaries,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
+    def _build_summary_store_backend(self, store_backend, runtime_environment):
+        if (
+            isinstance(self._store_backend, TupleStoreBackend)
+            and self._store_backend.filepath_suffix
+        ):
+            # The summary records do not end with the filepath_suffix of the validation results, so they are not
+            # listed as validation results.
+            summary_store_backend = copy.deepcopy(store_backend)
+            summary_store_backend["filepath_suffix"] = (
+                self._store_backend.filepath_suffix + self.SUMMARY_FILEPATH_SUFFIX
+            )
+        elif isinstance(self._store_backend, InMemoryStoreBackend):
+            summary_store_backend = {"class_name": "InMemoryStoreBackend"}
+        else:
+            raise ge_exceptions.DataContextError(
+                f"Validation result summaries are not supported by {self._store_backend.__class__.__name__}; only "
+                f"tuple store backends with a filepath_suffix and InMemoryStoreBackend can store them."
+            )
+
+        summary_store_backend["suppress_store_backend_id"] = True
+        return instantiate_class_from_config(
+            config=summary_store_backend,
+            runtime_environment=runtime_environment or {},
+            config_defaults={
+                "module_name": "great_expectations.data_context.store",
+                "store_name": self.store_name,
+            },
+        )
+
     def ge_cloud_response_json_to_object_dict(self, response_json: Dict) -> Dict:
         """
         This method takes full json response from GE cloud and outputs a dict appropriate for
@@ -164,6 +244,14 @@ class ValidationsStore(Store):
     def serialize(self, key, value):
         if self.ge_cloud_mode:
             return value.to_json_dict()
+        if self._use_orjson:
+            return orjson.dumps(
+                self._expectationSuiteValidationResultSchema.dump(value),
+                default=convert_to_json_serializable,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_SORT_KEYS
+                | orjson.OPT_SERIALIZE_NUMPY,
+            ).decode("utf-8")
         return self._expectationSuiteValidationResultSchema.dumps(
             value, indent=2, sort_keys=True
         )
@@ -174,6 +262,61 @@ class ValidationsStore(Store):
         else:
             return self._expectationSuiteValidationResultSchema.loads(value)
 
+    def set(self, key, value, **kwargs):
+        result = super().set(key, value, **kwargs)
+        if (
+            self._summary_store_backend is not None
+            and key != StoreBackend.STORE_BACKEND_ID_KEY
+        ):
+            self._summary_store_backend.set(
+                self.key_to_tuple(key),
+                json.dumps(self._get_summary_from_validation_result(value)),
+                **kwargs,
+            )
+        return result
+
+    def remove_key(self, key):
+        """Remove a validation result, along with its summary record (if any)."""
+        if self._summary_store_backend is not None:
+            try:
+                self._summary_store_backend.remove_key(self.key_to_tuple(key))
+            except Exception as e:
+                # The validation result may have been stored before summaries were enabled.
+                logger.debug(f"Unable to remove the summary record of {key}: {e}")
+        return self.store_backend.remove_key(self.key_to_tuple(key))
+
+    def get_summary(self, key) -> Optional[dict]:
+        """Return the "success", "statistics" and "meta" (in their JSON form) of a stored validation result.
+
+        The summary record written by ``set`` is read when the store was configured with ``store_summaries``; the
+        full validation result is deserialized otherwise (and for results stored before summaries were enabled).
+        """
+        self._validate_key(key)
+        if self._summary_store_backend is not None:
+            try:
+                return json.loads(
+                    self._summary_store_backend.get(self.key_to_tuple(key))
+                )
+            except ge_exceptions.InvalidKeyError:
+                pass
+
+        validation_result = self.get(key)
+        if validation_result is None:
+            return None
+        return self._get_summary_from_validation_result(validation_result)
+
+    @staticmethod
+    def _get_summary_from_validation_result(
+        validation_result: ExpectationSuiteValidationResult,
+    ) -> dict:
+        return convert_to_json_serializable(
+            {
+                "success": validation_result.success,
+                "statistics": validation_result.statistics,
+                "meta": validation_result.meta,
+            }
+        )
+
     def self_check(self, pretty_print):
         return_obj = {}
 
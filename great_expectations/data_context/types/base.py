@@ -3,6 +3,7 @@ import enum
 import itertools
 import json
 import logging
+import os
 import uuid
 from typing import Any, Dict, List, MutableMapping, Optional, Set, Union
 from uuid import UUID
@@ -1171,19 +1172,106 @@ class ProgressBarsConfigSchema(Schema):
 class ConcurrencyConfig(DictDot):
     """WARNING: This class is experimental."""
 
-    def __init__(self, enabled: bool = False):
+    def __init__(
+        self,
+        enabled: bool = False,
+        concurrent_actions: bool = False,
+        max_action_concurrency: int = 10,
+        max_pending_actions: int = 100,
+        max_batch_materialization_concurrency: Optional[int] = None,
+        backend: str = "thread",
+        sqlalchemy_pool_size: Optional[int] = None,
+        sqlalchemy_max_overflow: Optional[int] = None,
+        max_process_concurrency: Optional[int] = None,
+    ):
         """Initialize a concurrency configuration to control multithreaded execution.
 
         Args:
             enabled: Whether or not multithreading is enabled.
+            concurrent_actions: Whether or not validation actions are run concurrently on a thread pool, honoring the
+                "depends_on" ordering declared in each action list entry (requires multithreading to be enabled).
+            max_action_concurrency: Max number of validation actions to run at the same time.
+            max_pending_actions: Max number of validation actions that may be queued or running at the same time;
+                once reached, scheduling further actions blocks until a running action finishes.
+            max_batch_materialization_concurrency: Max number of batches that a validation operator builds (i.e. loads
+                into memory, materializes as temporary tables or downloads) and validates at the same time, in order to
+                bound memory and warehouse slot usage. None (the default) does not bound batch materialization beyond
+                the number of threads.
+            backend: Either "thread" (the default) or "process". With "process", validations run by a Checkpoint are
+                executed by a pool of warm worker processes (rather than threads), which speeds up CPU-bound (e.g.
+                pandas) validations that are otherwise serialized by the GIL. Each worker rebuilds the Data Context from
+                its configuration, so all stores must be persisted outside of the process (i.e. not in memory).
+            sqlalchemy_pool_size: "pool_size" of the SqlAlchemy Engines of Datasources, whose databases pool connections
+                with a QueuePool (Engines are shared by Datasources connecting to the same database). None (the default)
+                keeps the SqlAlchemy default, unless multithreading is enabled (which removes the bound).
+            sqlalchemy_max_overflow: "max_overflow" of the SqlAlchemy Engines of Datasources (see sqlalchemy_pool_size).
+            max_process_concurrency: Max number of worker processes of the "process" backend. None (the default) uses
+                one worker process per CPU.
         """
+        if backend not in ("thread", "process"):
+            raise ValueError(
+                f'Concurrency backend must be either "thread" or "process"; got "{backend}".'
+            )
+
         self._enabled = enabled
+        self._concurrent_actions = concurrent_actions
+        self._max_action_concurrency = max_action_concurrency
+        self._max_pending_actions = max_pending_actions
+        self._max_batch_materialization_concurrency = (
+            max_batch_materialization_concurrency
+        )
+        self._backend = backend
+        self._sqlalchemy_pool_size = sqlalchemy_pool_size
+        self._sqlalchemy_max_overflow = sqlalchemy_max_overflow
+        self._max_process_concurrency = max_process_concurrency
 
     @property
     def enabled(self):
         """Whether or not multithreading is enabled."""
         return self._enabled
 
+    @property
+    def concurrent_actions(self) -> bool:
+        """Whether or not validation actions are run concurrently."""
+        return self._concurrent_actions
+
+    @property
+    def max_action_concurrency(self) -> int:
+        """Max number of validation actions to run concurrently with multithreading."""
+        return self._max_action_concurrency
+
+    @property
+    def max_pending_actions(self) -> int:
+        """Max number of validation actions that may be queued or running at the same time."""
+        return self._max_pending_actions
+
+    @property
+    def max_batch_materialization_concurrency(self) -> Optional[int]:
+        """Max number of batches to build concurrently with multithreading (None if there is no bound)."""
+        return self._max_batch_materialization_concurrency
+
+    @property
+    def backend(self) -> str:
+        """Whether concurrent work is executed by threads ("thread") or by worker processes ("process")."""
+        return self._backend
+
+    @property
+    def sqlalchemy_pool_size(self) -> Optional[int]:
+        """Size of the connection pools of SqlAlchemy Engines (None for the SqlAlchemy default)."""
+        return self._sqlalchemy_pool_size
+
+    @property
+    def sqlalchemy_max_overflow(self) -> Optional[int]:
+        """Max overflow of the connection pools of SqlAlchemy Engines (None for the SqlAlchemy default)."""
+        return self._sqlalchemy_max_overflow
+
+    @property
+    def max_process_concurrency(self) -> int:
+        """Max number of worker processes to execute CPU-bound work with (one per CPU unless configured)."""
+        if self._max_process_concurrency is not None:
+            return self._max_process_concurrency
+        return os.cpu_count() or 1
+
     @property
     def max_database_query_concurrency(self) -> int:
         """Max number of concurrent database queries to execute with mulithreading."""
@@ -1200,23 +1288,46 @@ class ConcurrencyConfig(DictDot):
 
         Args:
             parameters: SqlAlchemy create_engine parameters to which we add concurrency appropriate parameters. If the
-                concurrency parameters are already set, those parameters are left unchanged.
+                concurrency parameters are already set, those parameters are left unchanged.  Otherwise, the configured
+                sqlalchemy_pool_size and sqlalchemy_max_overflow take precedence over the unbounded defaults.
         """
         if not self._enabled:
             return
 
         if "pool_size" not in parameters:
             # https://docs.sqlalchemy.org/en/14/core/engines.html#sqlalchemy.create_engine.params.pool_size
-            parameters["pool_size"] = 0
+            parameters["pool_size"] = (
+                0 if self._sqlalchemy_pool_size is None else self._sqlalchemy_pool_size
+            )
         if "max_overflow" not in parameters:
             # https://docs.sqlalchemy.org/en/14/core/engines.html#sqlalchemy.create_engine.params.max_overflow
-            parameters["max_overflow"] = -1
+            parameters["max_overflow"] = (
+                -1
+                if self._sqlalchemy_max_overflow is None
+                else self._sqlalchemy_max_overflow
+            )
 
 
 class ConcurrencyConfigSchema(Schema):
     """WARNING: This class is experimental."""
 
     enabled = fields.Boolean(default=False)
+    concurrent_actions = fields.Boolean(default=False)
+    max_action_concurrency = fields.Integer(default=10, validate=lambda x: x > 0)
+    max_pending_actions = fields.Integer(default=100, validate=lambda x: x > 0)
+    max_batch_materialization_concurrency = fields.Integer(
+        required=False, allow_none=True, validate=lambda x: x > 0
+    )
+    backend = fields.String(default="thread", validate=OneOf(["thread", "process"]))
+    sqlalchemy_pool_size = fields.Integer(
+        required=False, allow_none=True, validate=lambda x: x >= 0
+    )
+    sqlalchemy_max_overflow = fields.Integer(
+        required=False, allow_none=True, validate=lambda x: x >= -1
+    )
+    max_process_concurrency = fields.Integer(
+        required=False, allow_none=True, validate=lambda x: x > 0
+    )
 
 
 class GeCloudConfig(DictDot):
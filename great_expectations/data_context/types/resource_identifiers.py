@@ -95,6 +95,53 @@ class BatchIdentifierSchema(Schema):
         return BatchIdentifier(**data)
 
 
+class ColumnSketchIdentifier(DataContextKey):
+    """A ColumnSketchIdentifier identifies the ColumnSketch of a column of a batch (by the batch identifier and, if the
+    batch has one, by the fingerprint of its data).
+    """
+
+    def __init__(
+        self,
+        batch_identifier: str,
+        column_name: str,
+        data_fingerprint: Optional[str] = None,
+    ):
+        super().__init__()
+        self._batch_identifier = batch_identifier
+        self._column_name = column_name
+        self._data_fingerprint = data_fingerprint
+
+    @property
+    def batch_identifier(self) -> str:
+        return self._batch_identifier
+
+    @property
+    def column_name(self) -> str:
+        return self._column_name
+
+    @property
+    def data_fingerprint(self) -> Optional[str]:
+        return self._data_fingerprint
+
+    def to_tuple(self):
+        return (
+            self.batch_identifier,
+            self.data_fingerprint or "__none__",
+            self.column_name,
+        )
+
+    @classmethod
+    def from_tuple(cls, tuple_):
+        return cls(
+            batch_identifier=tuple_[0],
+            column_name=tuple_[2],
+            data_fingerprint=None if tuple_[1] == "__none__" else tuple_[1],
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}::{self._batch_identifier}::{self._data_fingerprint}::{self._column_name}"
+
+
 class ValidationResultIdentifier(DataContextKey):
     """A ValidationResultIdentifier identifies a validation result by the fully-qualified expectation_suite_identifier
     and run_id.
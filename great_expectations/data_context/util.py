@@ -7,6 +7,7 @@ import os
 import re
 import warnings
 from collections import OrderedDict
+from collections.abc import ItemsView, Mapping, ValuesView
 from functools import lru_cache
 from typing import Any, Optional
 from urllib.parse import urlparse
@@ -509,6 +510,54 @@ def parse_substitution_variable(substitution_variable: str) -> Optional[str]:
         return None
 
 
+class DatasourceDict(Mapping):
+    """
+    Read-only mapping of the names of the Datasources, configured in a DataContext, to the Datasources.
+
+    A Datasource (together with its ExecutionEngine and DataConnectors, which may open database connections, start
+    Spark sessions, or create cloud clients) is built by DataContext.get_datasource() when it is first looked up, so
+    that a DataContext only initializes the Datasources that it actually uses.  Iterating over values (or items) builds
+    every Datasource; those that cannot be initialized are skipped with a warning.
+    """
+
+    def __init__(self, data_context):
+        self._data_context = data_context
+
+    def __getitem__(self, datasource_name: str):
+        if datasource_name not in self:
+            raise KeyError(datasource_name)
+
+        return self._data_context.get_datasource(datasource_name=datasource_name)
+
+    def __contains__(self, datasource_name) -> bool:
+        return datasource_name in (self._data_context.config.datasources or {})
+
+    def __iter__(self):
+        return iter(list(self._data_context.config.datasources or {}))
+
+    def __len__(self) -> int:
+        return len(self._data_context.config.datasources or {})
+
+    def __repr__(self) -> str:
+        return repr(self._get_initialized_datasources())
+
+    def values(self) -> ValuesView:
+        return ValuesView(self._get_initialized_datasources())
+
+    def items(self) -> ItemsView:
+        return ItemsView(self._get_initialized_datasources())
+
+    def _get_initialized_datasources(self) -> dict:
+        datasources: dict = {}
+        for datasource_name in self:
+            try:
+                datasources[datasource_name] = self[datasource_name]
+            except ge_exceptions.DatasourceInitializationError as e:
+                logger.warning(f"Cannot initialize datasource {datasource_name}: {e}")
+
+        return datasources
+
+
 class PasswordMasker:
     """
     Used to mask passwords in Datasources. Does not mask sqlite urls.
@@ -1,10 +1,10 @@
 import inspect
 import logging
 from datetime import datetime
-from functools import lru_cache, wraps
+from functools import wraps
 from itertools import zip_longest
 from numbers import Number
-from typing import Any, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 import numpy as np
 import pandas as pd
@@ -14,6 +14,8 @@ from scipy import stats
 from great_expectations.data_asset.data_asset import DataAsset
 from great_expectations.data_asset.util import DocInherit, parse_result_format
 from great_expectations.dataset.util import (
+    CacheInfo,
+    GetterCache,
     build_categorical_partition_object,
     build_continuous_partition_object,
     is_valid_categorical_partition_object,
@@ -229,18 +231,63 @@ class Dataset(MetaDataset):
         "get_column_count_in_range",
     ]
 
+    # Maximum number of cached results of each getter (None: no maximum); getters not listed use
+    # default_getter_cache_maxsize.  Results of the getters listed here can be large.
+    getter_cache_maxsizes: Dict[str, Optional[int]] = {
+        "get_column_value_counts": 32,
+        "get_column_modes": 32,
+        "get_column_quantiles": 128,
+    }
+    default_getter_cache_maxsize: Optional[int] = 1024
+    # Maximum (estimated) memory, in bytes, of all cached getter results of a dataset (None: no maximum).
+    default_getter_cache_max_bytes: Optional[int] = 256 * 1024 * 1024
+
     def __init__(self, *args, **kwargs):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
-        # (e.g. self.spark_df) over the lifetime of the dataset instance
+        # (e.g. self.spark_df) over the lifetime of the dataset instance; call clear_cache() after modifying it
         self.caching = kwargs.pop("caching", True)
+        getter_cache_maxsizes: Dict[str, Optional[int]] = {
+            **self.getter_cache_maxsizes,
+            **(kwargs.pop("cache_maxsizes", None) or {}),
+        }
+        cache_max_bytes: Optional[int] = kwargs.pop(
+            "cache_max_bytes", self.default_getter_cache_max_bytes
+        )
+        # Set on the instance itself, so that pandas neither copies the cache to frames derived from a PandasDataset
+        # nor pickles it.
+        object.__setattr__(self, "_getter_cache", None)
 
         super().__init__(*args, **kwargs)
 
         if self.caching:
+            object.__setattr__(
+                self, "_getter_cache", GetterCache(max_bytes=cache_max_bytes)
+            )
             for func in self.hashable_getters:
-                caching_func = lru_cache(maxsize=None)(getattr(self, func))
+                caching_func = self._getter_cache.wrap(
+                    getter_name=func,
+                    getter=getattr(self, func),
+                    maxsize=getter_cache_maxsizes.get(
+                        func, self.default_getter_cache_maxsize
+                    ),
+                )
                 setattr(self, func, caching_func)
 
+    def get_cache_info(self) -> Dict[str, CacheInfo]:
+        """Returns: Dict[str, CacheInfo], the hits, misses, maximum and current number of cached results, by getter
+        (empty, if caching is disabled)"""
+        if self._getter_cache is None:
+            return {}
+
+        return {
+            func: self._getter_cache.cache_info(func) for func in self.hashable_getters
+        }
+
+    def clear_cache(self) -> None:
+        """Discard all cached getter results, which must be done whenever the underlying data is modified."""
+        if self._getter_cache is not None:
+            self._getter_cache.clear()
+
     @classmethod
     def from_dataset(cls, dataset=None):
         """This base implementation naively passes arguments on to the real constructor, which
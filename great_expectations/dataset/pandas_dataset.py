@@ -5,7 +5,7 @@ import warnings
 from datetime import datetime
 from functools import wraps
 from operator import ge, gt, le, lt
-from typing import List
+from typing import List, Optional, Tuple
 
 import jsonschema
 import numpy as np
@@ -71,21 +71,9 @@ class MetaPandasDataset(Dataset):
 
             result_format = parse_result_format(result_format)
 
-            if row_condition and self._supports_row_condition:
-                data = self._apply_row_condition(
-                    row_condition=row_condition, condition_parser=condition_parser
-                )
-            else:
-                data = self
-
-            series = data[column]
-
-            func_args = inspect.getfullargspec(func)[0][1:]
-            if (
-                "parse_strings_as_datetimes" in func_args
-                and pd.api.types.is_datetime64_any_dtype(series)
-            ):
-                kwargs["parse_strings_as_datetimes"] = True
+            if not (row_condition and self._supports_row_condition):
+                row_condition = None
+                condition_parser = None
 
             if func.__name__ in [
                 "expect_column_values_to_not_be_null",
@@ -97,25 +85,50 @@ class MetaPandasDataset(Dataset):
                 # Since there is no reason to look for most common unexpected values in this case,
                 # we will instruct the result formatting method to skip this step.
                 # FIXME rename to mapped_ignore_values?
-                boolean_mapped_null_values = np.full(series.shape, False)
+                ignore_null_values = False
                 result_format["partial_unexpected_count"] = 0
             else:
-                boolean_mapped_null_values = series.isnull().values
-
-            element_count = int(len(series))
+                ignore_null_values = True
 
             # FIXME rename nonnull to non_ignored?
-            nonnull_values = series[boolean_mapped_null_values == False]
-            nonnull_count = int((boolean_mapped_null_values == False).sum())
+            series, nonnull_values, nonnull_count = self._get_column_map_values(
+                column=column,
+                row_condition=row_condition,
+                condition_parser=condition_parser,
+                ignore_null_values=ignore_null_values,
+            )
+
+            func_args = inspect.getfullargspec(func)[0][1:]
+            if (
+                "parse_strings_as_datetimes" in func_args
+                and pd.api.types.is_datetime64_any_dtype(series)
+            ):
+                kwargs["parse_strings_as_datetimes"] = True
+
+            element_count = int(len(series))
 
             boolean_mapped_success_values = func(self, nonnull_values, *args, **kwargs)
             success_count = np.count_nonzero(boolean_mapped_success_values)
 
-            unexpected_list = list(
-                nonnull_values[boolean_mapped_success_values == False]
-            )
+            unexpected_values = nonnull_values[boolean_mapped_success_values == False]
+            unexpected_count = int(len(unexpected_values))
+
+            # Unexpected values (and their indexes) are only listed as far as the result format reports them; all of
+            # them are listed for COMPLETE, and for SUMMARY, whose partial_unexpected_counts count all of them.
+            unexpected_list_limit = None
+            unexpected_index_list_limit = None
+            if result_format["result_format"] == "BOOLEAN_ONLY":
+                unexpected_list_limit = 0
+                unexpected_index_list_limit = 0
+            elif result_format["result_format"] == "BASIC":
+                unexpected_list_limit = result_format["partial_unexpected_count"]
+                unexpected_index_list_limit = 0
+            elif result_format["result_format"] == "SUMMARY":
+                unexpected_index_list_limit = result_format["partial_unexpected_count"]
+
+            unexpected_list = list(unexpected_values.iloc[:unexpected_list_limit])
             unexpected_index_list = list(
-                nonnull_values[boolean_mapped_success_values == False].index
+                unexpected_values.index[:unexpected_index_list_limit]
             )
 
             if "output_strftime_format" in kwargs:
@@ -141,7 +154,7 @@ class MetaPandasDataset(Dataset):
                 success,
                 element_count,
                 nonnull_count,
-                len(unexpected_list),
+                unexpected_count,
                 unexpected_list,
                 unexpected_index_list,
             )
@@ -400,6 +413,8 @@ Notes:
         "_expectation_suite",
         "_config",
         "caching",
+        "_getter_cache",
+        "_column_map_cache",
         "default_expectation_args",
         "discard_subset_failing_expectations",
     ]
@@ -414,11 +429,28 @@ Notes:
         self.discard_subset_failing_expectations = kwargs.get(
             "discard_subset_failing_expectations", False
         )
+        # Filtered rows and columns shared by the column map expectations of a validation (see _prepare_validation).
+        # Set on the instance itself, so that frames derived during validation do not share it.
+        object.__setattr__(self, "_column_map_cache", None)
 
     @property
     def _constructor(self):
         return self.__class__
 
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.clear_cache()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.clear_cache()
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # The getter cache is not pickled; an unpickled dataset does not cache getter results.
+        object.__setattr__(self, "_getter_cache", None)
+        object.__setattr__(self, "_column_map_cache", None)
+
     def __finalize__(self, other, method=None, **kwargs):
         if isinstance(other, PandasDataset):
             self._initialize_expectations(other._expectation_suite)
@@ -443,6 +475,61 @@ Notes:
         else:
             return self.query(row_condition, parser=condition_parser)
 
+    def _prepare_validation(
+        self,
+        expectations: List[ExpectationConfiguration],
+        evaluation_parameters: dict,
+    ) -> None:
+        """While validating, the expectations share the rows matching a row condition, and the (non-null) values of a
+        column, which column map expectations would otherwise copy one by one."""
+        object.__setattr__(self, "_column_map_cache", {})
+
+    def _finish_validation(self) -> None:
+        object.__setattr__(self, "_column_map_cache", None)
+
+    def _get_column_map_values(
+        self,
+        column: str,
+        row_condition: Optional[str],
+        condition_parser: Optional[str],
+        ignore_null_values: bool,
+    ) -> Tuple[pd.Series, pd.Series, int]:
+        """Return the values of a column (restricted to the rows matching the row condition, if any), its values that
+        are not ignored (null), and their count.  During validation, the results are cached."""
+        cache: Optional[dict] = self._column_map_cache
+        key: tuple = (column, row_condition, condition_parser, ignore_null_values)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        data: pd.DataFrame
+        if row_condition is None:
+            data = self
+        elif cache is not None and (row_condition, condition_parser) in cache:
+            data = cache[(row_condition, condition_parser)]
+        else:
+            data = self._apply_row_condition(
+                row_condition=row_condition, condition_parser=condition_parser
+            )
+            if cache is not None:
+                cache[(row_condition, condition_parser)] = data
+
+        series: pd.Series = data[column]
+        nonnull_values: pd.Series = series
+        if ignore_null_values:
+            boolean_mapped_null_values: np.ndarray = series.isnull().values
+            if boolean_mapped_null_values.any():
+                nonnull_values = series[~boolean_mapped_null_values]
+
+        column_map_values: Tuple[pd.Series, pd.Series, int] = (
+            series,
+            nonnull_values,
+            int(len(nonnull_values)),
+        )
+        if cache is not None:
+            cache[key] = column_map_values
+
+        return column_map_values
+
     def get_row_count(self):
         return self.shape[0]
 
@@ -1,16 +1,19 @@
 import inspect
 import itertools
+import json
 import logging
 import traceback
 import warnings
 from datetime import datetime
 from functools import wraps
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
 from dateutil.parser import parse
 
+from great_expectations.core.evaluation_parameters import build_evaluation_parameters
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.util import (
     convert_to_json_serializable,
     get_sql_dialect_floating_point_infinity_value,
@@ -38,7 +41,13 @@ try:
     from sqlalchemy.engine import reflection
     from sqlalchemy.engine.default import DefaultDialect
     from sqlalchemy.exc import DatabaseError, ProgrammingError
-    from sqlalchemy.sql.elements import Label, TextClause, WithinGroup, quoted_name
+    from sqlalchemy.sql.elements import (
+        ColumnElement,
+        Label,
+        TextClause,
+        WithinGroup,
+        quoted_name,
+    )
     from sqlalchemy.sql.expression import BinaryExpression, literal
     from sqlalchemy.sql.operators import custom_op
     from sqlalchemy.sql.selectable import CTE, Select
@@ -54,6 +63,7 @@ except ImportError:
     Select = None
     CTE = None
     custom_op = None
+    ColumnElement = None
     Label = None
     WithinGroup = None
     TextClause = None
@@ -170,6 +180,33 @@ try:
 except ImportError:
     teradatasqlalchemy = None
 
+# Column aggregates (see SqlAlchemyDataset._get_column_aggregate_expression), which deferred evaluation computes ahead of
+# time for column aggregate expectations, by expectation type.
+DEFERRED_COLUMN_AGGREGATES_BY_EXPECTATION_TYPE: Dict[str, Tuple[str, ...]] = {
+    "expect_column_max_to_be_between": ("max", "null_count"),
+    "expect_column_mean_to_be_between": ("mean", "null_count"),
+    "expect_column_min_to_be_between": ("min", "null_count"),
+    "expect_column_proportion_of_unique_values_to_be_between": (
+        "unique_count",
+        "null_count",
+    ),
+    "expect_column_sum_to_be_between": ("sum", "null_count"),
+    "expect_column_unique_value_count_to_be_between": ("unique_count", "null_count"),
+}
+
+# Maximum number of aggregates computed by a single bundled query (wider queries are split).
+DEFERRED_EVALUATION_MAX_AGGREGATES_PER_QUERY: int = 500
+
+
+def _get_deferred_evaluation_key(
+    expectation_type: str, column: str, args: tuple, kwargs: dict
+) -> str:
+    return json.dumps(
+        [expectation_type, str(column), list(args), kwargs],
+        sort_keys=True,
+        default=repr,
+    )
+
 
 class SqlAlchemyBatchReference:
     def __init__(self, engine, table_name=None, schema=None, query=None):
@@ -234,7 +271,21 @@ class MetaSqlAlchemyDataset(Dataset):
             else:
                 unexpected_count_limit = result_format["partial_unexpected_count"]
 
-            expected_condition: BinaryExpression = func(self, column, *args, **kwargs)
+            # During deferred evaluation, conditions are built once: while validate() collects them (so that their
+            # counts are bundled into a single query), and reused while the expectations are evaluated.
+            deferred_evaluation_key: Optional[str] = None
+            if self._deferred_expected_conditions is not None:
+                deferred_evaluation_key = _get_deferred_evaluation_key(
+                    func.__name__, column, args, kwargs
+                )
+
+            expected_condition: BinaryExpression
+            if deferred_evaluation_key in (self._deferred_expected_conditions or {}):
+                expected_condition = self._deferred_expected_conditions[
+                    deferred_evaluation_key
+                ]
+            else:
+                expected_condition = func(self, column, *args, **kwargs)
 
             # Added to prepare for when an ignore_values argument is added to the expectation
             ignore_values: list = [None]
@@ -275,19 +326,37 @@ class MetaSqlAlchemyDataset(Dataset):
                     sa.literal(False), sa.literal(True), custom_op("=")
                 )
 
-            count_query: Select
-            if self.sql_engine_dialect.name.lower() == "mssql":
-                count_query = self._get_count_query_mssql(
-                    expected_condition=expected_condition,
-                    ignore_values_condition=ignore_values_condition,
-                )
-            else:
-                count_query = self._get_count_query_generic_sqlalchemy(
+            if self._collecting_deferred_conditions:
+                self._deferred_expected_conditions[
+                    deferred_evaluation_key
+                ] = expected_condition
+                self._deferred_count_expressions[
+                    deferred_evaluation_key
+                ] = self._get_count_expressions(
                     expected_condition=expected_condition,
                     ignore_values_condition=ignore_values_condition,
                 )
+                return {"success": None}
+
+            count_results: Optional[dict] = self._deferred_count_results.get(
+                deferred_evaluation_key
+            )
+            if count_results is None:
+                count_query: Select
+                if self.sql_engine_dialect.name.lower() == "mssql":
+                    count_query = self._get_count_query_mssql(
+                        expected_condition=expected_condition,
+                        ignore_values_condition=ignore_values_condition,
+                    )
+                else:
+                    count_query = self._get_count_query_generic_sqlalchemy(
+                        expected_condition=expected_condition,
+                        ignore_values_condition=ignore_values_condition,
+                    )
 
-            count_results: dict = dict(self.engine.execute(count_query).fetchone())
+                count_results = dict(self.engine.execute(count_query).fetchone())
+            else:
+                count_results = dict(count_results)
 
             # Handle case of empty table gracefully:
             if (
@@ -309,8 +378,15 @@ class MetaSqlAlchemyDataset(Dataset):
             count_results["null_count"] = int(count_results["null_count"])
             count_results["unexpected_count"] = int(count_results["unexpected_count"])
 
+            # Unexpected values are only queried, if there are any (and if they are reported).
+            unexpected_query_results: Optional[list] = None
+            if (
+                count_results["unexpected_count"] == 0
+                or result_format["result_format"] == "BOOLEAN_ONLY"
+            ):
+                unexpected_query_results = []
             # limit doesn't compile properly for oracle so we will append rownum to query string later
-            if self.engine.dialect.name.lower() == "oracle":
+            elif self.engine.dialect.name.lower() == "oracle":
                 raw_query = (
                     sa.select([sa.column(column)])
                     .select_from(self._table)
@@ -339,7 +415,8 @@ class MetaSqlAlchemyDataset(Dataset):
                     )
                     .limit(unexpected_count_limit)
                 )
-            unexpected_query_results = self.engine.execute(query)
+            if unexpected_query_results is None:
+                unexpected_query_results = self.engine.execute(query).fetchall()
 
             nonnull_count: int = (
                 count_results["element_count"] - count_results["null_count"]
@@ -348,7 +425,7 @@ class MetaSqlAlchemyDataset(Dataset):
             if "output_strftime_format" in kwargs:
                 output_strftime_format = kwargs["output_strftime_format"]
                 maybe_limited_unexpected_list = []
-                for x in unexpected_query_results.fetchall():
+                for x in unexpected_query_results:
                     if isinstance(x[column], str):
                         col = parse(x[column])
                     else:
@@ -358,7 +435,7 @@ class MetaSqlAlchemyDataset(Dataset):
                     )
             else:
                 maybe_limited_unexpected_list = [
-                    x[column] for x in unexpected_query_results.fetchall()
+                    x[column] for x in unexpected_query_results
                 ]
 
             success_count = nonnull_count - count_results["unexpected_count"]
@@ -394,6 +471,7 @@ class MetaSqlAlchemyDataset(Dataset):
 
         inner_wrapper.__name__ = func.__name__
         inner_wrapper.__doc__ = func.__doc__
+        inner_wrapper.is_column_map_expectation = True
 
         return inner_wrapper
 
@@ -473,29 +551,43 @@ class MetaSqlAlchemyDataset(Dataset):
         expected_condition: BinaryExpression,
         ignore_values_condition: BinaryExpression,
     ) -> Select:
+        null_count, unexpected_count = self._get_count_expressions(
+            expected_condition=expected_condition,
+            ignore_values_condition=ignore_values_condition,
+        )
         return sa.select(
             [
                 sa.func.count().label("element_count"),
-                sa.func.sum(sa.case([(ignore_values_condition, 1)], else_=0)).label(
-                    "null_count"
-                ),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    sa.not_(expected_condition),
-                                    sa.not_(ignore_values_condition),
-                                ),
-                                1,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("unexpected_count"),
+                null_count.label("null_count"),
+                unexpected_count.label("unexpected_count"),
             ]
         ).select_from(self._table)
 
+    @staticmethod
+    def _get_count_expressions(
+        expected_condition: BinaryExpression,
+        ignore_values_condition: BinaryExpression,
+    ) -> Tuple[ColumnElement, ColumnElement]:
+        """Return the aggregates counting the ignored (null) values and the unexpected values of a column map
+        expectation."""
+        return (
+            sa.func.sum(sa.case([(ignore_values_condition, 1)], else_=0)),
+            sa.func.sum(
+                sa.case(
+                    [
+                        (
+                            sa.and_(
+                                sa.not_(expected_condition),
+                                sa.not_(ignore_values_condition),
+                            ),
+                            1,
+                        )
+                    ],
+                    else_=0,
+                )
+            ),
+        )
+
 
 class SqlAlchemyDataset(MetaSqlAlchemyDataset):
     """
@@ -537,6 +629,18 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         *args,
         **kwargs,
     ):
+        # If deferred evaluation is enabled, validate() computes the counts of all column map expectations and the
+        # aggregates of supported column aggregate expectations of the suite in a single (bundled) query, before the
+        # expectations are evaluated; unexpected values are then only queried for expectations with unexpected values.
+        self._deferred_evaluation: bool = kwargs.pop("deferred_evaluation", False)
+        self._collecting_deferred_conditions: bool = False
+        self._deferred_expected_conditions: Optional[Dict[str, BinaryExpression]] = None
+        self._deferred_count_expressions: Dict[
+            str, Tuple[ColumnElement, ColumnElement]
+        ] = {}
+        self._deferred_count_results: Dict[str, dict] = {}
+        self._deferred_aggregate_results: Dict[Tuple[str, Optional[str]], Any] = {}
+
         if custom_sql and not table_name:
             # NOTE: Eugene 2020-01-31: @James, this is a not a proper fix, but without it the "public" schema
             # was used for a temp table and raising an error
@@ -742,8 +846,170 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
             ),
         )
 
+    def _prepare_validation(
+        self,
+        expectations: List[ExpectationConfiguration],
+        evaluation_parameters: dict,
+    ) -> None:
+        """With deferred evaluation, collect the conditions of all column map expectations (without running any query),
+        and compute their counts, together with the aggregates of supported column aggregate expectations, in a single
+        bundled query."""
+        # The counts of MSSQL are computed through a temporary table per expectation, and so are not bundled.
+        if not self._deferred_evaluation or self.engine.dialect.name.lower() == "mssql":
+            return
+
+        self._deferred_expected_conditions = {}
+        self._deferred_count_expressions = {}
+        column_aggregates: Set[Tuple[str, str]] = set()
+
+        self._collecting_deferred_conditions = True
+        try:
+            expectation: ExpectationConfiguration
+            for expectation in expectations:
+                expectation_method = getattr(self, expectation.expectation_type, None)
+                if expectation_method is None:
+                    continue
+
+                try:
+                    evaluation_args, _ = build_evaluation_parameters(
+                        expectation.kwargs,
+                        evaluation_parameters,
+                        self._config.get("interactive_evaluation", True),
+                        self._data_context,
+                    )
+                    if getattr(expectation_method, "is_column_map_expectation", False):
+                        # Only collects the condition (see MetaSqlAlchemyDataset.column_map_expectation).
+                        expectation_method(
+                            catch_exceptions=True,
+                            include_config=False,
+                            **evaluation_args,
+                        )
+                except Exception:
+                    # The error is reported when the expectation is evaluated.
+                    continue
+
+                column_aggregates.update(
+                    self._get_deferred_column_aggregates(
+                        expectation_type=expectation.expectation_type,
+                        evaluation_args=evaluation_args,
+                    )
+                )
+        finally:
+            self._collecting_deferred_conditions = False
+
+        try:
+            self._compute_deferred_aggregates(column_aggregates=column_aggregates)
+        except Exception as e:
+            # Every expectation then runs its own queries (and reports its own errors).
+            logger.warning(
+                f"Unable to compute the bundled counts of the expectations, which are evaluated one by one: {str(e)}"
+            )
+            self._deferred_count_results = {}
+            self._deferred_aggregate_results = {}
+
+    def _finish_validation(self) -> None:
+        self._deferred_expected_conditions = None
+        self._deferred_count_expressions = {}
+        self._deferred_count_results = {}
+        self._deferred_aggregate_results = {}
+
+    def _get_deferred_column_aggregates(
+        self, expectation_type: str, evaluation_args: dict
+    ) -> List[Tuple[str, str]]:
+        column: Optional[str] = evaluation_args.get("column")
+        if not isinstance(column, str) or evaluation_args.get(
+            "parse_strings_as_datetimes"
+        ):
+            return []
+
+        return [
+            (aggregate, column)
+            for aggregate in DEFERRED_COLUMN_AGGREGATES_BY_EXPECTATION_TYPE.get(
+                expectation_type, ()
+            )
+        ]
+
+    def _compute_deferred_aggregates(
+        self, column_aggregates: Set[Tuple[str, str]]
+    ) -> None:
+        """Compute the row count, the counts of the collected column map expectations, and the column aggregates, in as
+        few queries as possible (see DEFERRED_EVALUATION_MAX_AGGREGATES_PER_QUERY)."""
+        use_quoted_name: bool = bool(self.batch_kwargs.get("use_quoted_name"))
+
+        # Every aggregate is labeled by its position, and mapped to the result (and the name of its value) it sets.
+        aggregate_targets: List[Tuple[dict, Any]] = []
+        aggregates: List[ColumnElement] = []
+
+        deferred_evaluation_key: str
+        null_count: ColumnElement
+        unexpected_count: ColumnElement
+        for deferred_evaluation_key, (
+            null_count,
+            unexpected_count,
+        ) in self._deferred_count_expressions.items():
+            count_results: dict = {}
+            self._deferred_count_results[deferred_evaluation_key] = count_results
+            aggregate_targets.extend(
+                [(count_results, "null_count"), (count_results, "unexpected_count")]
+            )
+            aggregates.extend([null_count, unexpected_count])
+
+        aggregate: str
+        column: str
+        for aggregate, column in sorted(column_aggregates):
+            aggregate_targets.append(
+                (self._deferred_aggregate_results, (aggregate, column))
+            )
+            aggregates.append(
+                self._get_column_aggregate_expression(
+                    aggregate,
+                    quoted_name(column, quote=True) if use_quoted_name else column,
+                )
+            )
+
+        if not aggregates:
+            return
+
+        element_count: int = 0
+        for start in range(
+            0, len(aggregates), DEFERRED_EVALUATION_MAX_AGGREGATES_PER_QUERY
+        ):
+            end: int = start + DEFERRED_EVALUATION_MAX_AGGREGATES_PER_QUERY
+            row = self.engine.execute(
+                sa.select(
+                    [sa.func.count().label("element_count")]
+                    + [
+                        aggregate_expression.label(f"aggregate_{idx}")
+                        for idx, aggregate_expression in enumerate(
+                            aggregates[start:end], start
+                        )
+                    ]
+                ).select_from(self._table)
+            ).fetchone()
+            element_count = int(row[0] or 0)
+            idx: int
+            value: Any
+            for idx, value in enumerate(row[1:], start):
+                target, name = aggregate_targets[idx]
+                target[name] = value
+
+        for count_results in self._deferred_count_results.values():
+            count_results["element_count"] = element_count
+
+        for aggregate, column in column_aggregates:
+            if aggregate != "null_count":
+                self._deferred_aggregate_results[
+                    (aggregate, column)
+                ] = convert_to_json_serializable(
+                    self._deferred_aggregate_results[(aggregate, column)]
+                )
+        self._deferred_aggregate_results[("row_count", None)] = element_count
+
     def get_row_count(self, table_name=None):
         if table_name is None:
+            if ("row_count", None) in self._deferred_aggregate_results:
+                return self._deferred_aggregate_results[("row_count", None)]
+
             table_name = self._table
         else:
             table_name = sa.table(table_name)
@@ -757,63 +1023,89 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return [col["name"] for col in self.columns]
 
     def get_column_nonnull_count(self, column):
-        ignore_values = [None]
-        count_query = sa.select(
-            [
-                sa.func.count().label("element_count"),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.or_(
-                                    # first part of OR(IN (NULL)) gives error in teradata
-                                    sa.column(column).in_(ignore_values)
-                                    if self.engine.dialect.name.lower() != "teradatasql"
-                                    else False,
-                                    # Below is necessary b/c sa.in_() uses `==` but None != None
-                                    # But we only consider this if None is actually in the list of ignore values
-                                    sa.column(column).is_(None)
-                                    if None in ignore_values
-                                    else False,
-                                ),
-                                1,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("null_count"),
-            ]
-        ).select_from(self._table)
-        count_results = dict(self.engine.execute(count_query).fetchone())
+        count_results: dict
+        if ("null_count", column) in self._deferred_aggregate_results:
+            count_results = {
+                "element_count": self.get_row_count(),
+                "null_count": self._deferred_aggregate_results[("null_count", column)],
+            }
+        else:
+            count_query = sa.select(
+                [
+                    sa.func.count().label("element_count"),
+                    self._get_column_aggregate_expression("null_count", column).label(
+                        "null_count"
+                    ),
+                ]
+            ).select_from(self._table)
+            count_results = dict(self.engine.execute(count_query).fetchone())
         element_count = int(count_results.get("element_count") or 0)
         null_count = int(count_results.get("null_count") or 0)
         return element_count - null_count
 
     def get_column_sum(self, column):
-        return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select([sa.func.sum(sa.column(column))]).select_from(self._table)
-            ).scalar()
-        )
+        return self._get_column_aggregate("sum", column)
 
     def get_column_max(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
-        return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select([sa.func.max(sa.column(column))]).select_from(self._table)
-            ).scalar()
-        )
+        return self._get_column_aggregate("max", column)
 
     def get_column_min(self, column, parse_strings_as_datetimes=False):
         if parse_strings_as_datetimes:
             raise NotImplementedError
+        return self._get_column_aggregate("min", column)
+
+    def _get_column_aggregate(self, aggregate: str, column) -> Any:
+        if (aggregate, column) in self._deferred_aggregate_results:
+            return self._deferred_aggregate_results[(aggregate, column)]
+
         return convert_to_json_serializable(
             self.engine.execute(
-                sa.select([sa.func.min(sa.column(column))]).select_from(self._table)
+                sa.select(
+                    [self._get_column_aggregate_expression(aggregate, column)]
+                ).select_from(self._table)
             ).scalar()
         )
 
+    def _get_column_aggregate_expression(self, aggregate: str, column) -> ColumnElement:
+        if aggregate == "null_count":
+            ignore_values = [None]
+            return sa.func.sum(
+                sa.case(
+                    [
+                        (
+                            sa.or_(
+                                # first part of OR(IN (NULL)) gives error in teradata
+                                sa.column(column).in_(ignore_values)
+                                if self.engine.dialect.name.lower() != "teradatasql"
+                                else False,
+                                # Below is necessary b/c sa.in_() uses `==` but None != None
+                                # But we only consider this if None is actually in the list of ignore values
+                                sa.column(column).is_(None)
+                                if None in ignore_values
+                                else False,
+                            ),
+                            1,
+                        )
+                    ],
+                    else_=0,
+                )
+            )
+        elif aggregate == "sum":
+            return sa.func.sum(sa.column(column))
+        elif aggregate == "max":
+            return sa.func.max(sa.column(column))
+        elif aggregate == "min":
+            return sa.func.min(sa.column(column))
+        elif aggregate == "mean":
+            # column * 1.0 needed for correct calculation of avg in MSSQL
+            return sa.func.avg(sa.column(column) * 1.0)
+        elif aggregate == "unique_count":
+            return sa.func.count(sa.func.distinct(sa.column(column)))
+
+        raise ValueError(f'Unknown column aggregate "{aggregate}".')
+
     def get_column_value_counts(self, column, sort="value", collate=None):
         if sort not in ["value", "count", "none"]:
             raise ValueError("sort must be either 'value', 'count', or 'none'")
@@ -848,23 +1140,10 @@ class SqlAlchemyDataset(MetaSqlAlchemyDataset):
         return series
 
     def get_column_mean(self, column):
-        # column * 1.0 needed for correct calculation of avg in MSSQL
-        return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select([sa.func.avg(sa.column(column) * 1.0)]).select_from(
-                    self._table
-                )
-            ).scalar()
-        )
+        return self._get_column_aggregate("mean", column)
 
     def get_column_unique_count(self, column):
-        return convert_to_json_serializable(
-            self.engine.execute(
-                sa.select(
-                    [sa.func.count(sa.func.distinct(sa.column(column)))]
-                ).select_from(self._table)
-            ).scalar()
-        )
+        return self._get_column_aggregate("unique_count", column)
 
     def get_column_median(self, column):
         # AWS Athena and presto have an special function that can be used to retrieve the median
@@ -1,8 +1,12 @@
 # Utility methods for dealing with Dataset objects
 
 import logging
+import sys
+import threading
 import warnings
-from typing import Any, List
+from collections import OrderedDict, defaultdict, namedtuple
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -600,3 +604,135 @@ def check_sql_engine_dialect(
         return isinstance(actual_sql_engine_dialect, candidate_sql_engine_dialect)
     except (AttributeError, TypeError):
         return False
+
+
+# The statistics of a cached getter, with the fields of the statistics of functools.lru_cache.
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def estimate_cached_value_size(value: Any) -> int:
+    """Estimate the memory (in bytes) held by a value, including the values it contains."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_cached_value_size(key) + estimate_cached_value_size(item)
+            for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(
+            estimate_cached_value_size(item) for item in value
+        )
+    return sys.getsizeof(value)
+
+
+class GetterCache:
+    """A least recently used cache of the results of the getters of a dataset (see Dataset.hashable_getters).
+
+    The cache is bounded both by the number of results of each getter, and by the (estimated) memory of all results,
+    so that the results of large getters (e.g., value counts of high cardinality columns) do not accumulate over the
+    lifetime of the dataset.  A result larger than the memory bound is not cached.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self._max_bytes = max_bytes
+        self._lock = threading.RLock()
+        # Results (and their estimated sizes) by (getter name, args, kwargs), from least to most recently used.
+        self._entries: "OrderedDict[tuple, Tuple[Any, int]]" = OrderedDict()
+        self._nbytes = 0
+        self._maxsizes: Dict[str, Optional[int]] = {}
+        self._currsizes: Dict[str, int] = defaultdict(int)
+        self._hits: Dict[str, int] = defaultdict(int)
+        self._misses: Dict[str, int] = defaultdict(int)
+
+    @property
+    def nbytes(self) -> int:
+        """The estimated memory (in bytes) of all cached results."""
+        return self._nbytes
+
+    def wrap(
+        self, getter_name: str, getter: Callable, maxsize: Optional[int] = None
+    ) -> Callable:
+        """Return the getter, caching at most maxsize of its results (or any number of them, if maxsize is None).
+
+        Like functools.lru_cache, the returned function has cache_info() and cache_clear() methods.
+        """
+        self._maxsizes[getter_name] = maxsize
+
+        @wraps(getter)
+        def caching_getter(*args, **kwargs):
+            key: tuple = (getter_name, args, tuple(sorted(kwargs.items())))
+            with self._lock:
+                entry: Optional[Tuple[Any, int]] = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self._hits[getter_name] += 1
+                    return entry[0]
+
+                self._misses[getter_name] += 1
+
+            value: Any = getter(*args, **kwargs)
+            self._put(key=key, value=value)
+            return value
+
+        caching_getter.cache_info = lambda: self.cache_info(getter_name)
+        caching_getter.cache_clear = lambda: self.clear(getter_name)
+
+        return caching_getter
+
+    def _put(self, key: tuple, value: Any) -> None:
+        getter_name: str = key[0]
+        maxsize: Optional[int] = self._maxsizes[getter_name]
+        if maxsize is not None and maxsize <= 0:
+            return
+
+        nbytes: int = estimate_cached_value_size(value)
+        if self._max_bytes is not None and nbytes > self._max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._evict(key)
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+            self._currsizes[getter_name] += 1
+
+            if maxsize is not None and self._currsizes[getter_name] > maxsize:
+                self._evict(
+                    next(
+                        entry_key
+                        for entry_key in self._entries
+                        if entry_key[0] == getter_name
+                    )
+                )
+
+            while self._max_bytes is not None and self._nbytes > self._max_bytes:
+                self._evict(next(iter(self._entries)))
+
+    def _evict(self, key: tuple) -> None:
+        _, nbytes = self._entries.pop(key)
+        self._nbytes -= nbytes
+        self._currsizes[key[0]] -= 1
+
+    def cache_info(self, getter_name: str) -> CacheInfo:
+        return CacheInfo(
+            hits=self._hits[getter_name],
+            misses=self._misses[getter_name],
+            maxsize=self._maxsizes.get(getter_name),
+            currsize=self._currsizes[getter_name],
+        )
+
+    def clear(self, getter_name: Optional[str] = None) -> None:
+        """Remove the cached results of a getter (or of all getters, if getter_name is None).  The hit and miss counts
+        are kept."""
+        with self._lock:
+            for key in [
+                key
+                for key in self._entries
+                if getter_name is None or key[0] == getter_name
+            ]:
+                self._evict(key)
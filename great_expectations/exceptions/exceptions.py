@@ -169,6 +169,13 @@ class InvalidExpectationConfigurationError(GreatExpectationsError):
     pass
 
 
+class InconclusiveSampledValidationError(GreatExpectationsError):
+    """Raised when the result of validating an Expectation on a sample of data cannot be decided with the requested
+    confidence, so that the Expectation must be validated on entire data."""
+
+    pass
+
+
 class InvalidValidationResultError(GreatExpectationsError):
     pass
 
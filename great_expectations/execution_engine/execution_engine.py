@@ -3,7 +3,7 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -261,6 +261,11 @@ class ExecutionEngine(ABC):
     def dialect(self):
         return None
 
+    @property
+    def supports_sampling(self) -> bool:
+        """Whether or not metrics can be computed on samples of domains (see "sample_fraction" domain kwargs)."""
+        return True
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -318,6 +323,9 @@ class ExecutionEngine(ABC):
         resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
 
         metric_fn_bundle = []
+        metric_value_bundles: Dict[
+            Callable, List[Tuple[MetricConfiguration, dict]]
+        ] = {}
         for metric_to_resolve in metrics_to_resolve:
             metric_dependencies = {}
             for k, v in metric_to_resolve.metric_dependencies.items():
@@ -387,6 +395,14 @@ class ExecutionEngine(ABC):
                 MetricPartialFunctionTypes.MAP_SERIES,
                 MetricPartialFunctionTypes.MAP_CONDITION_SERIES,
             ]:
+                metric_value_bundle_fn: Optional[Callable] = getattr(
+                    metric_fn, "metric_value_bundle_fn", None
+                )
+                if metric_value_bundle_fn is not None:
+                    metric_value_bundles.setdefault(metric_value_bundle_fn, []).append(
+                        (metric_to_resolve, metric_provider_kwargs)
+                    )
+                    continue
                 try:
                     resolved_metrics[metric_to_resolve.id] = metric_fn(
                         **metric_provider_kwargs
@@ -407,6 +423,17 @@ class ExecutionEngine(ABC):
                     raise ge_exceptions.MetricResolutionError(
                         message=str(e), failed_metrics=(metric_to_resolve,)
                     )
+        for metric_value_bundle_fn, metric_value_bundle in metric_value_bundles.items():
+            try:
+                resolved_metrics.update(
+                    metric_value_bundle_fn(
+                        execution_engine=self, metric_value_bundle=metric_value_bundle
+                    )
+                )
+            except Exception as e:
+                raise ge_exceptions.MetricResolutionError(
+                    message=str(e), failed_metrics=[x[0] for x in metric_value_bundle]
+                )
         if len(metric_fn_bundle) > 0:
             try:
                 new_resolved = self.resolve_metric_bundle(metric_fn_bundle)
@@ -424,6 +451,11 @@ class ExecutionEngine(ABC):
         """Resolve a bundle of metrics with the same compute domain as part of a single trip to the compute engine."""
         raise NotImplementedError
 
+    def release_samples(self) -> None:
+        """Release resources (e.g., temporary tables) held for samples of batches ("sample_fraction" domain kwarg),
+        once the validations using them are done.  Engines, which do not materialize samples, hold none."""
+        pass
+
     def get_domain_records(
         self,
         domain_kwargs: dict,
@@ -612,6 +644,8 @@ class ExecutionEngine(ABC):
                     "table",
                     "row_condition",
                     "condition_parser",
+                    "sample_fraction",
+                    "sample_seed",
                 }
             )
             if len(unexpected_keys) > 0:
@@ -1,6 +1,8 @@
 import datetime
 import hashlib
+import json
 import logging
+import os
 import pickle
 import random
 import warnings
@@ -8,6 +10,7 @@ from functools import partial
 from io import BytesIO
 from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as ge_exceptions
@@ -62,6 +65,20 @@ except ImportError:
 
 HASH_THRESHOLD = 1e9
 
+# Methods of computing the "pandas_data_fingerprint" batch marker (see PandasExecutionEngine._get_data_fingerprint):
+#   "full": hash of the whole DataFrame (pickled, if it is not hashable by pandas);
+#   "incremental": hash of the whole DataFrame, computed one column at a time;
+#   "sampled": hash of the schema, the length, and evenly spaced blocks of rows of the DataFrame;
+#   "file": hash of the identity (path, size, and modification time or ETag) of the file the DataFrame is read from,
+#       and of the reading, splitting, and sampling directives (otherwise, as "sampled").
+# The method used (if other than "full") is recorded in the "pandas_data_fingerprint_method" batch marker, since only
+# "full" and "incremental" fingerprints change with every change of the data.
+DATA_FINGERPRINT_METHODS = ("full", "incremental", "sampled", "file")
+
+# The hash_function_name of hash based splitting and sampling, which buckets rows by pandas.util.hash_pandas_object (which
+# is vectorized), rather than by a hashlib digest of their string values (which is compatible with SQL "md5" splitting).
+PANDAS_HASH_FUNCTION_NAME = "pandas"
+
 
 class PandasExecutionEngine(ExecutionEngine):
     """
@@ -116,6 +133,13 @@ Notes:
         self._azure = None
         self._gcs = None
 
+        # None disables the "pandas_data_fingerprint" batch marker; can be overridden by BatchSpec.
+        data_fingerprint_method: Optional[str] = kwargs.pop(
+            "data_fingerprint_method", "full"
+        )
+        self._validate_data_fingerprint_method(data_fingerprint_method)
+        self._data_fingerprint_method = data_fingerprint_method
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -126,6 +150,8 @@ Notes:
                 "gcs_options": gcs_options,
             }
         )
+        if data_fingerprint_method != "full":
+            self._config["data_fingerprint_method"] = data_fingerprint_method
 
     def _instantiate_azure_client(self):
         azure_options = self.config.get("azure_options", {})
@@ -199,6 +225,9 @@ Notes:
             }
         )
 
+        # Identity of the file read (if any), from which the "file" data fingerprint is computed.
+        file_identity: Optional[dict] = None
+
         batch_data: Any
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
@@ -245,6 +274,11 @@ Please check your config."""
             logger.debug(
                 f"Fetching s3 object. Bucket: {s3_url.bucket} Key: {s3_url.key}"
             )
+            file_identity = {
+                "path": path,
+                "etag": s3_object.get("ETag"),
+                "size": s3_object.get("ContentLength"),
+            }
             reader_fn = self._get_reader_fn(reader_method, s3_url.key)
             buf = BytesIO(s3_object["Body"].read())
             buf.seek(0)
@@ -308,6 +342,13 @@ Please check your config."""
             reader_method: str = batch_spec.reader_method
             reader_options: dict = batch_spec.reader_options
             path: str = batch_spec.path
+            if os.path.isfile(path):
+                file_stat: os.stat_result = os.stat(path)
+                file_identity = {
+                    "path": os.path.abspath(path),
+                    "mtime_ns": file_stat.st_mtime_ns,
+                    "size": file_stat.st_size,
+                }
             reader_fn: Callable = self._get_reader_fn(reader_method, path)
             df = reader_fn(path, **reader_options)
 
@@ -317,13 +358,72 @@ Please check your config."""
             )
 
         df = self._apply_splitting_and_sampling_methods(batch_spec, df)
-        if df.memory_usage().sum() < HASH_THRESHOLD:
-            batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+        data_fingerprint: Optional[str]
+        data_fingerprint_method: Optional[str]
+        data_fingerprint, data_fingerprint_method = self._get_data_fingerprint(
+            batch_spec=batch_spec, df=df, file_identity=file_identity
+        )
+        if data_fingerprint is not None:
+            batch_markers["pandas_data_fingerprint"] = data_fingerprint
+            if data_fingerprint_method != "full":
+                batch_markers[
+                    "pandas_data_fingerprint_method"
+                ] = data_fingerprint_method
 
         typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
 
         return typed_batch_data, batch_markers
 
+    @staticmethod
+    def _validate_data_fingerprint_method(
+        data_fingerprint_method: Optional[str],
+    ) -> None:
+        if (
+            data_fingerprint_method is not None
+            and data_fingerprint_method not in DATA_FINGERPRINT_METHODS
+        ):
+            raise ge_exceptions.ExecutionEngineError(
+                f"""Unknown data_fingerprint_method "{data_fingerprint_method}"; must be one of \
+{", ".join(DATA_FINGERPRINT_METHODS)}, or None."""
+            )
+
+    def _get_data_fingerprint(
+        self, batch_spec: BatchSpec, df: pd.DataFrame, file_identity: Optional[dict]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Return the fingerprint of the data of a batch, computed with the data_fingerprint_method of the BatchSpec
+        (or of the execution engine), or None, if fingerprints are disabled, or the data is too large to be hashed,
+        together with the method actually used ("file" fingerprints of data not read from a file are "sampled")."""
+        data_fingerprint_method: Optional[str] = batch_spec.get(
+            "data_fingerprint_method", self._data_fingerprint_method
+        )
+        self._validate_data_fingerprint_method(data_fingerprint_method)
+        if data_fingerprint_method is None:
+            return None, None
+
+        if data_fingerprint_method == "file":
+            # Random samples of the same file differ, and so are fingerprinted by their data.
+            if (
+                file_identity is not None
+                and batch_spec.get("sampling_method") != "_sample_using_random"
+            ):
+                return (
+                    hash_batch_file(batch_spec=batch_spec, file_identity=file_identity),
+                    data_fingerprint_method,
+                )
+
+            data_fingerprint_method = "sampled"
+
+        if data_fingerprint_method == "sampled":
+            return hash_pandas_dataframe_sample(df), data_fingerprint_method
+
+        if df.memory_usage().sum() >= HASH_THRESHOLD:
+            return None, None
+
+        if data_fingerprint_method == "incremental":
+            return hash_pandas_dataframe_by_column(df), data_fingerprint_method
+
+        return hash_pandas_dataframe(df), data_fingerprint_method
+
     def _apply_splitting_and_sampling_methods(self, batch_spec, batch_data):
         if batch_spec.get("splitter_method"):
             splitter_fn = getattr(self, batch_spec.get("splitter_method"))
@@ -458,6 +558,13 @@ Please check your config."""
                     f"Unable to find batch with batch_id {batch_id}"
                 )
 
+        # Sampling (the seed makes every metric of a sampled validation see the same rows).
+        sample_fraction = domain_kwargs.get("sample_fraction")
+        if sample_fraction is not None:
+            data = data.sample(
+                frac=sample_fraction, random_state=domain_kwargs.get("sample_seed")
+            )
+
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
@@ -604,32 +711,31 @@ Please check your config."""
         date_format_string: str = "%Y-%m-%d",
     ):
         """Convert the values in the named column to the given date_format, and split on that"""
-        stringified_datetime_series = df[column_name].map(
-            lambda x: x.strftime(date_format_string)
-        )
         matching_string = batch_identifiers[column_name]
-        return df[stringified_datetime_series == matching_string]
+        matching_rows = _match_distinct_values(
+            df[column_name],
+            lambda x: x.strftime(date_format_string) == matching_string,
+        )
+        return df[matching_rows]
 
     @staticmethod
     def _split_on_divided_integer(
         df, column_name: str, divisor: int, batch_identifiers: dict
     ):
         """Divide the values in the named column by `divisor`, and split on that"""
-
         matching_divisor = batch_identifiers[column_name]
-        matching_rows = df[column_name].map(
-            lambda x: int(x / divisor) == matching_divisor
+        matching_rows = _match_distinct_values(
+            df[column_name], lambda x: int(x / divisor) == matching_divisor
         )
-
         return df[matching_rows]
 
     @staticmethod
     def _split_on_mod_integer(df, column_name: str, mod: int, batch_identifiers: dict):
         """Divide the values in the named column by `divisor`, and split on that"""
-
         matching_mod_value = batch_identifiers[column_name]
-        matching_rows = df[column_name].map(lambda x: x % mod == matching_mod_value)
-
+        matching_rows = _match_distinct_values(
+            df[column_name], lambda x: x % mod == matching_mod_value
+        )
         return df[matching_rows]
 
     @staticmethod
@@ -659,18 +765,12 @@ Please check your config."""
         hash_function_name: str = "md5",
     ):
         """Split on the hashed value of the named column"""
-        try:
-            hash_method = getattr(hashlib, hash_function_name)
-        except (TypeError, AttributeError):
-            raise (
-                ge_exceptions.ExecutionEngineError(
-                    f"""The splitting method used with SparkDFExecutionEngine has a reference to an invalid hash_function_name.
-                    Reference to {hash_function_name} cannot be found."""
-                )
-            )
-        matching_rows = df[column_name].map(
-            lambda x: hash_method(str(x).encode()).hexdigest()[-1 * hash_digits :]
-            == batch_identifiers["hash_value"]
+        matching_rows = _match_hash_value(
+            df[column_name],
+            hash_digits=hash_digits,
+            hash_value=batch_identifiers["hash_value"],
+            hash_function_name=hash_function_name,
+            engine_operation="splitting",
         )
         return df[matching_rows]
 
@@ -692,7 +792,7 @@ Please check your config."""
         value: int,
     ):
         """Take the mod of named column, and only keep rows that match the given value"""
-        return df[df[column_name].map(lambda x: x % mod == value)]
+        return df[_match_distinct_values(df[column_name], lambda x: x % mod == value)]
 
     @staticmethod
     def _sample_using_a_list(
@@ -712,21 +812,97 @@ Please check your config."""
         hash_function_name: str = "md5",
     ):
         """Hash the values in the named column, and only keep rows that match the given hash_value"""
+        matches = _match_hash_value(
+            df[column_name],
+            hash_digits=hash_digits,
+            hash_value=hash_value,
+            hash_function_name=hash_function_name,
+            engine_operation="sampling",
+        )
+        return df[matches]
+
+
+def _match_distinct_values(
+    series: pd.Series, predicate: Callable[[Any], bool]
+) -> np.ndarray:
+    """Return whether each value of a Series matches a predicate, which is evaluated once per distinct value (rather
+    than once per row).
+
+    Values are distinct if their bits differ (for floats, so that e.g. 0.0 and -0.0 are distinct), or if their string
+    representations differ (for objects, so that e.g. 1, 1.0, and True are distinct).
+    """
+    if len(series) == 0:
+        return np.zeros(0, dtype=bool)
+
+    codes: np.ndarray
+    if series.dtype == object:
+        if pd.api.types.infer_dtype(series, skipna=False) == "string":
+            codes, _ = pd.factorize(series)
+        else:
+            codes, _ = pd.factorize(
+                np.array([str(value) for value in series.to_numpy()], dtype=object)
+            )
+    elif isinstance(series.dtype, np.dtype) and series.dtype.kind == "f":
+        codes, _ = pd.factorize(
+            series.to_numpy().view(f"u{series.dtype.itemsize}"),
+        )
+    else:
+        # Missing values (all of which have the same representation) have the code -1.
+        codes, _ = pd.factorize(series)
+
+    distinct_codes: np.ndarray
+    first_positions: np.ndarray
+    distinct_codes, first_positions = np.unique(codes, return_index=True)
+    distinct_value_matches: np.ndarray = (
+        series.iloc[first_positions].map(predicate).to_numpy(dtype=bool)
+    )
+    return distinct_value_matches[np.searchsorted(distinct_codes, codes)]
+
+
+def _match_hash_value(
+    series: pd.Series,
+    hash_digits: int,
+    hash_value: str,
+    hash_function_name: str,
+    engine_operation: str,
+) -> np.ndarray:
+    """Return whether the last hash_digits hexadecimal digits of the hash of each value of a Series are hash_value.
+
+    For a hashlib hash_function_name, the hash is the digest of the string representation of the value, as for SQL
+    splitting (and is computed once per distinct value).  For PANDAS_HASH_FUNCTION_NAME, the hash is the (vectorized)
+    64 bit pandas.util.hash_pandas_object hash of the value, which is faster, but not compatible with other engines.
+    """
+    if hash_function_name == PANDAS_HASH_FUNCTION_NAME:
+        if not 0 < hash_digits <= 16 or len(hash_value) != hash_digits:
+            return np.zeros(len(series), dtype=bool)
+
         try:
-            hash_func = getattr(hashlib, hash_function_name)
-        except (TypeError, AttributeError):
-            raise (
-                ge_exceptions.ExecutionEngineError(
-                    f"""The sampling method used with PandasExecutionEngine has a reference to an invalid hash_function_name.
+            hashes: np.ndarray = pd.util.hash_pandas_object(series, index=False).values
+        except TypeError:
+            # In case of facing unhashable objects (like dict), hash their string representations
+            hashes = pd.util.hash_pandas_object(series.astype(str), index=False).values
+
+        hash_mask = np.uint64((1 << (4 * hash_digits)) - 1)
+        try:
+            return (hashes & hash_mask) == np.uint64(int(hash_value, 16))
+        except ValueError:
+            return np.zeros(len(series), dtype=bool)
+
+    try:
+        hash_method = getattr(hashlib, hash_function_name)
+    except (TypeError, AttributeError):
+        raise (
+            ge_exceptions.ExecutionEngineError(
+                f"""The {engine_operation} method used with PandasExecutionEngine has a reference to an invalid hash_function_name.
                     Reference to {hash_function_name} cannot be found."""
-                )
             )
-
-        matches = df[column_name].map(
-            lambda x: hash_func(str(x).encode()).hexdigest()[-1 * hash_digits :]
-            == hash_value
         )
-        return df[matches]
+
+    return _match_distinct_values(
+        series,
+        lambda x: hash_method(str(x).encode()).hexdigest()[-1 * hash_digits :]
+        == hash_value,
+    )
 
 
 def hash_pandas_dataframe(df):
@@ -737,3 +913,71 @@ def hash_pandas_dataframe(df):
         obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
 
     return hashlib.md5(obj).hexdigest()
+
+
+def _hash_pandas_values(obj: Union[pd.Index, pd.Series]) -> bytes:
+    try:
+        return pd.util.hash_pandas_object(obj, index=False).values.tobytes()
+    except TypeError:
+        # In case of facing unhashable objects (like dict), use pickle
+        return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+
+def hash_pandas_dataframe_by_column(df: pd.DataFrame) -> str:
+    """Hash all values of a DataFrame one column at a time, so that the hashes (or the pickle, for columns of
+    unhashable objects) of a single column are in memory at once."""
+    md5 = hashlib.md5()
+    md5.update(_hash_pandas_values(df.index))
+    column_index: int
+    for column_index, column in enumerate(df.columns):
+        md5.update(str(column).encode("utf-8"))
+        md5.update(_hash_pandas_values(df.iloc[:, column_index]))
+
+    return md5.hexdigest()
+
+
+def hash_pandas_dataframe_sample(
+    df: pd.DataFrame, num_blocks: int = 8, block_size: int = 128
+) -> str:
+    """Hash the schema and the length of a DataFrame, and num_blocks evenly spaced blocks of block_size rows (including
+    the first and the last rows).  Changes to other rows are not detected."""
+    md5 = hashlib.md5()
+    md5.update(
+        json.dumps(
+            [len(df), [str(column) for column in df.columns], list(map(str, df.dtypes))]
+        ).encode("utf-8")
+    )
+
+    sample: pd.DataFrame = df
+    if len(df) > num_blocks * block_size:
+        block_starts: np.ndarray = np.linspace(
+            0, len(df) - block_size, num_blocks, dtype=np.int64
+        )
+        sample = df.iloc[(block_starts[:, np.newaxis] + np.arange(block_size)).ravel()]
+
+    md5.update(hash_pandas_dataframe_by_column(sample).encode("utf-8"))
+
+    return md5.hexdigest()
+
+
+def hash_batch_file(batch_spec: BatchSpec, file_identity: dict) -> str:
+    """Hash the identity of the file a batch is read from, together with the directives of reading, splitting, and
+    sampling it, without reading the data."""
+    batch_directives: dict = {
+        key: batch_spec.get(key)
+        for key in [
+            "reader_method",
+            "reader_options",
+            "splitter_method",
+            "splitter_kwargs",
+            "sampling_method",
+            "sampling_kwargs",
+        ]
+    }
+    return hashlib.md5(
+        json.dumps(
+            {"file": file_identity, "batch_directives": batch_directives},
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+    ).hexdigest()
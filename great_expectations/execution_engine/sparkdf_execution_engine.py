@@ -404,6 +404,15 @@ Please check your config."""
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
+        # Sampling (the seed makes every metric of a sampled validation see the same rows).
+        sample_fraction = domain_kwargs.get("sample_fraction")
+        if sample_fraction is not None:
+            data = data.sample(
+                withReplacement=False,
+                fraction=sample_fraction,
+                seed=domain_kwargs.get("sample_seed"),
+            )
+
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
@@ -1,4 +1,6 @@
+import hashlib
 import logging
+from typing import Optional, Tuple
 
 from great_expectations.execution_engine.execution_engine import BatchData
 from great_expectations.util import generate_temporary_table_name
@@ -38,6 +40,8 @@ class SqlAlchemyBatchData(BatchData):
         use_quoted_name: bool = False,
         source_schema_name: str = None,
         source_table_name: str = None,
+        reuse_temp_table: bool = False,
+        use_cte: bool = False,
     ):
         """A Constructor used to initialize and SqlAlchemy Batch, create an id for it, and verify that all necessary
         parameters have been provided. If a Query is given, also builds a temporary table for this query
@@ -74,6 +78,12 @@ class SqlAlchemyBatchData(BatchData):
                 source_schema_name (str): \
                     For SqlAlchemyBatchData based on selectables, source_schema_name provides the name of the schema on which
                     the selectable is based. This is required for most kinds of table introspection (e.g. looking up column types)
+                reuse_temp_table (bool): \
+                    If true, a temporary table, which the execution engine has already created for the same query (and
+                    temp_table_schema_name), is reused, rather than the query being materialized again.
+                use_cte (bool): \
+                    If true (and no temporary table is created), a selectable is referenced as a common table expression
+                    (WITH clause), rather than as a subselect statement.
 
         The query that will be executed against the DB can be determined in any of three ways:
 
@@ -83,7 +93,9 @@ class SqlAlchemyBatchData(BatchData):
 
         In the case of (2) and (3) you have the option to execute the query either as a temporary table, or as a subselect statement.
 
-        In general, temporary tables invite more optimization from the query engine itself. Subselect statements may sometimes be preferred, because they do not require write access on the database.
+        In general, temporary tables invite more optimization from the query engine itself. Subselect statements (or common table expressions) may sometimes be preferred, because they do not require write access on the database, and do not materialize the batch.
+
+Temporary tables are registered with the execution engine, which drops them when it is closed.
 
 
         """
@@ -133,13 +145,6 @@ class SqlAlchemyBatchData(BatchData):
                 )
 
         elif create_temp_table:
-            if temp_table_name:
-                generated_table_name = temp_table_name
-            else:
-                generated_table_name = generate_temporary_table_name()
-                # mssql expects all temporary table names to have a prefix '#'
-                if engine.dialect.name.lower() == "mssql":
-                    generated_table_name = f"#{generated_table_name}"
             if selectable is not None:
                 if engine.dialect.name.lower() == "oracle":
                     # oracle query was already passed as a string
@@ -150,19 +155,21 @@ class SqlAlchemyBatchData(BatchData):
                         dialect=self.sql_engine_dialect,
                         compile_kwargs={"literal_binds": True},
                     )
-            self._create_temporary_table(
-                temp_table_name=generated_table_name,
-                query=query,
-                temp_table_schema_name=temp_table_schema_name,
-            )
             self._selectable = sa.Table(
-                generated_table_name,
+                self._get_or_create_temporary_table(
+                    query=query,
+                    temp_table_name=temp_table_name,
+                    temp_table_schema_name=temp_table_schema_name,
+                    reuse_temp_table=reuse_temp_table,
+                ),
                 sa.MetaData(),
                 schema=temp_table_schema_name,
             )
         else:
             if query:
                 self._selectable = sa.text(query)
+            elif use_cte:
+                self._selectable = selectable.cte(self._record_set_name)
             else:
                 self._selectable = selectable.alias(self._record_set_name)
 
@@ -191,6 +198,48 @@ class SqlAlchemyBatchData(BatchData):
     def use_quoted_name(self):
         return self._use_quoted_name
 
+    def _get_or_create_temporary_table(
+        self,
+        query,
+        temp_table_name: Optional[str] = None,
+        temp_table_schema_name: Optional[str] = None,
+        reuse_temp_table: bool = False,
+    ) -> str:
+        """Return the name of a temporary table holding the results of the query, creating the table unless a reusable
+        one (created by the execution engine for the same query in the same session) exists."""
+        query_hash: Optional[str] = None
+        if reuse_temp_table and not temp_table_name:
+            query_hash = hashlib.md5(
+                f"{temp_table_schema_name}.{query}".encode("utf-8")
+            ).hexdigest()
+            reusable_temp_table: Optional[
+                Tuple[str, Optional[str]]
+            ] = self.execution_engine.get_reusable_temp_table(query_hash=query_hash)
+            if reusable_temp_table is not None:
+                return reusable_temp_table[0]
+
+        generated: bool = not temp_table_name
+        if generated:
+            temp_table_name = generate_temporary_table_name()
+            # mssql expects all temporary table names to have a prefix '#'
+            if self.sql_engine_dialect.name.lower() == "mssql":
+                temp_table_name = f"#{temp_table_name}"
+
+        self._create_temporary_table(
+            temp_table_name=temp_table_name,
+            query=query,
+            temp_table_schema_name=temp_table_schema_name,
+        )
+        # Tables named by users (e.g., "bigquery_temp_table") are neither reused nor dropped.
+        if generated and hasattr(self.execution_engine, "register_temp_table"):
+            self.execution_engine.register_temp_table(
+                temp_table_name=temp_table_name,
+                temp_table_schema_name=temp_table_schema_name,
+                query_hash=query_hash,
+            )
+
+        return temp_table_name
+
     def _create_temporary_table(
         self, temp_table_name, query, temp_table_schema_name=None
     ):
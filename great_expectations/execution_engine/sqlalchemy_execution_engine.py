@@ -1,5 +1,6 @@
 import copy
 import datetime
+import hashlib
 import logging
 import traceback
 import warnings
@@ -18,6 +19,9 @@ from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
     SqlAlchemyDatasourceBatchSpec,
 )
+from great_expectations.core.sqlalchemy_engine_registry import (
+    sqlalchemy_engine_registry,
+)
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.exceptions import (
@@ -60,7 +64,7 @@ except ImportError:
     sa = None
 
 try:
-    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.exc import OperationalError, SQLAlchemyError
     from sqlalchemy.sql import Selectable
     from sqlalchemy.sql.elements import TextClause, quoted_name
 except ImportError:
@@ -70,6 +74,7 @@ except ImportError:
     TextClause = None
     quoted_name = None
     OperationalError = None
+    SQLAlchemyError = None
 
 
 try:
@@ -102,6 +107,15 @@ except (ImportError, KeyError, AttributeError):
     snowflake = None
 
 _BIGQUERY_MODULE_NAME = "sqlalchemy_bigquery"
+
+# Temporary tables of these dialects only persist within a connection, so the ExecutionEngine keeps one connection
+# checked out for its whole life.
+_CONNECTION_PINNING_DIALECTS = [
+    "sqlite",
+    "mssql",
+    "snowflake",
+    "mysql",
+]
 try:
     import sqlalchemy_bigquery as sqla_bigquery
 
@@ -197,6 +211,102 @@ def _get_dialect_type_module(dialect):
     return dialect
 
 
+def _pins_connection(drivername: str) -> bool:
+    """Whether ExecutionEngines of the dialect of the (URL) drivername keep a connection checked out for their life."""
+    return drivername.split("+")[0].lower() in _CONNECTION_PINNING_DIALECTS
+
+
+# Name of the row hash function that SQLite connections of execution engines are given for sampling.
+_SQLITE_SAMPLE_HASH_FUNCTION_NAME = "great_expectations_sample_hash"
+
+# Name of the column numbering the rows of a selectable while it is sampled (see "_get_row_hash_sampling_condition()").
+_SAMPLE_ROW_NUMBER_COLUMN_NAME = "great_expectations_sample_row_number"
+
+
+def _sqlite_sample_hash(seed: int, row_number: int) -> int:
+    """Hash of the number of a row and the seed of a sample, between 0 (included) and 2 ** 32 (excluded)."""
+    return int(hashlib.md5(f"{seed}|{row_number}".encode("utf-8")).hexdigest()[:8], 16)
+
+
+def _get_row_number_expression(dialect_name: str) -> str:
+    if dialect_name == "mssql":
+        # The OVER clause of row_number() requires an ORDER BY clause.
+        return "row_number() over (order by (select null))"
+
+    return "row_number() over ()"
+
+
+def _get_row_hash_sampling_condition(
+    dialect_name: str, row_number_column: str, sample_fraction: float, sample_seed: Any
+):
+    """Condition keeping each row with probability sample_fraction, by comparing the (MD5 or FarmHash) hash of the
+    number of the row and the seed to a threshold, so that every row is drawn independently of the others (and of
+    their values), and samples with the same seed (of the same rows, in the same order) are reproducible; None if no
+    hash function of the dialect is known.  Hashes are reduced to numbers between 0 (included) and 2 ** 32 (excluded).
+    """
+    seed: int = int(hashlib.md5(str(sample_seed).encode("utf-8")).hexdigest()[:8], 16)
+    threshold: int = int(sample_fraction * 2 ** 32)
+
+    if dialect_name == "sqlite":
+        return sa.text(
+            f"{_SQLITE_SAMPLE_HASH_FUNCTION_NAME}({seed}, {row_number_column}) < {threshold}"
+        )
+
+    if dialect_name == "postgresql":
+        return sa.text(
+            f"('x' || substr(md5('{seed}|' || {row_number_column}), 1, 8))::bit(32)::bigint < {threshold}"
+        )
+
+    if dialect_name == "mysql":
+        return sa.text(
+            f"conv(substr(md5(concat('{seed}|', {row_number_column})), 1, 8), 16, 10) < {threshold}"
+        )
+
+    if dialect_name == "mssql":
+        # The first 4 bytes of the hash are read as a signed 32-bit integer.
+        return sa.text(
+            f"cast(cast(substring(hashbytes('MD5', concat('{seed}|', {row_number_column})), 1, 4) as int) as bigint) "
+            f"+ 2147483648 < {threshold}"
+        )
+
+    if dialect_name == "snowflake":
+        return sa.text(
+            f"to_number(substr(md5(concat('{seed}|', {row_number_column})), 1, 8), 'XXXXXXXX') < {threshold}"
+        )
+
+    if dialect_name == "bigquery":
+        return sa.text(
+            f"mod(abs(farm_fingerprint(concat('{seed}|', cast({row_number_column} as string)))), 4294967296) < "
+            f"{threshold}"
+        )
+
+    return None
+
+
+def _get_bernoulli_sampling_condition(dialect_name: str, sample_fraction: float):
+    """Condition keeping each row with probability sample_fraction, written with the random functions of the dialect."""
+    if dialect_name == "sqlite":
+        # random() returns a signed 64-bit integer.
+        return sa.text(
+            f"abs(random() % 1000000) < {int(round(sample_fraction * 1000000))}"
+        )
+
+    if dialect_name == "mysql":
+        return sa.text(f"rand() < {sample_fraction}")
+
+    if dialect_name == "mssql":
+        # rand() is evaluated only once per query, unless it is seeded for every row.
+        return sa.text(f"rand(checksum(newid())) < {sample_fraction}")
+
+    if dialect_name == "bigquery":
+        return sa.text(f"rand() < {sample_fraction}")
+
+    if dialect_name == "snowflake":
+        return sa.text(f"uniform(0::float, 1::float, random()) < {sample_fraction}")
+
+    return sa.text(f"random() < {sample_fraction}")
+
+
 class SqlAlchemyExecutionEngine(ExecutionEngine):
     def __init__(
         self,
@@ -208,6 +318,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
+        reuse_temp_tables: bool = False,
+        use_cte: bool = False,
         concurrency: Optional[ConcurrencyConfig] = None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ):
@@ -235,6 +347,16 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     If neither the engines, the credentials, nor the connection_string have been provided,
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
+                create_temp_table (bool): \
+                    Whether batches built from queries or selectables are materialized as temporary tables.
+                reuse_temp_tables (bool): \
+                    Whether a batch, whose query is identical to that of an earlier batch, reuses the temporary table of
+                    the earlier batch (within the session of this ExecutionEngine), rather than being materialized again.
+                    Off by default: a reused temporary table is a snapshot, which does not reflect changes made to the
+                    source data after it was created.
+                use_cte (bool): \
+                    Whether batches, which are not materialized as temporary tables, are referenced as common table
+                    expressions (WITH clauses), rather than as subselect statements.
                 concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.
         """
         super().__init__(name=name, batch_data_dict=batch_data_dict)
@@ -244,6 +366,14 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        self._reuse_temp_tables = reuse_temp_tables
+        self._use_cte = use_cte
+        # Temporary tables created for batches (dropped when the ExecutionEngine is closed), and the names of reusable
+        # ones by the hash of their query.
+        self._temp_tables: List[Tuple[str, Optional[str]]] = []
+        self._reusable_temp_tables: Dict[str, Tuple[str, Optional[str]]] = {}
+        # Samples of batches (for sampled validations), materialized as temporary tables, by batch, fraction and seed.
+        self._sampled_batch_data: Dict[Tuple[str, float, Any], SqlAlchemyBatchData] = {}
 
         if engine is not None:
             if credentials is not None:
@@ -253,22 +383,42 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 )
             self.engine = engine
         else:
-            concurrency: ConcurrencyConfig
-            if data_context is None or data_context.concurrency is None:
-                concurrency = ConcurrencyConfig()
-            else:
+            if data_context is not None and data_context.concurrency is not None:
                 concurrency = data_context.concurrency
+            elif concurrency is None:
+                concurrency = ConcurrencyConfig()
 
             concurrency.add_sqlalchemy_create_engine_parameters(kwargs)
+            # Engines are shared (through the engine registry) by all ExecutionEngines and DatabaseStoreBackends, which
+            # connect to the same database with the same parameters.  ExecutionEngines, which keep a connection checked
+            # out for their whole life, get Engines of their own, so that they do not exhaust a shared connection pool.
+            engine_pool_kwargs: dict = {
+                "default_pool_size": concurrency.sqlalchemy_pool_size,
+                "default_max_overflow": concurrency.sqlalchemy_max_overflow,
+            }
 
             if credentials is not None:
-                self.engine = self._build_engine(credentials=credentials, **kwargs)
+                self.engine = self._build_engine(
+                    credentials=credentials, **engine_pool_kwargs, **kwargs
+                )
             elif connection_string is not None:
-                self.engine = sa.create_engine(connection_string, **kwargs)
+                self.engine = sqlalchemy_engine_registry.acquire_engine(
+                    connection_string,
+                    shared=not _pins_connection(
+                        drivername=make_url(connection_string).drivername
+                    ),
+                    **engine_pool_kwargs,
+                    **kwargs,
+                )
             elif url is not None:
                 parsed_url = make_url(url)
                 self.drivername = parsed_url.drivername
-                self.engine = sa.create_engine(url, **kwargs)
+                self.engine = sqlalchemy_engine_registry.acquire_engine(
+                    url,
+                    shared=not _pins_connection(drivername=self.drivername),
+                    **engine_pool_kwargs,
+                    **kwargs,
+                )
             else:
                 raise InvalidConfigError(
                     "Credentials or an engine are required for a SqlAlchemyExecutionEngine."
@@ -324,12 +474,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         # depending on the backend. This will need to be cleaned up in an upcoming refactor, so that Engine and
         # Connection can be handled separately.
         self._engine_backup = None
-        if self.engine and self.engine.dialect.name.lower() in [
-            "sqlite",
-            "mssql",
-            "snowflake",
-            "mysql",
-        ]:
+        if self.engine and self.engine.dialect.name.lower() in (
+            _CONNECTION_PINNING_DIALECTS
+        ):
             self._engine_backup = self.engine
             # sqlite/mssql temp tables only persist within a connection so override the engine
             self.engine = self.engine.connect()
@@ -376,6 +523,15 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def url(self) -> Optional[str]:
         return self._url
 
+    @property
+    def reuse_temp_tables(self) -> bool:
+        return self._reuse_temp_tables
+
+    @property
+    def supports_sampling(self) -> bool:
+        # Samples are materialized as temporary tables (see "_get_sampled_selectable()").
+        return self._create_temp_table
+
     def _build_engine(self, credentials: dict, **kwargs) -> "sa.engine.Engine":
         """
         Using a set of given credentials, constructs an Execution Engine , connecting to a database using a URL or a
@@ -403,7 +559,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             options = get_sqlalchemy_url(drivername, **credentials)
 
         self.drivername = drivername
-        engine = sa.create_engine(options, **create_engine_kwargs)
+        engine = sqlalchemy_engine_registry.acquire_engine(
+            options,
+            shared=not _pins_connection(drivername=drivername),
+            **create_engine_kwargs,
+        )
         return engine
 
     def _get_sqlalchemy_key_pair_auth_url(
@@ -514,6 +674,15 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         if TextClause and isinstance(selectable, TextClause):
             selectable = selectable.columns().subquery()
 
+        # Sampling.
+        if domain_kwargs.get("sample_fraction") is not None:
+            selectable = self._get_sampled_selectable(
+                selectable=selectable,
+                batch_id=batch_id or self.active_batch_data_id,
+                sample_fraction=domain_kwargs["sample_fraction"],
+                sample_seed=domain_kwargs.get("sample_seed"),
+            )
+
         # Filtering by row condition.
         if (
             "row_condition" in domain_kwargs
@@ -671,6 +840,114 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return selectable
 
+    def _get_sampled_selectable(
+        self,
+        selectable: Selectable,
+        batch_id: str,
+        sample_fraction: float,
+        sample_seed: Any = None,
+    ) -> Selectable:
+        """Bernoulli sample of the selectable, materialized as a temporary table, so that every metric computed on the
+        sample sees the same rows; samples are kept by batch, fraction and seed.
+
+        Each row is kept or not by a hash of its number and the seed, so that samples with the same seed are
+        reproducible.  On dialects without a known hash function, rows are sampled with random(), and the seed only
+        identifies a sample (because random number generators of databases cannot be seeded portably).
+        """
+        if not self.supports_sampling:
+            logger.warning(
+                f'Sampling requires temporary tables, which are not used by the "{self.engine.dialect.name}" dialect; '
+                f"the entire batch is used instead."
+            )
+            return selectable
+
+        key: Tuple[str, float, Any] = (
+            f"{batch_id}.{getattr(selectable, 'name', None)}",
+            sample_fraction,
+            sample_seed,
+        )
+        sampled_batch_data: Optional[
+            SqlAlchemyBatchData
+        ] = self._sampled_batch_data.get(key)
+        if sampled_batch_data is None:
+            sampled_batch_data = SqlAlchemyBatchData(
+                execution_engine=self,
+                selectable=self._get_sample_query(
+                    selectable=selectable,
+                    sample_fraction=sample_fraction,
+                    sample_seed=sample_seed,
+                ),
+                create_temp_table=True,
+            )
+            self._sampled_batch_data[key] = sampled_batch_data
+
+        return sampled_batch_data.selectable
+
+    def _get_sample_query(
+        self, selectable: Selectable, sample_fraction: float, sample_seed: Any
+    ) -> Selectable:
+        """Query selecting the rows of a sample of the selectable (see "_get_sampled_selectable()")."""
+        dialect_name: str = self.engine.dialect.name.lower()
+        row_number_column: str = self.engine.dialect.identifier_preparer.quote(
+            _SAMPLE_ROW_NUMBER_COLUMN_NAME
+        )
+        condition = _get_row_hash_sampling_condition(
+            dialect_name=dialect_name,
+            row_number_column=row_number_column,
+            sample_fraction=sample_fraction,
+            sample_seed=sample_seed,
+        )
+        if dialect_name == "sqlite":
+            # The row hash function of SQLite is a Python function, given to the (pinned) connection of this engine.
+            if isinstance(self.engine, sa.engine.Connection):
+                self.engine.connection.create_function(
+                    _SQLITE_SAMPLE_HASH_FUNCTION_NAME,
+                    2,
+                    _sqlite_sample_hash,
+                    deterministic=True,
+                )
+            else:
+                condition = None
+
+        if condition is None:
+            logger.warning(
+                f'Rows of samples are chosen at random by the "{self.engine.dialect.name}" dialect, so that samples '
+                f"are not reproducible with a seed."
+            )
+            return (
+                sa.select([sa.text("*")])
+                .select_from(selectable)
+                .where(
+                    _get_bernoulli_sampling_condition(
+                        dialect_name=dialect_name, sample_fraction=sample_fraction
+                    )
+                )
+            )
+
+        column_names: List[str] = list(
+            self.engine.execute(
+                sa.select([sa.text("*")]).select_from(selectable).limit(1)
+            ).keys()
+        )
+        numbered_rows: Selectable = (
+            sa.select(
+                [
+                    sa.text("*"),
+                    sa.text(
+                        f"{_get_row_number_expression(dialect_name=dialect_name)} AS {row_number_column}"
+                    ),
+                ]
+            )
+            .select_from(selectable)
+            .alias("great_expectations_numbered_rows")
+        )
+        # The row numbers are not part of the sample.
+        return (
+            sa.select([sa.column(column_name) for column_name in column_names])
+            .select_from(numbered_rows)
+            .where(condition)
+        )
+
     def get_compute_domain(
         self,
         domain_kwargs: Dict,
@@ -922,12 +1199,83 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         self.engine.dispose()
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
+
+        Engines shared through the engine registry are only disposed once no other ExecutionEngine uses them.
+        Temporary tables created for batches are dropped first.
         """
+        self._drop_temp_tables()
         if self._engine_backup:
             self.engine.close()
-            self._engine_backup.dispose()
+            sqlalchemy_engine_registry.release_engine(self._engine_backup)
         else:
-            self.engine.dispose()
+            sqlalchemy_engine_registry.release_engine(self.engine)
+
+    def register_temp_table(
+        self,
+        temp_table_name: str,
+        temp_table_schema_name: Optional[str] = None,
+        query_hash: Optional[str] = None,
+    ) -> None:
+        """Register a temporary table created for a batch, so that it is dropped when the ExecutionEngine is closed,
+        and (if the hash of its query is given) reused by batches with the same query."""
+        self._temp_tables.append((temp_table_name, temp_table_schema_name))
+        if query_hash is not None:
+            self._reusable_temp_tables[query_hash] = (
+                temp_table_name,
+                temp_table_schema_name,
+            )
+
+    def get_reusable_temp_table(
+        self, query_hash: str
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """Return the name and schema name of the temporary table created for the query with the given hash (if any)."""
+        return self._reusable_temp_tables.get(query_hash)
+
+    def release_samples(self) -> None:
+        """Drop the temporary tables materializing samples of batches (see "_get_sampled_selectable()")."""
+        sampled_temp_tables: List[Tuple[str, Optional[str]]] = [
+            (sampled_batch_data.selectable.name, sampled_batch_data.selectable.schema)
+            for sampled_batch_data in self._sampled_batch_data.values()
+        ]
+        temp_table_name: str
+        temp_table_schema_name: Optional[str]
+        for temp_table_name, temp_table_schema_name in sampled_temp_tables:
+            self._drop_temp_table(
+                temp_table_name=temp_table_name,
+                temp_table_schema_name=temp_table_schema_name,
+            )
+
+        self._temp_tables = [
+            temp_table
+            for temp_table in self._temp_tables
+            if temp_table not in sampled_temp_tables
+        ]
+        self._sampled_batch_data = {}
+
+    def _drop_temp_tables(self) -> None:
+        temp_table_name: str
+        temp_table_schema_name: Optional[str]
+        for temp_table_name, temp_table_schema_name in self._temp_tables:
+            self._drop_temp_table(
+                temp_table_name=temp_table_name,
+                temp_table_schema_name=temp_table_schema_name,
+            )
+
+        self._temp_tables = []
+        self._reusable_temp_tables = {}
+        self._sampled_batch_data = {}
+
+    def _drop_temp_table(
+        self, temp_table_name: str, temp_table_schema_name: Optional[str] = None
+    ) -> None:
+        try:
+            sa.Table(
+                temp_table_name, sa.MetaData(), schema=temp_table_schema_name
+            ).drop(self.engine, checkfirst=True)
+        except SQLAlchemyError as e:
+            logger.warning(
+                f'Unable to drop temporary table "{temp_table_name}": {str(e)}'
+            )
 
     ### Splitter methods for partitioning tables ###
 
@@ -1162,6 +1510,13 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         create_temp_table: bool = batch_spec.get(
             "create_temp_table", self._create_temp_table
         )
+        # Random samples differ on every run, even though their queries are identical, and so are never reused.
+        reuse_temp_table: bool = batch_spec.get(
+            "reuse_temp_table",
+            self._reuse_temp_tables
+            and batch_spec.get("sampling_method") != "_sample_using_random",
+        )
+        use_cte: bool = batch_spec.get("use_cte", self._use_cte)
 
         if isinstance(batch_spec, RuntimeQueryBatchSpec):
             # query != None is already checked when RuntimeQueryBatchSpec is instantiated
@@ -1176,6 +1531,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 create_temp_table=create_temp_table,
                 source_table_name=source_table_name,
                 source_schema_name=source_schema_name,
+                reuse_temp_table=reuse_temp_table,
             )
         elif isinstance(batch_spec, SqlAlchemyDatasourceBatchSpec):
             if self.engine.dialect.name.lower() == "oracle":
@@ -1194,6 +1550,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 create_temp_table=create_temp_table,
                 source_table_name=source_table_name,
                 source_schema_name=source_schema_name,
+                reuse_temp_table=reuse_temp_table,
+                use_cte=use_cte,
             )
 
         return batch_data, batch_markers
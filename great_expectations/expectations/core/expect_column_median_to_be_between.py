@@ -31,6 +31,10 @@ class ExpectColumnMedianToBeBetween(ColumnExpectation):
                     If True, the column median must be strictly larger than min_value, default=False
                 strict_max (boolean):
                     If True, the column median must be strictly smaller than max_value, default=False
+                approximation_relative_error (float or None): \
+                    If a float between 0 and 1, the column median is estimated (by a database-native approximation, or by \
+                    approxQuantile on Spark) to within this relative (rank) error; pandas always computes the exact median, \
+                    default=None
 
             Other Parameters:
                 result_format (str or None): \
@@ -60,6 +64,10 @@ class ExpectColumnMedianToBeBetween(ColumnExpectation):
                         "observed_value": (float) The true median for the column
                     }
 
+                If approximation_relative_error is set, "details": {"approximation": {"requested_relative_error": (float),
+                "relative_error": (float or None)}} reports the relative (rank) error actually achieved by the backend (0.0
+                if the median was computed exactly; None if the backend does not document its error bound).
+
                 * min_value and max_value are both inclusive unless strict_min or strict_max are set to True.
                 * If min_value is None, then max_value is treated as an upper bound
                 * If max_value is None, then min_value is treated as a lower bound
@@ -85,7 +93,13 @@ class ExpectColumnMedianToBeBetween(ColumnExpectation):
 
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.median",)
-    success_keys = ("min_value", "strict_min", "max_value", "strict_max")
+    success_keys = (
+        "min_value",
+        "strict_min",
+        "max_value",
+        "strict_max",
+        "approximation_relative_error",
+    )
 
     # Default values
     default_kwarg_values = {
@@ -93,6 +107,7 @@ class ExpectColumnMedianToBeBetween(ColumnExpectation):
         "max_value": None,
         "strict_min": None,
         "strict_max": None,
+        "approximation_relative_error": None,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
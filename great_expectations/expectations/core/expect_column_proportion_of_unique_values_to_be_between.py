@@ -35,6 +35,9 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
             If True, the minimum proportion of unique values must be strictly larger than min_value, default=False
         strict_max (boolean):
             If True, the maximum proportion of unique values must be strictly smaller than max_value, default=False
+        approximation_relative_error (float or None): \
+            If a float between 0 and 1, the proportion of unique values is estimated (from a number of unique values \
+            estimated as by expect_column_unique_value_count_to_be_between) to within this relative error, default=None
 
     Other Parameters:
         result_format (str or None): \
@@ -64,6 +67,10 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
                 "observed_value": (float) The proportion of unique values in the column
             }
 
+        If approximation_relative_error is set, "details": {"approximation": {"requested_relative_error": (float),
+        "relative_error": (float or None)}} reports the relative error actually achieved by the backend for the number
+        of unique values (0.0 if it is exact; None if the backend does not document its error bound).
+
         * min_value and max_value are both inclusive unless strict_min or strict_max are set to True.
         * If min_value is None, then max_value is treated as an upper bound
         * If max_value is None, then min_value is treated as a lower bound
@@ -85,7 +92,13 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
 
     # Setting necessary computation metric dependencies and defining kwargs, as well as assigning kwargs default values\
     metric_dependencies = ("column.unique_proportion",)
-    success_keys = ("min_value", "strict_min", "max_value", "strict_max")
+    success_keys = (
+        "min_value",
+        "strict_min",
+        "max_value",
+        "strict_max",
+        "approximation_relative_error",
+    )
 
     # Default values
     default_kwarg_values = {
@@ -93,6 +106,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnExpectation):
         "max_value": None,
         "strict_min": None,
         "strict_max": None,
+        "approximation_relative_error": None,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
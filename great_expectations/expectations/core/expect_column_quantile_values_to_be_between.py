@@ -82,6 +82,10 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
                    Quantiles and associated value ranges for the column. See above for details.
                allow_relative_error (boolean or string): \
                    Whether to allow relative error in quantile communications on backends that support or require it.
+               approximation_relative_error (float or None): \
+                   If a float between 0 and 1, quantiles are estimated (by a database-native approximation, or by \
+                   approxQuantile on Spark) to within this relative (rank) error; pandas always computes exact \
+                   quantiles, default=None
 
            Other Parameters:
                result_format (str or None): \
@@ -108,6 +112,10 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
                ::
                details.success_details
 
+               If approximation_relative_error is set, details.approximation reports the requested relative error \
+               and the relative error actually achieved (0.0 for exact quantiles; None if the backend does not \
+               document its error bound).
+
            See Also:
                :func:`expect_column_min_to_be_between \
                <great_expectations.execution_engine.execution_engine.ExecutionEngine.expect_column_min_to_be_between>`
@@ -132,6 +140,7 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
     success_keys = (
         "quantile_ranges",
         "allow_relative_error",
+        "approximation_relative_error",
         "auto",
         "profiler_config",
     )
@@ -213,6 +222,7 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
         "quantile_ranges": None,
         "result_format": "BASIC",
         "allow_relative_error": False,
+        "approximation_relative_error": None,
         "include_config": True,
         "catch_exceptions": False,
         "meta": None,
@@ -729,10 +739,19 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
             for idx, range_ in enumerate(comparison_quantile_ranges)
         ]
 
+        details: dict = {"success_details": success_details}
+        approximation: Optional[dict] = self._get_approximation_details(
+            configuration=configuration,
+            runtime_configuration=runtime_configuration,
+            execution_engine=execution_engine,
+        )
+        if approximation is not None:
+            details["approximation"] = approximation
+
         return {
             "success": np.all(success_details),
             "result": {
                 "observed_value": {"quantiles": quantiles, "values": quantile_vals},
-                "details": {"success_details": success_details},
+                "details": details,
             },
         }
@@ -28,6 +28,10 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
                     The minimum number of unique values allowed.
                 max_value (int or None): \
                     The maximum number of unique values allowed.
+                approximation_relative_error (float or None): \
+                    If a float between 0 and 1, the number of unique values is estimated (by a database-native \
+                    approximation, or by approx_count_distinct on Spark) to within this relative error; pandas always \
+                    counts exactly, default=None
 
             Other Parameters:
                 result_format (str or None): \
@@ -57,6 +61,10 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
                         "observed_value": (int) The number of unique values in the column
                     }
 
+                If approximation_relative_error is set, "details": {"approximation": {"requested_relative_error": (float),
+                "relative_error": (float or None)}} reports the relative error actually achieved by the backend (0.0 if
+                the count is exact; None if the backend does not document its error bound).
+
                 * min_value and max_value are both inclusive.
                 * If min_value is None, then max_value is treated as an upper bound
                 * If max_value is None, then min_value is treated as a lower bound
@@ -81,6 +89,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
     success_keys = (
         "min_value",
         "max_value",
+        "approximation_relative_error",
     )
 
     # Default values
@@ -89,6 +98,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnExpectation):
         "condition_parser": None,
         "min_value": None,
         "max_value": None,
+        "approximation_relative_error": None,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
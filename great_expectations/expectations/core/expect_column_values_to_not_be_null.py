@@ -318,7 +318,19 @@ class ExpectColumnValuesToNotBeNull(ColumnMapExpectation):
         total_count = metrics.get("table.row_count")
         unexpected_count = metrics.get(f"{self.map_metric}.unexpected_count")
 
-        if total_count is None or total_count == 0:
+        sampling: Optional[dict] = self._get_sampling(
+            configuration=configuration,
+            runtime_configuration=runtime_configuration,
+            execution_engine=execution_engine,
+        )
+        if sampling is not None:
+            success, interval = self._get_sampled_success(
+                sampling=sampling,
+                element_count=total_count or 0,
+                unexpected_count=unexpected_count,
+                mostly=mostly,
+            )
+        elif total_count is None or total_count == 0:
             # Vacuously true
             success = True
         else:
@@ -327,7 +339,7 @@ class ExpectColumnValuesToNotBeNull(ColumnMapExpectation):
 
         nonnull_count = None
 
-        return _format_map_output(
+        result = _format_map_output(
             result_format=parse_result_format(result_format),
             success=success,
             element_count=metrics.get("table.row_count"),
@@ -338,3 +350,9 @@ class ExpectColumnValuesToNotBeNull(ColumnMapExpectation):
                 f"{self.map_metric}.unexpected_index_list"
             ),
         )
+        if sampling is not None:
+            self._add_sampling_details(
+                result=result, sampling=sampling, interval=interval
+            )
+
+        return result
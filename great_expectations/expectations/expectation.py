@@ -47,14 +47,19 @@ from great_expectations.core.expectation_diagnostics.supporting_types import (
 from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.util import nested_update
 from great_expectations.exceptions import (
     GreatExpectationsError,
+    InconclusiveSampledValidationError,
     InvalidExpectationConfigurationError,
     InvalidExpectationKwargsError,
 )
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.expectations.metrics.util import (
+    get_approximation_achieved_relative_error,
+)
 from great_expectations.expectations.registry import (
     _registered_metrics,
     _registered_renderers,
@@ -62,7 +67,11 @@ from great_expectations.expectations.registry import (
     register_expectation,
     register_renderer,
 )
-from great_expectations.expectations.util import render_evaluation_parameter_string
+from great_expectations.expectations.util import (
+    get_approximation_relative_error,
+    get_binomial_confidence_interval,
+    render_evaluation_parameter_string,
+)
 from great_expectations.render.renderer.renderer import renderer
 from great_expectations.render.types import (
     CollapseContent,
@@ -785,10 +794,7 @@ class Expectation(metaclass=MetaExpectation):
         if not configuration:
             configuration = self.configuration
 
-        configuration = deepcopy(configuration)
-
-        if runtime_configuration:
-            configuration.kwargs.update(runtime_configuration)
+        configuration = configuration.copy_with_kwargs(runtime_configuration)
 
         success_kwargs = self.get_success_kwargs(configuration)
         runtime_kwargs = {
@@ -845,7 +851,7 @@ class Expectation(metaclass=MetaExpectation):
         runtime_configuration=None,
     ):
         if configuration is None:
-            configuration = deepcopy(self.configuration)
+            configuration = self.configuration.copy_with_kwargs()
 
         configuration.process_evaluation_parameters(
             evaluation_parameters, interactive_evaluation, data_context
@@ -1580,20 +1586,73 @@ class TableExpectation(Expectation, ABC):
         dependencies = super().get_validation_dependencies(
             configuration, execution_engine, runtime_configuration
         )
+        relative_error: Optional[float] = self._get_approximation_relative_error(
+            configuration=configuration, runtime_configuration=runtime_configuration
+        )
         for metric_name in self.metric_dependencies:
             metric_kwargs = get_metric_kwargs(
                 metric_name=metric_name,
                 configuration=configuration,
                 runtime_configuration=runtime_configuration,
             )
+            metric_value_kwargs = metric_kwargs["metric_value_kwargs"]
+            if (
+                relative_error is not None
+                and "approximation_relative_error" not in metric_value_kwargs
+            ):
+                # Metrics, which are exact by default, are only asked for approximations if the Expectation allows it.
+                metric_value_kwargs = IDDict(
+                    metric_value_kwargs, approximation_relative_error=relative_error
+                )
             dependencies["metrics"][metric_name] = MetricConfiguration(
                 metric_name=metric_name,
                 metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
-                metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
+                metric_value_kwargs=metric_value_kwargs,
             )
 
         return dependencies
 
+    def _get_approximation_relative_error(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Optional[float]:
+        """The relative error allowed for approximate statistics, if this Expectation has (and sets) an
+        "approximation_relative_error" argument (see "get_approximation_relative_error()"); None otherwise."""
+        if "approximation_relative_error" not in self.success_keys:
+            return None
+
+        return get_approximation_relative_error(
+            approximation_relative_error=self.get_runtime_kwargs(
+                configuration=configuration,
+                runtime_configuration=runtime_configuration,
+            ).get("approximation_relative_error")
+        )
+
+    def _get_approximation_details(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        runtime_configuration: Optional[dict] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+    ) -> Optional[dict]:
+        """The "approximation" details of a result: the requested relative error and the one actually achieved by the
+        execution engine (0.0 if the metric was computed exactly; None if the engine does not document its error), or
+        None if this Expectation did not request approximate statistics."""
+        relative_error: Optional[float] = self._get_approximation_relative_error(
+            configuration=configuration, runtime_configuration=runtime_configuration
+        )
+        if relative_error is None:
+            return None
+
+        return {
+            "requested_relative_error": relative_error,
+            "relative_error": get_approximation_achieved_relative_error(
+                metric_name=self.metric_dependencies[0],
+                relative_error=relative_error,
+                execution_engine=execution_engine,
+            ),
+        }
+
     @staticmethod
     def validate_metric_value_between_configuration(
         configuration: Optional[ExpectationConfiguration],
@@ -1703,7 +1762,16 @@ please see: https://greatexpectations.io/blog/why_we_dont_do_transformations_for
 
         success = above_min and below_max
 
-        return {"success": success, "result": {"observed_value": metric_value}}
+        result: dict = {"observed_value": metric_value}
+        approximation: Optional[dict] = self._get_approximation_details(
+            configuration=configuration,
+            runtime_configuration=runtime_configuration,
+            execution_engine=execution_engine,
+        )
+        if approximation is not None:
+            result["details"] = {"approximation": approximation}
+
+        return {"success": success, "result": result}
 
 
 class ColumnExpectation(TableExpectation, ABC):
@@ -1722,10 +1790,20 @@ class ColumnExpectation(TableExpectation, ABC):
 
 
 class ColumnMapExpectation(TableExpectation, ABC):
+    """
+    ColumnMapExpectations can be validated on a random sample of data, by setting "sampling" to a dictionary with the
+    sampled "fraction" of rows, and (optionally) the "confidence" level (0.99 by default) and "seed" of the sample.  The
+    success of the Expectation is decided from a binomial confidence interval of the proportion of expected values: if
+    the interval straddles "mostly", then InconclusiveSampledValidationError is raised, and the Validator validates the
+    Expectation on entire data instead.  Note that counts and unexpected values in results refer to the sample.
+    Execution engines that cannot sample data (SqlAlchemy without temporary tables) validate on entire data.
+    """
+
     map_metric = None
     domain_keys = ("batch_id", "table", "column", "row_condition", "condition_parser")
     domain_type = MetricDomainTypes.COLUMN
     success_keys = ("mostly",)
+    runtime_keys = TableExpectation.runtime_keys + ("sampling",)
     default_kwarg_values = {
         "row_condition": None,
         "condition_parser": None,  # we expect this to be explicitly set whenever a row_condition is passed
@@ -1733,7 +1811,9 @@ class ColumnMapExpectation(TableExpectation, ABC):
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": True,
+        "sampling": None,
     }
+    default_sampling_confidence = 0.99
 
     @classmethod
     def is_abstract(cls):
@@ -1751,6 +1831,17 @@ class ColumnMapExpectation(TableExpectation, ABC):
                     mostly, (int, float)
                 ), "'mostly' parameter must be an integer or float"
                 assert 0 <= mostly <= 1, "'mostly' parameter must be between 0 and 1"
+            sampling = configuration.kwargs.get("sampling")
+            if sampling is not None:
+                assert (
+                    isinstance(sampling, dict) and "fraction" in sampling
+                ), "'sampling' parameter must be a dictionary with a 'fraction' key"
+                assert (
+                    0 < sampling["fraction"] <= 1
+                ), "'fraction' of 'sampling' parameter must be greater than 0 and at most 1"
+                assert (
+                    0 < sampling.get("confidence", self.default_sampling_confidence) < 1
+                ), "'confidence' of 'sampling' parameter must be between 0 and 1"
         except AssertionError as e:
             raise InvalidExpectationConfigurationError(str(e))
         return True
@@ -1760,6 +1851,63 @@ class ColumnMapExpectation(TableExpectation, ABC):
         configuration: Optional[ExpectationConfiguration] = None,
         execution_engine: Optional[ExecutionEngine] = None,
         runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies = self._get_map_metric_validation_dependencies(
+            configuration, execution_engine, runtime_configuration
+        )
+
+        sampling: Optional[dict] = self._get_sampling(
+            configuration=configuration,
+            runtime_configuration=runtime_configuration,
+            execution_engine=execution_engine,
+        )
+        if sampling is not None:
+            # All metrics are computed on the same sample (identified by its fraction and seed) of the domain.
+            metric_dependencies = dependencies["metrics"]
+            metric_name: str
+            metric_configuration: MetricConfiguration
+            for metric_name, metric_configuration in metric_dependencies.items():
+                metric_dependencies[metric_name] = MetricConfiguration(
+                    metric_name=metric_configuration.metric_name,
+                    metric_domain_kwargs=IDDict(
+                        metric_configuration.metric_domain_kwargs,
+                        sample_fraction=sampling["fraction"],
+                        sample_seed=sampling["seed"],
+                    ),
+                    metric_value_kwargs=metric_configuration.metric_value_kwargs,
+                    metric_dependencies=metric_configuration.metric_dependencies,
+                )
+
+        return dependencies
+
+    def _get_sampling(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        runtime_configuration: Optional[dict] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+    ) -> Optional[dict]:
+        """The "sampling" argument (with defaults filled in), if this Expectation is validated on a sample of data;
+        None otherwise (including when the execution engine cannot sample data)."""
+        sampling: Optional[dict] = self.get_runtime_kwargs(
+            configuration=configuration, runtime_configuration=runtime_configuration
+        ).get("sampling")
+        if not sampling or sampling["fraction"] >= 1:
+            return None
+
+        if execution_engine is not None and not execution_engine.supports_sampling:
+            return None
+
+        return {
+            "fraction": sampling["fraction"],
+            "confidence": sampling.get("confidence", self.default_sampling_confidence),
+            "seed": sampling.get("seed", 0),
+        }
+
+    def _get_map_metric_validation_dependencies(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
     ):
         dependencies = super().get_validation_dependencies(
             configuration, execution_engine, runtime_configuration
@@ -1907,15 +2055,28 @@ class ColumnMapExpectation(TableExpectation, ABC):
         else:
             nonnull_count = total_count - null_count
 
+        sampling: Optional[dict] = self._get_sampling(
+            configuration=configuration,
+            runtime_configuration=runtime_configuration,
+            execution_engine=execution_engine,
+        )
+
         success = None
-        if total_count == 0 or nonnull_count == 0:
+        if sampling is not None:
+            success, interval = self._get_sampled_success(
+                sampling=sampling,
+                element_count=nonnull_count,
+                unexpected_count=unexpected_count,
+                mostly=mostly,
+            )
+        elif total_count == 0 or nonnull_count == 0:
             # Vacuously true
             success = True
         elif nonnull_count > 0:
             success_ratio = float(nonnull_count - unexpected_count) / nonnull_count
             success = success_ratio >= mostly
 
-        return _format_map_output(
+        result = _format_map_output(
             result_format=parse_result_format(result_format),
             success=success,
             element_count=total_count,
@@ -1925,6 +2086,46 @@ class ColumnMapExpectation(TableExpectation, ABC):
             unexpected_index_list=unexpected_index_list,
             unexpected_rows=unexpected_rows,
         )
+        if sampling is not None:
+            self._add_sampling_details(
+                result=result, sampling=sampling, interval=interval
+            )
+
+        return result
+
+    @staticmethod
+    def _get_sampled_success(
+        sampling: dict, element_count: int, unexpected_count: int, mostly: float
+    ) -> Tuple[bool, Tuple[float, float]]:
+        """Decide success from the confidence interval of the success ratio observed on a sample (along with the
+        interval), or raise InconclusiveSampledValidationError if the interval does not decide the "mostly" threshold.
+        """
+        interval: Tuple[float, float] = get_binomial_confidence_interval(
+            successes=element_count - unexpected_count,
+            trials=element_count,
+            confidence=sampling["confidence"],
+        )
+        if element_count > 0:
+            if interval[0] >= mostly:
+                return True, interval
+
+            if interval[1] < mostly:
+                return False, interval
+
+        raise InconclusiveSampledValidationError(
+            f"The success ratio of the sample is between {interval[0]} and {interval[1]} (with confidence "
+            f'{sampling["confidence"]}), which does not decide whether it is at least {mostly} ("mostly").'
+        )
+
+    @staticmethod
+    def _add_sampling_details(
+        result: dict, sampling: dict, interval: Tuple[float, float]
+    ) -> None:
+        if "result" in result:
+            result["result"].setdefault("details", {})["sampling"] = {
+                **sampling,
+                "success_ratio_interval": list(interval),
+            }
 
 
 class ColumnPairMapExpectation(TableExpectation, ABC):
@@ -2,6 +2,10 @@ from .meta_metric_provider import (  # isort:skip
     MetaMetricProvider,
     DeprecatedMetaMetricProvider,
 )
+import importlib
+
+from great_expectations.expectations.registry_manifest import CLASS_MODULES
+
 from .column_aggregate_metric_provider import (
     ColumnMetricProvider,  # This class name is being deprecated (use "ColumnAggregateMetricProvider" going forward).
 )
@@ -10,9 +14,6 @@ from .column_aggregate_metric_provider import (
     column_aggregate_partial,
     column_aggregate_value,
 )
-from .column_aggregate_metrics import *
-from .column_map_metrics import *
-from .column_pair_map_metrics import *
 from .map_metric_provider import (
     ColumnMapMetricProvider,
     MapMetricProvider,
@@ -27,5 +28,37 @@ from .metric_provider import (
     metric_partial,
     metric_value,
 )
-from .multicolumn_map_metrics import *
-from .table_metrics import *
+
+# Metric providers of the metric packages are imported (and so registered) only when they are referenced, either as
+# attributes of this package or by metric name through the registry.
+_LAZY_CLASS_NAMES = [
+    name
+    for name, module_name in CLASS_MODULES.items()
+    if module_name.startswith(f"{__name__}.")
+]
+
+__all__ = [
+    "MetaMetricProvider",
+    "DeprecatedMetaMetricProvider",
+    "ColumnMetricProvider",
+    "ColumnAggregateMetricProvider",
+    "column_aggregate_partial",
+    "column_aggregate_value",
+    "ColumnMapMetricProvider",
+    "MapMetricProvider",
+    "column_condition_partial",
+    "column_function_partial",
+    "MetricDomainTypes",
+    "MetricFunctionTypes",
+    "MetricPartialFunctionTypes",
+    "MetricProvider",
+    "metric_partial",
+    "metric_value",
+] + _LAZY_CLASS_NAMES
+
+
+def __getattr__(name: str):
+    if name in _LAZY_CLASS_NAMES:
+        return getattr(importlib.import_module(CLASS_MODULES[name]), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
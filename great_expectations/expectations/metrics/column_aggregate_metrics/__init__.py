@@ -1,17 +1,21 @@
-from .column_distinct_values import ColumnDistinctValues, ColumnDistinctValuesCount
-from .column_histogram import ColumnHistogram
-from .column_max import ColumnMax
-from .column_mean import ColumnMean
-from .column_median import ColumnMedian
-from .column_min import ColumnMin
-from .column_most_common_value import ColumnMostCommonValue
-from .column_parameterized_distribution_ks_test_p_value import (
-    ColumnParameterizedDistributionKSTestPValue,
-)
-from .column_partition import ColumnPartition
-from .column_proportion_of_unique_values import ColumnUniqueProportion
-from .column_quantile_values import ColumnQuantileValues
-from .column_standard_deviation import ColumnStandardDeviation
-from .column_sum import ColumnSum
-from .column_value_counts import ColumnValueCounts
-from .column_values_between_count import ColumnValuesBetweenCount
+"""
+Metric providers are imported (and so registered) only when they are referenced, either as attributes of this package or
+by metric name through the registry (see "great_expectations/expectations/registry_manifest.py").
+"""
+
+import importlib
+
+from great_expectations.expectations.registry_manifest import CLASS_MODULES
+
+__all__ = [
+    name
+    for name, module_name in CLASS_MODULES.items()
+    if module_name.startswith(f"{__name__}.")
+]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return getattr(importlib.import_module(CLASS_MODULES[name]), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
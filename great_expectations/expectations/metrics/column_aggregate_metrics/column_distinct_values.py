@@ -7,11 +7,17 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.import_manager import F, sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.util import (
+    get_approximate_count_distinct_expression,
+)
+from great_expectations.expectations.util import get_approximation_relative_error
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
@@ -79,6 +85,14 @@ class ColumnDistinctValues(ColumnAggregateMetricProvider):
 
 
 class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
+    """Number of distinct (non-null) values of a column.
+
+    If "approximation_relative_error" is set to a float between 0 and 1, the count is estimated (see
+    "get_approximation_relative_error()") by the dialect-native approximation for SQL databases (or an exact
+    "COUNT(DISTINCT)" without one) and by "approx_count_distinct" for Spark.  Pandas always counts exactly, as
+    "nunique()" is faster than sketching the column.
+    """
+
     metric_name = "column.distinct_values.count"
 
     @column_aggregate_value(engine=PandasExecutionEngine)
@@ -94,6 +108,31 @@ class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: Dict,
     ):
+        relative_error: Optional[float] = get_approximation_relative_error(
+            approximation_relative_error=metric_value_kwargs.get(
+                "approximation_relative_error"
+            )
+        )
+        if relative_error is not None:
+            (
+                selectable,
+                _,
+                accessor_domain_kwargs,
+            ) = execution_engine.get_compute_domain(
+                metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+            )
+            return execution_engine.engine.execute(
+                sa.select(
+                    [
+                        get_approximate_count_distinct_expression(
+                            column_name=accessor_domain_kwargs["column"],
+                            relative_error=relative_error,
+                            dialect=execution_engine.engine.dialect,
+                        )
+                    ]
+                ).select_from(selectable)
+            ).scalar()
+
         observed_value_counts = metrics["column.value_counts"]
         return len(observed_value_counts)
 
@@ -106,6 +145,21 @@ class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: Dict,
     ):
+        relative_error: Optional[float] = get_approximation_relative_error(
+            approximation_relative_error=metric_value_kwargs.get(
+                "approximation_relative_error"
+            )
+        )
+        if relative_error is not None:
+            df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+                metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+            )
+            return df.select(
+                F.approx_count_distinct(
+                    F.col(accessor_domain_kwargs["column"]), rsd=relative_error
+                )
+            ).collect()[0][0]
+
         observed_value_counts = metrics["column.value_counts"]
         return len(observed_value_counts)
 
@@ -128,6 +182,13 @@ class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
 
         if isinstance(
             execution_engine, (SqlAlchemyExecutionEngine, SparkDFExecutionEngine)
+        ) and (
+            get_approximation_relative_error(
+                approximation_relative_error=(metric.metric_value_kwargs or {}).get(
+                    "approximation_relative_error"
+                )
+            )
+            is None
         ):
             dependencies["column.value_counts"] = MetricConfiguration(
                 metric_name="column.value_counts",
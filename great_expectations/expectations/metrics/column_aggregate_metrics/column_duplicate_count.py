@@ -0,0 +1,35 @@
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_partial,
+    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.import_manager import F, sa
+
+
+class ColumnDuplicateCount(ColumnAggregateMetricProvider):
+    """Number of (non-null) values of a column, which repeat an earlier value (i.e., the number of values minus the
+    number of distinct values).
+
+    For SQL databases and Spark, the count is an aggregate ("COUNT(column) - COUNT(DISTINCT column)"), which is bundled
+    with the other aggregate metrics of the column into a single query.  A duplicate count of zero proves that all values
+    of the column are unique, without a uniqueness condition having to be evaluated row by row.
+    """
+
+    metric_name = "column.duplicate_count"
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, **kwargs):
+        return column.count() - column.nunique()
+
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(cls, column, **kwargs):
+        return sa.func.count(column) - sa.func.count(sa.distinct(column))
+
+    @column_aggregate_partial(engine=SparkDFExecutionEngine)
+    def _spark(cls, column, **kwargs):
+        return F.count(column) - F.countDistinct(column)
@@ -1,9 +1,10 @@
 import copy
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.util import (
     convert_to_json_serializable,
     get_sql_dialect_floating_point_infinity_value,
@@ -19,9 +20,63 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
 )
 from great_expectations.expectations.metrics.import_manager import Bucketizer, F, sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
+try:
+    from sqlalchemy.sql import Select
+    from sqlalchemy.sql.elements import ColumnElement, TextClause
+except ImportError:
+    logger.debug(
+        "Unable to load SqlAlchemy context; install optional sqlalchemy dependency for support"
+    )
+    Select = None
+    ColumnElement = None
+    TextClause = None
+
+
+def _get_column_histograms_for_metric_value_bundle(
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_value_bundle: List[Tuple[MetricConfiguration, dict]],
+) -> Dict[Tuple[str, str, str], list]:
+    """Resolve "column.histogram" metrics together, with one scan for all columns sharing a compute domain."""
+    column_bins_by_compute_domain: Dict[str, Tuple[Any, list, list]] = {}
+    for metric_configuration, metric_provider_kwargs in metric_value_bundle:
+        (
+            selectable,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(
+            domain_kwargs=metric_provider_kwargs["metric_domain_kwargs"],
+            domain_type=MetricDomainTypes.COLUMN,
+        )
+        _, metric_ids, column_bins = column_bins_by_compute_domain.setdefault(
+            IDDict(compute_domain_kwargs).to_id(), (selectable, [], [])
+        )
+        metric_ids.append(metric_configuration.id)
+        column_bins.append(
+            (
+                accessor_domain_kwargs["column"],
+                metric_provider_kwargs["metric_value_kwargs"]["bins"],
+            )
+        )
+
+    resolved_metrics: Dict[Tuple[str, str, str], list] = {}
+    for selectable, metric_ids, column_bins in column_bins_by_compute_domain.values():
+        resolved_metrics.update(
+            zip(
+                metric_ids,
+                _get_column_histograms_sqlalchemy(
+                    execution_engine=execution_engine,
+                    selectable=selectable,
+                    column_bins=column_bins,
+                ),
+            )
+        )
+
+    return resolved_metrics
+
 
 class ColumnHistogram(ColumnAggregateMetricProvider):
     metric_name = "column.histogram"
@@ -44,7 +99,10 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
         hist, bin_edges = np.histogram(df[column], bins, density=False)
         return list(hist)
 
-    @metric_value(engine=SqlAlchemyExecutionEngine)
+    @metric_value(
+        engine=SqlAlchemyExecutionEngine,
+        bundle_fn=_get_column_histograms_for_metric_value_bundle,
+    )
     def _sqlalchemy(
         cls,
         execution_engine: SqlAlchemyExecutionEngine,
@@ -62,100 +120,13 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
         selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
             domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
         )
-        column = accessor_domain_kwargs["column"]
-        bins = metric_value_kwargs["bins"]
-
-        case_conditions = []
-        idx = 0
-        if isinstance(bins, np.ndarray):
-            bins = bins.tolist()
-        else:
-            bins = list(bins)
-
-        # If we have an infinite lower bound, don't express that in sql
-        if (
-            bins[0]
-            == get_sql_dialect_floating_point_infinity_value(
-                schema="api_np", negative=True
-            )
-        ) or (
-            bins[0]
-            == get_sql_dialect_floating_point_infinity_value(
-                schema="api_cast", negative=True
-            )
-        ):
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case([(sa.column(column) < bins[idx + 1], 1)], else_=0)
-                ).label(f"bin_{str(idx)}")
-            )
-            idx += 1
-
-        for idx in range(idx, len(bins) - 2):
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    bins[idx] <= sa.column(column),
-                                    sa.column(column) < bins[idx + 1],
-                                ),
-                                1,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label(f"bin_{str(idx)}")
-            )
-
-        if (
-            bins[-1]
-            == get_sql_dialect_floating_point_infinity_value(
-                schema="api_np", negative=False
-            )
-        ) or (
-            bins[-1]
-            == get_sql_dialect_floating_point_infinity_value(
-                schema="api_cast", negative=False
-            )
-        ):
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case([(bins[-2] <= sa.column(column), 1)], else_=0)
-                ).label(f"bin_{str(len(bins) - 1)}")
-            )
-        else:
-            case_conditions.append(
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    bins[-2] <= sa.column(column),
-                                    sa.column(column) <= bins[-1],
-                                ),
-                                1,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label(f"bin_{str(len(bins) - 1)}")
-            )
-
-        query = (
-            sa.select(case_conditions)
-            .where(
-                sa.column(column) != None,
-            )
-            .select_from(selectable)
-        )
-
-        # Run the data through convert_to_json_serializable to ensure we do not have Decimal types
-        hist = convert_to_json_serializable(
-            list(execution_engine.engine.execute(query).fetchone())
-        )
-        return hist
+        return _get_column_histograms_sqlalchemy(
+            execution_engine=execution_engine,
+            selectable=selectable,
+            column_bins=[
+                (accessor_domain_kwargs["column"], metric_value_kwargs["bins"])
+            ],
+        )[0]
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
@@ -203,19 +174,25 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
         # But, since the last bin in our case will often be +infinity, we need to
         # find the number of values exactly equal to the upper bound to add those
 
-        # We'll try for an optimization by asking for it at the same time
-        if added_max:
-            upper_bound_count = (
-                temp_column.select(column).filter(F.col(column) == bins[-2]).count()
+        # These are counted by the same aggregation as the bins (they all fall in the added +infinity bin), so that
+        # the column is only scanned once
+        hist_rows = (
+            bucketed.groupBy("buckets")
+            .agg(
+                F.count(F.lit(1)).alias("count"),
+                F.sum(F.when(F.col(column) == bins[-2], 1).otherwise(0)).alias(
+                    "upper_bound_count"
+                ),
             )
-        else:
-            upper_bound_count = 0
-
-        hist_rows = bucketed.groupBy("buckets").count().collect()
+            .collect()
+        )
         # Spark only returns buckets that have nonzero counts.
         hist = [0] * (len(bins) - 1)
+        upper_bound_count = 0
         for row in hist_rows:
             hist[int(row["buckets"])] = row["count"]
+            if added_max and int(row["buckets"]) == len(bins) - 2:
+                upper_bound_count = row["upper_bound_count"]
 
         hist[-2] += upper_bound_count
 
@@ -232,3 +209,120 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
                 logger.warning("Discarding histogram values above highest bin.")
 
         return hist
+
+
+def _get_column_histograms_sqlalchemy(
+    execution_engine: SqlAlchemyExecutionEngine,
+    selectable: Any,
+    column_bins: List[Tuple[str, Any]],
+) -> List[list]:
+    """Count the values of each column falling in each of its bins, with a single scan of the selectable.
+
+    Every row is assigned the index of its bin in each column (see "_get_bin_index_expression()").  For one column, the
+    rows are counted by bin with "GROUP BY"; for several columns, every (column, bin) pair is counted by its own
+    "SUM(CASE ...)" over the bin indices, so that all histograms come from one pass without multiplying the rows.
+
+    Returns:
+        The histogram (list of counts corresponding to bins) of each column, in the order of "column_bins"
+    """
+    bins_list: List[list] = [
+        bins.tolist() if isinstance(bins, np.ndarray) else list(bins)
+        for _, bins in column_bins
+    ]
+    bin_index_expressions: List[ColumnElement] = [
+        _get_bin_index_expression(column=sa.column(column_name), bins=bins)
+        for (column_name, _), bins in zip(column_bins, bins_list)
+    ]
+    bin_indices = (
+        sa.select(
+            [
+                bin_index_expression.label(f"bin_index_{histogram_index}")
+                for histogram_index, bin_index_expression in enumerate(
+                    bin_index_expressions
+                )
+            ]
+        )
+        .select_from(selectable)
+        .subquery("bin_indices")
+    )
+
+    histograms: List[list] = [[0] * (len(bins) - 1) for bins in bins_list]
+    if len(column_bins) == 1:
+        bin_index_column: ColumnElement = bin_indices.c.bin_index_0
+        query: Select = (
+            sa.select([bin_index_column, sa.func.count().label("bin_count")])
+            .where(bin_index_column != None)
+            .group_by(bin_index_column)
+        )
+        for bin_index, bin_count in execution_engine.engine.execute(query).fetchall():
+            histograms[0][int(bin_index)] = bin_count
+    else:
+        query: Select = sa.select(
+            [
+                sa.func.sum(
+                    sa.case(
+                        [
+                            (
+                                bin_indices.c[f"bin_index_{histogram_index}"]
+                                == bin_index,
+                                1,
+                            )
+                        ],
+                        else_=0,
+                    )
+                ).label(f"bin_count_{histogram_index}_{bin_index}")
+                for histogram_index, histogram in enumerate(histograms)
+                for bin_index in range(len(histogram))
+            ]
+        )
+        bin_counts = iter(execution_engine.engine.execute(query).fetchone())
+        for histogram in histograms:
+            for bin_index in range(len(histogram)):
+                # SUM is NULL when there are no rows.
+                histogram[bin_index] = next(bin_counts) or 0
+
+    # Run the data through convert_to_json_serializable to ensure we do not have Decimal types
+    return [convert_to_json_serializable(histogram) for histogram in histograms]
+
+
+def _get_bin_index_expression(column: ColumnElement, bins: list) -> ColumnElement:
+    """Expression of the index of the bin in which the value of the column falls (NULL if it falls in no bin).
+
+    Bins follow the numpy convention, "bins[i] <= value < bins[i + 1]", except for the last bin, which includes its
+    upper edge; infinite outer edges are not expressed in SQL.  The bin is found by a binary search over the edges,
+    written as nested "CASE" expressions, so that every value is compared with O(log(number of bins)) edges.
+    """
+
+    def _binary_search(lowest_bin_index: int, highest_bin_index: int) -> Any:
+        if lowest_bin_index == highest_bin_index:
+            return sa.literal(lowest_bin_index)
+
+        middle_bin_index: int = (lowest_bin_index + highest_bin_index + 1) // 2
+        return sa.case(
+            [
+                (
+                    column < bins[middle_bin_index],
+                    _binary_search(lowest_bin_index, middle_bin_index - 1),
+                )
+            ],
+            else_=_binary_search(middle_bin_index, highest_bin_index),
+        )
+
+    out_of_range_conditions: List[ColumnElement] = [column == None]
+    if not _is_infinite_bin_edge(edge=bins[0], negative=True):
+        out_of_range_conditions.append(column < bins[0])
+    if not _is_infinite_bin_edge(edge=bins[-1], negative=False):
+        out_of_range_conditions.append(column > bins[-1])
+
+    return sa.case(
+        [(sa.or_(*out_of_range_conditions), None)],
+        else_=_binary_search(0, len(bins) - 2),
+    )
+
+
+def _is_infinite_bin_edge(edge: float, negative: bool) -> bool:
+    return edge == get_sql_dialect_floating_point_infinity_value(
+        schema="api_np", negative=negative
+    ) or edge == get_sql_dialect_floating_point_infinity_value(
+        schema="api_cast", negative=negative
+    )
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -16,11 +16,89 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
 )
 from great_expectations.expectations.metrics.import_manager import sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.util import (
+    get_approximate_percentile_expression,
+    get_sorted_column_values_at_positions,
+    get_sorted_column_values_at_positions_by_metric,
+    sql_engine_supports_window_functions,
+)
+from great_expectations.expectations.util import get_approximation_relative_error
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
+try:
+    from sqlalchemy.sql.elements import ColumnElement
+except ImportError:
+    ColumnElement = None
+
+
+def _get_column_medians_for_metric_value_bundle(
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_value_bundle: List[Tuple[MetricConfiguration, dict]],
+) -> Dict[Tuple[str, str, str], Optional[Any]]:
+    """Resolve "column.median" metrics together.
+
+    On SQLite and MySQL, the center values of all columns sharing a compute domain are read by a single ordered scan
+    (see "get_sorted_column_values_at_positions_by_metric()"); other dialects compute the median of each column on its
+    own.
+    """
+    if not sql_engine_supports_window_functions(
+        sqlalchemy_engine=execution_engine.engine
+    ):
+        return {
+            metric_configuration.id: _get_column_median_sqlalchemy(
+                execution_engine=execution_engine,
+                metric_domain_kwargs=metric_provider_kwargs["metric_domain_kwargs"],
+                metric_value_kwargs=metric_provider_kwargs["metric_value_kwargs"],
+                metrics=metric_provider_kwargs["metrics"],
+            )
+            for metric_configuration, metric_provider_kwargs in metric_value_bundle
+        }
+
+    resolved_metrics: Dict[Tuple[str, str, str], Optional[Any]] = {}
+    nonnull_counts: Dict[Tuple[str, str, str], int] = {}
+    metric_positions: List[Tuple[Tuple[str, str, str], dict, List[int]]] = []
+    for metric_configuration, metric_provider_kwargs in metric_value_bundle:
+        nonnull_count: Optional[int] = metric_provider_kwargs["metrics"].get(
+            "column_values.nonnull.count"
+        )
+        if not nonnull_count:
+            resolved_metrics[metric_configuration.id] = None
+        else:
+            nonnull_counts[metric_configuration.id] = nonnull_count
+            metric_positions.append(
+                (
+                    metric_configuration.id,
+                    metric_provider_kwargs["metric_domain_kwargs"],
+                    _get_column_median_positions(nonnull_count=nonnull_count),
+                )
+            )
+
+    center_values_by_metric: Dict[
+        Tuple[str, str, str], List[Any]
+    ] = get_sorted_column_values_at_positions_by_metric(
+        execution_engine=execution_engine,
+        metric_positions=metric_positions,
+        ignore_nulls=True,
+    )
+    resolved_metrics.update(
+        {
+            metric_id: _get_median_of_center_values(
+                center_values=center_values, nonnull_count=nonnull_counts[metric_id]
+            )
+            for metric_id, center_values in center_values_by_metric.items()
+        }
+    )
+    return resolved_metrics
+
 
 class ColumnMedian(ColumnAggregateMetricProvider):
-    """MetricProvider Class for Aggregate Mean MetricProvider"""
+    """MetricProvider Class for Aggregate Mean MetricProvider
+
+    If "approximation_relative_error" is set to a float between 0 and 1, the median is estimated (see
+    "get_approximation_relative_error()") by the dialect-native approximation for SQL databases having one and by
+    "approxQuantile" for Spark.  Pandas always computes the exact median, as "median()" is faster than sketching the
+    column.
+    """
 
     metric_name = "column.median"
 
@@ -29,7 +107,11 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         """Pandas Median Implementation"""
         return column.median()
 
-    @metric_value(engine=SqlAlchemyExecutionEngine, metric_fn_type="value")
+    @metric_value(
+        engine=SqlAlchemyExecutionEngine,
+        metric_fn_type="value",
+        bundle_fn=_get_column_medians_for_metric_value_bundle,
+    )
     def _sqlalchemy(
         cls,
         execution_engine: SqlAlchemyExecutionEngine,
@@ -38,47 +120,14 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: Dict,
     ):
-        (
-            selectable,
-            compute_domain_kwargs,
-            accessor_domain_kwargs,
-        ) = execution_engine.get_compute_domain(
-            metric_domain_kwargs, MetricDomainTypes.COLUMN
-        )
-        column_name = accessor_domain_kwargs["column"]
-        column = sa.column(column_name)
-        sqlalchemy_engine = execution_engine.engine
         """SqlAlchemy Median Implementation"""
-        nonnull_count = metrics.get("column_values.nonnull.count")
-        if not nonnull_count:
-            return None
-        element_values = sqlalchemy_engine.execute(
-            sa.select([column])
-            .order_by(column)
-            .where(column != None)
-            .offset(max(nonnull_count // 2 - 1, 0))
-            .limit(2)
-            .select_from(selectable)
+        return _get_column_median_sqlalchemy(
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
+            metrics=metrics,
         )
 
-        column_values = list(element_values.fetchall())
-
-        if len(column_values) == 0:
-            column_median = None
-        elif nonnull_count % 2 == 0:
-            # An even number of column values: take the average of the two center values
-            column_median = (
-                float(
-                    column_values[0][0]
-                    + column_values[1][0]  # left center value  # right center value
-                )
-                / 2.0
-            )  # Average center values
-        else:
-            # An odd number of column values, we can just take the center value
-            column_median = column_values[1][0]  # True center value
-        return column_median
-
     @metric_value(engine=SparkDFExecutionEngine, metric_fn_type="value")
     def _spark(
         cls,
@@ -100,12 +149,20 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         # to the 50th percentile such that we always get exactly the middle two values
         # (i.e. 0 < epsilon < 1 / (2 * values))
 
-        # Note that this can be an expensive computation; we are not exposing
-        # spark's ability to estimate.
+        # Note that this can be an expensive computation; spark's ability to estimate
+        # is only used if "approximation_relative_error" is set.
         # We add two to 2 * n_values to maintain a legitimate quantile
         # in the degenerate case when n_values = 0
 
         """Spark Median Implementation"""
+        relative_error: Optional[float] = get_approximation_relative_error(
+            approximation_relative_error=metric_value_kwargs.get(
+                "approximation_relative_error"
+            )
+        )
+        if relative_error is not None:
+            return df.approxQuantile(column, [0.5], relative_error)[0]
+
         table_row_count = metrics.get("table.row_count")
         result = df.approxQuantile(
             column, [0.5, 0.5 + (1 / (2 + (2 * table_row_count)))], 0
@@ -140,3 +197,103 @@ class ColumnMedian(ColumnAggregateMetricProvider):
             )
 
         return dependencies
+
+
+def _get_column_median_sqlalchemy(
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+) -> Optional[Any]:
+    (
+        selectable,
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    ) = execution_engine.get_compute_domain(
+        metric_domain_kwargs, MetricDomainTypes.COLUMN
+    )
+    column_name = accessor_domain_kwargs["column"]
+    column = sa.column(column_name)
+    sqlalchemy_engine = execution_engine.engine
+    nonnull_count = metrics.get("column_values.nonnull.count")
+    if not nonnull_count:
+        return None
+
+    relative_error: Optional[float] = get_approximation_relative_error(
+        approximation_relative_error=(metric_value_kwargs or {}).get(
+            "approximation_relative_error"
+        )
+    )
+    if relative_error is not None:
+        approximate_median: Optional[
+            ColumnElement
+        ] = get_approximate_percentile_expression(
+            column_name=column_name,
+            quantile=0.5,
+            relative_error=relative_error,
+            dialect=sqlalchemy_engine.dialect,
+        )
+        if approximate_median is not None:
+            return sqlalchemy_engine.execute(
+                sa.select([approximate_median]).select_from(selectable)
+            ).scalar()
+
+    if sql_engine_supports_window_functions(sqlalchemy_engine=sqlalchemy_engine):
+        center_values: List[Any] = get_sorted_column_values_at_positions(
+            column_positions={
+                column_name: _get_column_median_positions(nonnull_count=nonnull_count)
+            },
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+            ignore_nulls=True,
+        )[column_name]
+        return _get_median_of_center_values(
+            center_values=center_values, nonnull_count=nonnull_count
+        )
+
+    element_values = sqlalchemy_engine.execute(
+        sa.select([column])
+        .order_by(column)
+        .where(column != None)
+        .offset(max(nonnull_count // 2 - 1, 0))
+        .limit(2)
+        .select_from(selectable)
+    )
+
+    column_values = list(element_values.fetchall())
+
+    if len(column_values) == 0:
+        column_median = None
+    elif nonnull_count % 2 == 0:
+        # An even number of column values: take the average of the two center values
+        column_median = (
+            float(
+                column_values[0][0]
+                + column_values[1][0]  # left center value  # right center value
+            )
+            / 2.0
+        )  # Average center values
+    else:
+        # An odd number of column values, we can just take the center value (the only value, if there is just one)
+        column_median = column_values[-1][0]  # True center value
+    return column_median
+
+
+def _get_column_median_positions(nonnull_count: int) -> List[int]:
+    # The positions of the two center values (the same position twice for an odd number of values).
+    return [(nonnull_count - 1) // 2, nonnull_count // 2]
+
+
+def _get_median_of_center_values(
+    center_values: List[Any], nonnull_count: int
+) -> Optional[Any]:
+    left_center_value, right_center_value = center_values
+    if left_center_value is None or right_center_value is None:
+        return None
+
+    if nonnull_count % 2 == 1:
+        # An odd number of column values, we can just take the center value
+        return right_center_value
+
+    # An even number of column values: take the average of the two center values
+    return float(left_center_value + right_center_value) / 2.0
@@ -57,9 +57,18 @@ class ColumnUniqueProportion(ColumnAggregateMetricProvider):
             runtime_configuration=runtime_configuration,
         )
 
+        # An approximate unique proportion is computed from an approximate count of distinct values.
+        approximation_relative_error: Optional[float] = (
+            metric.metric_value_kwargs or {}
+        ).get("approximation_relative_error")
         dependencies["column.distinct_values.count"] = MetricConfiguration(
             metric_name="column.distinct_values.count",
             metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs={
+                "approximation_relative_error": approximation_relative_error
+            }
+            if approximation_relative_error is not None
+            else None,
         )
 
         dependencies["column_values.nonnull.unexpected_count"] = MetricConfiguration(
@@ -1,10 +1,10 @@
 import itertools
 import logging
+import math
 import traceback
 from collections.abc import Iterable
-from typing import Any, Dict, List
-
-import numpy as np
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Dict, List, Optional, Tuple
 
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
@@ -19,25 +19,31 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
 )
 from great_expectations.expectations.metrics.import_manager import sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
-from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.expectations.metrics.util import (
+    attempt_allowing_relative_error,
+    get_approximate_percentile_expression,
+    get_sorted_column_values_at_positions,
+    get_sorted_column_values_at_positions_by_metric,
+    sql_engine_supports_window_functions,
+)
+from great_expectations.expectations.util import get_approximation_relative_error
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
 try:
     from sqlalchemy.exc import ProgrammingError
     from sqlalchemy.sql import Select
-    from sqlalchemy.sql.elements import Label, TextClause, WithinGroup
-    from sqlalchemy.sql.selectable import CTE
+    from sqlalchemy.sql.elements import ColumnElement, TextClause, WithinGroup
 except ImportError:
     logger.debug(
         "Unable to load SqlAlchemy context; install optional sqlalchemy dependency for support"
     )
     ProgrammingError = None
     Select = None
-    Label = None
+    ColumnElement = None
     TextClause = None
     WithinGroup = None
-    CTE = None
 
 try:
     from sqlalchemy.engine.row import Row
@@ -54,13 +60,60 @@ except ImportError:
         Row = None
 
 
+def _get_column_quantiles_for_metric_value_bundle(
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_value_bundle: List[Tuple[MetricConfiguration, dict]],
+) -> Dict[Tuple[str, str, str], list]:
+    """Resolve "column.quantile_values" metrics together.
+
+    On SQLite and MySQL, the quantiles of all columns sharing a compute domain are read by a single ordered scan (see
+    "get_sorted_column_values_at_positions_by_metric()"); other dialects compute the quantiles of each column on its own.
+    """
+    sqlalchemy_engine = execution_engine.engine
+    if not sql_engine_supports_window_functions(sqlalchemy_engine=sqlalchemy_engine):
+        return {
+            metric_configuration.id: _get_column_quantiles_sqlalchemy(
+                execution_engine=execution_engine,
+                metric_domain_kwargs=metric_provider_kwargs["metric_domain_kwargs"],
+                metric_value_kwargs=metric_provider_kwargs["metric_value_kwargs"],
+                metrics=metric_provider_kwargs["metrics"],
+            )
+            for metric_configuration, metric_provider_kwargs in metric_value_bundle
+        }
+
+    dialect_name: str = sqlalchemy_engine.dialect.name.lower()
+    return get_sorted_column_values_at_positions_by_metric(
+        execution_engine=execution_engine,
+        metric_positions=[
+            (
+                metric_configuration.id,
+                metric_provider_kwargs["metric_domain_kwargs"],
+                _get_column_quantile_positions(
+                    dialect_name=dialect_name,
+                    quantiles=metric_provider_kwargs["metric_value_kwargs"][
+                        "quantiles"
+                    ],
+                    table_row_count=metric_provider_kwargs["metrics"].get(
+                        "table.row_count"
+                    ),
+                ),
+            )
+            for metric_configuration, metric_provider_kwargs in metric_value_bundle
+        ],
+    )
+
+
 class ColumnQuantileValues(ColumnAggregateMetricProvider):
     metric_name = "column.quantile_values"
     value_keys = ("quantiles", "allow_relative_error")
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, quantiles, allow_relative_error, **kwargs):
-        """Quantile Function"""
+        """Quantile Function
+
+        Pandas always computes exact quantiles ("approximation_relative_error" is ignored), as "quantile()" is faster
+        than sketching the column.
+        """
         interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
 
         if not allow_relative_error:
@@ -73,7 +126,10 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
             )
         return column.quantile(quantiles, interpolation=allow_relative_error).tolist()
 
-    @metric_value(engine=SqlAlchemyExecutionEngine)
+    @metric_value(
+        engine=SqlAlchemyExecutionEngine,
+        bundle_fn=_get_column_quantiles_for_metric_value_bundle,
+    )
     def _sqlalchemy(
         cls,
         execution_engine: SqlAlchemyExecutionEngine,
@@ -82,75 +138,12 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: Dict,
     ):
-        (
-            selectable,
-            compute_domain_kwargs,
-            accessor_domain_kwargs,
-        ) = execution_engine.get_compute_domain(
-            metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        return _get_column_quantiles_sqlalchemy(
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
+            metrics=metrics,
         )
-        column_name = accessor_domain_kwargs["column"]
-        column = sa.column(column_name)
-        sqlalchemy_engine = execution_engine.engine
-        dialect = sqlalchemy_engine.dialect
-        quantiles = metric_value_kwargs["quantiles"]
-        allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
-        table_row_count = metrics.get("table.row_count")
-        if dialect.name.lower() == "mssql":
-            return _get_column_quantiles_mssql(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-            )
-        elif dialect.name.lower() == "bigquery":
-            return _get_column_quantiles_bigquery(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-            )
-        elif dialect.name.lower() == "mysql":
-            return _get_column_quantiles_mysql(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-            )
-        elif dialect.name.lower() == "snowflake":
-            # NOTE: 20201216 - JPC - snowflake has a representation/precision limitation
-            # in its percentile_disc implementation that causes an error when we do
-            # not round. It is unclear to me *how* the call to round affects the behavior --
-            # the binary representation should be identical before and after, and I do
-            # not observe a type difference. However, the issue is replicable in the
-            # snowflake console and directly observable in side-by-side comparisons with
-            # and without the call to round()
-            quantiles = [round(x, 10) for x in quantiles]
-            return _get_column_quantiles_generic_sqlalchemy(
-                column=column,
-                quantiles=quantiles,
-                allow_relative_error=allow_relative_error,
-                dialect=dialect,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-            )
-        elif dialect.name.lower() == "sqlite":
-            return _get_column_quantiles_sqlite(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-                table_row_count=table_row_count,
-            )
-        else:
-            return _get_column_quantiles_generic_sqlalchemy(
-                column=column,
-                quantiles=quantiles,
-                allow_relative_error=allow_relative_error,
-                dialect=dialect,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-            )
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
@@ -171,6 +164,13 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
         quantiles = metric_value_kwargs["quantiles"]
         column = accessor_domain_kwargs["column"]
+        relative_error: Optional[float] = get_approximation_relative_error(
+            approximation_relative_error=metric_value_kwargs.get(
+                "approximation_relative_error"
+            )
+        )
+        if relative_error is not None:
+            return df.approxQuantile(column, list(quantiles), relative_error)
         if allow_relative_error is False:
             allow_relative_error = 0.0
         if (
@@ -184,6 +184,157 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         return df.approxQuantile(column, list(quantiles), allow_relative_error)
 
 
+def _get_column_quantiles_sqlalchemy(
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+) -> list:
+    (
+        selectable,
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    ) = execution_engine.get_compute_domain(
+        metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+    )
+    column_name = accessor_domain_kwargs["column"]
+    column = sa.column(column_name)
+    sqlalchemy_engine = execution_engine.engine
+    dialect = sqlalchemy_engine.dialect
+    quantiles = metric_value_kwargs["quantiles"]
+    allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
+    table_row_count = metrics.get("table.row_count")
+    relative_error: Optional[float] = get_approximation_relative_error(
+        approximation_relative_error=metric_value_kwargs.get(
+            "approximation_relative_error"
+        )
+    )
+    if relative_error is not None:
+        approximate_quantiles: List[Optional[ColumnElement]] = [
+            get_approximate_percentile_expression(
+                column_name=column_name,
+                quantile=quantile,
+                relative_error=relative_error,
+                dialect=dialect,
+            )
+            for quantile in quantiles
+        ]
+        if all(
+            approximate_quantile is not None
+            for approximate_quantile in approximate_quantiles
+        ):
+            return list(
+                sqlalchemy_engine.execute(
+                    sa.select(approximate_quantiles).select_from(selectable)
+                ).fetchone()
+            )
+
+    if sql_engine_supports_window_functions(sqlalchemy_engine=sqlalchemy_engine):
+        return get_sorted_column_values_at_positions(
+            column_positions={
+                column_name: _get_column_quantile_positions(
+                    dialect_name=dialect.name.lower(),
+                    quantiles=quantiles,
+                    table_row_count=table_row_count,
+                )
+            },
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )[column_name]
+    elif dialect.name.lower() == "mssql":
+        return _get_column_quantiles_mssql(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )
+    elif dialect.name.lower() == "bigquery":
+        return _get_column_quantiles_bigquery(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )
+    elif dialect.name.lower() == "snowflake":
+        # NOTE: 20201216 - JPC - snowflake has a representation/precision limitation
+        # in its percentile_disc implementation that causes an error when we do
+        # not round. It is unclear to me *how* the call to round affects the behavior --
+        # the binary representation should be identical before and after, and I do
+        # not observe a type difference. However, the issue is replicable in the
+        # snowflake console and directly observable in side-by-side comparisons with
+        # and without the call to round()
+        quantiles = [round(x, 10) for x in quantiles]
+        return _get_column_quantiles_generic_sqlalchemy(
+            column=column,
+            quantiles=quantiles,
+            allow_relative_error=allow_relative_error,
+            dialect=dialect,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )
+    elif dialect.name.lower() == "sqlite":
+        return _get_column_quantiles_sqlite(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+            table_row_count=table_row_count,
+        )
+    else:
+        return _get_column_quantiles_generic_sqlalchemy(
+            column=column,
+            quantiles=quantiles,
+            allow_relative_error=allow_relative_error,
+            dialect=dialect,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )
+
+
+def _get_column_quantile_positions(
+    dialect_name: str, quantiles: Iterable, table_row_count: int
+) -> List[int]:
+    """Positions (in the column sorted in ascending order, NULL values first) of the requested quantiles' values.
+
+    The positions reproduce the values formerly picked by one "ORDER BY ... OFFSET ... LIMIT 1" query per quantile on
+    SQLite and by a "PERCENT_RANK()" query on MySQL, respectively, so that quantiles are unchanged.
+    """
+    if dialect_name == "mysql":
+        return _get_column_quantile_positions_mysql(
+            quantiles=quantiles, table_row_count=table_row_count
+        )
+
+    # "OFFSET quantile * table_row_count - 1" (SqlAlchemy truncates the offset to an integer; SQLite ignores negatives).
+    return [max(int(quantile * table_row_count - 1), 0) for quantile in quantiles]
+
+
+def _get_column_quantile_positions_mysql(
+    quantiles: Iterable, table_row_count: int
+) -> List[int]:
+    # The last position having "PERCENT_RANK() <= quantile", both compared as "DECIMAL(18, 15)" values.
+    if table_row_count < 2:
+        return [0 for _ in quantiles]
+
+    precision: Decimal = Decimal("1e-15")
+    last_position: int = table_row_count - 1
+    positions: List[int] = []
+    for quantile in quantiles:
+        quantile = Decimal(float(quantile)).quantize(precision, rounding=ROUND_HALF_UP)
+        position: int = min(max(math.floor(quantile * last_position), 0), last_position)
+        # Percent ranks are rounded, too; hence, the following positions may also compare as not exceeding the quantile.
+        while (
+            position < last_position
+            and Decimal((position + 1) / last_position).quantize(
+                precision, rounding=ROUND_HALF_UP
+            )
+            <= quantile
+        ):
+            position += 1
+        positions.append(position)
+
+    return positions
+
+
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, sqlalchemy_engine
 ) -> list:
@@ -229,73 +380,14 @@ def _get_column_quantiles_bigquery(
         raise pe
 
 
-def _get_column_quantiles_mysql(
-    column, quantiles: Iterable, selectable, sqlalchemy_engine
-) -> list:
-    # MySQL does not support "percentile_disc", so we implement it as a compound query.
-    # Please see https://stackoverflow.com/questions/19770026/calculate-percentile-value-using-mysql for reference.
-    percent_rank_query: CTE = (
-        sa.select(
-            [
-                column,
-                sa.cast(
-                    sa.func.percent_rank().over(order_by=column.asc()),
-                    sa.dialects.mysql.DECIMAL(18, 15),
-                ).label("p"),
-            ]
-        )
-        .order_by(sa.column("p").asc())
-        .select_from(selectable)
-        .cte("t")
-    )
-
-    selects: List[WithinGroup] = []
-    for idx, quantile in enumerate(quantiles):
-        # pymysql cannot handle conversion of numpy float64 to float; convert just in case
-        if np.issubdtype(type(quantile), np.float_):
-            quantile = float(quantile)
-        quantile_column: Label = (
-            sa.func.first_value(column)
-            .over(
-                order_by=sa.case(
-                    [
-                        (
-                            percent_rank_query.c.p
-                            <= sa.cast(quantile, sa.dialects.mysql.DECIMAL(18, 15)),
-                            percent_rank_query.c.p,
-                        )
-                    ],
-                    else_=None,
-                ).desc()
-            )
-            .label(f"q_{idx}")
-        )
-        selects.append(quantile_column)
-    quantiles_query: Select = (
-        sa.select(selects).distinct().order_by(percent_rank_query.c.p.desc())
-    )
-
-    try:
-        quantiles_results: Row = sqlalchemy_engine.execute(quantiles_query).fetchone()
-        return list(quantiles_results)
-    except ProgrammingError as pe:
-        exception_message: str = "An SQL syntax Exception occurred."
-        exception_traceback: str = traceback.format_exc()
-        exception_message += (
-            f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
-        )
-        logger.error(exception_message)
-        raise pe
-
-
 def _get_column_quantiles_sqlite(
     column, quantiles: Iterable, selectable, sqlalchemy_engine, table_row_count
 ) -> list:
     """
     The present implementation is somewhat inefficient, because it requires as many calls to
     "sqlalchemy_engine.execute()" as the number of partitions in the "quantiles" parameter (albeit, typically,
-    only a few).  However, this is the only mechanism available for SQLite at the present time (11/17/2021), because
-    the analytical processing is not a very strongly represented capability of the SQLite database management system.
+    only a few).  Hence, it is only used for SQLite versions older than 3.25.0, which lack window functions; newer
+    versions compute all quantiles in a single ordered scan (see "_get_column_quantiles_for_metric_value_bundle()").
     """
     offsets: List[int] = [quantile * table_row_count - 1 for quantile in quantiles]
     quantile_queries: List[Select] = [
@@ -0,0 +1,91 @@
+import itertools
+from typing import Any, Dict, Iterator, List
+
+from great_expectations.core.sketches import ColumnSketch
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.metric_provider import metric_value
+
+# Number of column values fetched (and added to the sketch) at a time by SQL and Spark implementations.
+SKETCH_FETCH_SIZE: int = 100000
+
+
+class ColumnSketchMetric(ColumnAggregateMetricProvider):
+    """ColumnSketch (mergeable summary of counts, extrema, moments, distinct values and quantiles) of a column.
+
+    The summary is computed in a single pass over the column.  Neither SQL databases nor Spark can build the mergeable
+    HyperLogLog and KLL sketches of the summary natively, so their implementations stream every value of the column to
+    Python (in chunks of SKETCH_FETCH_SIZE values, through "fetchmany()" and "toLocalIterator()", respectively).  This
+    transfers the entire column and is much slower than any single aggregate metric computed in the database or on the
+    cluster; it only pays off if the summary is persisted in MetricSketchStore and reused by many later runs over the
+    same, unchanged batch.
+
+    WARNING: This metric is experimental.
+    """
+
+    metric_name = "column.sketch"
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, **kwargs):
+        sketch: ColumnSketch = ColumnSketch()
+        sketch.update(column)
+        return sketch
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: Dict,
+    ):
+        selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        result = execution_engine.engine.execute(
+            sa.select([sa.column(accessor_domain_kwargs["column"])]).select_from(
+                selectable
+            )
+        )
+
+        sketch: ColumnSketch = ColumnSketch()
+        rows: List[tuple] = result.fetchmany(SKETCH_FETCH_SIZE)
+        while rows:
+            sketch.update([row[0] for row in rows])
+            rows = result.fetchmany(SKETCH_FETCH_SIZE)
+
+        return sketch
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: Dict,
+    ):
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        rows: Iterator = df.select(
+            F.col(accessor_domain_kwargs["column"])
+        ).toLocalIterator()
+
+        sketch: ColumnSketch = ColumnSketch()
+        chunk: List = [row[0] for row in itertools.islice(rows, SKETCH_FETCH_SIZE)]
+        while chunk:
+            sketch.update(chunk)
+            chunk = [row[0] for row in itertools.islice(rows, SKETCH_FETCH_SIZE)]
+
+        return sketch
@@ -1,26 +1,21 @@
-from .column_value_lengths import ColumnValuesValueLength, ColumnValuesValueLengthEquals
-from .column_values_between import ColumnValuesBetween
-from .column_values_dateutil_parseable import ColumnValuesDateutilParseable
-from .column_values_decreasing import ColumnValuesDecreasing
-from .column_values_in_set import ColumnValuesInSet
-from .column_values_in_type_list import ColumnValuesInTypeList
-from .column_values_increasing import ColumnValuesIncreasing
-from .column_values_json_parseable import ColumnValuesJsonParseable
-from .column_values_match_json_schema import ColumnValuesMatchJsonSchema
-from .column_values_match_like_pattern import ColumnValuesMatchLikePattern
-from .column_values_match_like_pattern_list import ColumnValuesMatchLikePatternList
-from .column_values_match_regex import ColumnValuesMatchRegex
-from .column_values_match_regex_list import ColumnValuesMatchRegexList
-from .column_values_match_strftime_format import ColumnValuesMatchStrftimeFormat
-from .column_values_non_null import ColumnValuesNonNull
-from .column_values_not_in_set import ColumnValuesNotInSet
-from .column_values_not_match_like_pattern import ColumnValuesNotMatchLikePattern
-from .column_values_not_match_like_pattern_list import (
-    ColumnValuesNotMatchLikePatternList,
-)
-from .column_values_not_match_regex import ColumnValuesNotMatchRegex
-from .column_values_not_match_regex_list import ColumnValuesNotMatchRegexList
-from .column_values_null import ColumnValuesNull
-from .column_values_of_type import ColumnValuesOfType
-from .column_values_unique import ColumnValuesUnique
-from .column_values_z_score import ColumnValuesZScore
+"""
+Metric providers are imported (and so registered) only when they are referenced, either as attributes of this package or
+by metric name through the registry (see "great_expectations/expectations/registry_manifest.py").
+"""
+
+import importlib
+
+from great_expectations.expectations.registry_manifest import CLASS_MODULES
+
+__all__ = [
+    name
+    for name, module_name in CLASS_MODULES.items()
+    if module_name.startswith(f"{__name__}.")
+]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return getattr(importlib.import_module(CLASS_MODULES[name]), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,25 +1,54 @@
+from typing import Any, Dict, List, Optional
+
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.core import ExpectationConfiguration
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
 from great_expectations.execution_engine.execution_engine import (
+    MetricDomainTypes,
     MetricPartialFunctionTypes,
 )
+from great_expectations.execution_engine.sqlalchemy_batch_data import (
+    SqlAlchemyBatchData,
+)
 from great_expectations.expectations.metrics.import_manager import F, Window, sa
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
+    _sqlalchemy_column_map_condition_value_counts,
+    _sqlalchemy_column_map_condition_values,
+    _sqlalchemy_map_condition_unexpected_count_value,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.util import Select, get_duplicated_mask
 from great_expectations.util import generate_temporary_table_name
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
 class ColumnValuesUnique(ColumnMapMetricProvider):
+    """
+    For "SqlAlchemyExecutionEngine", the unexpected count, values, and value counts are not computed from the (window)
+    uniqueness condition, but from the "column.duplicate_count" aggregate ("COUNT(column) - COUNT(DISTINCT column)"),
+    which is bundled with the other aggregate metrics of the column, and which proves a column unique without any
+    further query.  Otherwise, the duplicated values and their counts come from a single grouped query.  The condition
+    is only evaluated for unexpected rows, or when a caller supplies it as the "unexpected_condition" dependency.
+    """
+
     condition_metric_name = "column_values.unique"
 
+    SQLALCHEMY_DUPLICATE_METRIC_SUFFIXES = (
+        ".unexpected_count",
+        ".unexpected_values",
+        ".unexpected_value_counts",
+    )
+
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
-        return ~column.duplicated(keep=False)
+        return ~get_duplicated_mask(column)
 
     # NOTE: 20201119 - JPC - We cannot split per-dialect into window and non-window functions
     # @column_condition_partial(
@@ -43,17 +72,30 @@ class ColumnValuesUnique(ColumnMapMetricProvider):
         # Will - 20210126
         # This is a special case that needs to be handled for mysql, where you cannot refer to a temp_table
         # more than once in the same query. So instead of passing dup_query as-is, a second temp_table is created with
-        # the column we will be performing the expectation on, and the query is performed against it.
+        # the column we will be performing the expectation on, and the query is performed against it.  If the execution
+        # engine reuses temporary tables, the second temp_table is reused by uniqueness checks of the same column of the
+        # same batch.
         dialect = kwargs.get("_dialect", None)
         sql_engine = kwargs.get("_sqlalchemy_engine", None)
+        execution_engine = kwargs.get("_execution_engine", None)
         if sql_engine and dialect and dialect.dialect.name == "mysql":
-            temp_table_name = generate_temporary_table_name()
-            temp_table_stmt = "CREATE TEMPORARY TABLE {new_temp_table} AS SELECT tmp.{column_name} FROM {source_table} tmp".format(
-                new_temp_table=temp_table_name,
-                source_table=_table,
-                column_name=column.name,
+            temp_table_query: str = (
+                "SELECT tmp.{column_name} FROM {source_table} tmp".format(
+                    source_table=_table,
+                    column_name=column.name,
+                )
             )
-            sql_engine.execute(temp_table_stmt)
+            if execution_engine is not None:
+                temp_table_name = SqlAlchemyBatchData(
+                    execution_engine=execution_engine,
+                    query=temp_table_query,
+                    reuse_temp_table=execution_engine.reuse_temp_tables,
+                ).selectable.name
+            else:
+                temp_table_name = generate_temporary_table_name()
+                sql_engine.execute(
+                    f"CREATE TEMPORARY TABLE {temp_table_name} AS {temp_table_query}"
+                )
             dup_query = (
                 sa.select([column])
                 .select_from(sa.text(temp_table_name))
@@ -75,3 +117,168 @@ class ColumnValuesUnique(ColumnMapMetricProvider):
     )
     def _spark(cls, column, **kwargs):
         return F.count(F.lit(1)).over(Window.partitionBy(column)) <= 1
+
+    @metric_value(
+        engine=SqlAlchemyExecutionEngine, metric_name_suffix=".unexpected_count"
+    )
+    def _sqlalchemy_unexpected_count(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: Dict,
+    ):
+        if "unexpected_condition" in metrics:
+            return _sqlalchemy_map_condition_unexpected_count_value(
+                cls,
+                execution_engine=execution_engine,
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=metric_value_kwargs,
+                metrics=metrics,
+            )
+
+        if metrics["column.duplicate_count"] == 0:
+            return 0
+
+        duplicate_value_counts = cls._sqlalchemy_duplicate_value_counts_query(
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metrics=metrics,
+        ).alias("duplicate_value_counts")
+        unexpected_count: Optional[int] = execution_engine.engine.execute(
+            sa.select([sa.func.sum(duplicate_value_counts.c._num_rows)])
+        ).scalar()
+        return int(unexpected_count or 0)
+
+    @metric_value(
+        engine=SqlAlchemyExecutionEngine, metric_name_suffix=".unexpected_values"
+    )
+    def _sqlalchemy_unexpected_values(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: Dict,
+    ):
+        if "unexpected_condition" in metrics:
+            return _sqlalchemy_column_map_condition_values(
+                cls,
+                execution_engine=execution_engine,
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=metric_value_kwargs,
+                metrics=metrics,
+            )
+
+        if metrics["column.duplicate_count"] == 0:
+            return []
+
+        result_format: dict = metric_value_kwargs["result_format"]
+        limit: Optional[int] = None
+        if result_format["result_format"] != "COMPLETE":
+            limit = result_format["partial_unexpected_count"]
+
+        # Every duplicated value is repeated as often as it occurs, until the limit is reached.
+        unexpected_values: List[Any] = []
+        result = execution_engine.engine.execute(
+            cls._sqlalchemy_duplicate_value_counts_query(
+                execution_engine=execution_engine,
+                metric_domain_kwargs=metric_domain_kwargs,
+                metrics=metrics,
+            )
+        )
+        try:
+            for value, num_rows in result:
+                if limit is not None and len(unexpected_values) + num_rows >= limit:
+                    unexpected_values.extend([value] * (limit - len(unexpected_values)))
+                    break
+                unexpected_values.extend([value] * num_rows)
+        finally:
+            result.close()
+
+        return unexpected_values
+
+    @metric_value(
+        engine=SqlAlchemyExecutionEngine,
+        metric_name_suffix=".unexpected_value_counts",
+    )
+    def _sqlalchemy_unexpected_value_counts(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: Dict,
+    ):
+        if "unexpected_condition" in metrics:
+            return _sqlalchemy_column_map_condition_value_counts(
+                cls,
+                execution_engine=execution_engine,
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=metric_value_kwargs,
+                metrics=metrics,
+            )
+
+        if metrics["column.duplicate_count"] == 0:
+            return []
+
+        return execution_engine.engine.execute(
+            cls._sqlalchemy_duplicate_value_counts_query(
+                execution_engine=execution_engine,
+                metric_domain_kwargs=metric_domain_kwargs,
+                metrics=metrics,
+            )
+        ).fetchall()
+
+    @classmethod
+    def _sqlalchemy_duplicate_value_counts_query(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: Dict,
+        metrics: Dict[str, Any],
+    ) -> Select:
+        """Return the query of every duplicated (non-null) value of the column and the number of rows it occurs in."""
+        selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column_name: str = accessor_domain_kwargs["column"]
+        if column_name not in metrics["table.columns"]:
+            raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                message=f'Error: The column "{column_name}" in BatchData does not exist.'
+            )
+
+        column = sa.column(column_name)
+        return (
+            sa.select([column, sa.func.count(column).label("_num_rows")])
+            .select_from(selectable)
+            .group_by(column)
+            .having(sa.func.count(column) > 1)
+        )
+
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        if isinstance(execution_engine, SqlAlchemyExecutionEngine) and any(
+            metric.metric_name == f"{cls.condition_metric_name}{metric_name_suffix}"
+            for metric_name_suffix in cls.SQLALCHEMY_DUPLICATE_METRIC_SUFFIXES
+        ):
+            dependencies.pop("unexpected_condition", None)
+            dependencies["column.duplicate_count"] = MetricConfiguration(
+                metric_name="column.duplicate_count",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+            )
+
+        return dependencies
@@ -1,3 +1,21 @@
-from .column_pair_values_equal import ColumnPairValuesEqual
-from .column_pair_values_greater import ColumnPairValuesAGreaterThanB
-from .column_pair_values_in_set import ColumnPairValuesInSet
+"""
+Metric providers are imported (and so registered) only when they are referenced, either as attributes of this package or
+by metric name through the registry (see "great_expectations/expectations/registry_manifest.py").
+"""
+
+import importlib
+
+from great_expectations.expectations.registry_manifest import CLASS_MODULES
+
+__all__ = [
+    name
+    for name, module_name in CLASS_MODULES.items()
+    if module_name.startswith(f"{__name__}.")
+]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return getattr(importlib.import_module(CLASS_MODULES[name]), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,7 @@
 import inspect
 import logging
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 
@@ -404,6 +404,7 @@ def column_condition_partial(
                     _dialect=dialect,
                     _table=selectable,
                     _sqlalchemy_engine=sqlalchemy_engine,
+                    _execution_engine=execution_engine,
                     _metrics=metrics,
                 )
                 if filter_column_isnull:
@@ -2733,6 +2734,43 @@ class MapMetricProvider(MetricProvider):
         ):
             return
 
+        # Metrics of the condition (e.g., "unexpected_count"), which the class computes with its own "metric_value"
+        # methods (declaring the "metric_name_suffix" of the metric), rather than with the generic map metric functions.
+        overridden_metric_providers: Dict[
+            Tuple[str, Type[ExecutionEngine]], Callable
+        ] = {}
+        if hasattr(cls, "condition_metric_name"):
+            for attr, candidate_metric_fn in inspect.getmembers(cls):
+                metric_name_suffix: Optional[str] = getattr(
+                    candidate_metric_fn, "metric_definition_kwargs", {}
+                ).get("metric_name_suffix")
+                if (
+                    hasattr(candidate_metric_fn, "metric_engine")
+                    and getattr(candidate_metric_fn, "metric_fn_type")
+                    == MetricFunctionTypes.VALUE
+                    and metric_name_suffix
+                ):
+                    # noinspection PyUnresolvedReferences
+                    overridden_metric_providers[
+                        (
+                            f"{cls.condition_metric_name}{metric_name_suffix}",
+                            candidate_metric_fn.metric_engine,
+                        )
+                    ] = candidate_metric_fn
+
+        def register_map_metric(
+            metric_name: str, execution_engine: Type[ExecutionEngine], **kwargs
+        ) -> None:
+            overridden_metric_provider: Optional[
+                Callable
+            ] = overridden_metric_providers.get((metric_name, execution_engine))
+            if overridden_metric_provider is not None:
+                kwargs["metric_provider"] = overridden_metric_provider
+                kwargs["metric_fn_type"] = MetricFunctionTypes.VALUE
+            register_metric(
+                metric_name=metric_name, execution_engine=execution_engine, **kwargs
+            )
+
         for attr, candidate_metric_fn in inspect.getmembers(cls):
             if not hasattr(candidate_metric_fn, "metric_engine"):
                 # This is not a metric
@@ -2770,7 +2808,7 @@ class MapMetricProvider(MetricProvider):
                     ),
                 )
                 if issubclass(engine, PandasExecutionEngine):
-                    register_metric(
+                    register_map_metric(
                         metric_name=f"{metric_name}.condition",
                         metric_domain_keys=metric_domain_keys,
                         metric_value_keys=metric_value_keys,
@@ -2779,7 +2817,7 @@ class MapMetricProvider(MetricProvider):
                         metric_provider=condition_provider,
                         metric_fn_type=metric_fn_type,
                     )
-                    register_metric(
+                    register_map_metric(
                         metric_name=f"{metric_name}.unexpected_count",
                         metric_domain_keys=metric_domain_keys,
                         metric_value_keys=metric_value_keys,
@@ -2788,7 +2826,7 @@ class MapMetricProvider(MetricProvider):
                         metric_provider=_pandas_map_condition_unexpected_count,
                         metric_fn_type=MetricFunctionTypes.VALUE,
                     )
-                    register_metric(
+                    register_map_metric(
                         metric_name=f"{metric_name}.unexpected_index_list",
                         metric_domain_keys=metric_domain_keys,
                         metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2797,7 +2835,7 @@ class MapMetricProvider(MetricProvider):
                         metric_provider=_pandas_map_condition_index,
                         metric_fn_type=MetricFunctionTypes.VALUE,
                     )
-                    register_metric(
+                    register_map_metric(
                         metric_name=f"{metric_name}.unexpected_rows",
                         metric_domain_keys=metric_domain_keys,
                         metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2807,7 +2845,7 @@ class MapMetricProvider(MetricProvider):
                         metric_fn_type=MetricFunctionTypes.VALUE,
                     )
                     if domain_type == MetricDomainTypes.COLUMN:
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_values",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2816,7 +2854,7 @@ class MapMetricProvider(MetricProvider):
                             metric_provider=_pandas_column_map_condition_values,
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_value_counts",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2826,7 +2864,7 @@ class MapMetricProvider(MetricProvider):
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                     elif domain_type == MetricDomainTypes.COLUMN_PAIR:
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_values",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2835,7 +2873,7 @@ class MapMetricProvider(MetricProvider):
                             metric_provider=_pandas_column_pair_map_condition_values,
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.filtered_row_count",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2845,7 +2883,7 @@ class MapMetricProvider(MetricProvider):
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                     elif domain_type == MetricDomainTypes.MULTICOLUMN:
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_values",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2854,7 +2892,7 @@ class MapMetricProvider(MetricProvider):
                             metric_provider=_pandas_multicolumn_map_condition_values,
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.filtered_row_count",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2864,7 +2902,7 @@ class MapMetricProvider(MetricProvider):
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                 elif issubclass(engine, SqlAlchemyExecutionEngine):
-                    register_metric(
+                    register_map_metric(
                         metric_name=f"{metric_name}.condition",
                         metric_domain_keys=metric_domain_keys,
                         metric_value_keys=metric_value_keys,
@@ -2873,7 +2911,7 @@ class MapMetricProvider(MetricProvider):
                         metric_provider=condition_provider,
                         metric_fn_type=metric_fn_type,
                     )
-                    register_metric(
+                    register_map_metric(
                         metric_name=f"{metric_name}.unexpected_rows",
                         metric_domain_keys=metric_domain_keys,
                         metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2884,7 +2922,7 @@ class MapMetricProvider(MetricProvider):
                     )
                     if metric_fn_type == MetricPartialFunctionTypes.MAP_CONDITION_FN:
                         if domain_type == MetricDomainTypes.COLUMN:
-                            register_metric(
+                            register_map_metric(
                                 metric_name=metric_name
                                 + ".unexpected_count.aggregate_fn",
                                 metric_domain_keys=metric_domain_keys,
@@ -2894,7 +2932,7 @@ class MapMetricProvider(MetricProvider):
                                 metric_provider=_sqlalchemy_map_condition_unexpected_count_aggregate_fn,
                                 metric_fn_type=MetricPartialFunctionTypes.AGGREGATE_FN,
                             )
-                            register_metric(
+                            register_map_metric(
                                 metric_name=f"{metric_name}.unexpected_count",
                                 metric_domain_keys=metric_domain_keys,
                                 metric_value_keys=metric_value_keys,
@@ -2904,7 +2942,7 @@ class MapMetricProvider(MetricProvider):
                                 metric_fn_type=MetricFunctionTypes.VALUE,
                             )
                         else:
-                            register_metric(
+                            register_map_metric(
                                 metric_name=f"{metric_name}.unexpected_count",
                                 metric_domain_keys=metric_domain_keys,
                                 metric_value_keys=metric_value_keys,
@@ -2916,7 +2954,7 @@ class MapMetricProvider(MetricProvider):
                     elif (
                         metric_fn_type == MetricPartialFunctionTypes.WINDOW_CONDITION_FN
                     ):
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_count",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=metric_value_keys,
@@ -2926,7 +2964,7 @@ class MapMetricProvider(MetricProvider):
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                     if domain_type == MetricDomainTypes.COLUMN:
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_values",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2935,7 +2973,7 @@ class MapMetricProvider(MetricProvider):
                             metric_provider=_sqlalchemy_column_map_condition_values,
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_value_counts",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2945,7 +2983,7 @@ class MapMetricProvider(MetricProvider):
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                     elif domain_type == MetricDomainTypes.COLUMN_PAIR:
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_values",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2954,7 +2992,7 @@ class MapMetricProvider(MetricProvider):
                             metric_provider=_sqlalchemy_column_pair_map_condition_values,
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.filtered_row_count",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2964,7 +3002,7 @@ class MapMetricProvider(MetricProvider):
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                     elif domain_type == MetricDomainTypes.MULTICOLUMN:
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_values",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2973,7 +3011,7 @@ class MapMetricProvider(MetricProvider):
                             metric_provider=_sqlalchemy_multicolumn_map_condition_values,
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.filtered_row_count",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -2983,7 +3021,7 @@ class MapMetricProvider(MetricProvider):
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                 elif issubclass(engine, SparkDFExecutionEngine):
-                    register_metric(
+                    register_map_metric(
                         metric_name=f"{metric_name}.condition",
                         metric_domain_keys=metric_domain_keys,
                         metric_value_keys=metric_value_keys,
@@ -2992,7 +3030,7 @@ class MapMetricProvider(MetricProvider):
                         metric_provider=condition_provider,
                         metric_fn_type=metric_fn_type,
                     )
-                    register_metric(
+                    register_map_metric(
                         metric_name=f"{metric_name}.unexpected_rows",
                         metric_domain_keys=metric_domain_keys,
                         metric_value_keys=(*metric_value_keys, "result_format"),
@@ -3003,7 +3041,7 @@ class MapMetricProvider(MetricProvider):
                     )
                     if metric_fn_type == MetricPartialFunctionTypes.MAP_CONDITION_FN:
                         if domain_type == MetricDomainTypes.COLUMN:
-                            register_metric(
+                            register_map_metric(
                                 metric_name=metric_name
                                 + ".unexpected_count.aggregate_fn",
                                 metric_domain_keys=metric_domain_keys,
@@ -3013,7 +3051,7 @@ class MapMetricProvider(MetricProvider):
                                 metric_provider=_spark_map_condition_unexpected_count_aggregate_fn,
                                 metric_fn_type=MetricPartialFunctionTypes.AGGREGATE_FN,
                             )
-                            register_metric(
+                            register_map_metric(
                                 metric_name=f"{metric_name}.unexpected_count",
                                 metric_domain_keys=metric_domain_keys,
                                 metric_value_keys=metric_value_keys,
@@ -3023,7 +3061,7 @@ class MapMetricProvider(MetricProvider):
                                 metric_fn_type=MetricFunctionTypes.VALUE,
                             )
                         else:
-                            register_metric(
+                            register_map_metric(
                                 metric_name=f"{metric_name}.unexpected_count",
                                 metric_domain_keys=metric_domain_keys,
                                 metric_value_keys=metric_value_keys,
@@ -3035,7 +3073,7 @@ class MapMetricProvider(MetricProvider):
                     elif (
                         metric_fn_type == MetricPartialFunctionTypes.WINDOW_CONDITION_FN
                     ):
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_count",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=metric_value_keys,
@@ -3045,7 +3083,7 @@ class MapMetricProvider(MetricProvider):
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                     if domain_type == MetricDomainTypes.COLUMN:
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_values",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -3054,7 +3092,7 @@ class MapMetricProvider(MetricProvider):
                             metric_provider=_spark_column_map_condition_values,
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_value_counts",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -3064,7 +3102,7 @@ class MapMetricProvider(MetricProvider):
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                     elif domain_type == MetricDomainTypes.COLUMN_PAIR:
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_values",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -3073,7 +3111,7 @@ class MapMetricProvider(MetricProvider):
                             metric_provider=_spark_column_pair_map_condition_values,
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.filtered_row_count",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -3083,7 +3121,7 @@ class MapMetricProvider(MetricProvider):
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
                     elif domain_type == MetricDomainTypes.MULTICOLUMN:
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.unexpected_values",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -3092,7 +3130,7 @@ class MapMetricProvider(MetricProvider):
                             metric_provider=_spark_multicolumn_map_condition_values,
                             metric_fn_type=MetricFunctionTypes.VALUE,
                         )
-                        register_metric(
+                        register_map_metric(
                             metric_name=f"{metric_name}.filtered_row_count",
                             metric_domain_keys=metric_domain_keys,
                             metric_value_keys=(*metric_value_keys, "result_format"),
@@ -3115,7 +3153,7 @@ class MapMetricProvider(MetricProvider):
                 metric_name = cls.function_metric_name
                 metric_domain_keys = cls.function_domain_keys
                 metric_value_keys = cls.function_value_keys
-                register_metric(
+                register_map_metric(
                     metric_name=f"{metric_name}.map",
                     metric_domain_keys=metric_domain_keys,
                     metric_value_keys=metric_value_keys,
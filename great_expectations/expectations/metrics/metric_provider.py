@@ -24,9 +24,15 @@ logger = logging.getLogger(__name__)
 def metric_value(
     engine: Type[ExecutionEngine],
     metric_fn_type: Union[str, MetricFunctionTypes] = MetricFunctionTypes.VALUE,
+    bundle_fn: Optional[Callable] = None,
     **kwargs,
 ):
-    """The metric decorator annotates a method"""
+    """The metric decorator annotates a method
+
+    If "bundle_fn" is given, the execution engine resolves all metrics computed by the annotated method in one call
+    to "bundle_fn(execution_engine, metric_value_bundle)", where "metric_value_bundle" is the list of
+    (metric_configuration, metric_provider_kwargs) pairs to resolve; "bundle_fn" returns their values by metric id.
+    """
 
     def wrapper(metric_fn: Callable):
         @wraps(metric_fn)
@@ -35,6 +41,7 @@ def metric_value(
 
         inner_func.metric_engine = engine
         inner_func.metric_fn_type = MetricFunctionTypes(metric_fn_type)
+        inner_func.metric_value_bundle_fn = bundle_fn
         inner_func.metric_definition_kwargs = kwargs
         return inner_func
 
@@ -13,6 +13,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     multicolumn_condition_partial,
     multicolumn_function_partial,
 )
+from great_expectations.expectations.metrics.util import get_duplicated_mask
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 
@@ -37,7 +38,7 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
 
     @multicolumn_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column_list, **kwargs):
-        row_wise_cond = ~column_list.duplicated(keep=False)
+        row_wise_cond = ~get_duplicated_mask(column_list)
         return row_wise_cond
 
     @multicolumn_function_partial(engine=SqlAlchemyExecutionEngine)
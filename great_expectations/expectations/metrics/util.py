@@ -1,11 +1,21 @@
 import logging
+import math
 import warnings
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 from packaging import version
 
+from great_expectations.core.id_dict import IDDict
+from great_expectations.execution_engine import (
+    ExecutionEngine,
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.execution_engine.util import check_sql_engine_dialect
 from great_expectations.util import get_sqlalchemy_inspector
 
@@ -295,6 +305,297 @@ def attempt_allowing_relative_error(dialect):
     return detected_redshift or detected_psycopg2
 
 
+# Relative (standard) errors of dialect-native approximate distinct counts having a fixed, documented precision.
+_APPROXIMATE_COUNT_DISTINCT_FIXED_RELATIVE_ERRORS: Dict[str, float] = {
+    "snowflake": 0.0162338,
+    "redshift": 0.02,
+}
+# Bounds of the "max_standard_error" argument of Trino's "approx_distinct()".
+_TRINO_APPROX_DISTINCT_MIN_STANDARD_ERROR: float = 0.0040625
+_TRINO_APPROX_DISTINCT_MAX_STANDARD_ERROR: float = 0.26
+
+
+def get_approximate_count_distinct_expression(
+    column_name: str, relative_error: float, dialect: Dialect
+) -> ColumnElement:
+    """Expression counting the distinct (non-null) values of a column, approximately where the dialect supports it.
+
+    Dialects without a native approximation fall back to the exact "COUNT(DISTINCT column)" (which still saves fetching
+    all distinct values, as "column.value_counts" does).  The relative error actually achieved is reported by
+    "get_approximate_count_distinct_relative_error()".
+    """
+    dialect_name: str = dialect.name.lower()
+    column: ColumnElement = sa.column(column_name)
+    if dialect_name in ("databricks", "hive"):
+        return sa.func.approx_count_distinct(column, float(relative_error))
+    elif dialect_name == "trino":
+        return sa.func.approx_distinct(
+            column, _get_trino_approx_distinct_standard_error(relative_error)
+        )
+    elif dialect_name in ("bigquery", "snowflake"):
+        return sa.func.approx_count_distinct(column)
+    elif dialect_name == "redshift":
+        return sa.literal_column(
+            f"APPROXIMATE COUNT(DISTINCT {dialect.identifier_preparer.quote(column_name)})"
+        )
+
+    return sa.func.count(sa.distinct(column))
+
+
+def get_approximate_count_distinct_relative_error(
+    relative_error: float, dialect: Dialect
+) -> Optional[float]:
+    """The relative error achieved by "get_approximate_count_distinct_expression()" when asked for "relative_error".
+
+    Returns 0.0 for the exact fallback, and None for dialects whose native approximation has no documented error.
+    """
+    dialect_name: str = dialect.name.lower()
+    if dialect_name in ("databricks", "hive"):
+        return float(relative_error)
+    elif dialect_name == "trino":
+        return _get_trino_approx_distinct_standard_error(relative_error)
+    elif dialect_name in _APPROXIMATE_COUNT_DISTINCT_FIXED_RELATIVE_ERRORS:
+        return _APPROXIMATE_COUNT_DISTINCT_FIXED_RELATIVE_ERRORS[dialect_name]
+    elif dialect_name == "bigquery":
+        return None
+
+    return 0.0
+
+
+def _get_trino_approx_distinct_standard_error(relative_error: float) -> float:
+    return min(
+        max(float(relative_error), _TRINO_APPROX_DISTINCT_MIN_STANDARD_ERROR),
+        _TRINO_APPROX_DISTINCT_MAX_STANDARD_ERROR,
+    )
+
+
+def get_approximate_percentile_expression(
+    column_name: str, quantile: float, relative_error: float, dialect: Dialect
+) -> Optional[ColumnElement]:
+    """Expression approximating the value of a column at a quantile, or None if the dialect has no native approximation.
+
+    The relative error actually achieved is reported by "get_approximate_percentile_relative_error()".
+    """
+    dialect_name: str = dialect.name.lower()
+    column: ColumnElement = sa.column(column_name)
+    # pymysql and other drivers cannot handle numpy floats; convert just in case.
+    quantile = float(quantile)
+    if dialect_name in ("snowflake", "trino"):
+        return sa.func.approx_percentile(column, quantile)
+    elif dialect_name in ("databricks", "hive"):
+        return sa.func.percentile_approx(
+            column, quantile, _get_percentile_approx_accuracy(relative_error)
+        )
+    elif dialect_name == "bigquery":
+        # APPROX_QUANTILES splits the column into "number_of_buckets" buckets of (approximately) equal size.
+        number_of_buckets: int = max(int(math.ceil(1.0 / relative_error)), 2)
+        return sa.literal_column(
+            f"APPROX_QUANTILES({dialect.identifier_preparer.quote(column_name)}, {number_of_buckets})"
+            f"[OFFSET({int(round(quantile * number_of_buckets))})]"
+        )
+
+    return None
+
+
+def get_approximate_percentile_relative_error(
+    relative_error: float, dialect: Dialect
+) -> Optional[float]:
+    """The relative (rank) error achieved by "get_approximate_percentile_expression()" when asked for "relative_error".
+
+    Returns 0.0 for dialects falling back to exact quantiles, and None for dialects whose native approximation has no
+    documented error bound.
+    """
+    dialect_name: str = dialect.name.lower()
+    if dialect_name in ("databricks", "hive"):
+        return 1.0 / _get_percentile_approx_accuracy(relative_error)
+    elif dialect_name in ("snowflake", "trino", "bigquery"):
+        return None
+
+    return 0.0
+
+
+def _get_percentile_approx_accuracy(relative_error: float) -> int:
+    return max(int(math.ceil(1.0 / relative_error)), 1)
+
+
+def get_approximation_achieved_relative_error(
+    metric_name: str, relative_error: float, execution_engine: ExecutionEngine
+) -> Optional[float]:
+    """The relative error to which a metric, asked for an approximation within "relative_error", was computed.
+
+    Pandas always computes these metrics exactly (0.0), as its exact computations are faster than sketching.  Spark
+    honors the requested error.  SQL dialects use their native approximations, whose achieved error may differ from (or,
+    for some dialects, is not documented relative to; None) the requested one, or fall back to exact computations (0.0).
+    """
+    if isinstance(execution_engine, PandasExecutionEngine):
+        return 0.0
+
+    if isinstance(execution_engine, SparkDFExecutionEngine):
+        return float(relative_error)
+
+    if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+        dialect: Dialect = execution_engine.engine.dialect
+        if metric_name in ("column.distinct_values.count", "column.unique_proportion"):
+            return get_approximate_count_distinct_relative_error(
+                relative_error=relative_error, dialect=dialect
+            )
+
+        if metric_name in ("column.median", "column.quantile_values"):
+            return get_approximate_percentile_relative_error(
+                relative_error=relative_error, dialect=dialect
+            )
+
+    return None
+
+
+def sql_engine_supports_window_functions(sqlalchemy_engine: Engine) -> bool:
+    """Whether the ordered scans of "get_sorted_column_values_at_positions()" can run on this SQLite or MySQL engine.
+
+    Other dialects compute quantiles and medians with their own aggregate functions, and are reported as unsupported.
+    """
+    dialect_name: str = sqlalchemy_engine.dialect.name.lower()
+    if dialect_name == "sqlite":
+        # Window functions are available as of SQLite 3.25.0.
+        sqlite_version_info: Optional[tuple] = getattr(
+            sqlalchemy_engine.dialect.dbapi, "sqlite_version_info", None
+        )
+        return sqlite_version_info is not None and tuple(sqlite_version_info) >= (
+            3,
+            25,
+            0,
+        )
+
+    # Window functions are available as of MySQL 8.0, which computing quantiles with "percent_rank" always required.
+    return dialect_name == "mysql"
+
+
+def get_sorted_column_values_at_positions(
+    column_positions: Dict[str, List[int]],
+    selectable: Select,
+    sqlalchemy_engine: Engine,
+    ignore_nulls: bool = False,
+) -> Dict[str, List[Any]]:
+    """Fetch the values at the given (0-based) positions of columns sorted in ascending order, in a single statement.
+
+    Every column is numbered by its own "ROW_NUMBER()" window, and the requested positions are picked by conditional
+    aggregates, so that all positions of all columns of a selectable are read in one ordered scan.  NULL values sort
+    first (as in SQLite and MySQL), unless "ignore_nulls" is set, in which case they are not counted.  Positions past the
+    last row yield None.
+
+    Returns:
+        The values at the requested positions, by column name
+    """
+    column_names: List[str] = list(column_positions.keys())
+    if not any(column_positions.values()):
+        return {column_name: [] for column_name in column_names}
+
+    columns: List[ColumnElement] = [
+        sa.column(column_name) for column_name in column_names
+    ]
+    row_numbers: List[Label] = [
+        (
+            sa.func.row_number().over(
+                partition_by=column.is_(None) if ignore_nulls else None,
+                order_by=column.asc(),
+            )
+            - 1
+        ).label(f"__row_number_{idx}")
+        for idx, column in enumerate(columns)
+    ]
+    numbered_rows = (
+        sa.select(columns + row_numbers)
+        .select_from(selectable)
+        .subquery("numbered_rows")
+    )
+
+    selects: List[Label] = []
+    for idx, column_name in enumerate(column_names):
+        value: ColumnElement = numbered_rows.c[column_name]
+        row_number: ColumnElement = numbered_rows.c[f"__row_number_{idx}"]
+        for position in column_positions[column_name]:
+            condition: BinaryExpression = row_number == position
+            if ignore_nulls:
+                condition = sa.and_(condition, value.isnot(None))
+            selects.append(
+                sa.func.max(sa.case([(condition, value)], else_=None)).label(
+                    f"value_{len(selects)}"
+                )
+            )
+
+    values: Iterator[Any] = iter(
+        sqlalchemy_engine.execute(
+            sa.select(selects).select_from(numbered_rows)
+        ).fetchone()
+    )
+    return {
+        column_name: [next(values) for _ in column_positions[column_name]]
+        for column_name in column_names
+    }
+
+
+def get_sorted_column_values_at_positions_by_metric(
+    execution_engine: "SqlAlchemyExecutionEngine",  # noqa: F821
+    metric_positions: List[Tuple[Tuple[str, str, str], dict, List[int]]],
+    ignore_nulls: bool = False,
+) -> Dict[Tuple[str, str, str], List[Any]]:
+    """Fetch the sorted column values at given positions for several column metrics, with one statement per domain.
+
+    Args:
+        execution_engine: the SqlAlchemyExecutionEngine computing the metrics
+        metric_positions: (metric id, metric domain kwargs, positions) for each metric; the positions of all metrics
+            sharing a compute domain (e.g., several columns of the same batch) are read by a single ordered scan
+        ignore_nulls: whether NULL values are left out of the sorted column values
+
+    Returns:
+        The values at the requested positions, by metric id
+    """
+    positions_by_compute_domain: Dict[str, Tuple[Select, Dict[str, Set[int]]]] = {}
+    metric_columns: List[Tuple[Tuple[str, str, str], str, str, List[int]]] = []
+    for metric_id, metric_domain_kwargs, positions in metric_positions:
+        (
+            selectable,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(
+            metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        compute_domain_id: str = IDDict(compute_domain_kwargs).to_id()
+        column_name: str = accessor_domain_kwargs["column"]
+        _, column_positions = positions_by_compute_domain.setdefault(
+            compute_domain_id, (selectable, {})
+        )
+        column_positions.setdefault(column_name, set()).update(positions)
+        metric_columns.append((metric_id, compute_domain_id, column_name, positions))
+
+    values_by_compute_domain: Dict[str, Dict[str, Dict[int, Any]]] = {}
+    for compute_domain_id, (
+        selectable,
+        column_positions,
+    ) in positions_by_compute_domain.items():
+        sorted_column_positions: Dict[str, List[int]] = {
+            column_name: sorted(positions)
+            for column_name, positions in column_positions.items()
+        }
+        column_values: Dict[str, List[Any]] = get_sorted_column_values_at_positions(
+            column_positions=sorted_column_positions,
+            selectable=selectable,
+            sqlalchemy_engine=execution_engine.engine,
+            ignore_nulls=ignore_nulls,
+        )
+        values_by_compute_domain[compute_domain_id] = {
+            column_name: dict(zip(sorted_column_positions[column_name], values))
+            for column_name, values in column_values.items()
+        }
+
+    return {
+        metric_id: [
+            values_by_compute_domain[compute_domain_id][column_name][position]
+            for position in positions
+        ]
+        for metric_id, compute_domain_id, column_name, positions in metric_columns
+    }
+
+
 def is_column_present_in_table(
     engine: Engine,
     table_selectable: Select,
@@ -494,6 +795,39 @@ def parse_value_set(value_set):
     return parsed_value_set
 
 
+def get_duplicated_mask(data: Union[pd.Series, pd.DataFrame]) -> pd.Series:
+    """Mark all values (or rows of all columns) of data, which occur more than once (missing values compare equal), as
+    "data.duplicated(keep=False)" does.
+
+    Every column is factorized (hashed into dense integer codes), the codes of multiple columns are combined into one
+    dense integer key per row (re-factorizing the partial key after each column keeps it within the number of rows),
+    and the occurrences of keys are counted with "numpy.bincount", so that no per-row tuples or second hash-based pass
+    over the data are needed.
+    """
+    columns: List[pd.Series]
+    name: Optional[Any] = None
+    if isinstance(data, pd.DataFrame):
+        columns = [data.iloc[:, idx] for idx in range(data.shape[1])]
+    else:
+        columns = [data]
+        name = data.name
+
+    keys: Optional[np.ndarray] = None
+    column: pd.Series
+    for column in columns:
+        # Missing values are coded as -1; shifting the codes makes them a key of their own.
+        codes: np.ndarray = pd.factorize(column)[0].astype(np.int64) + 1
+        if keys is None:
+            keys = codes
+        else:
+            keys = pd.factorize(keys * (codes.max(initial=0) + 1) + codes)[0]
+
+    if keys is None or keys.size == 0:
+        return pd.Series(False, index=data.index, dtype=bool, name=name)
+
+    return pd.Series(np.bincount(keys)[keys] > 1, index=data.index, name=name)
+
+
 def get_dialect_like_pattern_expression(column, dialect, like_pattern, positive=True):
     dialect_supported: bool = False
 
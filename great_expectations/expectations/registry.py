@@ -1,10 +1,17 @@
+import importlib
 import logging
+import sys
 import warnings
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric import Metric
+from great_expectations.expectations.registry_manifest import (
+    EXPECTATION_MODULES,
+    METRIC_MODULES,
+    RENDERER_MODULES,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +31,31 @@ _registered_renderers = {}
 """
 
 
+def _import_defining_module(object_name: str) -> None:
+    """Import (and so register) the module, in which a core Expectation or metric is defined, unless it is imported.
+
+    Core Expectations and metric providers are imported lazily, when they are first referenced by name (see
+    "great_expectations/expectations/registry_manifest.py").
+    """
+    module_name: Optional[str] = (
+        EXPECTATION_MODULES.get(object_name)
+        or METRIC_MODULES.get(object_name)
+        or RENDERER_MODULES.get(object_name)
+    )
+    if module_name is not None and module_name not in sys.modules:
+        importlib.import_module(module_name)
+
+
+def _import_all_expectation_modules() -> None:
+    """Import (and so register) all core Expectations (e.g., in order to list them along with their renderers)."""
+    module_name: str
+    for module_name in set(EXPECTATION_MODULES.values()).union(
+        RENDERER_MODULES.values()
+    ):
+        if module_name not in sys.modules:
+            importlib.import_module(module_name)
+
+
 def register_renderer(
     object_name: str,
     parent_class: Type[Union["Expectation", "Metric"]],  # noqa: F821
@@ -65,14 +97,17 @@ def register_renderer(
 
 
 def get_renderer_names(object_name: str) -> List[str]:
+    _import_defining_module(object_name=object_name)
     return list(_registered_renderers.get(object_name, {}).keys())
 
 
 def get_renderer_impls(object_name: str) -> List[str]:
+    _import_defining_module(object_name=object_name)
     return list(_registered_renderers.get(object_name, {}).values())
 
 
 def get_renderer_impl(object_name, renderer_type):
+    _import_defining_module(object_name=object_name)
     return _registered_renderers.get(object_name, {}).get(renderer_type)
 
 
@@ -178,6 +213,7 @@ def register_metric(
 def get_metric_provider(
     metric_name: str, execution_engine: "ExecutionEngine"  # noqa: F821
 ) -> Tuple["MetricProvider", Callable]:  # noqa: F821
+    _import_defining_module(object_name=metric_name)
     try:
         metric_definition = _registered_metrics[metric_name]
         return metric_definition["providers"][type(execution_engine).__name__]
@@ -190,6 +226,7 @@ def get_metric_provider(
 def get_metric_function_type(
     metric_name: str, execution_engine: "ExecutionEngine"  # noqa: F821
 ) -> Optional[Union["MetricPartialFunctionTypes", "MetricFunctionTypes"]]:  # noqa: F821
+    _import_defining_module(object_name=metric_name)
     try:
         metric_definition = _registered_metrics[metric_name]
         provider_fn, provider_class = metric_definition["providers"][
@@ -207,6 +244,7 @@ def get_metric_kwargs(
     configuration: Optional["ExpectationConfiguration"] = None,  # noqa: F821
     runtime_configuration: Optional[dict] = None,
 ) -> Dict:
+    _import_defining_module(object_name=metric_name)
     try:
         metric_definition = _registered_metrics.get(metric_name)
         if metric_definition is None:
@@ -276,12 +314,14 @@ def get_expectation_impl(expectation_name):
             DeprecationWarning,
         )
         expectation_name = renamed[expectation_name]
+    _import_defining_module(object_name=expectation_name)
     return _registered_expectations.get(expectation_name)
 
 
 def list_registered_expectation_implementations(
     expectation_root: Type["Expectation"] = None,  # noqa: F821
 ) -> List[str]:
+    _import_all_expectation_modules()
     registered_expectation_implementations = []
     for (
         expectation_name,
@@ -1,6 +1,14 @@
 import logging
+import math
+from typing import Any, Optional, Tuple
 
-from great_expectations.exceptions import GreatExpectationsError
+import numpy as np
+from scipy import stats
+
+from great_expectations.exceptions import (
+    GreatExpectationsError,
+    InvalidExpectationConfigurationError,
+)
 from great_expectations.render.types import RenderedStringTemplateContent
 
 logger = logging.getLogger(__name__)
@@ -73,3 +81,49 @@ def add_values_with_json_schema_from_list_in_params(
                 "value": v,
             }
     return params_with_json_schema
+
+
+def get_approximation_relative_error(
+    approximation_relative_error: Any,
+) -> Optional[float]:
+    """The relative error to which approximate statistics are allowed, or None if statistics must be exact.
+
+    Approximate statistics are requested by setting "approximation_relative_error" to a float between 0 and 1
+    (exclusive); None keeps exact statistics.
+    """
+    if approximation_relative_error is None:
+        return None
+
+    if (
+        isinstance(approximation_relative_error, bool)
+        or not isinstance(approximation_relative_error, (float, np.floating))
+        or not 0.0 < approximation_relative_error < 1.0
+    ):
+        raise InvalidExpectationConfigurationError(
+            f'"approximation_relative_error" must be None or a float between 0 and 1 (exclusive); '
+            f"{approximation_relative_error} was given."
+        )
+
+    return float(approximation_relative_error)
+
+
+def get_binomial_confidence_interval(
+    successes: int, trials: int, confidence: float
+) -> Tuple[float, float]:
+    """Wilson score interval of a proportion (e.g., of expected values), observed as successes among trials (e.g.,
+    non-null values of a sample), at the given confidence level."""
+    if trials <= 0:
+        return 0.0, 1.0
+
+    z: float = float(stats.norm.ppf((1.0 + confidence) / 2.0))
+    proportion: float = successes / trials
+    denominator: float = 1.0 + z**2 / trials
+    center: float = (proportion + z**2 / (2.0 * trials)) / denominator
+    margin: float = (
+        z
+        * math.sqrt(
+            proportion * (1.0 - proportion) / trials + z**2 / (4.0 * trials**2)
+        )
+        / denominator
+    )
+    return max(0.0, center - margin), min(1.0, center + margin)
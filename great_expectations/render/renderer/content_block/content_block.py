@@ -7,6 +7,7 @@ from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
 from great_expectations.expectations.registry import (
+    _import_all_expectation_modules,
     _registered_renderers,
     get_renderer_impl,
 )
@@ -403,6 +404,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
 
     @classmethod
     def list_available_expectations(cls):
+        _import_all_expectation_modules()
         expectations = [
             object_name
             for object_name in _registered_renderers
@@ -107,6 +107,9 @@ class SiteBuilder:
                     view:
                         module_name: great_expectations.render.view
                         class_name: DefaultJinjaIndexPageView
+
+    Compiled jinja templates can be persisted across processes by setting ``bytecode_cache_directory`` (relative paths
+    are resolved against the data context root directory, e.g. ``uncommitted/data_docs_template_cache``).
     """
 
     def __init__(
@@ -119,6 +122,7 @@ class SiteBuilder:
         site_section_builders=None,
         runtime_environment=None,
         ge_cloud_mode=False,
+        bytecode_cache_directory=None,
         **kwargs,
     ):
         self.site_name = site_name
@@ -157,6 +161,15 @@ class SiteBuilder:
                 plugins_directory, "custom_data_docs", "views"
             )
 
+        if (
+            bytecode_cache_directory
+            and not os.path.isabs(bytecode_cache_directory)
+            and data_context.root_directory
+        ):
+            bytecode_cache_directory = os.path.join(
+                data_context.root_directory, bytecode_cache_directory
+            )
+
         if site_index_builder is None:
             site_index_builder = {"class_name": "DefaultSiteIndexBuilder"}
 
@@ -230,6 +243,7 @@ class SiteBuilder:
                     "target_store": self.target_store,
                     "custom_styles_directory": custom_styles_directory,
                     "custom_views_directory": custom_views_directory,
+                    "bytecode_cache_directory": bytecode_cache_directory,
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
                     "ge_cloud_mode": self.ge_cloud_mode,
@@ -254,6 +268,7 @@ class SiteBuilder:
                 "data_context": data_context,
                 "custom_styles_directory": custom_styles_directory,
                 "custom_views_directory": custom_views_directory,
+                "bytecode_cache_directory": bytecode_cache_directory,
                 "show_how_to_buttons": self.show_how_to_buttons,
                 "target_store": self.target_store,
                 "site_name": self.site_name,
@@ -342,6 +357,7 @@ class DefaultSiteSectionBuilder:
         source_store_name,
         custom_styles_directory=None,
         custom_views_directory=None,
+        bytecode_cache_directory=None,
         show_how_to_buttons=True,
         run_name_filter=None,
         validation_results_limit=None,
@@ -392,6 +408,7 @@ class DefaultSiteSectionBuilder:
             runtime_environment={
                 "custom_styles_directory": custom_styles_directory,
                 "custom_views_directory": custom_views_directory,
+                "bytecode_cache_directory": bytecode_cache_directory,
             },
             config_defaults={"module_name": module_name},
         )
@@ -507,6 +524,7 @@ class DefaultSiteIndexBuilder:
         site_section_builders_config,
         custom_styles_directory=None,
         custom_views_directory=None,
+        bytecode_cache_directory=None,
         show_how_to_buttons=True,
         validation_results_limit=None,
         renderer=None,
@@ -558,6 +576,7 @@ class DefaultSiteIndexBuilder:
             runtime_environment={
                 "custom_styles_directory": custom_styles_directory,
                 "custom_views_directory": custom_views_directory,
+                "bytecode_cache_directory": bytecode_cache_directory,
             },
             config_defaults={"module_name": module_name},
         )
@@ -843,6 +862,13 @@ diagnose and repair the underlying issue.  Detailed information follows:
 
         return validation_and_profiling_result_site_keys
 
+    def _get_validations_source_store(self, section_name: str):
+        validations_store_name = (
+            self.source_stores.get(section_name)
+            or self.data_context.validations_store_name
+        )
+        return self.data_context.stores[validations_store_name]
+
     def _add_profiling_to_index_links(
         self,
         index_links_dict: OrderedDict,
@@ -860,17 +886,15 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     validation_result_key, profiling_run_name_filter
                 )
             ]
+            profiling_store = self._get_validations_source_store("profiling")
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
+                    validation_summary = profiling_store.get_summary(
+                        profiling_result_key
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    batch_kwargs = validation_summary["meta"].get("batch_kwargs", {})
+                    batch_spec = validation_summary["meta"].get("batch_spec", {})
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -915,18 +939,17 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 validation_result_site_keys = validation_result_site_keys[
                     : self.validation_results_limit
                 ]
+            # Only the success flag and batch metadata of each validation result are needed for the index.
+            validations_store = self._get_validations_source_store("validations")
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
+                    validation_summary = validations_store.get_summary(
+                        validation_result_key
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    validation_success = validation_summary["success"]
+                    batch_kwargs = validation_summary["meta"].get("batch_kwargs", {})
+                    batch_spec = validation_summary["meta"].get("batch_spec", {})
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
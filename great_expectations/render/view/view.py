@@ -1,6 +1,10 @@
 import datetime
+import functools
+import hashlib
 import json
+import os
 import re
+import threading
 from collections import OrderedDict
 from string import Template as pTemplate
 from uuid import uuid4
@@ -9,6 +13,7 @@ import mistune
 from jinja2 import (
     ChoiceLoader,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     PackageLoader,
     contextfilter,
@@ -53,10 +58,54 @@ class DefaultJinjaView:
 
     _template = NoOpTemplate
 
-    def __init__(self, custom_styles_directory=None, custom_views_directory=None):
+    # Maximum number of rendered content blocks and string templates memoized per jinja Environment
+    fragment_cache_size = 4096
+
+    # jinja Environments shared by all views of the same class and configuration, so that templates are loaded and
+    # compiled once per process, instead of once per view (e.g., per Data Docs site section builder)
+    _environment_caches = {}
+    _environment_caches_lock = threading.Lock()
+
+    def __init__(
+        self,
+        custom_styles_directory=None,
+        custom_views_directory=None,
+        bytecode_cache_directory=None,
+    ):
         self.custom_styles_directory = custom_styles_directory
         self.custom_views_directory = custom_views_directory
+        self.bytecode_cache_directory = bytecode_cache_directory
+
+        self._environment_cache = self._get_environment_cache()
+        self.env = self._environment_cache.env
+
+    def _get_environment_cache(self):
+        key = (
+            type(self),
+            self.custom_styles_directory,
+            self.custom_views_directory,
+            self.bytecode_cache_directory,
+        )
+        with DefaultJinjaView._environment_caches_lock:
+            environment_cache = DefaultJinjaView._environment_caches.get(key)
+            if environment_cache is None:
+                # Fragments rendered by custom views can depend on arbitrary context variables, so they are not memoized.
+                environment_cache = _JinjaEnvironmentCache(
+                    fragment_cache_size=0
+                    if self.custom_views_directory
+                    else self.fragment_cache_size
+                )
+                environment_cache.env = self._build_environment(environment_cache)
+                DefaultJinjaView._environment_caches[key] = environment_cache
+        return environment_cache
+
+    @classmethod
+    def clear_environment_caches(cls):
+        """Drop all shared jinja Environments, together with their compiled templates and memoized fragments."""
+        with DefaultJinjaView._environment_caches_lock:
+            DefaultJinjaView._environment_caches.clear()
 
+    def _build_environment(self, environment_cache):
         templates_loader = PackageLoader("great_expectations", "render/view/templates")
         styles_loader = PackageLoader("great_expectations", "render/view/static/styles")
 
@@ -66,31 +115,51 @@ class DefaultJinjaView:
         if self.custom_views_directory:
             loaders.append(FileSystemLoader(self.custom_views_directory))
 
-        self.env = Environment(
+        bytecode_cache = None
+        if self.bytecode_cache_directory:
+            os.makedirs(self.bytecode_cache_directory, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(
+                directory=self.bytecode_cache_directory
+            )
+
+        env = Environment(
             loader=ChoiceLoader(loaders),
             autoescape=select_autoescape(["html", "xml"]),
             extensions=["jinja2.ext.do"],
+            bytecode_cache=bytecode_cache,
         )
 
-        self.env.filters["render_string_template"] = self.render_string_template
-        self.env.filters[
+        # Filters whose output is not determined by their arguments (unique ids, timestamps) make the fragments
+        # rendering them ineligible for memoization.
+        impure = environment_cache.impure
+
+        env.filters["render_string_template"] = environment_cache.memoize_by_argument(
+            self.render_string_template
+        )
+        env.filters[
             "render_styling_from_string_template"
         ] = self.render_styling_from_string_template
-        self.env.filters["render_styling"] = self.render_styling
-        self.env.filters["render_content_block"] = self.render_content_block
-        self.env.filters["render_markdown"] = self.render_markdown
-        self.env.filters[
+        env.filters["render_styling"] = self.render_styling
+        env.filters["render_content_block"] = self.render_content_block
+        env.filters["render_markdown"] = self.render_markdown
+        env.filters[
             "get_html_escaped_json_string_from_dict"
         ] = self.get_html_escaped_json_string_from_dict
-        self.env.filters["generate_html_element_uuid"] = self.generate_html_element_uuid
-        self.env.filters[
+        env.filters["generate_html_element_uuid"] = impure(
+            self.generate_html_element_uuid
+        )
+        env.filters[
             "attributes_dict_to_html_string"
         ] = self.attributes_dict_to_html_string
-        self.env.filters[
-            "render_bootstrap_table_data"
-        ] = self.render_bootstrap_table_data
-        self.env.globals["ge_version"] = ge_version
-        self.env.filters["add_data_context_id_to_url"] = self.add_data_context_id_to_url
+        env.filters["render_bootstrap_table_data"] = self.render_bootstrap_table_data
+        env.globals["ge_version"] = ge_version
+        env.globals["now"] = impure(
+            lambda: datetime.datetime.now(datetime.timezone.utc)
+        )
+        env.filters["add_data_context_id_to_url"] = impure(
+            self.add_data_context_id_to_url
+        )
+        return env
 
     def render(self, document, template=None, **kwargs):
         self._validate_document(document)
@@ -107,10 +176,7 @@ class DefaultJinjaView:
         if template is None:
             return NoOpTemplate
 
-        template = self.env.get_template(template)
-        template.globals["now"] = lambda: datetime.datetime.now(datetime.timezone.utc)
-
-        return template
+        return self.env.get_template(template)
 
     @contextfilter
     def add_data_context_id_to_url(self, jinja_context, url, add_datetime=True):
@@ -182,18 +248,40 @@ class DefaultJinjaView:
         else:
             template_filename = f"{content_block_type}.j2"
         template = self._get_template(template=template_filename)
+
+        # Content block templates only read the content block itself, its position and the ids of the enclosing
+        # section and content block.
+        environment_cache = self._environment_cache
+        fragment_key = environment_cache.make_fragment_key(
+            template_filename,
+            content_block,
+            index,
+            content_block_id,
+            jinja_context.get("content_block_id"),
+            jinja_context.get("section_id"),
+        )
+        if fragment_key is not None:
+            rendered_block = environment_cache.get_fragment(fragment_key)
+            if rendered_block is not None:
+                return rendered_block
+
+        impure_calls = environment_cache.impure_calls
         if content_block_id:
-            return template.render(
+            rendered_block = template.render(
                 jinja_context,
                 content_block=content_block,
                 index=index,
                 content_block_id=content_block_id,
             )
         else:
-            return template.render(
+            rendered_block = template.render(
                 jinja_context, content_block=content_block, index=index
             )
 
+        if fragment_key is not None and environment_cache.impure_calls == impure_calls:
+            environment_cache.set_fragment(fragment_key, rendered_block)
+        return rendered_block
+
     def render_dict_values(self, context, dict_, index=None, content_block_id=None):
         for key, val in dict_.items():
             if key.startswith("_"):
@@ -434,6 +522,72 @@ class DefaultJinjaView:
         raise NotImplementedError
 
 
+class _JinjaEnvironmentCache:
+    """A jinja Environment shared by views, together with an LRU cache of the fragments rendered with it.
+
+    Fragments are keyed by a hash of the JSON serialization of the content they render; fragments whose rendering
+    called an impure filter (see ``impure``) are never memoized.
+    """
+
+    def __init__(self, fragment_cache_size):
+        self.env = None
+        self.fragment_cache_size = fragment_cache_size
+        self.impure_calls = 0
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+
+    def impure(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self.impure_calls += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    def memoize_by_argument(self, func):
+        @functools.wraps(func)
+        def wrapper(value):
+            if not isinstance(value, dict):
+                return func(value)
+
+            key = self.make_fragment_key(func.__name__, value)
+            if key is None:
+                return func(value)
+
+            rendered = self.get_fragment(key)
+            if rendered is None:
+                rendered = func(value)
+                self.set_fragment(key, rendered)
+            return rendered
+
+        return wrapper
+
+    def make_fragment_key(self, name, content, *args):
+        if not self.fragment_cache_size:
+            return None
+
+        try:
+            content_json = json.dumps(content, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+
+        return (name, hashlib.md5(content_json.encode("utf-8")).hexdigest()) + args
+
+    def get_fragment(self, key):
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+            return fragment
+
+    def set_fragment(self, key, fragment):
+        with self._lock:
+            self._fragments[key] = fragment
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > self.fragment_cache_size:
+                self._fragments.popitem(last=False)
+
+
 class DefaultJinjaPageView(DefaultJinjaView):
     _template = "page.j2"
 
@@ -353,6 +353,7 @@ class CategoricalColumnDomainBuilder(ColumnDomainBuilder):
         ] = get_resolved_metrics_by_key(
             validator=validator,
             metric_configurations_by_key=metrics_for_cardinality_check,
+            resolved_metrics_store=self.resolved_metrics_store,
         )
 
         candidate_column_names: List[str] = [
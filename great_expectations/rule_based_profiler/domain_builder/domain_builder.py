@@ -106,6 +106,7 @@ class DomainBuilder(Builder, ABC):
         ] = get_resolved_metrics_by_key(
             validator=validator,
             metric_configurations_by_key=metric_configurations_by_batch_id,
+            resolved_metrics_store=self.resolved_metrics_store,
         )
 
         batch_id: str
@@ -224,6 +224,7 @@ class MapMetricColumnDomainBuilder(ColumnDomainBuilder):
             mean_table_row_count_as_float=mean_table_row_count_as_float,
             max_unexpected_ratio=max_unexpected_ratio,
             min_max_unexpected_values_proportion=min_max_unexpected_values_proportion,
+            resolved_metrics_store=self.resolved_metrics_store,
         )
 
         return build_simple_domains_from_column_names(
@@ -279,6 +280,7 @@ class MapMetricColumnDomainBuilder(ColumnDomainBuilder):
         mean_table_row_count_as_float: float,
         max_unexpected_ratio: float,
         min_max_unexpected_values_proportion: float,
+        resolved_metrics_store: Optional[Dict[Tuple[str, str, str], Any]] = None,
     ) -> List[str]:
         """
         Compute figures of merit and return column names satisfying tolerance limits.
@@ -289,6 +291,7 @@ class MapMetricColumnDomainBuilder(ColumnDomainBuilder):
             mean_table_row_count_as_float: average number of records over available Batch objects.
             max_unexpected_ratio: maximum "unexpected_count" value of "map_metric_name" averaged over numbers of records
             min_max_unexpected_values_proportion: minimum fraction of Batch objects adhering to "max_unexpected_ratio"
+            resolved_metrics_store: Optional profiler-wide Dictionary of resolved metrics
 
         Returns:
             List of column names satisfying tolerance limits.
@@ -301,6 +304,7 @@ class MapMetricColumnDomainBuilder(ColumnDomainBuilder):
         ] = get_resolved_metrics_by_key(
             validator=validator,
             metric_configurations_by_key=metric_configurations_by_column_name,
+            resolved_metrics_store=resolved_metrics_store,
         )
 
         metric_value: Any
@@ -1,5 +1,5 @@
 import copy
-import itertools
+import json
 import logging
 import uuid
 from numbers import Number
@@ -14,8 +14,13 @@ from great_expectations.core.batch import (
     Batch,
     BatchRequest,
     RuntimeBatchRequest,
+    get_batch_request_as_dict,
     materialize_batch_request,
 )
+from great_expectations.core.sketches import ColumnSketch
+from great_expectations.data_context.types.resource_identifiers import (
+    ColumnSketchIdentifier,
+)
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
 from great_expectations.rule_based_profiler.types import (
@@ -91,6 +96,36 @@ def get_validator(
     return validator
 
 
+def get_batch_specification_key(
+    batch_list: Optional[List[Batch]] = None,
+    batch_request: Optional[Union[str, BatchRequest, RuntimeBatchRequest, dict]] = None,
+    domain: Optional[Domain] = None,
+    variables: Optional[ParameterContainer] = None,
+    parameters: Optional[Dict[str, ParameterContainer]] = None,
+) -> str:
+    """
+    Returns string, identifying Batch objects, which "get_validator()" uses for the same arguments (i.e., the same
+    "batch_list" or the same "batch_request", after "$variable"/"$parameter"-style references have been resolved).
+    """
+    batch: Batch
+    if batch_list is not None and not all([batch is None for batch in batch_list]):
+        return json.dumps([batch.id for batch in batch_list])
+
+    batch_request = build_batch_request(
+        batch_request=batch_request,
+        domain=domain,
+        variables=variables,
+        parameters=parameters,
+    )
+
+    # In-memory data (e.g., "batch_data" of RuntimeBatchRequest) is identified by object identity.
+    return json.dumps(
+        get_batch_request_as_dict(batch_request=batch_request),
+        sort_keys=True,
+        default=lambda value: f"{type(value).__name__}_{id(value)}",
+    )
+
+
 def get_batch_ids(
     data_context: Optional["DataContext"] = None,  # noqa: F821
     batch_list: Optional[List[Batch]] = None,
@@ -262,9 +297,189 @@ def get_parameter_value(
     return parameter_reference
 
 
+def compute_metrics(
+    validator: "Validator",  # noqa: F821
+    metric_configurations: List[MetricConfiguration],
+    resolved_metrics_store: Optional[Dict[Tuple[str, str, str], Any]] = None,
+    metric_sketch_store: Optional["MetricSketchStore"] = None,  # noqa: F821
+) -> Dict[Tuple[str, str, str], Any]:
+    """
+    Compute (resolve) metrics, reusing metrics already available in profiler-wide resolved metrics store, if supplied.
+
+    Metric IDs do not include the identity of the active Batch of Validator, unless "batch_id" is part of
+    "metric_domain_kwargs".  Hence, resolved metrics store is only used if every "MetricConfiguration" is Batch-scoped.
+
+    If metric sketch store is supplied, then values of metrics of Batch columns, which can be derived from ColumnSketch
+    summaries (see "ColumnSketch.can_get_metric_value()"), are derived from summaries persisted in the store; missing
+    summaries are computed (one pass over every such column; see "column.sketch") and saved in the store first.
+    Summaries are only kept for Batch objects having a data fingerprint (see "_get_column_sketch_key()"), which SQL and
+    Spark Batch objects do not have, so their metrics are always computed from data.
+
+    Args:
+        validator: Validator used to compute metrics.
+        metric_configurations: "MetricConfiguration" objects to be resolved.
+        resolved_metrics_store: Dictionary of metrics resolved so far (by unique metric ID), shared by all Builder
+        components of profiler; newly resolved metrics are added to it.
+        metric_sketch_store: MetricSketchStore, in which ColumnSketch summaries of Batch columns are persisted.
+
+    Returns:
+        Dictionary with (at least) requested metrics resolved, with unique metric ID as key and metric value as value.
+    """
+    metric_configuration: MetricConfiguration
+    if metric_sketch_store is not None:
+        resolved_metrics: Dict[Tuple[str, str, str], Any]
+        (
+            resolved_metrics,
+            metric_configurations,
+        ) = _get_metric_values_from_column_sketches(
+            validator=validator,
+            metric_configurations=metric_configurations,
+            metric_sketch_store=metric_sketch_store,
+        )
+        if resolved_metrics_store is not None:
+            resolved_metrics_store.update(resolved_metrics)
+
+        if metric_configurations:
+            resolved_metrics.update(
+                compute_metrics(
+                    validator=validator,
+                    metric_configurations=metric_configurations,
+                    resolved_metrics_store=resolved_metrics_store,
+                )
+            )
+
+        return resolved_metrics
+
+    if resolved_metrics_store is None or not all(
+        [
+            metric_configuration.metric_domain_kwargs.get("batch_id") is not None
+            for metric_configuration in metric_configurations
+        ]
+    ):
+        return validator.compute_metrics(metric_configurations=metric_configurations)
+
+    return validator.compute_metrics(
+        metric_configurations=metric_configurations,
+        resolved_metrics=resolved_metrics_store,
+    )
+
+
+def _get_metric_values_from_column_sketches(
+    validator: "Validator",  # noqa: F821
+    metric_configurations: List[MetricConfiguration],
+    metric_sketch_store: "MetricSketchStore",  # noqa: F821
+) -> Tuple[Dict[Tuple[str, str, str], Any], List[MetricConfiguration]]:
+    """
+    Derives values of metrics of Batch columns from ColumnSketch summaries, computing and persisting missing summaries.
+
+    Returns:
+        Tuple containing resolved metrics (by unique metric ID) and "MetricConfiguration" objects, whose values cannot
+        be derived from summaries (these must be computed from data).
+    """
+    metric_configuration: MetricConfiguration
+    sketch_keys: List[ColumnSketchIdentifier] = [
+        _get_column_sketch_key(
+            validator=validator, metric_configuration=metric_configuration
+        )
+        for metric_configuration in metric_configurations
+    ]
+
+    sketch_key: ColumnSketchIdentifier
+    sketches: Dict[Tuple[str, str, str], ColumnSketch] = {
+        sketch_key.to_tuple(): metric_sketch_store.get(key=sketch_key)
+        for sketch_key in sketch_keys
+        if sketch_key is not None and metric_sketch_store.has_key(key=sketch_key)
+    }
+
+    # Summaries of all columns (of all Batch objects), which are not in the store yet, are computed together.
+    sketch_metric_configurations: Dict[Tuple[str, str, str], MetricConfiguration] = {
+        sketch_key.to_tuple(): MetricConfiguration(
+            metric_name="column.sketch",
+            metric_domain_kwargs={
+                "batch_id": sketch_key.batch_identifier,
+                "column": sketch_key.column_name,
+            },
+            metric_value_kwargs=None,
+        )
+        for sketch_key in sketch_keys
+        if sketch_key is not None and sketch_key.to_tuple() not in sketches
+    }
+    if sketch_metric_configurations:
+        computed_sketches: Dict[
+            Tuple[str, str, str], ColumnSketch
+        ] = validator.compute_metrics(
+            metric_configurations=list(sketch_metric_configurations.values())
+        )
+        sketch_key_tuple: Tuple[str, str, str]
+        for (
+            sketch_key_tuple,
+            metric_configuration,
+        ) in sketch_metric_configurations.items():
+            sketches[sketch_key_tuple] = computed_sketches[metric_configuration.id]
+            metric_sketch_store.set(
+                key=ColumnSketchIdentifier.from_tuple(sketch_key_tuple),
+                value=sketches[sketch_key_tuple],
+            )
+
+    resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+    unresolved_metric_configurations: List[MetricConfiguration] = []
+    sketch: Optional[ColumnSketch]
+    for metric_configuration, sketch_key in zip(metric_configurations, sketch_keys):
+        sketch = None if sketch_key is None else sketches[sketch_key.to_tuple()]
+        if sketch is not None and sketch.can_get_metric_value(
+            metric_name=metric_configuration.metric_name,
+            metric_value_kwargs=metric_configuration.metric_value_kwargs,
+        ):
+            resolved_metrics[metric_configuration.id] = sketch.get_metric_value(
+                metric_name=metric_configuration.metric_name,
+                metric_value_kwargs=metric_configuration.metric_value_kwargs,
+            )
+        else:
+            unresolved_metric_configurations.append(metric_configuration)
+
+    return resolved_metrics, unresolved_metric_configurations
+
+
+def _get_column_sketch_key(
+    validator: "Validator",  # noqa: F821
+    metric_configuration: MetricConfiguration,
+) -> Optional[ColumnSketchIdentifier]:
+    # Only metrics of entire columns of identified Batch objects (e.g., without row conditions) have summaries.
+    metric_domain_kwargs: dict = metric_configuration.metric_domain_kwargs
+    if not (
+        metric_configuration.metric_name
+        in ColumnSketch.EXACT_METRIC_NAMES | ColumnSketch.APPROXIMATE_METRIC_NAMES
+        and set(metric_domain_kwargs.keys()) == {"batch_id", "column"}
+        and metric_domain_kwargs["batch_id"] is not None
+    ):
+        return None
+
+    batch: Optional[Batch] = validator.batches.get(metric_domain_kwargs["batch_id"])
+    if batch is None:
+        return None
+
+    # Fingerprints of all of the data of a batch ("full" and "incremental" ones) change with the data, so summaries keyed
+    # on them are never stale.  Batch objects without such a fingerprint (e.g., of whole database tables or of Spark
+    # files), or with a "sampled" or "file" one (which can stay the same when rows left out of the sample, or the data
+    # read from a file, change), can carry different data under the same fingerprint, and are not summarized.
+    batch_markers: dict = batch.batch_markers or {}
+    data_fingerprint: Optional[str] = batch_markers.get("pandas_data_fingerprint")
+    if data_fingerprint is None or batch_markers.get(
+        "pandas_data_fingerprint_method", "full"
+    ) not in ("full", "incremental"):
+        return None
+
+    return ColumnSketchIdentifier(
+        batch_identifier=metric_domain_kwargs["batch_id"],
+        column_name=metric_domain_kwargs["column"],
+        data_fingerprint=data_fingerprint,
+    )
+
+
 def get_resolved_metrics_by_key(
     validator: "Validator",  # noqa: F821
     metric_configurations_by_key: Dict[str, List[MetricConfiguration]],
+    resolved_metrics_store: Optional[Dict[Tuple[str, str, str], Any]] = None,
 ) -> Dict[str, Dict[Tuple[str, str, str], Any]]:
     """
     Compute (resolve) metrics for every column name supplied on input.
@@ -275,6 +490,7 @@ def get_resolved_metrics_by_key(
         Dictionary of the form {
             "my_key": List[MetricConfiguration],  # examples of "my_key" are: "my_column_name", "my_batch_id", etc.
         }
+        resolved_metrics_store: Optional profiler-wide Dictionary of resolved metrics (see "compute_metrics()").
 
     Returns:
         Dictionary of the form {
@@ -287,68 +503,32 @@ def get_resolved_metrics_by_key(
 
     # Step 1: Gather "MetricConfiguration" objects corresponding to all possible key values/combinations.
     # and compute all metric values (resolve "MetricConfiguration" objects ) using a single method call.
-    resolved_metrics: Dict[Tuple[str, str, str], Any] = validator.compute_metrics(
+    resolved_metrics: Dict[Tuple[str, str, str], Any] = compute_metrics(
+        validator=validator,
         metric_configurations=[
             metric_configuration
             for key, metric_configurations_for_key in metric_configurations_by_key.items()
             for metric_configuration in metric_configurations_for_key
-        ]
-    )
-
-    # Step 2: Gather "MetricConfiguration" ID values for each key (one element per batch_id in every list).
-    metric_configuration_ids_by_key: Dict[str, List[Tuple[str, str, str]]] = {
-        key: [
-            metric_configuration.id
-            for metric_configuration in metric_configurations_for_key
-        ]
-        for key, metric_configurations_for_key in metric_configurations_by_key.items()
-    }
-
-    metric_configuration_ids: List[Tuple[str, str, str]]
-    # Step 3: Obtain flattened list of "MetricConfiguration" ID values across all key values/combinations.
-    metric_configuration_ids_all_keys: List[Tuple[str, str, str]] = list(
-        itertools.chain(
-            *[
-                metric_configuration_ids
-                for metric_configuration_ids in metric_configuration_ids_by_key.values()
-            ]
-        )
+        ],
+        resolved_metrics_store=resolved_metrics_store,
     )
 
-    # Step 4: Retain only those metric computation results that both, correspond to "MetricConfiguration" objects of
-    # interest (reflecting specified key values/combinations).
-    metric_configuration_id: Tuple[str, str, str]
-    metric_value: Any
-    resolved_metrics = {
-        metric_configuration_id: metric_value
-        for metric_configuration_id, metric_value in resolved_metrics.items()
-        if metric_configuration_id in metric_configuration_ids_all_keys
-    }
+    # Step 2: In a single pass over keys, retain only those keys, for which every "MetricConfiguration" object (one
+    # element per batch_id in every list) was resolved (using hash-based lookups into dictionary of resolved metrics).
+    resolved_metrics_by_key: Dict[str, Dict[Tuple[str, str, str], Any]] = {}
 
-    # Step 5: Gather "MetricConfiguration" ID values for effective collection of resolved metrics.
-    metric_configuration_ids_resolved_metrics: List[Tuple[str, str, str]] = list(
-        resolved_metrics.keys()
-    )
+    resolved_metrics_for_key: Dict[Tuple[str, str, str], Any]
+    for key, metric_configurations_for_key in metric_configurations_by_key.items():
+        resolved_metrics_for_key = {}
+        for metric_configuration in metric_configurations_for_key:
+            if metric_configuration.id not in resolved_metrics:
+                break
 
-    # Step 6: Produce "key" list, corresponding to effective "MetricConfiguration" ID values.
-    candidate_keys: List[str] = [
-        key
-        for key, metric_configuration_ids in metric_configuration_ids_by_key.items()
-        if all(
-            [
-                metric_configuration_id in metric_configuration_ids_resolved_metrics
-                for metric_configuration_id in metric_configuration_ids
+            resolved_metrics_for_key[metric_configuration.id] = resolved_metrics[
+                metric_configuration.id
             ]
-        )
-    ]
-
-    resolved_metrics_by_key: Dict[str, Dict[Tuple[str, str, str], Any]] = {
-        key: {
-            metric_configuration.id: resolved_metrics[metric_configuration.id]
-            for metric_configuration in metric_configurations_by_key[key]
-        }
-        for key in candidate_keys
-    }
+        else:
+            resolved_metrics_by_key[key] = resolved_metrics_for_key
 
     return resolved_metrics_by_key
 
@@ -16,6 +16,7 @@ from great_expectations.rule_based_profiler.types import (
     Domain,
     ParameterContainer,
 )
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
 class MetricMultiBatchParameterBuilder(ParameterBuilder):
@@ -33,6 +34,7 @@ class MetricMultiBatchParameterBuilder(ParameterBuilder):
         enforce_numeric_metric: Union[str, bool] = False,
         replace_nan_with_zero: Union[str, bool] = False,
         reduce_scalar_metric: Union[str, bool] = True,
+        metric_sketch_store_name: Optional[str] = None,
         json_serialize: Union[str, bool] = True,
         batch_list: Optional[List[Batch]] = None,
         batch_request: Optional[
@@ -52,6 +54,8 @@ class MetricMultiBatchParameterBuilder(ParameterBuilder):
             replace_nan_with_zero: if False (default), then if the computed metric gives NaN, then exception is raised;
             otherwise, if True, then if the computed metric gives NaN, then it is converted to the 0.0 (float) value.
             reduce_scalar_metric: if True (default), then reduces computation of 1-dimensional metric to scalar value.
+            metric_sketch_store_name: name of MetricSketchStore of DataContext; if specified, then metric values are
+            derived from summaries of Batch columns persisted in it, whenever possible (see "compute_metrics()").
             json_serialize: If True (default), convert computed value to JSON prior to saving results.
             batch_list: explicitly passed Batch objects for parameter computation (take precedence over batch_request).
             batch_request: specified in ParameterBuilder configuration to get Batch objects for parameter computation.
@@ -74,6 +78,8 @@ class MetricMultiBatchParameterBuilder(ParameterBuilder):
 
         self._reduce_scalar_metric = reduce_scalar_metric
 
+        self._metric_sketch_store_name = metric_sketch_store_name
+
     @property
     def fully_qualified_parameter_name(self) -> str:
         return f"{PARAMETER_KEY}{self.name}"
@@ -110,6 +116,39 @@ class MetricMultiBatchParameterBuilder(ParameterBuilder):
     def reduce_scalar_metric(self) -> Union[str, bool]:
         return self._reduce_scalar_metric
 
+    @property
+    def metric_sketch_store_name(self) -> Optional[str]:
+        return self._metric_sketch_store_name
+
+    def get_metric_configurations(
+        self,
+        batch_ids: List[str],
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Declares "MetricConfiguration" directives for "metric_name" computed on all Batch objects (see "get_metrics()").
+
+        If metric sketch store is configured, then no metrics are declared, so that they are derived from summaries of
+        Batch columns when building parameters, rather than computed from data in advance.
+        """
+        if self.metric_sketch_store_name is not None:
+            return []
+
+        metric_configurations: List[MetricConfiguration]
+        _, _, metric_configurations = self._build_metric_configurations(
+            metric_name=self.metric_name,
+            metric_domain_kwargs=self.metric_domain_kwargs,
+            metric_value_kwargs=self.metric_value_kwargs,
+            batch_ids=batch_ids,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        return metric_configurations
+
     def _build_parameters(
         self,
         parameter_container: ParameterContainer,
@@ -129,6 +168,7 @@ class MetricMultiBatchParameterBuilder(ParameterBuilder):
             metric_value_kwargs=self.metric_value_kwargs,
             enforce_numeric_metric=self.enforce_numeric_metric,
             replace_nan_with_zero=self.replace_nan_with_zero,
+            metric_sketch_store_name=self.metric_sketch_store_name,
             domain=domain,
             variables=variables,
             parameters=parameters,
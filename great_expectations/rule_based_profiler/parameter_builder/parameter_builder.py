@@ -11,11 +11,13 @@ from great_expectations.core.batch import Batch, BatchRequest, RuntimeBatchReque
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.rule_based_profiler.helpers.util import (
     build_metric_domain_kwargs,
+    compute_metrics,
 )
 from great_expectations.rule_based_profiler.helpers.util import (
     get_batch_ids as get_batch_ids_from_batch_list_or_batch_request,
 )
 from great_expectations.rule_based_profiler.helpers.util import (
+    get_batch_specification_key,
     get_parameter_value_and_validate_return_type,
 )
 from great_expectations.rule_based_profiler.helpers.util import (
@@ -202,15 +204,27 @@ class ParameterBuilder(Builder, ABC):
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
     ) -> Optional["Validator"]:  # noqa: F821
-        return get_validator_using_batch_list_or_batch_request(
-            purpose="parameter_builder",
-            data_context=self.data_context,
-            batch_list=self.batch_list,
-            batch_request=self.batch_request,
-            domain=domain,
-            variables=variables,
-            parameters=parameters,
-        )
+        with self.get_data_access_context():
+            if self.prefetched_validators:
+                batch_specification_key: str = get_batch_specification_key(
+                    batch_list=self.batch_list,
+                    batch_request=self.batch_request,
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                )
+                if batch_specification_key in self.prefetched_validators:
+                    return self.prefetched_validators.pop(batch_specification_key)
+
+            return get_validator_using_batch_list_or_batch_request(
+                purpose="parameter_builder",
+                data_context=self.data_context,
+                batch_list=self.batch_list,
+                batch_request=self.batch_request,
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
 
     def get_batch_ids(
         self,
@@ -218,14 +232,38 @@ class ParameterBuilder(Builder, ABC):
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
     ) -> Optional[List[str]]:
-        return get_batch_ids_from_batch_list_or_batch_request(
-            data_context=self.data_context,
-            batch_list=self.batch_list,
-            batch_request=self.batch_request,
-            domain=domain,
-            variables=variables,
-            parameters=parameters,
-        )
+        with self.get_data_access_context():
+            return get_batch_ids_from_batch_list_or_batch_request(
+                data_context=self.data_context,
+                batch_list=self.batch_list,
+                batch_request=self.batch_request,
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+
+    def get_metric_configurations(
+        self,
+        batch_ids: List[str],
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Declares "MetricConfiguration" directives, which this ParameterBuilder will resolve for specified Domain.
+
+        Rule uses these declarations in order to resolve metrics needed by all of its ParameterBuilder components for
+        all Domains together, before any parameters are built.  The declaration is advisory: metrics not declared (or
+        not resolved in advance) are computed as part of building parameters.  The default implementation declares
+        no metrics; ParameterBuilder classes, whose metrics are known in advance, override this method.
+
+        :param batch_ids: Identifiers of Batch objects, on which metrics are to be computed.
+        :param domain: Domain object scoping "$variable"/"$parameter"-style references in configuration and runtime.
+        :param variables: Part of the "rule state" available for "$variable"-style references.
+        :param parameters: Part of the "rule state" available for "$parameter"-style references.
+        :return: List of "MetricConfiguration" objects
+        """
+        return []
 
     def get_metrics(
         self,
@@ -238,6 +276,7 @@ class ParameterBuilder(Builder, ABC):
         ] = None,
         enforce_numeric_metric: Union[str, bool] = False,
         replace_nan_with_zero: Union[str, bool] = False,
+        metric_sketch_store_name: Optional[str] = None,
         domain: Optional[Domain] = None,
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
@@ -252,6 +291,8 @@ class ParameterBuilder(Builder, ABC):
         :param metric_value_kwargs: Metric Value Kwargs is an essential parameter of the MetricConfiguration object.
         :param enforce_numeric_metric: Flag controlling whether or not metric output must be numerically-valued.
         :param replace_nan_with_zero: Directive controlling how NaN metric values, if encountered, should be handled.
+        :param metric_sketch_store_name: Name of MetricSketchStore of DataContext, from whose summaries of Batch
+        columns metric values are derived, whenever possible (see "compute_metrics()").
         :param domain: Domain object scoping "$variable"/"$parameter"-style references in configuration and runtime.
         :param variables: Part of the "rule state" available for "$variable"-style references.
         :param parameters: Part of the "rule state" available for "$parameter"-style references.
@@ -269,79 +310,22 @@ class ParameterBuilder(Builder, ABC):
                 message=f"Utilizing a {self.__class__.__name__} requires a non-empty list of batch identifiers."
             )
 
-        """
-        Compute metrics, corresponding to multiple "MetricConfiguration" directives, together, rather than individually.
-
-        As a strategy, since "metric_domain_kwargs" changes depending on "batch_id", "metric_value_kwargs" serves as
-        identifying entity (through "AttributedResolvedMetrics") for accessing resolved metrics (computation results).
-
-        All "MetricConfiguration" directives are generated by combining each metric_value_kwargs" with
-        "metric_domain_kwargs" for all "batch_ids" (where every "metric_domain_kwargs" represents separate "batch_id").
-        Then, all "MetricConfiguration" objects, collected into list as container, are resolved simultaneously.
-        """
-
-        # First: Gather "metric_domain_kwargs" (corresponding to "batch_ids").
-
-        domain_kwargs: dict = build_metric_domain_kwargs(
-            batch_id=None,
+        domain_kwargs: dict
+        metrics_to_resolve: List[MetricConfiguration]
+        (
+            domain_kwargs,
+            metric_value_kwargs,
+            metrics_to_resolve,
+        ) = self._build_metric_configurations(
+            metric_name=metric_name,
             metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
+            batch_ids=batch_ids,
             domain=domain,
             variables=variables,
             parameters=parameters,
         )
 
-        batch_id: str
-        metric_domain_kwargs = [
-            copy.deepcopy(
-                build_metric_domain_kwargs(
-                    batch_id=batch_id,
-                    metric_domain_kwargs=copy.deepcopy(domain_kwargs),
-                    domain=domain,
-                    variables=variables,
-                    parameters=parameters,
-                )
-            )
-            for batch_id in batch_ids
-        ]
-
-        # Second: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).
-
-        if not isinstance(metric_value_kwargs, list):
-            metric_value_kwargs = [metric_value_kwargs]
-
-        value_kwargs_cursor: dict
-        metric_value_kwargs = [
-            # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.
-            get_parameter_value_and_validate_return_type(
-                domain=domain,
-                parameter_reference=value_kwargs_cursor,
-                expected_return_type=None,
-                variables=variables,
-                parameters=parameters,
-            )
-            for value_kwargs_cursor in metric_value_kwargs
-        ]
-
-        # Third: Generate "MetricConfiguration" directives for all "metric_domain_kwargs" / "metric_value_kwargs" pairs.
-
-        domain_kwargs_cursor: dict
-        kwargs_combinations: List[List[dict]] = [
-            [domain_kwargs_cursor, value_kwargs_cursor]
-            for value_kwargs_cursor in metric_value_kwargs
-            for domain_kwargs_cursor in metric_domain_kwargs
-        ]
-
-        kwargs_pair_cursor: List[dict, dict]
-        metrics_to_resolve: List[MetricConfiguration] = [
-            MetricConfiguration(
-                metric_name=metric_name,
-                metric_domain_kwargs=kwargs_pair_cursor[0],
-                metric_value_kwargs=kwargs_pair_cursor[1],
-                metric_dependencies=None,
-            )
-            for kwargs_pair_cursor in kwargs_combinations
-        ]
-
         # Fourth: Resolve all metrics in one operation simultaneously.
 
         # The Validator object used for metric calculation purposes.
@@ -351,9 +335,26 @@ class ParameterBuilder(Builder, ABC):
             parameters=parameters,
         )
 
-        resolved_metrics: Dict[Tuple[str, str, str], Any] = validator.compute_metrics(
-            metric_configurations=metrics_to_resolve
-        )
+        metric_sketch_store: Optional["MetricSketchStore"] = None  # noqa: F821
+        if metric_sketch_store_name is not None:
+            if (
+                self.data_context is None
+                or metric_sketch_store_name not in self.data_context.stores
+            ):
+                raise ge_exceptions.ProfilerConfigurationError(
+                    message=f'Unable to find MetricSketchStore "{metric_sketch_store_name}" for {self.__class__.__name__} in DataContext.'
+                )
+
+            metric_sketch_store = self.data_context.stores[metric_sketch_store_name]
+
+        resolved_metrics: Dict[Tuple[str, str, str], Any]
+        with self.get_data_access_context():
+            resolved_metrics = compute_metrics(
+                validator=validator,
+                metric_configurations=metrics_to_resolve,
+                resolved_metrics_store=self.resolved_metrics_store,
+                metric_sketch_store=metric_sketch_store,
+            )
 
         # Fifth: Map resolved metrics to their attributes for identification and recovery by receiver.
 
@@ -441,6 +442,99 @@ class ParameterBuilder(Builder, ABC):
             },
         )
 
+    def _build_metric_configurations(
+        self,
+        metric_name: str,
+        metric_domain_kwargs: Optional[
+            Union[Union[str, dict], List[Union[str, dict]]]
+        ] = None,
+        metric_value_kwargs: Optional[
+            Union[Union[str, dict], List[Union[str, dict]]]
+        ] = None,
+        batch_ids: Optional[List[str]] = None,
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Tuple[dict, List[dict], List[MetricConfiguration]]:
+        """
+        Build "MetricConfiguration" directives, so that corresponding metrics are computed together, rather than
+        individually.
+
+        As a strategy, since "metric_domain_kwargs" changes depending on "batch_id", "metric_value_kwargs" serves as
+        identifying entity (through "AttributedResolvedMetrics") for accessing resolved metrics (computation results).
+
+        All "MetricConfiguration" directives are generated by combining each metric_value_kwargs" with
+        "metric_domain_kwargs" for all "batch_ids" (where every "metric_domain_kwargs" represents separate "batch_id").
+        Then, all "MetricConfiguration" objects, collected into list as container, are resolved simultaneously.
+
+        :return: Tuple containing "metric_domain_kwargs" (without "batch_id"), resolved "metric_value_kwargs" list, and
+        "MetricConfiguration" objects, generated for all "batch_ids" / "metric_value_kwargs" combinations.
+        """
+
+        # First: Gather "metric_domain_kwargs" (corresponding to "batch_ids").
+
+        domain_kwargs: dict = build_metric_domain_kwargs(
+            batch_id=None,
+            metric_domain_kwargs=metric_domain_kwargs,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        batch_id: str
+        metric_domain_kwargs = [
+            copy.deepcopy(
+                build_metric_domain_kwargs(
+                    batch_id=batch_id,
+                    metric_domain_kwargs=copy.deepcopy(domain_kwargs),
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                )
+            )
+            for batch_id in batch_ids
+        ]
+
+        # Second: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).
+
+        if not isinstance(metric_value_kwargs, list):
+            metric_value_kwargs = [metric_value_kwargs]
+
+        value_kwargs_cursor: dict
+        metric_value_kwargs = [
+            # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.
+            get_parameter_value_and_validate_return_type(
+                domain=domain,
+                parameter_reference=value_kwargs_cursor,
+                expected_return_type=None,
+                variables=variables,
+                parameters=parameters,
+            )
+            for value_kwargs_cursor in metric_value_kwargs
+        ]
+
+        # Third: Generate "MetricConfiguration" directives for all "metric_domain_kwargs" / "metric_value_kwargs" pairs.
+
+        domain_kwargs_cursor: dict
+        kwargs_combinations: List[List[dict]] = [
+            [domain_kwargs_cursor, value_kwargs_cursor]
+            for value_kwargs_cursor in metric_value_kwargs
+            for domain_kwargs_cursor in metric_domain_kwargs
+        ]
+
+        kwargs_pair_cursor: List[dict, dict]
+        metrics_to_resolve: List[MetricConfiguration] = [
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=kwargs_pair_cursor[0],
+                metric_value_kwargs=kwargs_pair_cursor[1],
+                metric_dependencies=None,
+            )
+            for kwargs_pair_cursor in kwargs_combinations
+        ]
+
+        return domain_kwargs, metric_value_kwargs, metrics_to_resolve
+
     def _sanitize_metric_computation(
         self,
         metric_name: str,
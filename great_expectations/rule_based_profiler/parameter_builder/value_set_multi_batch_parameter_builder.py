@@ -44,6 +44,7 @@ class ValueSetMultiBatchParameterBuilder(MetricMultiBatchParameterBuilder):
         "enforce_numeric_metric",
         "replace_nan_with_zero",
         "reduce_scalar_metric",
+        "metric_sketch_store_name",
     }
 
     def __init__(
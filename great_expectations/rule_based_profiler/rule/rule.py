@@ -1,8 +1,10 @@
 import copy
 import json
-from typing import Dict, List, Optional
+from threading import RLock
+from typing import Any, Dict, List, Optional, Tuple
 
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.rule_based_profiler.config.base import (
     domainBuilderConfigSchema,
@@ -13,10 +15,46 @@ from great_expectations.rule_based_profiler.domain_builder import DomainBuilder
 from great_expectations.rule_based_profiler.expectation_configuration_builder import (
     ExpectationConfigurationBuilder,
 )
+from great_expectations.rule_based_profiler.helpers.util import (
+    compute_metrics,
+    get_batch_specification_key,
+)
 from great_expectations.rule_based_profiler.parameter_builder import ParameterBuilder
-from great_expectations.rule_based_profiler.types import Domain, ParameterContainer
-from great_expectations.types import SerializableDictDot
+from great_expectations.rule_based_profiler.types import (
+    PARAMETER_KEY,
+    Builder,
+    Domain,
+    ParameterContainer,
+    is_fully_qualified_parameter_name_literal_string_format,
+)
+from great_expectations.types import DictDot, SerializableDictDot
 from great_expectations.util import deep_filter_properties_iterable
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+
+def _contains_parameter_reference(value: Any) -> bool:
+    """
+    Whether or not configuration value (or any value nested in it) is a fully-qualified parameter name referring to
+    results of ParameterBuilder components (as opposed to "$variables" and "$domain" references).
+    """
+    if isinstance(value, DictDot):
+        value = value.to_dict()
+
+    if isinstance(value, dict):
+        return any(
+            _contains_parameter_reference(value=element) for element in value.values()
+        )
+
+    if isinstance(value, (list, tuple)):
+        return any(_contains_parameter_reference(value=element) for element in value)
+
+    return (
+        isinstance(value, str)
+        and is_fully_qualified_parameter_name_literal_string_format(
+            fully_qualified_parameter_name=value
+        )
+        and value.startswith(PARAMETER_KEY)
+    )
 
 
 class Rule(SerializableDictDot):
@@ -46,49 +84,221 @@ class Rule(SerializableDictDot):
     def generate(
         self,
         variables: Optional[ParameterContainer] = None,
+        resolved_metrics_store: Optional[Dict[Tuple[str, str, str], Any]] = None,
     ) -> List[ExpectationConfiguration]:
         """
         Builds a list of Expectation Configurations, returning a single Expectation Configuration entry for every
         ConfigurationBuilder available based on the instantiation.
 
+        :param variables: Part of the "rule state" available for "$variable"-style references.
+        :param resolved_metrics_store: Profiler-wide Dictionary of resolved metrics, shared by DomainBuilder and
+        ParameterBuilder components of all Rules (metrics already resolved for the same Batch are not computed again).
         :return: List of Corresponding Expectation Configurations representing every configured rule
         """
-        expectation_configurations: List[ExpectationConfiguration] = []
+        builders: List[Builder] = [self.domain_builder] + (
+            self.parameter_builders or []
+        )
+
+        # Domains may be processed concurrently (see "_generate()"); hence, access of Builder components to shared
+        # state (i.e., DataContext, ExecutionEngine, and resolved metrics store) is serialized.
+        data_access_lock: RLock = RLock()
+        prefetched_validators: Dict[str, "Validator"] = {}  # noqa: F821
+
+        builder: Builder
+        for builder in builders:
+            builder.resolved_metrics_store = resolved_metrics_store
+            builder.data_access_lock = data_access_lock
+            builder.prefetched_validators = prefetched_validators
 
+        try:
+            return self._generate(
+                variables=variables,
+                resolved_metrics_store=resolved_metrics_store,
+                prefetched_validators=prefetched_validators,
+            )
+        finally:
+            for builder in builders:
+                builder.resolved_metrics_store = None
+                builder.data_access_lock = None
+                builder.prefetched_validators = None
+
+    def _generate(
+        self,
+        variables: Optional[ParameterContainer] = None,
+        resolved_metrics_store: Optional[Dict[Tuple[str, str, str], Any]] = None,
+        prefetched_validators: Optional[Dict[str, "Validator"]] = None,  # noqa: F821
+    ) -> List[ExpectationConfiguration]:
         domains: List[Domain] = self.domain_builder.get_domains(variables=variables)
 
         domain: Domain
         for domain in domains:
-            parameter_container: ParameterContainer = ParameterContainer(
-                parameter_nodes=None
+            self._parameters[domain.id] = ParameterContainer(parameter_nodes=None)
+
+        if resolved_metrics_store is not None:
+            self._resolve_metrics_for_domains(
+                domains=domains,
+                resolved_metrics_store=resolved_metrics_store,
+                variables=variables,
+                prefetched_validators=prefetched_validators,
             )
-            self._parameters[domain.id] = parameter_container
 
-            parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
-            parameter_builder: ParameterBuilder
-            for parameter_builder in parameter_builders:
-                parameter_builder.build_parameters(
-                    parameter_container=parameter_container,
+        # Domains are independent of one another; hence, estimation for every Domain (e.g., bootstrap-based ranges) is
+        # done concurrently, if concurrency is enabled in the DataContext configuration (please see the AsyncExecutor
+        # docstring for details), and synchronously otherwise.  Results are collected in the order of Domain objects.
+        data_context = self.domain_builder.data_context
+        with AsyncExecutor(
+            concurrency_config=data_context.concurrency if data_context else None,
+            max_workers=len(domains),
+        ) as async_executor:
+            async_results: List[AsyncResult] = [
+                async_executor.submit(
+                    self._generate_for_domain,
                     domain=domain,
                     variables=variables,
-                    parameters=self._parameters,
                 )
+                for domain in domains
+            ]
+
+        async_result: AsyncResult
+        expectation_configurations: List[ExpectationConfiguration] = [
+            expectation_configuration
+            for async_result in async_results
+            for expectation_configuration in async_result.result()
+        ]
+
+        return expectation_configurations
+
+    def _resolve_metrics_for_domains(
+        self,
+        domains: List[Domain],
+        resolved_metrics_store: Dict[Tuple[str, str, str], Any],
+        variables: Optional[ParameterContainer] = None,
+        prefetched_validators: Optional[Dict[str, "Validator"]] = None,  # noqa: F821
+    ) -> None:
+        """
+        Resolves metrics, declared by ParameterBuilder components for all Domains, using one metric computation graph
+        per set of Batch objects (rather than one graph per ParameterBuilder per Domain), and saves them in resolved
+        metrics store, from which ParameterBuilder components obtain them when building parameters.
+
+        Metric declarations of ParameterBuilder components, whose configuration refers to parameters not yet built
+        (i.e., "$parameter"-style references to results of other ParameterBuilder components), cannot be gathered in
+        advance; such metrics are computed as part of building parameters.
+
+        Validator objects, obtained here, are saved in "prefetched_validators" (by Batch specification key), so that
+        ParameterBuilder components use them, instead of obtaining Validator objects for the same Batch objects again.
+        """
+        parameter_builders: List[ParameterBuilder] = [
+            parameter_builder
+            for parameter_builder in self.parameter_builders or []
+            if not self._refers_to_parameters(parameter_builder=parameter_builder)
+        ]
+        if not (domains and parameter_builders):
+            return
 
-            expectation_configuration_builders: List[
-                ExpectationConfigurationBuilder
-            ] = (self.expectation_configuration_builders or [])
-            expectation_configuration_builder: ExpectationConfigurationBuilder
-            for expectation_configuration_builder in expectation_configuration_builders:
-                expectation_configurations.append(
-                    expectation_configuration_builder.build_expectation_configuration(
-                        parameter_container=parameter_container,
+        if prefetched_validators is None:
+            prefetched_validators = {}
+
+        # Validator objects (and their Batch identifiers) are obtained once per distinct Batch specification.
+        batch_specification_key: str
+        validator: Optional["Validator"]  # noqa: F821
+        validators_by_batch_specification_key: Dict[
+            str, Optional["Validator"]  # noqa: F821
+        ] = {}
+        metric_configurations_by_batch_specification_key: Dict[
+            str, List[MetricConfiguration]
+        ] = {}
+
+        parameter_builder: ParameterBuilder
+        domain: Domain
+        metric_configurations: List[MetricConfiguration]
+        for parameter_builder in parameter_builders:
+            for domain in domains:
+                batch_specification_key = get_batch_specification_key(
+                    batch_list=parameter_builder.batch_list,
+                    batch_request=parameter_builder.batch_request,
+                    domain=domain,
+                    variables=variables,
+                    parameters=self._parameters,
+                )
+                if batch_specification_key not in validators_by_batch_specification_key:
+                    validator = parameter_builder.get_validator(
                         domain=domain,
                         variables=variables,
                         parameters=self._parameters,
                     )
+                    validators_by_batch_specification_key[
+                        batch_specification_key
+                    ] = validator
+                    if validator is not None:
+                        prefetched_validators[batch_specification_key] = validator
+
+                validator = validators_by_batch_specification_key[
+                    batch_specification_key
+                ]
+                if validator is None:
+                    continue
+
+                metric_configurations = parameter_builder.get_metric_configurations(
+                    batch_ids=validator.loaded_batch_ids,
+                    domain=domain,
+                    variables=variables,
+                    parameters=self._parameters,
                 )
+                metric_configurations_by_batch_specification_key.setdefault(
+                    batch_specification_key, []
+                ).extend(metric_configurations)
 
-        return expectation_configurations
+        for (
+            batch_specification_key,
+            metric_configurations,
+        ) in metric_configurations_by_batch_specification_key.items():
+            if metric_configurations:
+                compute_metrics(
+                    validator=validators_by_batch_specification_key[
+                        batch_specification_key
+                    ],
+                    metric_configurations=metric_configurations,
+                    resolved_metrics_store=resolved_metrics_store,
+                )
+
+    @staticmethod
+    def _refers_to_parameters(parameter_builder: ParameterBuilder) -> bool:
+        """
+        Whether or not configuration of ParameterBuilder contains "$parameter"-style references (to results of other
+        ParameterBuilder components), which can only be resolved while building parameters.
+        """
+        return _contains_parameter_reference(value=parameter_builder.to_dict())
+
+    def _generate_for_domain(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+    ) -> List[ExpectationConfiguration]:
+        parameter_container: ParameterContainer = self._parameters[domain.id]
+
+        parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
+        parameter_builder: ParameterBuilder
+        for parameter_builder in parameter_builders:
+            parameter_builder.build_parameters(
+                parameter_container=parameter_container,
+                domain=domain,
+                variables=variables,
+                parameters=self._parameters,
+            )
+
+        expectation_configuration_builders: List[ExpectationConfigurationBuilder] = (
+            self.expectation_configuration_builders or []
+        )
+        expectation_configuration_builder: ExpectationConfigurationBuilder
+        return [
+            expectation_configuration_builder.build_expectation_configuration(
+                parameter_container=parameter_container,
+                domain=domain,
+                variables=variables,
+                parameters=self._parameters,
+            )
+            for expectation_configuration_builder in expectation_configuration_builders
+        ]
 
     @property
     def name(self) -> str:
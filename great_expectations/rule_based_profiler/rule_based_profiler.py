@@ -4,7 +4,7 @@ import logging
 import uuid
 from dataclasses import asdict, dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import (
@@ -299,10 +299,14 @@ class BaseRuleBasedProfiler(ConfigPeer):
                 profiler_config=self._citation,
             )
 
+        # Metrics resolved by any Rule are reused by subsequent Rules requesting same metric on same Batch of data.
+        resolved_metrics_store: Dict[Tuple[str, str, str], Any] = {}
+
         rule: Rule
         for rule in effective_rules:
             expectation_configurations: List[ExpectationConfiguration] = rule.generate(
                 variables=effective_variables,
+                resolved_metrics_store=resolved_metrics_store,
             )
             expectation_configuration: ExpectationConfiguration
             for expectation_configuration in expectation_configurations:
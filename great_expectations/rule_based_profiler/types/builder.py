@@ -1,5 +1,7 @@
 import json
-from typing import Any, List, Optional, Set, Union
+from contextlib import nullcontext
+from threading import RLock
+from typing import Any, ContextManager, Dict, List, Optional, Set, Tuple, Union
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import (
@@ -21,6 +23,9 @@ class Builder(SerializableDictDot):
     exclude_field_names: Set[str] = {
         "batch_list",
         "data_context",
+        "resolved_metrics_store",
+        "data_access_lock",
+        "prefetched_validators",
     }
 
     def __init__(
@@ -41,6 +46,10 @@ class Builder(SerializableDictDot):
         self._batch_request = batch_request
         self._data_context = data_context
 
+        self._resolved_metrics_store = None
+        self._data_access_lock = None
+        self._prefetched_validators = None
+
     """
     Full getter/setter accessors for "batch_request" and "batch_list" are for configuring Builder dynamically.
     """
@@ -70,6 +79,54 @@ class Builder(SerializableDictDot):
     def data_context(self) -> Optional["DataContext"]:  # noqa: F821
         return self._data_context
 
+    """
+    Profiler-wide store of resolved metrics (by unique metric ID) is set by Rule for the duration of its evaluation, so
+    that metrics, computed on the same Batch by Builder components of all Rules, are only resolved once.
+    """
+
+    @property
+    def resolved_metrics_store(self) -> Optional[Dict[Tuple[str, str, str], Any]]:
+        return self._resolved_metrics_store
+
+    @resolved_metrics_store.setter
+    def resolved_metrics_store(
+        self, value: Optional[Dict[Tuple[str, str, str], Any]]
+    ) -> None:
+        self._resolved_metrics_store = value
+
+    """
+    Lock, set by Rule for the duration of its evaluation, which serializes access of its Builder components to shared
+    state (i.e., DataContext, ExecutionEngine, and resolved metrics store), while Domains are processed concurrently.
+    """
+
+    @property
+    def data_access_lock(self) -> Optional[RLock]:
+        return self._data_access_lock
+
+    @data_access_lock.setter
+    def data_access_lock(self, value: Optional[RLock]) -> None:
+        self._data_access_lock = value
+
+    def get_data_access_context(self) -> ContextManager:
+        return (
+            nullcontext() if self._data_access_lock is None else self._data_access_lock
+        )
+
+    """
+    Validator objects, obtained by Rule for resolving metrics of all Domains in advance, by Batch specification key (see
+    "get_batch_specification_key()"); each is handed over to the first "get_validator()" call for the same Batch objects.
+    """
+
+    @property
+    def prefetched_validators(self) -> Optional[Dict[str, "Validator"]]:  # noqa: F821
+        return self._prefetched_validators
+
+    @prefetched_validators.setter
+    def prefetched_validators(
+        self, value: Optional[Dict[str, "Validator"]]  # noqa: F821
+    ) -> None:
+        self._prefetched_validators = value
+
     def set_batch_data(
         self,
         batch_list: Optional[List[Batch]] = None,
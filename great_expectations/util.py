@@ -41,7 +41,10 @@ from great_expectations.exceptions import (
     PluginClassNotFoundError,
     PluginModuleNotFoundError,
 )
-from great_expectations.expectations.registry import _registered_expectations
+from great_expectations.expectations.registry import (
+    _import_all_expectation_modules,
+    _registered_expectations,
+)
 
 try:
     import black
@@ -1334,6 +1337,7 @@ def generate_library_json_from_registered_expectations():
     """Generate the JSON object used to populate the public gallery"""
     library_json = {}
 
+    _import_all_expectation_modules()
     for expectation_name, expectation in _registered_expectations.items():
         report_object = expectation().run_diagnostics()
         library_json[expectation_name] = report_object
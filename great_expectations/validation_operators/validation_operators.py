@@ -1,13 +1,16 @@
+import concurrent.futures
 import logging
+import time
 import warnings
 from collections import OrderedDict
-from typing import Union
+from threading import BoundedSemaphore
+from typing import Dict, List, Optional, Union
 
 from dateutil.parser import parse
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.checkpoint.util import send_slack_notification
-from great_expectations.core.async_executor import AsyncExecutor
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import Batch
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_asset import DataAsset
@@ -126,6 +129,39 @@ class ActionListValidationOperator(ValidationOperator):
               class_name: UpdateDataDocsAction
 
 
+    **Concurrent actions**
+
+    If ``concurrency`` is enabled in the Data Context configuration together with its ``concurrent_actions`` option,
+    actions run on a bounded thread pool, so that slow notifications no longer hold up the validation of the next
+    batch. Each action list entry may then declare:
+
+    * ``depends_on`` - the names of the (earlier) actions that must finish before this action starts; their results are
+      passed to this action as its ``payload``. An entry without ``depends_on`` waits for every action listed before it,
+      which preserves the sequential behavior.
+    * ``timeout`` - the maximum number of seconds this action may run, counted from when it starts running (time spent
+      queued behind other actions does not count). An action that does not finish in time does not fail the run: its
+      result is recorded as ``{"class": ..., "timed_out": True}`` and it is left to finish in the background. Actions
+      that depend on it (directly or not) are not run; their results are recorded as
+      ``{"class": ..., "skipped": True, "reason": "dependency_timed_out"}``.
+
+    .. code-block:: yaml
+
+        action_list:
+          - name: store_validation_result
+            action:
+              class_name: StoreValidationResultAction
+          - name: update_data_docs
+            depends_on: [store_validation_result]
+            action:
+              class_name: UpdateDataDocsAction
+          - name: send_slack_notification_on_validation_result
+            depends_on: [update_data_docs]
+            timeout: 30
+            action:
+              class_name: SlackNotificationAction
+              slack_webhook: ${validation_notification_slack_webhook}
+
+
     **Invocation**
 
     This is an example of invoking an instance of a Validation Operator from Python:
@@ -187,6 +223,9 @@ class ActionListValidationOperator(ValidationOperator):
         }
     """
 
+    _REQUIRED_ACTION_CONFIG_KEYS = {"name", "action"}
+    _OPTIONAL_ACTION_CONFIG_KEYS = {"depends_on", "timeout"}
+
     def __init__(
         self,
         data_context,
@@ -212,13 +251,23 @@ class ActionListValidationOperator(ValidationOperator):
         for action_config in action_list:
             assert isinstance(action_config, dict)
             # NOTE: Eugene: 2019-09-23: need a better way to validate an action config:
-            if not set(action_config.keys()) == {"name", "action"}:
+            if not (
+                self._REQUIRED_ACTION_CONFIG_KEYS
+                <= set(action_config.keys())
+                <= self._REQUIRED_ACTION_CONFIG_KEYS | self._OPTIONAL_ACTION_CONFIG_KEYS
+            ):
                 raise KeyError(
-                    'Action config keys must be ("name", "action"). Instead got {}'.format(
-                        action_config.keys()
-                    )
+                    'Action config keys must be ("name", "action") and optionally ("depends_on", "timeout"). '
+                    "Instead got {}".format(action_config.keys())
                 )
 
+            for dependency_name in action_config.get("depends_on") or []:
+                if dependency_name not in self.actions:
+                    raise ge_exceptions.InvalidConfigError(
+                        f'Action "{action_config["name"]}" depends on "{dependency_name}", which is not the name of '
+                        f"an action listed before it."
+                    )
+
             config = action_config["action"]
             module_name = "great_expectations.validation_operators"
             new_action = instantiate_class_from_config(
@@ -328,75 +377,116 @@ class ActionListValidationOperator(ValidationOperator):
         # len(assets_to_validate) is equal to 1. So no unnecessary multithreading is ever used here even though it may
         # be nested inside another AsyncExecutor (and this is a good thing because it avoids extra overhead associated
         # with each thread and minimizes the total number of threads to simplify debugging).
+        #
+        # Building a batch from an item (which may load data, create temporary tables or download files) is done in
+        # the same submitted call as its validation, so that batch materialization is pipelined with validation per
+        # asset instead of running serially on the calling thread. The number of batches built and validated at the
+        # same time is bounded by concurrency_config.max_batch_materialization_concurrency (if set).
+        if result_format is None:
+            result_format = self.result_format
+
+        batch_validate_arguments = {
+            "run_id": run_id,
+            "result_format": result_format,
+            "evaluation_parameters": evaluation_parameters,
+        }
+
+        if catch_exceptions is not None:
+            batch_validate_arguments["catch_exceptions"] = catch_exceptions
+
         with AsyncExecutor(
             self.data_context.concurrency, max_workers=len(assets_to_validate)
         ) as async_executor:
-            batch_and_async_result_tuples = []
-            for item in assets_to_validate:
-                batch = self._build_batch_from_item(item)
-
-                if hasattr(batch, "active_batch_id"):
-                    batch_identifier = batch.active_batch_id
-                else:
-                    batch_identifier = batch.batch_id
-
-                if result_format is None:
-                    result_format = self.result_format
-
-                batch_validate_arguments = {
-                    "run_id": run_id,
-                    "result_format": result_format,
-                    "evaluation_parameters": evaluation_parameters,
-                }
-
-                if catch_exceptions is not None:
-                    batch_validate_arguments["catch_exceptions"] = catch_exceptions
-
-                batch_and_async_result_tuples.append(
-                    (
-                        batch,
-                        async_executor.submit(
-                            batch.validate,
-                            **batch_validate_arguments,
-                        ),
-                    )
+            batch_materialization_semaphore = (
+                self._get_batch_materialization_semaphore()
+                if async_executor.execute_concurrently
+                else None
+            )
+            async_batch_and_validation_results = [
+                async_executor.submit(
+                    self._build_batch_and_validate,
+                    item=item,
+                    batch_materialization_semaphore=batch_materialization_semaphore,
+                    batch_validate_arguments=batch_validate_arguments,
                 )
+                for item in assets_to_validate
+            ]
 
             run_results = {}
-            for batch, async_batch_validation_result in batch_and_async_result_tuples:
-                if self.data_context.ge_cloud_mode:
-                    expectation_suite_identifier = GeCloudIdentifier(
-                        resource_type="expectation_suite",
-                        ge_cloud_id=batch._expectation_suite.ge_cloud_id,
-                    )
-                    validation_result_id = GeCloudIdentifier(
-                        resource_type="suite_validation_result"
-                    )
+            actions_async_executor = self._get_actions_async_executor()
+            actions_finished = False
+            try:
+                for (
+                    async_batch_and_validation_result
+                ) in async_batch_and_validation_results:
+                    (
+                        batch,
+                        batch_validation_result,
+                    ) = async_batch_and_validation_result.result()
+
+                    if hasattr(batch, "active_batch_id"):
+                        batch_identifier = batch.active_batch_id
+                    else:
+                        batch_identifier = batch.batch_id
+
+                    if self.data_context.ge_cloud_mode:
+                        expectation_suite_identifier = GeCloudIdentifier(
+                            resource_type="expectation_suite",
+                            ge_cloud_id=batch._expectation_suite.ge_cloud_id,
+                        )
+                        validation_result_id = GeCloudIdentifier(
+                            resource_type="suite_validation_result"
+                        )
+                    else:
+                        expectation_suite_identifier = ExpectationSuiteIdentifier(
+                            expectation_suite_name=batch._expectation_suite.expectation_suite_name
+                        )
+                        validation_result_id = ValidationResultIdentifier(
+                            batch_identifier=batch_identifier,
+                            expectation_suite_identifier=expectation_suite_identifier,
+                            run_id=run_id,
+                        )
+
+                    if actions_async_executor is None:
+                        batch_actions_results = self._run_actions(
+                            batch=batch,
+                            expectation_suite_identifier=expectation_suite_identifier,
+                            expectation_suite=batch._expectation_suite,
+                            batch_validation_result=batch_validation_result,
+                            run_id=run_id,
+                            validation_result_id=validation_result_id,
+                            checkpoint_identifier=checkpoint_identifier,
+                        )
+                    else:
+                        # Actions are only scheduled here; their results are collected once every batch has been
+                        # handled.
+                        batch_actions_results = self._submit_actions(
+                            async_executor=actions_async_executor,
+                            batch=batch,
+                            expectation_suite_identifier=expectation_suite_identifier,
+                            batch_validation_result=batch_validation_result,
+                            run_id=run_id,
+                            validation_result_id=validation_result_id,
+                            checkpoint_identifier=checkpoint_identifier,
+                        )
+
+                    run_result_obj = {
+                        "validation_result": batch_validation_result,
+                        "actions_results": batch_actions_results,
+                    }
+                    run_results[validation_result_id] = run_result_obj
+
+                if actions_async_executor is None:
+                    actions_finished = True
                 else:
-                    expectation_suite_identifier = ExpectationSuiteIdentifier(
-                        expectation_suite_name=batch._expectation_suite.expectation_suite_name
-                    )
-                    validation_result_id = ValidationResultIdentifier(
-                        batch_identifier=batch_identifier,
-                        expectation_suite_identifier=expectation_suite_identifier,
-                        run_id=run_id,
+                    actions_finished = self._collect_actions_results(
+                        run_results=run_results
                     )
-
-                batch_actions_results = self._run_actions(
-                    batch=batch,
-                    expectation_suite_identifier=expectation_suite_identifier,
-                    expectation_suite=batch._expectation_suite,
-                    batch_validation_result=async_batch_validation_result.result(),
-                    run_id=run_id,
-                    validation_result_id=validation_result_id,
-                    checkpoint_identifier=checkpoint_identifier,
-                )
-
-                run_result_obj = {
-                    "validation_result": async_batch_validation_result.result(),
-                    "actions_results": batch_actions_results,
-                }
-                run_results[validation_result_id] = run_result_obj
+            finally:
+                if actions_async_executor is not None:
+                    # After a failure or an action timing out, do not block on actions that are still running; they are
+                    # left to finish in the background.
+                    actions_async_executor.shutdown(wait=actions_finished)
 
         return ValidationOperatorResult(
             run_id=run_id,
@@ -405,6 +495,193 @@ class ActionListValidationOperator(ValidationOperator):
             evaluation_parameters=evaluation_parameters,
         )
 
+    def _get_batch_materialization_semaphore(self) -> Optional[BoundedSemaphore]:
+        """Returns a semaphore bounding the number of batches built and validated at the same time, or None if there is
+        no bound."""
+        concurrency = self.data_context.concurrency
+        if (
+            concurrency is None
+            or concurrency.max_batch_materialization_concurrency is None
+        ):
+            return None
+
+        return BoundedSemaphore(concurrency.max_batch_materialization_concurrency)
+
+    def _build_batch_and_validate(
+        self,
+        item,
+        batch_materialization_semaphore: Optional[BoundedSemaphore],
+        batch_validate_arguments: dict,
+    ) -> tuple:
+        """Builds the batch for one asset to validate (see _build_batch_from_item) and validates it.
+
+        The batch materialization semaphore (if any) is held until the batch is validated, because a materialized
+        batch keeps using memory and warehouse slots until then.
+
+        Returns:
+            A tuple of the batch and its validation result
+        """
+        if batch_materialization_semaphore is None:
+            batch = self._build_batch_from_item(item)
+            return batch, batch.validate(**batch_validate_arguments)
+
+        with batch_materialization_semaphore:
+            batch = self._build_batch_from_item(item)
+            return batch, batch.validate(**batch_validate_arguments)
+
+    def _get_actions_async_executor(self) -> Optional[AsyncExecutor]:
+        """Returns a new AsyncExecutor for running actions concurrently, or None if actions are to run sequentially."""
+        concurrency = self.data_context.concurrency
+        if not (
+            concurrency is not None
+            and concurrency.enabled
+            and concurrency.concurrent_actions
+        ):
+            return None
+
+        async_executor = AsyncExecutor(
+            concurrency,
+            max_workers=concurrency.max_action_concurrency,
+            max_pending_tasks=concurrency.max_pending_actions,
+        )
+        if not async_executor.execute_concurrently:
+            async_executor.shutdown()
+            return None
+
+        return async_executor
+
+    def _submit_actions(
+        self,
+        async_executor: AsyncExecutor,
+        batch: Union[Batch, DataAsset],
+        expectation_suite_identifier: ExpectationSuiteIdentifier,
+        batch_validation_result,
+        run_id,
+        validation_result_id,
+        checkpoint_identifier=None,
+    ) -> Dict[str, AsyncResult]:
+        """
+        Schedules all actions configured for this operator on the result of validating one batch against one
+        expectation suite, without waiting for any of them to finish.
+
+        Actions are submitted in the order of the action list and each one waits for the actions it depends on (see
+        "depends_on" in the class docstring). Because an action can only depend on actions listed before it, and the
+        executor starts calls in submission order, waiting on dependencies never deadlocks the thread pool.
+
+        :return: a dictionary: {action name -> AsyncResult of the action}
+        """
+        async_actions_results: Dict[str, AsyncResult] = {}
+        ancestor_action_names: Dict[str, List[str]] = {}
+        for action in self.action_list:
+            action_name: str = action["name"]
+            if "depends_on" in action:
+                direct_dependency_names = action["depends_on"] or []
+            else:
+                direct_dependency_names = list(async_actions_results.keys())
+
+            ancestors = set(direct_dependency_names)
+            for dependency_name in direct_dependency_names:
+                ancestors.update(ancestor_action_names[dependency_name])
+            # Keep the action list order, so that the payload matches what sequential execution would produce.
+            ancestor_action_names[action_name] = [
+                name for name in async_actions_results.keys() if name in ancestors
+            ]
+
+            async_actions_results[action_name] = async_executor.submit(
+                self._run_action_after_dependencies,
+                action=action,
+                dependencies={
+                    name: async_actions_results[name]
+                    for name in ancestor_action_names[action_name]
+                },
+                validation_result_suite_identifier=validation_result_id,
+                validation_result_suite=batch_validation_result,
+                data_asset=batch,
+                expectation_suite_identifier=expectation_suite_identifier,
+                checkpoint_identifier=checkpoint_identifier,
+            )
+
+        return async_actions_results
+
+    def _run_action_after_dependencies(
+        self, action: dict, dependencies: Dict[str, AsyncResult], **action_run_kwargs
+    ) -> dict:
+        logger.debug(f"Processing validation action with name {action['name']}")
+        payload = {
+            name: self._get_action_result(name=name, async_action_result=async_result)
+            for name, async_result in dependencies.items()
+        }
+        if any(
+            dependency_result.get("timed_out") is True
+            or dependency_result.get("skipped") is True
+            for dependency_result in payload.values()
+        ):
+            # The action would otherwise run while an action it depends on is still running in the background.
+            logger.error(
+                f"Skipping action with name {action['name']}, because an action it depends on did not finish"
+            )
+            return {
+                "class": action["action"]["class_name"],
+                "skipped": True,
+                "reason": "dependency_timed_out",
+            }
+
+        try:
+            action_result = self.actions[action["name"]].run(
+                payload=payload, **action_run_kwargs
+            )
+        except Exception as e:
+            logger.exception(f"Error running action with name {action['name']}")
+            raise e
+
+        action_result = {} if action_result is None else action_result
+        action_result["class"] = action["action"]["class_name"]
+        return action_result
+
+    def _get_action_result(self, name: str, async_action_result: AsyncResult) -> dict:
+        action: dict = next(
+            action for action in self.action_list if action["name"] == name
+        )
+        timeout: Optional[float] = action.get("timeout")
+        if timeout is not None:
+            # The timeout of an action is measured from when it starts running, so that time spent queued behind other
+            # actions (see max_action_concurrency and max_pending_actions) does not count towards it.
+            timeout = max(
+                0.0,
+                timeout - (time.monotonic() - async_action_result.wait_until_started()),
+            )
+        try:
+            return async_action_result.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            logger.error(
+                f"Action with name {name} did not finish within {action['timeout']} seconds"
+            )
+            return {"class": action["action"]["class_name"], "timed_out": True}
+
+    def _collect_actions_results(self, run_results: dict) -> bool:
+        """Replaces the AsyncResults of submitted actions in run_results with the results of those actions.
+
+        Returns:
+            Whether or not every action finished (i.e. none of them timed out or was skipped because an action it
+            depends on timed out)
+        """
+        actions_finished = True
+        for run_result_obj in run_results.values():
+            run_result_obj["actions_results"] = {
+                name: self._get_action_result(
+                    name=name, async_action_result=async_result
+                )
+                for name, async_result in run_result_obj["actions_results"].items()
+            }
+            if any(
+                action_result.get("timed_out") is True
+                or action_result.get("skipped") is True
+                for action_result in run_result_obj["actions_results"].values()
+            ):
+                actions_finished = False
+
+        return actions_finished
+
     def _run_actions(
         self,
         batch: Union[Batch, DataAsset],
@@ -32,6 +32,7 @@ from great_expectations.dataset import PandasDataset, SparkDFDataset, SqlAlchemy
 from great_expectations.dataset.sqlalchemy_dataset import SqlAlchemyBatchReference
 from great_expectations.exceptions import (
     GreatExpectationsError,
+    InconclusiveSampledValidationError,
     InvalidExpectationConfigurationError,
     MetricResolutionError,
 )
@@ -644,10 +645,14 @@ class Validator:
         ]
 
     def compute_metrics(
-        self, metric_configurations: List[MetricConfiguration]
+        self,
+        metric_configurations: List[MetricConfiguration],
+        resolved_metrics: Optional[Dict[Tuple[str, str, str], Any]] = None,
     ) -> Dict[Tuple[str, str, str], Any]:
         """
         metrics: List of desired MetricConfiguration objects to be resolved.
+        resolved_metrics: Optional Dictionary of already resolved metrics (by unique metric ID), which are reused rather
+        than computed again; newly resolved metrics (including their dependencies) are added to this Dictionary.
         Return Dictionary with requested metrics resolved, with unique metric ID as key and computed metric as value.
         """
         graph: ValidationGraph = ValidationGraph()
@@ -673,7 +678,9 @@ class Validator:
                 metric_configuration=metric_configuration,
             )
 
-        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+        if resolved_metrics is None:
+            resolved_metrics = {}
+
         # noinspection PyUnusedLocal
         aborted_metrics_info: Dict[
             Tuple[str, str, str],
@@ -754,6 +761,22 @@ class Validator:
                 Returns:
                     A list of Validations, validating that all necessary metrics are available.
         """
+        try:
+            return self._graph_validate(
+                configurations=configurations,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+        finally:
+            # Samples of batches (see "sampling" of ColumnMapExpectation) are only needed while validating.
+            self._execution_engine.release_samples()
+
+    def _graph_validate(
+        self,
+        configurations: List[ExpectationConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], Any]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> List[ExpectationValidationResult]:
         if runtime_configuration is None:
             runtime_configuration = {}
 
@@ -814,6 +837,9 @@ class Validator:
             else:
                 raise err
 
+        # Expectations, whose validation on a sample of data was inconclusive, by position of their results in "evrs".
+        inconclusive_sampled_configurations: Dict[int, ExpectationConfiguration] = {}
+
         configuration: ExpectationConfiguration
         result: ExpectationValidationResult
         for configuration in processed_configurations:
@@ -824,6 +850,10 @@ class Validator:
                     runtime_configuration=runtime_configuration,
                 )
                 evrs.append(result)
+            except InconclusiveSampledValidationError as err:
+                logger.info(f"{err} Validating on entire data instead.")
+                inconclusive_sampled_configurations[len(evrs)] = configuration
+                evrs.append(None)
             except Exception as err:
                 if catch_exceptions:
                     exception_traceback: str = traceback.format_exc()
@@ -836,6 +866,19 @@ class Validator:
                 else:
                     raise err
 
+        if inconclusive_sampled_configurations:
+            # Inconclusive sampled validations are escalated to validations on entire data.
+            escalated_evrs: List[ExpectationValidationResult] = self._graph_validate(
+                configurations=list(inconclusive_sampled_configurations.values()),
+                metrics=metrics,
+                runtime_configuration={**runtime_configuration, "sampling": None},
+            )
+            idx: int
+            for idx, result in zip(
+                inconclusive_sampled_configurations.keys(), escalated_evrs
+            ):
+                evrs[idx] = result
+
         return evrs
 
     def _generate_metric_dependency_subgraphs_for_each_expectation_configuration(
@@ -862,8 +905,10 @@ class Validator:
             except AssertionError as e:
                 raise InvalidExpectationConfigurationError(str(e))
 
-            evaluated_config = copy.deepcopy(configuration)
-            evaluated_config.kwargs.update({"batch_id": self.active_batch_id})
+            # The batch_id is added to a copy of the kwargs dictionary; the (possibly large) kwargs values are shared.
+            evaluated_config = configuration.copy_with_kwargs(
+                {"batch_id": self.active_batch_id}
+            )
 
             expectation_impl = get_expectation_impl(evaluated_config.expectation_type)
             validation_dependencies: dict = (
@@ -1519,6 +1564,25 @@ set as active.
             logger.info(message + settings_message)
         return expectation_suite
 
+    def _get_expectation_suite_for_validation(self) -> ExpectationSuite:
+        """Copy the expectation suite of this validator for a validation run.
+
+        Validation substitutes evaluation parameters into new kwargs dictionaries of the expectations and records them
+        in their meta, so the expectations are copied shallowly (see ExpectationConfiguration.copy_with_kwargs),
+        rather than deep-copying their (possibly large) kwargs values as get_expectation_suite does.
+        """
+        expectation_suite: ExpectationSuite = copy.copy(self.expectation_suite)
+        expectation_suite.expectations = [
+            expectation.copy_with_kwargs()
+            for expectation in self.expectation_suite.expectations
+        ]
+        for expectation in expectation_suite.expectations:
+            expectation.success_on_last_run = None
+        logger.info(
+            f"\t{len(expectation_suite.expectations)} expectation(s) included in expectation_suite."
+        )
+        return expectation_suite
+
     def save_expectation_suite(
         self,
         filepath: Optional[str] = None,
@@ -1707,12 +1771,7 @@ set as active.
                 self._data_context = data_context
 
             if expectation_suite is None:
-                expectation_suite = self.get_expectation_suite(
-                    discard_failed_expectations=False,
-                    discard_result_format_kwargs=False,
-                    discard_include_config_kwargs=False,
-                    discard_catch_exceptions_kwargs=False,
-                )
+                expectation_suite = self._get_expectation_suite_for_validation()
             elif isinstance(expectation_suite, str):
                 try:
                     with open(expectation_suite) as infile:
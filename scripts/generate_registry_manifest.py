@@ -0,0 +1,140 @@
+"""
+Generate "great_expectations/expectations/registry_manifest.py", the manifest of modules, in which core Expectations and
+metric providers are defined, so that the registry imports (and so registers) them only when they are referenced.
+
+Usage (from the root of the repository, after adding, renaming, or removing a core Expectation or metric):
+
+    python scripts/generate_registry_manifest.py
+"""
+
+import importlib
+import pkgutil
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from great_expectations.expectations.expectation import Expectation
+from great_expectations.expectations.metrics.metric_provider import MetricProvider
+from great_expectations.expectations.registry import (
+    _registered_expectations,
+    _registered_metrics,
+    _registered_renderers,
+)
+
+MANIFEST_PATH: Path = (
+    Path(__file__).parent.parent
+    / "great_expectations"
+    / "expectations"
+    / "registry_manifest.py"
+)
+
+# Packages, whose modules are imported lazily.
+LAZY_PACKAGES: List[str] = [
+    "great_expectations.expectations.core",
+    "great_expectations.expectations.metrics.column_aggregate_metrics",
+    "great_expectations.expectations.metrics.column_map_metrics",
+    "great_expectations.expectations.metrics.column_pair_map_metrics",
+    "great_expectations.expectations.metrics.multicolumn_map_metrics",
+    "great_expectations.expectations.metrics.table_metrics",
+]
+
+# Modules of lazy packages, which are not exported (they are experimental or incomplete).
+EXCLUDED_MODULES: List[str] = [
+    "great_expectations.expectations.core.expect_column_bootstrapped_ks_test_p_value_to_be_greater_than",
+    "great_expectations.expectations.core.expect_column_chisquare_test_p_value_to_be_greater_than",
+    "great_expectations.expectations.core.expect_column_parameterized_distribution_ks_test_p_value_to_be_greater_than",
+    "great_expectations.expectations.metrics.column_aggregate_metrics.column_bootstrapped_ks_test_p_value",
+]
+
+MANIFEST_HEADER: str = '''# This file is generated by "scripts/generate_registry_manifest.py"; do not edit it by hand.
+"""
+Modules, in which core Expectations and metric providers are defined.
+
+The registry imports (and so registers) these modules only when Expectations or metrics, which they define, are
+referenced; the lazy packages ("great_expectations.expectations.core" and the metric packages) resolve their exported
+classes through CLASS_MODULES.
+"""
+'''
+
+
+def _get_lazy_module_names() -> Iterator[str]:
+    package_name: str
+    for package_name in LAZY_PACKAGES:
+        package = importlib.import_module(package_name)
+        for module_info in pkgutil.iter_modules(package.__path__):
+            module_name: str = f"{package_name}.{module_info.name}"
+            if module_name not in EXCLUDED_MODULES:
+                yield module_name
+
+
+def build_registry_manifest() -> Dict[str, Dict[str, str]]:
+    """Import all lazy modules, and map Expectation types, metric names, object names of renderers, and exported class
+    names to their modules."""
+    module_names: List[str] = sorted(_get_lazy_module_names())
+    module_name: str
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+    expectation_modules: Dict[str, str] = {
+        expectation_type: expectation.__module__
+        for expectation_type, expectation in _registered_expectations.items()
+        if expectation.__module__ in module_names
+    }
+
+    metric_modules: Dict[str, str] = {}
+    metric_name: str
+    metric_definition: dict
+    for metric_name, metric_definition in _registered_metrics.items():
+        metric_class_modules: List[str] = sorted(
+            metric_class.__module__
+            for metric_class, _ in metric_definition["providers"].values()
+            if metric_class.__module__ in module_names
+        )
+        if metric_class_modules:
+            metric_modules[metric_name] = metric_class_modules[0]
+
+    renderer_modules: Dict[str, str] = {}
+    object_name: str
+    renderers: dict
+    for object_name, renderers in _registered_renderers.items():
+        renderer_class_modules: List[str] = sorted(
+            renderer_class.__module__
+            for renderer_class, _ in renderers.values()
+            if renderer_class.__module__ in module_names
+        )
+        if renderer_class_modules:
+            renderer_modules[object_name] = renderer_class_modules[0]
+
+    class_modules: Dict[str, str] = {}
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        for name, value in vars(module).items():
+            if (
+                isinstance(value, type)
+                and issubclass(value, (Expectation, MetricProvider))
+                and value.__module__ == module_name
+                and not name.startswith("_")
+            ):
+                class_modules[name] = module_name
+
+    return {
+        "EXPECTATION_MODULES": dict(sorted(expectation_modules.items())),
+        "METRIC_MODULES": dict(sorted(metric_modules.items())),
+        "RENDERER_MODULES": dict(sorted(renderer_modules.items())),
+        "CLASS_MODULES": dict(sorted(class_modules.items())),
+    }
+
+
+def render_registry_manifest(manifest: Dict[str, Dict[str, str]]) -> str:
+    sections: List[str] = [MANIFEST_HEADER]
+    variable_name: str
+    modules: Dict[str, str]
+    for variable_name, modules in manifest.items():
+        entries: str = "".join(
+            f'    "{name}": "{module}",\n' for name, module in modules.items()
+        )
+        sections.append(f"{variable_name} = {{\n{entries}}}\n")
+    return "\n".join(sections)
+
+
+if __name__ == "__main__":
+    MANIFEST_PATH.write_text(render_registry_manifest(build_registry_manifest()))
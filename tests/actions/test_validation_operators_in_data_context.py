@@ -1,14 +1,26 @@
+import concurrent.futures
 import json
+import threading
+import time
 
+import pandas as pd
 import pytest
 
+import great_expectations as ge
 from great_expectations import DataContext
+from great_expectations.checkpoint.actions import ValidationAction
 from great_expectations.core import ExpectationSuite
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context import BaseDataContext
+from great_expectations.data_context.types.base import (
+    ConcurrencyConfig,
+    DataContextConfig,
+    InMemoryStoreBackendDefaults,
+)
 from great_expectations.data_context.util import file_relative_path
-from great_expectations.exceptions import DataContextError
+from great_expectations.exceptions import DataContextError, InvalidConfigError
 from great_expectations.self_check.util import expectationSuiteSchema
+from great_expectations.validation_operators import ActionListValidationOperator
 
 
 @pytest.fixture()
@@ -288,3 +300,353 @@ def test_warning_and_failure_validation_operator(validation_operators_data_conte
     ]
     assert "f1.warning" in suite_names
     assert "f1.failure" in suite_names
+
+
+class _RecordingAction(ValidationAction):
+    def __init__(self, data_context, barrier=None, sleep_seconds=0):
+        super().__init__(data_context)
+        self.barrier = barrier
+        self.sleep_seconds = sleep_seconds
+        self.payloads = []
+
+    def _run(
+        self,
+        validation_result_suite,
+        validation_result_suite_identifier,
+        data_asset,
+        expectation_suite_identifier=None,
+        checkpoint_identifier=None,
+        payload=None,
+    ):
+        self.payloads.append(payload)
+        if self.barrier is not None:
+            # Only passes if every party of the barrier runs at the same time.
+            self.barrier.wait()
+        time.sleep(self.sleep_seconds)
+        return {"thread": threading.get_ident()}
+
+
+def _build_concurrency_data_context(**concurrency_kwargs) -> BaseDataContext:
+    return BaseDataContext(
+        project_config=DataContextConfig(
+            concurrency=ConcurrencyConfig(enabled=True, **concurrency_kwargs),
+            store_backend_defaults=InMemoryStoreBackendDefaults(),
+        )
+    )
+
+
+@pytest.fixture
+def concurrent_actions_data_context():
+    return _build_concurrency_data_context(concurrent_actions=True)
+
+
+@pytest.fixture
+def concurrent_actions_batch():
+    batch = ge.dataset.PandasDataset(
+        pd.DataFrame({"x": [1, 2, 3]}),
+        batch_kwargs={"ge_batch_id": "82a8de83-e063-11e9-8226-acde48001122"},
+    )
+    batch.expect_column_values_to_not_be_null(column="x")
+    return batch
+
+
+def test_action_list_operator_runs_independent_actions_concurrently(
+    concurrent_actions_data_context, concurrent_actions_batch
+):
+    operator = ActionListValidationOperator(
+        data_context=concurrent_actions_data_context,
+        name="concurrent_actions_operator",
+        action_list=[
+            {"name": "first", "action": {"class_name": "NoOpAction"}},
+            {
+                "name": "second",
+                "depends_on": [],
+                "action": {"class_name": "NoOpAction"},
+            },
+            {
+                "name": "last",
+                "depends_on": ["first"],
+                "action": {"class_name": "NoOpAction"},
+            },
+        ],
+    )
+    barrier = threading.Barrier(2, timeout=10)
+    operator.actions["first"] = _RecordingAction(
+        concurrent_actions_data_context, barrier=barrier
+    )
+    operator.actions["second"] = _RecordingAction(
+        concurrent_actions_data_context, barrier=barrier
+    )
+    operator.actions["last"] = _RecordingAction(concurrent_actions_data_context)
+
+    operator_result = operator.run(
+        assets_to_validate=[concurrent_actions_batch],
+        run_id=RunIdentifier(run_name="test-concurrent-actions"),
+    )
+
+    assert operator_result.success
+    actions_results = list(operator_result.run_results.values())[0]["actions_results"]
+    assert list(actions_results.keys()) == ["first", "second", "last"]
+    assert actions_results["first"]["thread"] != actions_results["second"]["thread"]
+    assert all(
+        action_result["class"] == "NoOpAction"
+        for action_result in actions_results.values()
+    )
+    # "last" only receives the results of the actions it depends on.
+    assert operator.actions["second"].payloads == [{}]
+    assert list(operator.actions["last"].payloads[0].keys()) == ["first"]
+
+
+def test_action_list_operator_concurrent_action_timeout(
+    concurrent_actions_data_context, concurrent_actions_batch
+):
+    operator = ActionListValidationOperator(
+        data_context=concurrent_actions_data_context,
+        name="concurrent_actions_operator",
+        action_list=[
+            {
+                "name": "slow",
+                "timeout": 0.1,
+                "action": {"class_name": "NoOpAction"},
+            },
+            {
+                "name": "fast",
+                "depends_on": [],
+                "action": {"class_name": "NoOpAction"},
+            },
+        ],
+    )
+    operator.actions["slow"] = _RecordingAction(
+        concurrent_actions_data_context, sleep_seconds=2
+    )
+    operator.actions["fast"] = _RecordingAction(concurrent_actions_data_context)
+
+    start = time.monotonic()
+    operator_result = operator.run(
+        assets_to_validate=[concurrent_actions_batch],
+        run_id=RunIdentifier(run_name="test-concurrent-actions"),
+    )
+    # The slow action is left to finish in the background.
+    assert time.monotonic() - start < 1.5
+
+    # Only the result of the action that timed out records it.
+    actions_results = list(operator_result.run_results.values())[0]["actions_results"]
+    assert actions_results["slow"] == {"class": "NoOpAction", "timed_out": True}
+    assert actions_results["fast"]["class"] == "NoOpAction"
+    assert "timed_out" not in actions_results["fast"]
+
+
+def test_action_list_operator_skips_actions_depending_on_timed_out_action(
+    concurrent_actions_data_context, concurrent_actions_batch
+):
+    operator = ActionListValidationOperator(
+        data_context=concurrent_actions_data_context,
+        name="concurrent_actions_operator",
+        action_list=[
+            {
+                "name": "slow",
+                "timeout": 0.1,
+                "action": {"class_name": "NoOpAction"},
+            },
+            {
+                "name": "dependent",
+                "depends_on": ["slow"],
+                "action": {"class_name": "NoOpAction"},
+            },
+            {
+                "name": "indirectly_dependent",
+                "depends_on": ["dependent"],
+                "action": {"class_name": "NoOpAction"},
+            },
+        ],
+    )
+    operator.actions["slow"] = _RecordingAction(
+        concurrent_actions_data_context, sleep_seconds=2
+    )
+    operator.actions["dependent"] = _RecordingAction(concurrent_actions_data_context)
+    operator.actions["indirectly_dependent"] = _RecordingAction(
+        concurrent_actions_data_context
+    )
+
+    operator_result = operator.run(
+        assets_to_validate=[concurrent_actions_batch],
+        run_id=RunIdentifier(run_name="test-concurrent-actions"),
+    )
+
+    actions_results = list(operator_result.run_results.values())[0]["actions_results"]
+    assert actions_results["slow"] == {"class": "NoOpAction", "timed_out": True}
+    for name in ["dependent", "indirectly_dependent"]:
+        assert actions_results[name] == {
+            "class": "NoOpAction",
+            "skipped": True,
+            "reason": "dependency_timed_out",
+        }
+        assert operator.actions[name].payloads == []
+
+
+def test_action_list_operator_concurrent_action_timeout_is_measured_from_start(
+    concurrent_actions_batch,
+):
+    data_context = _build_concurrency_data_context(
+        concurrent_actions=True, max_action_concurrency=2
+    )
+    operator = ActionListValidationOperator(
+        data_context=data_context,
+        name="concurrent_actions_operator",
+        action_list=[
+            {"name": "first", "action": {"class_name": "NoOpAction"}},
+            {
+                "name": "second",
+                "depends_on": [],
+                "action": {"class_name": "NoOpAction"},
+            },
+            {
+                "name": "queued",
+                "depends_on": [],
+                "timeout": 0.5,
+                "action": {"class_name": "NoOpAction"},
+            },
+        ],
+    )
+    operator.actions["first"] = _RecordingAction(data_context, sleep_seconds=1)
+    operator.actions["second"] = _RecordingAction(data_context, sleep_seconds=1)
+    operator.actions["queued"] = _RecordingAction(data_context, sleep_seconds=0.1)
+
+    operator_result = operator.run(
+        assets_to_validate=[concurrent_actions_batch],
+        run_id=RunIdentifier(run_name="test-concurrent-actions"),
+    )
+
+    # "queued" waits for a thread for longer than its timeout, which does not count towards it.
+    actions_results = list(operator_result.run_results.values())[0]["actions_results"]
+    assert "timed_out" not in actions_results["queued"]
+    assert actions_results["queued"]["class"] == "NoOpAction"
+
+
+def test_action_list_operator_shuts_down_actions_executor_on_error(
+    concurrent_actions_data_context, concurrent_actions_batch, monkeypatch
+):
+    operator = ActionListValidationOperator(
+        data_context=concurrent_actions_data_context,
+        name="concurrent_actions_operator",
+        action_list=[{"name": "first", "action": {"class_name": "NoOpAction"}}],
+    )
+    actions_async_executors = []
+    get_actions_async_executor = operator._get_actions_async_executor
+
+    def _get_actions_async_executor():
+        async_executor = get_actions_async_executor()
+        actions_async_executors.append(async_executor)
+        return async_executor
+
+    def _submit_actions(**kwargs):
+        raise RuntimeError("submission failed")
+
+    monkeypatch.setattr(
+        operator, "_get_actions_async_executor", _get_actions_async_executor
+    )
+    monkeypatch.setattr(operator, "_submit_actions", _submit_actions)
+
+    with pytest.raises(RuntimeError):
+        operator.run(
+            assets_to_validate=[concurrent_actions_batch],
+            run_id=RunIdentifier(run_name="test-concurrent-actions"),
+        )
+    assert len(actions_async_executors) == 1
+    # noinspection PyProtectedMember
+    assert actions_async_executors[0]._executor._shutdown
+
+
+def test_action_list_operator_rejects_dependency_on_unknown_action(
+    concurrent_actions_data_context,
+):
+    with pytest.raises(InvalidConfigError):
+        ActionListValidationOperator(
+            data_context=concurrent_actions_data_context,
+            name="concurrent_actions_operator",
+            action_list=[
+                {
+                    "name": "first",
+                    "depends_on": ["second"],
+                    "action": {"class_name": "NoOpAction"},
+                },
+                {"name": "second", "action": {"class_name": "NoOpAction"}},
+            ],
+        )
+
+
+def _build_pandas_batches(count: int) -> list:
+    batches = []
+    for idx in range(count):
+        batch = ge.dataset.PandasDataset(
+            pd.DataFrame({"x": [1, 2, 3]}),
+            batch_kwargs={"ge_batch_id": f"82a8de83-e063-11e9-8226-acde4800112{idx}"},
+        )
+        batch.expect_column_values_to_not_be_null(column="x")
+        batches.append(batch)
+    return batches
+
+
+def test_action_list_operator_builds_batches_concurrently():
+    data_context = _build_concurrency_data_context()
+    operator = ActionListValidationOperator(
+        data_context=data_context, name="operator", action_list=[]
+    )
+    # Only passes if both batches are built at the same time.
+    barrier = threading.Barrier(2, timeout=10)
+
+    def build_batch_from_item(item):
+        barrier.wait()
+        return item
+
+    operator._build_batch_from_item = build_batch_from_item
+
+    operator_result = operator.run(
+        assets_to_validate=_build_pandas_batches(count=2),
+        run_id=RunIdentifier(run_name="test-batch-materialization"),
+    )
+
+    assert operator_result.success
+    assert len(operator_result.run_results) == 2
+
+
+def test_action_list_operator_bounds_concurrent_batch_materialization():
+    data_context = _build_concurrency_data_context(
+        max_batch_materialization_concurrency=1
+    )
+    operator = ActionListValidationOperator(
+        data_context=data_context, name="operator", action_list=[]
+    )
+    lock = threading.Lock()
+    active_batches = []
+    max_active_batches = []
+
+    # A batch is active from when it starts being built until it has been validated.
+    def build_batch_from_item(item):
+        with lock:
+            active_batches.append(item)
+            max_active_batches.append(len(active_batches))
+        time.sleep(0.05)
+
+        validate = item.validate
+
+        def validate_and_release(**kwargs):
+            validation_result = validate(**kwargs)
+            time.sleep(0.05)
+            with lock:
+                active_batches.remove(item)
+            return validation_result
+
+        item.validate = validate_and_release
+        return item
+
+    operator._build_batch_from_item = build_batch_from_item
+
+    operator_result = operator.run(
+        assets_to_validate=_build_pandas_batches(count=3),
+        run_id=RunIdentifier(run_name="test-batch-materialization"),
+    )
+
+    assert operator_result.success
+    assert len(operator_result.run_results) == 3
+    assert max(max_active_batches) == 1
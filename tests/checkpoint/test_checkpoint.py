@@ -14,11 +14,17 @@ import great_expectations as ge
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.checkpoint import Checkpoint, LegacyCheckpoint
 from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
+from great_expectations.core import ExpectationSuiteValidationResult
 from great_expectations.core.batch import RuntimeBatchRequest
 from great_expectations.core.config_peer import ConfigOutputModes
 from great_expectations.core.util import get_or_create_spark_application
-from great_expectations.data_context.data_context import DataContext
-from great_expectations.data_context.types.base import CheckpointConfig
+from great_expectations.data_context.data_context import BaseDataContext, DataContext
+from great_expectations.data_context.types.base import (
+    CheckpointConfig,
+    ConcurrencyConfig,
+    DataContextConfig,
+    InMemoryStoreBackendDefaults,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ConfigurationIdentifier,
 )
@@ -4921,3 +4927,115 @@ def test_newstyle_checkpoint_result_can_be_pickled(
 
     result: CheckpointResult = checkpoint.run()
     assert isinstance(pickle.dumps(result), bytes)
+
+
+def test_newstyle_checkpoint_runs_validations_in_worker_processes_with_process_concurrency_backend(
+    titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled,
+):
+    context: DataContext = titanic_pandas_data_context_with_v013_datasource_with_checkpoints_v1_with_empty_store_stats_enabled
+    context.config.concurrency = ConcurrencyConfig(enabled=True, backend="process")
+    context.create_expectation_suite("my_expectation_suite")
+
+    checkpoint: Checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_basic_data_connector",
+                    "data_asset_name": data_asset_name,
+                }
+            }
+            for data_asset_name in ["Titanic_1911", "Titanic_1912"]
+        ],
+    )
+
+    result: CheckpointResult = checkpoint.run()
+
+    assert result["success"]
+    assert len(result.list_validation_results()) == 2
+    assert all(
+        isinstance(validation_result, ExpectationSuiteValidationResult)
+        for validation_result in result.list_validation_results()
+    )
+    # The validation results are stored by the worker processes.
+    assert len(context.validations_store.list_keys()) == 2
+
+
+def test_newstyle_checkpoint_runs_validations_in_threads_with_process_concurrency_backend_and_in_memory_stores(
+    caplog,
+):
+    context: BaseDataContext = BaseDataContext(
+        project_config=DataContextConfig(
+            concurrency=ConcurrencyConfig(enabled=True, backend="process"),
+            store_backend_defaults=InMemoryStoreBackendDefaults(),
+        )
+    )
+    context.add_datasource(
+        "my_datasource",
+        **yaml.load(
+            """
+        class_name: Datasource
+        execution_engine:
+          class_name: PandasExecutionEngine
+        data_connectors:
+          default_runtime_data_connector_name:
+            class_name: RuntimeDataConnector
+            batch_identifiers:
+              - default_identifier_name
+        """
+        ),
+    )
+    context.create_expectation_suite("my_expectation_suite")
+
+    checkpoint: Checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {
+                    "class_name": "StoreValidationResultAction",
+                },
+            },
+        ],
+    )
+    validations: List[dict] = [
+        {
+            "batch_request": RuntimeBatchRequest(
+                datasource_name="my_datasource",
+                data_connector_name="default_runtime_data_connector_name",
+                data_asset_name=data_asset_name,
+                batch_identifiers={"default_identifier_name": data_asset_name},
+                runtime_parameters={
+                    "batch_data": pd.DataFrame({"col1": [1, 2], "col2": [3, 4]})
+                },
+            )
+        }
+        for data_asset_name in ["test_df_1", "test_df_2"]
+    ]
+
+    with caplog.at_level(logging.WARNING):
+        result: CheckpointResult = checkpoint.run(validations=validations)
+
+    assert result["success"]
+    assert len(result.list_validation_results()) == 2
+    # Worker processes would neither find the Expectation Suite nor store the validation results in the in-memory
+    # stores of this Data Context.
+    assert len(context.validations_store.list_keys()) == 2
+    assert "in threads instead of worker processes" in caplog.text
@@ -1,4 +1,14 @@
-from great_expectations.core.async_executor import AsyncExecutor
+import concurrent.futures
+import os
+import threading
+import time
+
+import pytest
+
+from great_expectations.core.async_executor import (
+    AsyncExecutor,
+    get_process_pool_executor,
+)
 from great_expectations.data_context.types.base import ConcurrencyConfig
 
 
@@ -21,3 +31,90 @@ def test_async_executor_does_not_execute_concurrently_when_concurrency_enabled_w
         ConcurrencyConfig(enabled=True), max_workers=1
     ) as async_executor:
         assert not async_executor.execute_concurrently
+
+
+def test_async_executor_blocks_submit_when_max_pending_tasks_reached():
+    release = threading.Event()
+    with AsyncExecutor(
+        ConcurrencyConfig(enabled=True), max_workers=4, max_pending_tasks=1
+    ) as async_executor:
+        async_executor.submit(release.wait)
+        submitter = threading.Thread(target=async_executor.submit, args=(lambda: 1,))
+        submitter.start()
+        submitter.join(timeout=0.2)
+        assert submitter.is_alive()
+
+        release.set()
+        submitter.join(timeout=10)
+        assert not submitter.is_alive()
+
+
+def test_async_result_timeout():
+    release = threading.Event()
+    with AsyncExecutor(
+        ConcurrencyConfig(enabled=True), max_workers=2
+    ) as async_executor:
+        async_result = async_executor.submit(release.wait)
+        with pytest.raises(concurrent.futures.TimeoutError):
+            async_result.result(timeout=0.1)
+        release.set()
+        assert async_result.result(timeout=10) is True
+
+
+def test_async_result_started_at_excludes_time_queued():
+    release = threading.Event()
+    with AsyncExecutor(
+        ConcurrencyConfig(enabled=True), max_workers=2
+    ) as async_executor:
+        blocking_async_result = async_executor.submit(release.wait)
+        async_executor.submit(release.wait)
+        queued_async_result = async_executor.submit(lambda: True)
+        assert blocking_async_result.wait_until_started() is not None
+        assert queued_async_result.started_at is None
+
+        release.set()
+        started_at = queued_async_result.wait_until_started()
+        assert started_at >= blocking_async_result.started_at
+        assert queued_async_result.result(timeout=10) is True
+
+
+def test_async_executor_executes_in_warm_worker_processes_with_process_backend():
+    concurrency_config = ConcurrencyConfig(enabled=True, backend="process")
+    process_pool_executor = get_process_pool_executor(
+        max_workers=concurrency_config.max_process_concurrency
+    )
+    with AsyncExecutor(
+        concurrency_config, max_workers=2, allow_processes=True
+    ) as async_executor:
+        assert async_executor.execute_in_processes
+        assert async_executor.submit(os.getpid).result() != os.getpid()
+
+    # The shared process pool is kept warm after the executor is shut down.
+    assert (
+        get_process_pool_executor(
+            max_workers=concurrency_config.max_process_concurrency
+        )
+        is process_pool_executor
+    )
+
+
+def test_async_executor_shutdown_waits_for_process_pool_work():
+    with AsyncExecutor(
+        ConcurrencyConfig(enabled=True, backend="process", max_process_concurrency=2),
+        max_workers=2,
+        allow_processes=True,
+    ) as async_executor:
+        async_results = [async_executor.submit(time.sleep, 0.5) for _ in range(2)]
+
+    # The shared process pool is not shut down, but the work submitted through the executor has finished.
+    # noinspection PyProtectedMember
+    assert all(async_result._future.done() for async_result in async_results)
+
+
+def test_async_executor_uses_threads_with_process_backend_when_processes_are_not_allowed():
+    with AsyncExecutor(
+        ConcurrencyConfig(enabled=True, backend="process"), max_workers=2
+    ) as async_executor:
+        assert async_executor.execute_concurrently
+        assert not async_executor.execute_in_processes
+        assert async_executor.submit(os.getpid).result() == os.getpid()
@@ -192,3 +192,42 @@ def test_expectation_configuration_patch(config4, config5, config6, config7):
 
     with pytest.raises(ValueError):
         config5.patch("add", "/foo/-", 4)
+
+
+def test_expectation_configuration_copy_with_kwargs(config1):
+    copied_config = config1.copy_with_kwargs({"batch_id": "my_batch_id"})
+
+    assert copied_config.kwargs == {
+        "column": "a",
+        "value_set": [1, 2, 3],
+        "result_format": "BASIC",
+        "batch_id": "my_batch_id",
+    }
+    assert "batch_id" not in config1.kwargs
+    # kwargs values are shared, not copied
+    assert copied_config.kwargs["value_set"] is config1.kwargs["value_set"]
+
+    copied_config.meta["notes"] = "This is a copied expectation."
+    assert config1.meta == {"notes": "This is an expectation."}
+
+
+def test_expectation_configuration_process_evaluation_parameters_does_not_modify_copies():
+    config = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_between",
+        kwargs={
+            "column": "a",
+            "min_value": {"$PARAMETER": "my_min", "$PARAMETER.my_min": 1},
+            "max_value": 10,
+        },
+    )
+    copied_config = config.copy_with_kwargs()
+    copied_config.process_evaluation_parameters(evaluation_parameters={})
+
+    assert copied_config.kwargs["min_value"] == 1
+    assert copied_config.get_raw_configuration().kwargs["min_value"] == {
+        "$PARAMETER": "my_min"
+    }
+    assert config.kwargs["min_value"] == {
+        "$PARAMETER": "my_min",
+        "$PARAMETER.my_min": 1,
+    }
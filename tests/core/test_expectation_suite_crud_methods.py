@@ -1,3 +1,4 @@
+import pickle
 from copy import deepcopy
 from unittest import mock
 from uuid import UUID
@@ -709,3 +710,127 @@ def test_replace_expectation_finds_no_matches(ge_cloud_suite, ge_cloud_id, exp4)
         str(err.value)
         == "More than one matching expectation was found. Please be more specific with your search criteria"
     )
+
+
+def test_find_expectation_indexes_after_suite_modifications(
+    exp1, exp2, exp4, exp6, empty_suite
+):
+    def linear_find_expectation_indexes(suite, expectation_configuration, match_type):
+        return [
+            idx
+            for idx, expectation in enumerate(suite.expectations)
+            if expectation.isEquivalentTo(expectation_configuration, match_type)
+        ]
+
+    def assert_indexes_match_linear_scan(suite):
+        for expectation_configuration in (exp1, exp2, exp4, exp6, column_list_exp):
+            for match_type in ("domain", "success", "runtime"):
+                assert suite.find_expectation_indexes(
+                    expectation_configuration, match_type
+                ) == linear_find_expectation_indexes(
+                    suite, expectation_configuration, match_type
+                )
+
+    column_list_exp = ExpectationConfiguration(
+        expectation_type="expect_select_column_values_to_be_unique_within_record",
+        kwargs={"column_list": ["a", "b"]},
+    )
+
+    empty_suite._add_expectation(exp1, send_usage_event=False)
+    empty_suite._add_expectation(exp2, send_usage_event=False)
+    empty_suite._add_expectation(column_list_exp, send_usage_event=False)
+    assert empty_suite.find_expectation_indexes(exp4) == [1]
+    assert_indexes_match_linear_scan(empty_suite)
+
+    # Replacing through the suite keeps the index up to date
+    empty_suite._add_expectation(exp4, send_usage_event=False)
+    assert empty_suite.expectations[1] is exp4
+    empty_suite.replace_expectation(exp6, existing_expectation_configuration=exp1)
+    assert empty_suite.expectations[0] is exp6
+    assert_indexes_match_linear_scan(empty_suite)
+
+    # Modifications of the list of expectations and of single expectations are picked up
+    empty_suite.expectations.pop(0)
+    assert_indexes_match_linear_scan(empty_suite)
+    empty_suite.expectations = [exp1, deepcopy(exp1), exp2]
+    assert empty_suite.find_expectation_indexes(exp1) == [0, 1]
+    empty_suite.patch_expectation(
+        exp2, op="replace", path="/column", value="a", match_type="domain"
+    )
+    assert empty_suite.find_expectation_indexes(exp1) == [0, 1, 2]
+    assert_indexes_match_linear_scan(empty_suite)
+
+    empty_suite.remove_expectation(exp1, remove_multiple_matches=True)
+    assert empty_suite.expectations == []
+    assert_indexes_match_linear_scan(empty_suite)
+
+
+def test_find_expectation_indexes_after_in_place_kwargs_edits(
+    exp1, exp2, exp4, empty_suite
+):
+    empty_suite._add_expectation(deepcopy(exp1), send_usage_event=False)
+    empty_suite._add_expectation(deepcopy(exp2), send_usage_event=False)
+    assert empty_suite.find_expectation_indexes(exp1, "domain") == [0]
+
+    # Expectations edited in place are indexed under their new domain
+    empty_suite.expectations[0].kwargs["column"] = "c"
+    assert empty_suite.find_expectation_indexes(exp1, "domain") == []
+
+    empty_suite.expectations[0].kwargs["column"] = "b"
+    assert empty_suite.find_expectation_indexes(exp2, "domain") == [0, 1]
+
+    # ...so adding an expectation on the new domain does not add a duplicate
+    with pytest.raises(ValueError):
+        empty_suite._add_expectation(deepcopy(exp4), send_usage_event=False)
+    assert len(empty_suite.expectations) == 2
+
+    # Replacing the kwargs of an expectation is picked up as well
+    empty_suite.expectations[1].kwargs = {"column": "d", "value_set": [1]}
+    assert empty_suite.find_expectation_indexes(exp2, "domain") == [0]
+
+
+def test_add_expectation_replaces_expectation_edited_in_place(exp1, exp4, empty_suite):
+    empty_suite._add_expectation(deepcopy(exp1), send_usage_event=False)
+    assert empty_suite.find_expectation_indexes(exp4, "domain") == []
+
+    empty_suite.expectations[0].kwargs["column"] = "b"
+    assert empty_suite.find_expectation_indexes(exp4, "domain") == [0]
+
+    new_expectation = deepcopy(exp4)
+    new_expectation.kwargs["mostly"] = 0.5
+    empty_suite._add_expectation(new_expectation, send_usage_event=False)
+    assert empty_suite.expectations == [new_expectation]
+
+
+def test_copies_of_expectation_kwargs_do_not_invalidate_expectation_index(
+    exp1, empty_suite
+):
+    empty_suite._add_expectation(exp1, send_usage_event=False)
+    expectation_index = empty_suite._get_expectation_index()
+
+    deepcopy(exp1).kwargs["column"] = "b"
+    exp1.copy_with_kwargs({"column": "b"}).kwargs["column"] = "c"
+    assert pickle.loads(pickle.dumps(exp1)).kwargs == exp1.kwargs
+    assert empty_suite._get_expectation_index() is expectation_index
+
+
+def test_expectation_index_is_updated_by_removals(exp1, exp2, exp4, empty_suite):
+    empty_suite._add_expectation(exp1, send_usage_event=False)
+    empty_suite._add_expectation(exp2, send_usage_event=False)
+    column_c_exp = deepcopy(exp1)
+    column_c_exp.kwargs["column"] = "c"
+    empty_suite._add_expectation(column_c_exp, send_usage_event=False)
+    expectation_index = empty_suite._get_expectation_index()
+
+    empty_suite.remove_expectation(exp4, match_type="domain")
+    assert empty_suite._get_expectation_index() is expectation_index
+    assert empty_suite.expectations == [exp1, column_c_exp]
+    assert empty_suite.find_expectation_indexes(exp1) == [0]
+    assert empty_suite.find_expectation_indexes(column_c_exp) == [1]
+
+    empty_suite.patch_expectation(
+        column_c_exp, op="replace", path="/column", value="b", match_type="domain"
+    )
+    assert empty_suite._get_expectation_index() is not expectation_index
+    assert empty_suite.find_expectation_indexes(exp4) == [1]
+    assert empty_suite.find_expectation_indexes(column_c_exp) == [1]
@@ -1,8 +1,11 @@
 import copy
+import json
 import logging
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from great_expectations import DataContext
 from great_expectations.checkpoint import Checkpoint
@@ -59,6 +62,36 @@ def test_lossy_conversion():
     assert not requires_lossy_conversion(d)
 
 
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (np.array([1, 2, 3]), [1, 2, 3]),
+        (np.array([[1.5, np.nan], [np.inf, 0.0]]), [[1.5, None], [np.inf, 0.0]]),
+        (np.array(["a", "b"]), ["a", "b"]),
+        (np.array([1, "a", None], dtype=object), [1, "a", None]),
+        (pd.Index([1.0, np.nan]), [1.0, None]),
+        (pd.DatetimeIndex(["2020-01-01"]), ["2020-01-01T00:00:00"]),
+        (
+            pd.Series([np.float32(0.5), np.nan], index=["a", "b"], name="v"),
+            [{"index": "a", "v": 0.5}, {"index": "b", "v": None}],
+        ),
+        (
+            pd.Series([1, None], dtype="Int64"),
+            [{"index": 0, "value": 1}, {"index": 1, "value": None}],
+        ),
+        ({1: (np.int32(1), np.float32(0.5), np.bool_(True))}, {"1": [1, 0.5, True]}),
+        (np.float64(np.nan), None),
+    ],
+)
+def test_convert_to_json_serializable(data, expected):
+    converted = convert_to_json_serializable(data)
+
+    assert converted == expected
+    assert json.loads(json.dumps(converted)) == json.loads(json.dumps(expected))
+    # Converting converted data changes nothing.
+    assert convert_to_json_serializable(converted) == converted
+
+
 # TODO add unittests for convert_to_json_serializable() and ensure_json_serializable()
 def test_serialization_of_spark_df(spark_session):
     df = pd.DataFrame({"a": [1, 2, 3]})
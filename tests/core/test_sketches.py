@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.sketches import (
+    ColumnSketch,
+    HyperLogLogSketch,
+    KllQuantileSketch,
+)
+
+
+def test_hyper_log_log_sketch_estimate_is_within_error():
+    sketch = HyperLogLogSketch.for_relative_error(relative_error=0.02)
+    assert sketch.relative_error <= 0.02
+
+    sketch.update(np.arange(100000) % 20000)
+    sketch.update(pd.Series([None, np.nan]))
+    assert abs(sketch.estimate() - 20000) <= 3 * 0.02 * 20000
+
+
+def test_hyper_log_log_sketch_small_cardinality_is_exact():
+    sketch = HyperLogLogSketch()
+    sketch.update(["a", "b", "c", "a", "b"])
+    assert sketch.estimate() == 3
+
+
+def test_hyper_log_log_sketch_merge_and_json_round_trip():
+    sketch = HyperLogLogSketch(precision=12)
+    sketch.update(np.arange(0, 6000))
+    other_sketch = HyperLogLogSketch(precision=12)
+    other_sketch.update(np.arange(4000, 10000))
+
+    union_sketch = HyperLogLogSketch(precision=12)
+    union_sketch.update(np.arange(0, 10000))
+
+    sketch.merge(HyperLogLogSketch.from_json_dict(other_sketch.to_json_dict()))
+    assert sketch.estimate() == union_sketch.estimate()
+
+    with pytest.raises(ValueError):
+        sketch.merge(HyperLogLogSketch(precision=10))
+
+
+def test_kll_quantile_sketch_is_exact_before_compaction():
+    sketch = KllQuantileSketch(k=200)
+    sketch.update([5, 1, 4, 2, 3, None])
+    assert sketch.count == 5
+    assert sketch.quantiles([0.0, 0.5, 1.0]) == [1, 3, 5]
+    assert KllQuantileSketch().quantiles([0.5]) == [None]
+
+
+def test_kll_quantile_sketch_merge_and_json_round_trip():
+    values = np.random.default_rng(42).normal(size=50000)
+    sketch = KllQuantileSketch.for_relative_error(relative_error=0.01)
+    other_sketch = KllQuantileSketch.for_relative_error(relative_error=0.01)
+    sketch.update(values[:25000])
+    other_sketch.update(values[25000:])
+
+    sketch.merge(KllQuantileSketch.from_json_dict(other_sketch.to_json_dict()))
+    assert sketch.count == 50000
+
+    sorted_values = np.sort(values)
+    for quantile, estimate in zip(
+        [0.1, 0.25, 0.5, 0.75, 0.9], sketch.quantiles([0.1, 0.25, 0.5, 0.75, 0.9])
+    ):
+        rank = np.searchsorted(sorted_values, estimate) / len(values)
+        assert abs(rank - quantile) <= 3 * 0.01
+
+
+def test_column_sketch_merge_and_metric_values():
+    values = pd.Series(
+        np.r_[
+            np.random.default_rng(7).normal(loc=5.0, scale=2.0, size=10000), [None] * 5
+        ]
+    )
+    sketch = ColumnSketch()
+    sketch.update(values[:4000])
+    other_sketch = ColumnSketch()
+    other_sketch.update(values[4000:])
+    sketch.merge(ColumnSketch.from_json_dict(other_sketch.to_json_dict()))
+
+    assert sketch.row_count == 10005
+    assert sketch.get_metric_value("column_values.nonnull.unexpected_count") == 5
+    assert sketch.get_metric_value("column_values.null.unexpected_count") == 10000
+    assert sketch.get_metric_value("column.min") == values.min()
+    assert sketch.get_metric_value("column.max") == values.max()
+    assert np.isclose(sketch.get_metric_value("column.mean"), values.mean())
+    assert np.isclose(
+        sketch.get_metric_value("column.standard_deviation"), values.std()
+    )
+
+    assert not sketch.can_get_metric_value("column.median")
+    assert not sketch.can_get_metric_value(
+        "column.median", {"approximation_relative_error": 0.001}
+    )
+    assert sketch.can_get_metric_value(
+        "column.median", {"approximation_relative_error": 0.05}
+    )
+    assert abs(sketch.get_metric_value("column.median") - values.median()) < 0.1
+
+
+def test_column_sketch_of_non_numeric_values():
+    sketch = ColumnSketch()
+    sketch.update(["a", "b", None, "a"])
+    sketch.update([])
+
+    assert not sketch.is_numeric
+    assert sketch.null_count == 1
+    assert sketch.can_get_metric_value("column_values.nonnull.unexpected_count")
+    assert not sketch.can_get_metric_value("column.max")
+    assert sketch.can_get_metric_value(
+        "column.distinct_values.count", {"approximation_relative_error": 0.05}
+    )
+    assert sketch.get_metric_value("column.distinct_values.count") == 2
@@ -0,0 +1,130 @@
+import pytest
+
+from great_expectations.core.sqlalchemy_engine_registry import (
+    SqlAlchemyEngineRegistry,
+    sqlalchemy_engine_registry,
+)
+from great_expectations.data_context.types.base import ConcurrencyConfig
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+
+sa = pytest.importorskip("sqlalchemy")
+
+
+@pytest.fixture
+def sqlite_url(tmp_path) -> str:
+    return f"sqlite:///{tmp_path / 'test.db'}"
+
+
+def test_engines_are_shared_and_reference_counted(sqlite_url):
+    registry = SqlAlchemyEngineRegistry()
+    engine = registry.acquire_engine(sqlite_url)
+    assert registry.acquire_engine(sqlite_url.replace("sqlite", "SQLite")) is engine
+    assert registry.get_reference_count(engine) == 2
+    assert registry.acquire_engine(sqlite_url, echo=True) is not engine
+
+    registry.release_engine(engine)
+    assert registry.get_reference_count(engine) == 1
+    assert registry.acquire_engine(sqlite_url) is engine
+
+    registry.release_engine(engine)
+    registry.release_engine(engine)
+    assert registry.get_reference_count(engine) == 0
+    assert registry.get_pool_metrics(engine) is None
+    assert registry.acquire_engine(sqlite_url) is not engine
+
+
+def test_in_memory_engines_are_not_shared():
+    registry = SqlAlchemyEngineRegistry()
+    engine = registry.acquire_engine("sqlite://")
+    assert registry.acquire_engine("sqlite://") is not engine
+    assert registry.get_reference_count(engine) == 0
+
+
+def test_pool_metrics(sqlite_url):
+    registry = SqlAlchemyEngineRegistry()
+    engine = registry.acquire_engine(
+        sqlite_url, poolclass=sa.pool.QueuePool, default_pool_size=1
+    )
+    assert engine.pool.size() == 1
+
+    with engine.connect() as connection:
+        connection.execute(sa.text("SELECT 1"))
+    with engine.connect() as connection:
+        connection.execute(sa.text("SELECT 1"))
+
+    pool_metrics: dict = registry.get_pool_metrics(engine)
+    assert pool_metrics["checkouts"] == 2
+    assert pool_metrics["connects"] == 1
+    assert pool_metrics["peak_checked_out"] == 1
+    assert pool_metrics["peak_overflow"] == 0
+
+
+def test_pool_sizing_is_only_applied_to_queue_pools(sqlite_url):
+    registry = SqlAlchemyEngineRegistry()
+    # SQLite file databases do not pool connections (a "pool_size" would make create_engine fail).
+    engine = registry.acquire_engine(
+        sqlite_url, default_pool_size=3, default_max_overflow=0
+    )
+    assert not isinstance(engine.pool, sa.pool.QueuePool)
+
+
+def test_unshared_engines(sqlite_url):
+    registry = SqlAlchemyEngineRegistry()
+    engine = registry.acquire_engine(sqlite_url, shared=False)
+    assert registry.acquire_engine(sqlite_url, shared=False) is not engine
+    assert registry.get_reference_count(engine) == 0
+
+
+def test_execution_engines_pinning_connections_do_not_share_engines(sqlite_url):
+    # SQLite ExecutionEngines keep a connection checked out for their whole life, so sharing a pool among more of them
+    # than the pool has connections would exhaust it.
+    execution_engines = [
+        SqlAlchemyExecutionEngine(
+            connection_string=sqlite_url,
+            poolclass=sa.pool.QueuePool,
+            pool_size=1,
+            max_overflow=1,
+            pool_timeout=1,
+        )
+        for _ in range(3)
+    ]
+    engines = {
+        id(execution_engine._engine_backup) for execution_engine in execution_engines
+    }
+    assert len(engines) == 3
+    for execution_engine in execution_engines:
+        assert (
+            sqlalchemy_engine_registry.get_reference_count(
+                execution_engine._engine_backup
+            )
+            == 0
+        )
+        assert execution_engine.engine.execute(sa.text("SELECT 1")).scalar() == 1
+        execution_engine.close()
+
+
+def test_configured_pool_sizing_takes_precedence_over_concurrency_defaults(
+    sqlite_url,
+):
+    execution_engine = SqlAlchemyExecutionEngine(
+        connection_string=sqlite_url,
+        concurrency=ConcurrencyConfig(
+            enabled=True, sqlalchemy_pool_size=3, sqlalchemy_max_overflow=2
+        ),
+        poolclass=sa.pool.QueuePool,
+    )
+    engine = execution_engine._engine_backup
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 2
+
+    unbounded_execution_engine = SqlAlchemyExecutionEngine(
+        connection_string=sqlite_url,
+        concurrency=ConcurrencyConfig(enabled=True),
+        poolclass=sa.pool.QueuePool,
+    )
+    unbounded_engine = unbounded_execution_engine._engine_backup
+    assert unbounded_engine.pool.size() == 0
+    assert unbounded_engine.pool._max_overflow == -1
+
+    execution_engine.close()
+    unbounded_execution_engine.close()
@@ -1,4 +1,6 @@
 import logging
+import threading
+import time
 from typing import Dict
 from unittest import mock
 
@@ -11,6 +13,7 @@ from great_expectations.core.usage_statistics.schemas import (
 from great_expectations.core.usage_statistics.usage_statistics import (
     UsageStatisticsHandler,
     get_profiler_run_usage_statistics,
+    usage_statistics_enabled_method,
 )
 from great_expectations.data_context import BaseDataContext
 from great_expectations.data_context.types.base import DataContextConfig
@@ -414,3 +417,61 @@ def test_get_profiler_run_usage_statistics_without_handler():
     )
     payload: dict = get_profiler_run_usage_statistics(profiler=profiler)
     assert payload == {}
+
+
+def test_usage_statistics_enabled_method_reports_durations_of_concurrent_calls(
+    in_memory_data_context_config_usage_stats_enabled,
+):
+    context: BaseDataContext = BaseDataContext(
+        in_memory_data_context_config_usage_stats_enabled
+    )
+    usage_statistics_handler = UsageStatisticsHandler(
+        data_context=context,
+        data_context_id=in_memory_data_context_config_usage_stats_enabled.anonymous_usage_statistics.data_context_id,
+        usage_statistics_url=in_memory_data_context_config_usage_stats_enabled.anonymous_usage_statistics.usage_statistics_url,
+    )
+
+    class _UsageStatisticsCapable:
+        _usage_statistics_handler = usage_statistics_handler
+
+        @usage_statistics_enabled_method(event_name="data_context.get_batch_list")
+        def sleep(self, seconds: float) -> float:
+            time.sleep(seconds)
+            return seconds
+
+    event_durations: Dict[float, int] = {}
+    build_envelope = usage_statistics_handler.build_envelope
+    event_durations_lock = threading.Lock()
+
+    # All calls emit their messages at the same time.
+    barrier = threading.Barrier(4, timeout=10)
+
+    def _build_envelope(message: dict) -> dict:
+        barrier.wait()
+        envelope = build_envelope(message=message)
+        with event_durations_lock:
+            event_durations[current_call.seconds] = envelope["event_duration"]
+        return envelope
+
+    current_call = threading.local()
+
+    def _sleep(seconds: float) -> None:
+        current_call.seconds = seconds
+        _UsageStatisticsCapable().sleep(seconds)
+
+    with mock.patch.object(
+        usage_statistics_handler, "build_envelope", side_effect=_build_envelope
+    ):
+        threads = [
+            threading.Thread(target=_sleep, args=(seconds,))
+            for seconds in (0.0, 0.5, 0.01, 0.3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    # Every call reports its own duration (in milliseconds).
+    assert sorted(event_durations.keys()) == [0.0, 0.01, 0.3, 0.5]
+    for seconds, event_duration in event_durations.items():
+        assert seconds * 1000 <= event_duration < seconds * 1000 + 200
@@ -217,3 +217,17 @@ def test_database_store_backend_id_initialization(caplog, sa, test_backends):
         expectations_store_with_database_backend.store_backend_id
         == "00000000-0000-0000-0000-000000aaaaaa"
     )
+
+
+def test_database_store_backend_creates_table_on_first_use(sa, tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'store.db'}")
+    store_backend = DatabaseStoreBackend(
+        engine=engine,
+        table_name="ge_store",
+        key_columns=["k1"],
+    )
+    assert not sa.inspect(engine).has_table("ge_store")
+
+    store_backend.set(("1",), "hello")
+    assert sa.inspect(engine).has_table("ge_store")
+    assert store_backend.get(("1",)) == "hello"
@@ -0,0 +1,42 @@
+from great_expectations.core.sketches import ColumnSketch
+from great_expectations.data_context.store import MetricSketchStore
+from great_expectations.data_context.types.resource_identifiers import (
+    ColumnSketchIdentifier,
+)
+
+
+def test_metric_sketch_store_round_trip(tmp_path_factory):
+    base_directory: str = str(tmp_path_factory.mktemp("metric_sketch_store"))
+    store: MetricSketchStore = MetricSketchStore(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": base_directory,
+        },
+        store_name="metric_sketch_store",
+    )
+
+    sketch: ColumnSketch = ColumnSketch()
+    sketch.update([1, 2, None, 4])
+    key: ColumnSketchIdentifier = ColumnSketchIdentifier(
+        batch_identifier="0808e185a52825d22356de2fe00a8f5f", column_name="a"
+    )
+    assert not store.has_key(key)
+
+    store.set(key, sketch)
+    assert store.has_key(key)
+    assert store.list_keys() == [key]
+
+    stored_sketch: ColumnSketch = store.get(key)
+    assert stored_sketch.to_json_dict() == sketch.to_json_dict()
+    assert stored_sketch.get_metric_value("column_values.nonnull.unexpected_count") == 1
+    assert stored_sketch.get_metric_value("column.max") == 4
+
+    assert store.config == {
+        "store_backend": {
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": base_directory,
+        },
+        "store_name": "metric_sketch_store",
+        "module_name": "great_expectations.data_context.store.metric_sketch_store",
+        "class_name": "MetricSketchStore",
+    }
@@ -1,21 +1,29 @@
 import datetime
+import json
+import os
 from unittest import mock
 
 import boto3
+import numpy as np
+import pandas as pd
 import pytest
 from freezegun import freeze_time
 from moto import mock_s3
 
+import great_expectations.exceptions as ge_exceptions
 import tests.test_utils as test_utils
 from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
 )
 from great_expectations.data_context.store import ValidationsStore
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
+from great_expectations.self_check.util import build_pandas_validator_with_data
 from great_expectations.util import gen_directory_tree_str
 from tests.core.usage_statistics.util import (
     usage_stats_exceptions_exist,
@@ -158,6 +166,34 @@ def test_ValidationsStore_with_InMemoryStoreBackend():
     assert test_utils.validate_uuid4(my_store.store_backend_id)
 
 
+def test_ValidationsStore_with_orjson():
+    pytest.importorskip("orjson")
+
+    validator = build_pandas_validator_with_data(
+        df=pd.DataFrame({"a": [1.5, 2.0, 3.0, 4.5]})
+    )
+    validator.expect_column_mean_to_be_between(column="a", min_value=0, max_value=10)
+    validator.expect_column_values_to_be_in_set(column="a", value_set=[1.5, 2.0])
+    validation_result: ExpectationSuiteValidationResult = validator.validate()
+    # Metrics computed by a Validator are numpy scalars, which orjson does not serialize on its own.
+    assert isinstance(validation_result.results[0].result["observed_value"], np.float64)
+
+    expected_json_dict: dict = json.loads(json.dumps(validation_result.to_json_dict()))
+
+    my_store = ValidationsStore(use_orjson=True)
+    key = ValidationResultIdentifier.from_tuple(
+        ("a", "b", "c", "quarantine", "20190926T134241.000000Z", "prod-100")
+    )
+
+    assert my_store.config["use_orjson"] is True
+    assert json.loads(my_store.serialize(key, validation_result)) == expected_json_dict
+
+    my_store.set(key, validation_result)
+    assert (
+        json.loads(json.dumps(my_store.get(key).to_json_dict())) == expected_json_dict
+    )
+
+
 @freeze_time("09/26/2019 13:42:41")
 @pytest.mark.filterwarnings(
     "ignore:String run_ids are deprecated*:DeprecationWarning:great_expectations.data_context.types.resource_identifiers"
@@ -252,6 +288,138 @@ test_ValidationResultStore_with_TupleFileSystemStoreBackend__dir0/
     assert my_store.store_backend_id == my_store_duplicate.store_backend_id
 
 
+@freeze_time("09/26/2019 13:42:41")
+def test_ValidationsStore_get_summary_with_TupleFileSystemStoreBackend(
+    tmp_path_factory,
+):
+    path = str(tmp_path_factory.mktemp("test_ValidationsStore_get_summary__dir"))
+    store_backend_config = {
+        "module_name": "great_expectations.data_context.store",
+        "class_name": "TupleFilesystemStoreBackend",
+        "base_directory": "my_store/",
+    }
+    my_store = ValidationsStore(
+        store_backend=store_backend_config,
+        runtime_environment={"root_directory": path},
+        store_summaries=True,
+    )
+    assert my_store.config["store_summaries"] is True
+
+    key = ValidationResultIdentifier.from_tuple(
+        ("asset", "quarantine", "prod-100", "20190926T134241.000000Z", "batch_id")
+    )
+    validation_result = ExpectationSuiteValidationResult(
+        success=False,
+        results=[
+            ExpectationValidationResult(
+                success=False,
+                expectation_config=ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_be_in_set",
+                    kwargs={"column": "a", "value_set": [1, 2]},
+                ),
+            )
+        ],
+        statistics={"evaluated_expectations": 1, "successful_expectations": 0},
+        meta={"batch_kwargs": {"data_asset_name": "asset"}},
+    )
+    my_store.set(key, validation_result)
+
+    expected_summary = {
+        "success": False,
+        "statistics": {"evaluated_expectations": 1, "successful_expectations": 0},
+        "meta": {"batch_kwargs": {"data_asset_name": "asset"}},
+    }
+    assert my_store.get_summary(key) == expected_summary
+    assert my_store.list_keys() == [key]
+    assert (
+        gen_directory_tree_str(path)
+        == """\
+test_ValidationsStore_get_summary__dir0/
+    my_store/
+        .ge_store_backend_id
+        asset/
+            quarantine/
+                prod-100/
+                    20190926T134241.000000Z/
+                        batch_id.json
+                        batch_id.json.summary
+"""
+    )
+
+    # Without summary records, the summary is computed from the full validation result.
+    assert (
+        ValidationsStore(
+            store_backend=store_backend_config,
+            runtime_environment={"root_directory": path},
+        ).get_summary(key)
+        == expected_summary
+    )
+
+    with pytest.raises(ge_exceptions.DataContextError):
+        ValidationsStore(
+            store_backend={
+                "module_name": "great_expectations.data_context.store",
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": "my_store/",
+                "filepath_suffix": None,
+            },
+            runtime_environment={"root_directory": path},
+            store_summaries=True,
+        )
+
+
+def test_ValidationsStore_summary_records_are_rewritten_and_removed(
+    tmp_path_factory,
+):
+    path = str(tmp_path_factory.mktemp("test_ValidationsStore_summary_records__dir"))
+    my_store = ValidationsStore(
+        store_backend={
+            "module_name": "great_expectations.data_context.store",
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "my_store/",
+        },
+        runtime_environment={"root_directory": path},
+        store_summaries=True,
+    )
+    key = ValidationResultIdentifier.from_tuple(
+        ("asset", "quarantine", "prod-100", "20190926T134241.000000Z", "batch_id")
+    )
+    summary_path = os.path.join(
+        path,
+        "my_store",
+        "asset",
+        "quarantine",
+        "prod-100",
+        "20190926T134241.000000Z",
+        "batch_id.json.summary",
+    )
+
+    # Summary records are read without listing the keys of the store backends (which is slow for cloud backends).
+    with mock.patch.object(
+        my_store.store_backend, "_has_key", side_effect=AssertionError
+    ), mock.patch.object(
+        my_store._summary_store_backend, "_has_key", side_effect=AssertionError
+    ):
+        my_store.set(key, ExpectationSuiteValidationResult(success=False))
+        assert my_store.get_summary(key)["success"] is False
+        my_store.set(key, ExpectationSuiteValidationResult(success=True))
+        assert my_store.get_summary(key)["success"] is True
+
+    # Removing a validation result removes its summary record.
+    my_store.remove_key(key)
+    assert not my_store.has_key(key)
+    assert not os.path.exists(summary_path)
+
+    # Validation results stored before summaries were enabled are summarized from the full validation result.
+    my_store.store_backend.set(
+        my_store.key_to_tuple(key),
+        my_store.serialize(key, ExpectationSuiteValidationResult(success=False)),
+    )
+    assert my_store.get_summary(key)["success"] is False
+    my_store.remove_key(key)
+    assert not my_store.has_key(key)
+
+
 @pytest.mark.filterwarnings(
     "ignore:String run_ids are deprecated*:DeprecationWarning:great_expectations.data_context.types.resource_identifiers"
 )
@@ -1,3 +1,7 @@
+import os
+
+import pytest
+
 from great_expectations.data_context import BaseDataContext
 from great_expectations.data_context.types.base import (
     ConcurrencyConfig,
@@ -29,3 +33,43 @@ def test_data_context_concurrency_property():
         )
     )
     assert data_context.concurrency.enabled
+
+
+def test_concurrent_actions_disabled_by_default():
+    concurrency_config = ConcurrencyConfig(enabled=True)
+    assert not concurrency_config.concurrent_actions
+
+
+def test_concurrent_actions_enabled_with_dict():
+    data_context_config = DataContextConfig(
+        concurrency={
+            "enabled": True,
+            "concurrent_actions": True,
+            "max_action_concurrency": 4,
+            "max_pending_actions": 8,
+        }
+    )
+    assert data_context_config.concurrency.concurrent_actions
+    assert data_context_config.concurrency.max_action_concurrency == 4
+    assert data_context_config.concurrency.max_pending_actions == 8
+
+
+def test_concurrency_backend():
+    assert ConcurrencyConfig().backend == "thread"
+    assert ConcurrencyConfig(backend="process").backend == "process"
+    with pytest.raises(ValueError):
+        ConcurrencyConfig(backend="fork")
+
+
+def test_max_process_concurrency():
+    assert ConcurrencyConfig().max_process_concurrency == (os.cpu_count() or 1)
+    assert ConcurrencyConfig(max_process_concurrency=3).max_process_concurrency == 3
+
+    data_context_config = DataContextConfig(
+        concurrency={
+            "enabled": True,
+            "backend": "process",
+            "max_process_concurrency": 2,
+        }
+    )
+    assert data_context_config.concurrency.max_process_concurrency == 2
@@ -2048,6 +2048,44 @@ validations:
     assert mock_emit.call_args_list == expected_call_args_list
 
 
+def test_datasources_are_initialized_on_first_use(empty_data_context):
+    context: DataContext = empty_data_context
+    context.add_datasource(
+        "my_pandas_datasource",
+        class_name="Datasource",
+        execution_engine={"class_name": "PandasExecutionEngine"},
+        data_connectors={
+            "my_runtime_data_connector": {
+                "class_name": "RuntimeDataConnector",
+                "batch_identifiers": ["default_identifier_name"],
+            }
+        },
+    )
+    # A Datasource, which cannot be initialized, must not prevent the DataContext from being loaded.
+    context.add_datasource(
+        "my_broken_datasource", initialize=False, class_name="Datasource"
+    )
+
+    context = DataContext(context_root_dir=context.root_directory)
+    assert context._cached_datasources == {}
+    assert "my_pandas_datasource" in context.datasources
+    assert "my_broken_datasource" in context.datasources
+    assert len(context.datasources) == 2
+    assert context._cached_datasources == {}
+
+    datasource = context.datasources["my_pandas_datasource"]
+    assert isinstance(datasource, Datasource)
+    assert list(context._cached_datasources.keys()) == ["my_pandas_datasource"]
+    assert context.get_datasource("my_pandas_datasource") is datasource
+
+    with pytest.raises(ge_exceptions.DatasourceInitializationError):
+        context.get_datasource("my_broken_datasource")
+
+    assert dict(context.datasources.items()) == {"my_pandas_datasource": datasource}
+    with pytest.raises(KeyError):
+        context.datasources["not_a_datasource"]
+
+
 @mock.patch(
     "great_expectations.core.usage_statistics.usage_statistics.UsageStatisticsHandler.emit"
 )
@@ -1,3 +1,4 @@
+import pickle
 from collections import OrderedDict
 
 import pytest
@@ -32,6 +33,78 @@ def test_caching(test_backend):
     )
     with pytest.raises(AttributeError):
         dataset.get_column_max.cache_info()
+    assert dataset.get_cache_info() == {}
+
+
+def test_caching_is_bounded():
+    dataset = PandasDataset(data, cache_maxsizes={"get_column_max": 1})
+    dataset.get_column_max("a")
+    dataset.get_column_max("b")
+    dataset.get_column_max("b")
+    dataset.get_column_max("a")
+    assert dataset.get_column_max.cache_info() == (1, 3, 1, 1)
+    assert dataset.get_cache_info()["get_column_max"] == (1, 3, 1, 1)
+
+    dataset.clear_cache()
+    assert dataset.get_column_max.cache_info().currsize == 0
+    dataset.get_column_max("a")
+    assert dataset.get_column_max.cache_info().misses == 4
+
+
+def test_caching_is_bounded_by_memory():
+    dataset = PandasDataset(
+        {"a": [str(value) for value in range(1000)]}, cache_max_bytes=1024
+    )
+    dataset.get_column_value_counts("a")
+    dataset.get_column_value_counts("a")
+    dataset.get_column_nonnull_count("a")
+    dataset.get_column_nonnull_count("a")
+
+    # The value counts are larger than the cache, and so are not cached.
+    assert dataset.get_column_value_counts.cache_info().hits == 0
+    assert dataset.get_column_value_counts.cache_info().currsize == 0
+    assert dataset.get_column_nonnull_count.cache_info().hits == 1
+    assert dataset._getter_cache.nbytes <= 1024
+
+
+def test_caching_is_invalidated_when_data_is_modified():
+    dataset = PandasDataset({"a": [1, 2, 3]})
+    assert dataset.get_column_max("a") == 3
+
+    dataset["a"] = [4, 5, 6]
+    assert dataset.get_column_max("a") == 6
+
+    dataset["b"] = [1, 2, 3]
+    assert dataset.get_column_count() == 2
+    del dataset["b"]
+    assert dataset.get_column_count() == 1
+
+
+def test_caching_of_derived_dataset_is_invalidated_when_data_is_modified():
+    dataset = PandasDataset({"a": [1, 2, 3]})
+    assert dataset.get_column_max("a") == 3
+
+    derived = dataset[dataset["a"] > 1]
+    assert derived.get_column_max("a") == 3
+    derived["a"] = [4, 5]
+    assert derived.get_column_max("a") == 5
+    derived.clear_cache()
+    assert derived.get_cache_info()["get_column_max"].currsize == 0
+
+    # The cache of the dataset that the derived dataset was derived from is its own.
+    assert dataset.get_cache_info()["get_column_max"] == (0, 1, 1024, 1)
+    assert dataset.get_column_max("a") == 3
+
+
+def test_pickled_dataset_can_be_modified():
+    dataset = PandasDataset({"a": [1, 2, 3]})
+    assert dataset.get_column_max("a") == 3
+
+    unpickled = pickle.loads(pickle.dumps(dataset))
+    assert unpickled.get_column_max("a") == 3
+    unpickled["a"] = [4, 5, 6]
+    assert unpickled.get_column_max("a") == 6
+    unpickled.clear_cache()
 
 
 def test_head(test_backend):
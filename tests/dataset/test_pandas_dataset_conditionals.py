@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -484,3 +486,89 @@ def test_condition_parser_in_expectation_config():
             row_condition='group=="a"',
             condition_parser="SQL",
         )
+
+
+def test_validation_shares_row_condition_and_column_values(monkeypatch):
+    df = ge.dataset.PandasDataset(
+        {"group": ["a", "a", "b", "b"], "x": [1, 2, None, 4], "y": [1, 1, 2, 3]}
+    )
+    df.expect_column_values_to_be_in_set(
+        "x", value_set=[1, 2], row_condition='group=="a"', condition_parser="pandas"
+    )
+    df.expect_column_values_to_be_between(
+        "x",
+        min_value=0,
+        max_value=3,
+        row_condition='group=="a"',
+        condition_parser="pandas",
+    )
+    df.expect_column_values_to_not_be_null(
+        "x", row_condition='group=="a"', condition_parser="pandas"
+    )
+    df.expect_column_values_to_be_in_set("x", value_set=[1, 2])
+    df.expect_column_values_to_be_between("x", min_value=0, max_value=3)
+
+    expected_results = [
+        result.to_json_dict()
+        for result in df.validate(result_format="COMPLETE").results
+    ]
+
+    row_conditions = []
+    apply_row_condition = df._apply_row_condition
+
+    def counting_apply_row_condition(row_condition, condition_parser):
+        row_conditions.append(row_condition)
+        return apply_row_condition(row_condition, condition_parser)
+
+    monkeypatch.setattr(df, "_apply_row_condition", counting_apply_row_condition)
+    validation_results = df.validate(result_format="COMPLETE")
+
+    assert row_conditions == ['group=="a"']
+    assert [
+        result.to_json_dict() for result in validation_results.results
+    ] == expected_results
+    assert validation_results.results[4].result["unexpected_list"] == [4.0]
+    assert validation_results.results[4].result["unexpected_index_list"] == [3]
+    assert df._column_map_cache is None
+
+    # Outside of validation, nothing is cached.
+    df.expect_column_values_to_be_in_set(
+        "x", value_set=[1, 2], row_condition='group=="a"', condition_parser="pandas"
+    )
+    assert row_conditions == ['group=="a"', 'group=="a"']
+
+
+def test_basic_result_format_lists_only_partial_unexpected_values():
+    df = ge.dataset.PandasDataset({"x": list(range(100))})
+
+    result = df.expect_column_values_to_be_in_set(
+        "x",
+        value_set=[0],
+        result_format={"result_format": "BASIC", "partial_unexpected_count": 3},
+    )
+
+    assert result.result["unexpected_count"] == 99
+    assert result.result["partial_unexpected_list"] == [1, 2, 3]
+
+
+def test_validation_does_not_share_its_cache_with_derived_frames(monkeypatch):
+    df = ge.dataset.PandasDataset({"group": ["a", "a", "b"], "x": [1, 2, 3]})
+    df.expect_column_values_to_be_in_set(
+        "x", value_set=[1, 2], row_condition='group=="a"', condition_parser="pandas"
+    )
+
+    derived_frames = []
+    apply_row_condition = df._apply_row_condition
+
+    def recording_apply_row_condition(row_condition, condition_parser):
+        derived_frames.append(apply_row_condition(row_condition, condition_parser))
+        assert df._column_map_cache is not None
+        assert derived_frames[-1]._column_map_cache is None
+        return derived_frames[-1]
+
+    monkeypatch.setattr(df, "_apply_row_condition", recording_apply_row_condition)
+    assert df.validate().success
+    assert len(derived_frames) == 1
+
+    unpickled = pickle.loads(pickle.dumps(df))
+    assert unpickled._column_map_cache is None
@@ -333,6 +333,51 @@ def test_sqlalchemy_dataset_unexpected_count_calculations(sa, unexpected_count_d
     assert res2.result["unexpected_count"] == 5
 
 
+def test_deferred_evaluation_bundles_validation_queries(sa):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3, 3, None], "b": ["x", "y", "z", "w", "v"]}).to_sql(
+        "test_table", engine, index=False
+    )
+
+    validation_results = {}
+    statement_counts = {}
+    for deferred_evaluation in [False, True]:
+        dataset = SqlAlchemyDataset(
+            "test_table",
+            engine=engine,
+            deferred_evaluation=deferred_evaluation,
+            interactive_evaluation=False,
+        )
+        dataset.expect_column_values_to_be_in_set("a", value_set=[1, 2, 3])
+        dataset.expect_column_values_to_be_unique("a")
+        dataset.expect_column_values_to_not_be_null("a")
+        dataset.expect_column_values_to_be_between(
+            "a", min_value={"$PARAMETER": "min_a"}, max_value=10
+        )
+        dataset.expect_column_max_to_be_between("a", min_value=0, max_value=5)
+        dataset.expect_column_mean_to_be_between("a", min_value=0, max_value=5)
+        dataset.expect_column_values_to_be_in_set("b", value_set=["x", "y", "z"])
+        dataset.expect_column_unique_value_count_to_be_between(
+            "b", min_value=1, max_value=10
+        )
+
+        statements = []
+        sa.event.listen(
+            dataset.engine,
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+        validation_results[deferred_evaluation] = dataset.validate(
+            result_format="SUMMARY", evaluation_parameters={"min_a": 2}
+        ).to_json_dict()["results"]
+        statement_counts[deferred_evaluation] = len(statements)
+
+    assert validation_results[True] == validation_results[False]
+    # One bundled query, and one query of unexpected values for each of the three expectations with unexpected values.
+    assert statement_counts[True] == 4
+    assert statement_counts[False] > statement_counts[True]
+
+
 def test_result_format_warning(sa, unexpected_count_df):
     with pytest.warns(
         UserWarning,
@@ -1,4 +1,5 @@
 import datetime
+import hashlib
 import os
 import random
 from pathlib import Path
@@ -6,6 +7,7 @@ from typing import List
 from unittest import mock
 
 import boto3
+import numpy as np
 import pandas as pd
 import pytest
 from moto import mock_s3
@@ -33,6 +35,9 @@ from great_expectations.execution_engine.execution_engine import (
 )
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
+    hash_pandas_dataframe,
+    hash_pandas_dataframe_by_column,
+    hash_pandas_dataframe_sample,
     storage,
 )
 from great_expectations.util import is_library_loadable
@@ -647,6 +652,92 @@ def test_get_batch_with_split_on_whole_table_filesystem(
     assert test_df.dataframe.shape == (5, 2)
 
 
+def test_data_fingerprint_methods(test_df):
+    markers = {
+        data_fingerprint_method: PandasExecutionEngine(
+            data_fingerprint_method=data_fingerprint_method
+        ).get_batch_data_and_markers(RuntimeDataBatchSpec(batch_data=test_df))[1]
+        for data_fingerprint_method in [None, "full", "incremental", "sampled", "file"]
+    }
+
+    assert "pandas_data_fingerprint" not in markers[None]
+    assert markers["full"]["pandas_data_fingerprint"] == hash_pandas_dataframe(test_df)
+    assert markers["incremental"][
+        "pandas_data_fingerprint"
+    ] == hash_pandas_dataframe_by_column(test_df)
+    assert markers["sampled"][
+        "pandas_data_fingerprint"
+    ] == hash_pandas_dataframe_sample(test_df)
+    # Data not read from a file is fingerprinted by a sample.
+    assert (
+        markers["file"]["pandas_data_fingerprint"]
+        == markers["sampled"]["pandas_data_fingerprint"]
+    )
+    assert "pandas_data_fingerprint_method" not in markers["full"]
+    assert markers["incremental"]["pandas_data_fingerprint_method"] == "incremental"
+    assert markers["sampled"]["pandas_data_fingerprint_method"] == "sampled"
+    assert markers["file"]["pandas_data_fingerprint_method"] == "sampled"
+
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        PandasExecutionEngine(data_fingerprint_method="unknown")
+
+
+def test_hash_pandas_dataframe_by_column_and_sample():
+    df = pd.DataFrame(
+        {"a": range(10000), "b": [{"key": value % 7} for value in range(10000)]}
+    )
+    modified_df = df.copy()
+    modified_df.loc[4000, "a"] = -1
+
+    assert hash_pandas_dataframe_by_column(df) == hash_pandas_dataframe_by_column(
+        df.copy()
+    )
+    assert hash_pandas_dataframe_by_column(df) != hash_pandas_dataframe_by_column(
+        modified_df
+    )
+
+    assert hash_pandas_dataframe_sample(df) == hash_pandas_dataframe_sample(df.copy())
+    # The schema, the length, and the first and last rows are always sampled; other rows may not be.
+    assert hash_pandas_dataframe_sample(df) == hash_pandas_dataframe_sample(modified_df)
+    assert hash_pandas_dataframe_sample(df) != hash_pandas_dataframe_sample(
+        df.iloc[:-1]
+    )
+    assert hash_pandas_dataframe_sample(df) != hash_pandas_dataframe_sample(
+        df.rename(columns={"a": "c"})
+    )
+    assert hash_pandas_dataframe_sample(df) != hash_pandas_dataframe_sample(
+        df.astype({"a": "float"})
+    )
+
+
+def test_file_data_fingerprint(test_df_small, tmpdir):
+    path = str(tmpdir.join("file.csv"))
+    test_df_small.to_csv(path, index=False)
+    execution_engine = PandasExecutionEngine(data_fingerprint_method="file")
+
+    def get_data_fingerprint(**kwargs) -> str:
+        return execution_engine.get_batch_data_and_markers(
+            PathBatchSpec(path=path, reader_method="read_csv", **kwargs)
+        )[1]["pandas_data_fingerprint"]
+
+    data_fingerprint = get_data_fingerprint()
+    assert get_data_fingerprint() == data_fingerprint
+    assert (
+        get_data_fingerprint(
+            sampling_method="_sample_using_a_list",
+            sampling_kwargs={"column_name": "col1", "value_list": [1]},
+        )
+        != data_fingerprint
+    )
+    # Random samples are fingerprinted by their data.
+    assert get_data_fingerprint(
+        sampling_method="_sample_using_random", sampling_kwargs={"p": 1.0}
+    ) == hash_pandas_dataframe_sample(test_df_small)
+
+    test_df_small.iloc[:1].to_csv(path, index=False)
+    assert get_data_fingerprint() != data_fingerprint
+
+
 def test_get_batch_with_split_on_whole_table_s3(
     batch_with_split_on_whole_table_s3, test_df_small
 ):
@@ -964,6 +1055,69 @@ def test_sample_using_md5(test_df):
     ).all()
 
 
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.Series(range(1000)) % 37,
+        pd.Series([0.0, -0.0, 1.5, np.nan] * 50),
+        pd.Series([1, 1.0, True, "1", None, np.nan, "a"] * 50, dtype=object),
+        pd.Series(pd.date_range("2020-01-01", periods=40, freq="D").repeat(5)),
+    ],
+)
+def test_sample_using_hash_is_compatible_with_row_by_row_md5(values):
+    df = pd.DataFrame({"values": values})
+
+    sampled_df = PandasExecutionEngine._sample_using_hash(
+        df, column_name="values", hash_digits=1, hash_value="a"
+    )
+
+    assert sampled_df.index.tolist() == [
+        index
+        for index, value in values.items()
+        if hashlib.md5(str(value).encode()).hexdigest()[-1:] == "a"
+    ]
+
+
+def test_sample_using_pandas_hash(test_df):
+    sampled_df = (
+        PandasExecutionEngine()
+        .get_batch_data(
+            RuntimeDataBatchSpec(
+                batch_data=test_df,
+                sampling_method="_sample_using_hash",
+                sampling_kwargs={
+                    "column_name": "id",
+                    "hash_digits": 1,
+                    "hash_value": "7",
+                    "hash_function_name": "pandas",
+                },
+            )
+        )
+        .dataframe
+    )
+    hashes = pd.util.hash_pandas_object(test_df["id"], index=False)
+
+    assert sampled_df.index.tolist() == test_df.index[hashes % 16 == 7].tolist()
+
+    split_df = (
+        PandasExecutionEngine()
+        .get_batch_data(
+            RuntimeDataBatchSpec(
+                batch_data=test_df,
+                splitter_method="_split_on_hashed_column",
+                splitter_kwargs={
+                    "column_name": "id",
+                    "hash_digits": 1,
+                    "hash_function_name": "pandas",
+                    "batch_identifiers": {"hash_value": "7"},
+                },
+            )
+        )
+        .dataframe
+    )
+    assert split_df.equals(sampled_df)
+
+
 ### Splitting + Sampling methods ###
 def test_get_batch_with_split_on_divided_integer_and_sample_on_list(test_df):
     split_df = PandasExecutionEngine().get_batch_data(
@@ -134,3 +134,101 @@ def test_instantiation_with_and_without_temp_table(sqlite_view_engine, sa):
     )
     res = execution_engine.get_batch_data_and_markers(batch_spec=my_batch_spec)
     assert len(res) == 2
+
+
+def test_temp_tables_are_reused_and_dropped(sa, sqlite_view_engine):
+    execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
+        engine=sqlite_view_engine, reuse_temp_tables=True
+    )
+    selectable = sa.select("*").select_from(sa.text("main.test_table"))
+
+    batch_data: SqlAlchemyBatchData = SqlAlchemyBatchData(
+        execution_engine=execution_engine,
+        selectable=selectable,
+        reuse_temp_table=True,
+    )
+    assert len(get_sqlite_temp_table_names(sqlite_view_engine)) == 2
+
+    # The same query reuses the temporary table (unless reuse is not requested).
+    assert (
+        SqlAlchemyBatchData(
+            execution_engine=execution_engine,
+            selectable=selectable,
+            reuse_temp_table=True,
+        ).selectable.name
+        == batch_data.selectable.name
+    )
+    assert len(get_sqlite_temp_table_names(sqlite_view_engine)) == 2
+    SqlAlchemyBatchData(execution_engine=execution_engine, selectable=selectable)
+    assert len(get_sqlite_temp_table_names(sqlite_view_engine)) == 3
+
+    # Batches built by an execution engine configured to reuse temporary tables reuse them.
+    batch_spec = SqlAlchemyDatasourceBatchSpec(
+        table_name="test_table",
+        batch_identifiers={"a": 1},
+        splitter_method="_split_on_column_value",
+        splitter_kwargs={"column_name": "a"},
+    )
+    first_batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=batch_spec
+    )
+    second_batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=batch_spec
+    )
+    assert first_batch_data.selectable.name == second_batch_data.selectable.name
+    assert len(get_sqlite_temp_table_names(sqlite_view_engine)) == 4
+
+    # Closing the execution engine drops its temporary tables (before the connection is closed).
+    execution_engine._drop_temp_tables()
+    assert get_sqlite_temp_table_names(sqlite_view_engine) == {"test_temp_view"}
+    assert execution_engine.get_reusable_temp_table(query_hash="any") is None
+
+
+def test_reloaded_batches_reflect_changes_to_the_source_table(sa, sqlite_view_engine):
+    execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
+        engine=sqlite_view_engine
+    )
+    batch_spec_kwargs: dict = {
+        "table_name": "test_table",
+        "batch_identifiers": {"a": 1},
+        "splitter_method": "_split_on_column_value",
+        "splitter_kwargs": {"column_name": "a"},
+    }
+
+    def get_row_count() -> int:
+        batch_data, _ = execution_engine.get_batch_data_and_markers(
+            batch_spec=SqlAlchemyDatasourceBatchSpec(**batch_spec_kwargs)
+        )
+        return execution_engine.engine.execute(
+            sa.select([sa.func.count()]).select_from(batch_data.selectable)
+        ).scalar()
+
+    assert get_row_count() == 1
+
+    sqlite_view_engine.execute(sa.text("INSERT INTO test_table (a) VALUES (1)"))
+
+    # Temporary tables are not reused by default, so the reloaded batch is not a stale snapshot.
+    assert get_row_count() == 2
+
+    execution_engine._drop_temp_tables()
+
+
+def test_instantiation_with_selectable_as_cte(sa, sqlite_view_engine):
+    execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
+        engine=sqlite_view_engine
+    )
+    selectable = (
+        sa.select("*").select_from(sa.text("main.test_table")).where(sa.text("a > 2"))
+    )
+    batch_data: SqlAlchemyBatchData = SqlAlchemyBatchData(
+        execution_engine=execution_engine,
+        selectable=selectable,
+        create_temp_table=False,
+        use_cte=True,
+    )
+    assert len(get_sqlite_temp_table_names(sqlite_view_engine)) == 1
+    assert isinstance(batch_data.selectable, sa.sql.expression.CTE)
+
+    query = sa.select([sa.func.count()]).select_from(batch_data.selectable)
+    assert str(query).startswith("WITH great_expectations_sub_selection AS")
+    assert execution_engine.engine.execute(query).scalar() == 3
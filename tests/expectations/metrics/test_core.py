@@ -1,5 +1,6 @@
 import copy
 import logging
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -15,6 +16,10 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyBatchData,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.util import (
+    get_approximation_achieved_relative_error,
+    get_duplicated_mask,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.self_check.util import (
     build_pandas_engine,
@@ -192,6 +197,136 @@ def test_quantiles_metric_sa(sa):
     assert results == {desired_metric.id: [1.0, 2.0, 3.0]}
 
 
+def test_quantiles_metric_sa_multiple_columns_single_statement(sa):
+    engine = build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 3, 4], "b": [40, None, 20, 10]}), sa
+    )
+
+    table_columns_metric, metrics = get_table_columns_metric(engine=engine)
+    table_row_count_metric = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={},
+        metric_value_kwargs=None,
+    )
+    metrics[table_row_count_metric.id] = 4
+
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name="column.quantile_values",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs={
+                "quantiles": [0.0, 2.5e-1, 5.0e-1, 7.5e-1, 1.0],
+            },
+            metric_dependencies={
+                "table.columns": table_columns_metric,
+                "table.row_count": table_row_count_metric,
+            },
+        )
+        for column in ["a", "b"]
+    ]
+
+    statements = []
+    sa.event.listen(
+        engine.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics, metrics=metrics
+    )
+    assert results == {
+        desired_metrics[0].id: [1, 1, 2, 3, 4],
+        desired_metrics[1].id: [None, None, 10, 20, 40],
+    }
+    assert len(statements) == 1
+
+
+@pytest.mark.parametrize(
+    "values,median",
+    [
+        ([None, 7, None], 7),
+        ([3, None, 1, 2], 2),
+        ([4, 1, 3, 2, None], 2.5),
+        ([None, None], None),
+    ],
+)
+def test_median_metric_sa(sa, values, median):
+    engine = build_sa_engine(pd.DataFrame({"a": values}, dtype="float"), sa)
+
+    table_columns_metric, metrics = get_table_columns_metric(engine=engine)
+    table_row_count_metric = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={},
+        metric_value_kwargs=None,
+    )
+    metrics[table_row_count_metric.id] = len(values)
+    nonnull_count_metric = MetricConfiguration(
+        metric_name="column_values.nonnull.count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    metrics[nonnull_count_metric.id] = len(
+        [value for value in values if value is not None]
+    )
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+            "table.row_count": table_row_count_metric,
+            "column_values.nonnull.count": nonnull_count_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results == {desired_metric.id: median}
+
+
+def test_histogram_metric_sa_multiple_columns_single_statement(sa):
+    engine = build_sa_engine(
+        pd.DataFrame(
+            {"a": [1, 2, 3, 4, 5, None], "b": [-10, 0, 2.5, 5, 7.5, 10]},
+            dtype="float",
+        ),
+        sa,
+    )
+
+    table_columns_metric, metrics = get_table_columns_metric(engine=engine)
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name="column.histogram",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs={"bins": bins},
+            metric_dependencies={"table.columns": table_columns_metric},
+        )
+        for column, bins in [
+            ("a", (1.0, 2.0, 3.0, 4.0)),
+            ("b", (-np.inf, 0.0, 5.0, np.inf)),
+        ]
+    ]
+
+    statements = []
+    sa.event.listen(
+        engine.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics, metrics=metrics
+    )
+    assert results == {
+        desired_metrics[0].id: [1, 1, 2],
+        desired_metrics[1].id: [1, 2, 3],
+    }
+    assert len(statements) == 1
+    # The rows are not crossed with the list of columns.
+    assert "UNION" not in statements[0].upper()
+    assert "JOIN" not in statements[0].upper()
+
+
 def test_quantiles_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
         spark=spark_session,
@@ -1126,6 +1261,26 @@ def test_map_unique_column_does_not_exist_pd():
     )
 
 
+@pytest.mark.parametrize(
+    "column_names",
+    [["a"], ["b"], ["a", "b"], ["a", "b", "c"]],
+)
+def test_get_duplicated_mask_matches_duplicated(column_names):
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 3, None, None, 1],
+            "b": ["x", "y", "x", "x", None, None, "1"],
+            "c": [1.5, 1.5, 2.5, 2.5, np.nan, np.nan, 1.5],
+        },
+        index=[10, 11, 12, 13, 14, 15, 16],
+    )
+    data = df[column_names] if len(column_names) > 1 else df[column_names[0]]
+
+    duplicated_mask: pd.Series = get_duplicated_mask(data)
+
+    pd.testing.assert_series_equal(duplicated_mask, data.duplicated(keep=False))
+
+
 def test_map_unique_column_exists_sa(sa):
     engine = build_sa_engine(
         pd.DataFrame(
@@ -1155,31 +1310,44 @@ def test_map_unique_column_exists_sa(sa):
     )
     metrics.update(results)
 
-    # This is no longer a MAP_CONDITION because mssql does not support it. Instead, it is a WINDOW_CONDITION
-    #
-    # aggregate_fn = MetricConfiguration(
-    #     metric_name="column_values.unique.unexpected_count.aggregate_fn",
-    #     metric_domain_kwargs={"column": "a"},
-    #     metric_value_kwargs=None,
-    #     metric_dependencies={"unexpected_condition": condition_metric},
-    # )
-    # aggregate_fn_metrics = engine.resolve_metrics(
-    #     metrics_to_resolve=(aggregate_fn,), metrics=metrics
-    # )
+    # The unexpected count, values, and value counts are computed from the (bundled) duplicate count aggregate, rather
+    # than from the (window) condition.
+    duplicate_count_aggregate_fn = MetricConfiguration(
+        metric_name="column.duplicate_count.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    duplicate_count_metric = MetricConfiguration(
+        metric_name="column.duplicate_count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+        metric_dependencies={"metric_partial_fn": duplicate_count_aggregate_fn},
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(duplicate_count_aggregate_fn,), metrics=metrics
+    )
+    metrics.update(results)
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(duplicate_count_metric,), metrics=metrics
+    )
+    metrics.update(results)
+    assert results[duplicate_count_metric.id] == 1
 
     desired_metric = MetricConfiguration(
         metric_name="column_values.unique.unexpected_count",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
-        # metric_dependencies={"metric_partial_fn": aggregate_fn},
         metric_dependencies={
-            "unexpected_condition": condition_metric,
+            "column.duplicate_count": duplicate_count_metric,
             "table.columns": table_columns_metric,
         },
     )
     results = engine.resolve_metrics(
         metrics_to_resolve=(desired_metric,),
-        metrics=metrics,  # metrics=aggregate_fn_metrics
+        metrics=metrics,
     )
     metrics.update(results)
     assert results[desired_metric.id] == 2
@@ -1191,7 +1359,7 @@ def test_map_unique_column_exists_sa(sa):
             "result_format": {"result_format": "BASIC", "partial_unexpected_count": 20}
         },
         metric_dependencies={
-            "unexpected_condition": condition_metric,
+            "column.duplicate_count": duplicate_count_metric,
             "table.columns": table_columns_metric,
         },
     )
@@ -1208,7 +1376,7 @@ def test_map_unique_column_exists_sa(sa):
             "result_format": {"result_format": "BASIC", "partial_unexpected_count": 20}
         },
         metric_dependencies={
-            "unexpected_condition": condition_metric,
+            "column.duplicate_count": duplicate_count_metric,
             "table.columns": table_columns_metric,
         },
     )
@@ -5158,3 +5326,170 @@ def test_map_select_column_values_unique_within_record_spark(spark_session):
         {"a": 1.0, "b": 1.0, "c": 2.0},
         {"a": 4.0, "b": 4.0, "c": 4.0},
     ]
+
+
+def test_distinct_values_count_metric_pd_approximation_relative_error_is_exact():
+    engine = build_pandas_engine(pd.DataFrame({"a": np.arange(10000) % 3000}))
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.distinct_values.count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"approximation_relative_error": 0.05},
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results[desired_metric.id] == 3000
+
+
+def test_median_metric_pd_approximation_relative_error_is_exact():
+    engine = build_pandas_engine(pd.DataFrame({"a": np.arange(10001)}))
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"approximation_relative_error": 0.01},
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results[desired_metric.id] == 5000
+
+
+def test_distinct_values_count_metric_sa_approximation_relative_error(sa):
+    engine = build_sa_engine(pd.DataFrame({"a": [1, 2, 2, None, 3, 3, 3]}), sa)
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.distinct_values.count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"approximation_relative_error": 0.05},
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    # SQLite has no approximate distinct count, and falls back to an exact "COUNT(DISTINCT)".
+    assert results[desired_metric.id] == 3
+
+
+@pytest.mark.parametrize(
+    "dialect_name,metric_name,expected_relative_error",
+    [
+        ("sqlite", "column.distinct_values.count", 0.0),
+        ("sqlite", "column.median", 0.0),
+        ("databricks", "column.distinct_values.count", 0.05),
+        ("databricks", "column.quantile_values", 0.05),
+        ("trino", "column.distinct_values.count", 0.05),
+        ("snowflake", "column.unique_proportion", 0.0162338),
+        ("snowflake", "column.median", None),
+        ("redshift", "column.distinct_values.count", 0.02),
+        ("bigquery", "column.distinct_values.count", None),
+    ],
+)
+def test_get_approximation_achieved_relative_error_sa(
+    dialect_name, metric_name, expected_relative_error
+):
+    execution_engine = mock.MagicMock(spec=SqlAlchemyExecutionEngine)
+    execution_engine.engine = mock.MagicMock()
+    execution_engine.engine.dialect.name = dialect_name
+
+    assert (
+        get_approximation_achieved_relative_error(
+            metric_name=metric_name,
+            relative_error=0.05,
+            execution_engine=execution_engine,
+        )
+        == expected_relative_error
+    )
+
+
+def test_get_approximation_achieved_relative_error_trino_bounds():
+    execution_engine = mock.MagicMock(spec=SqlAlchemyExecutionEngine)
+    execution_engine.engine = mock.MagicMock()
+    execution_engine.engine.dialect.name = "trino"
+
+    assert (
+        get_approximation_achieved_relative_error(
+            metric_name="column.distinct_values.count",
+            relative_error=0.001,
+            execution_engine=execution_engine,
+        )
+        == 0.0040625
+    )
+
+
+def test_get_approximation_achieved_relative_error_pd():
+    assert (
+        get_approximation_achieved_relative_error(
+            metric_name="column.median",
+            relative_error=0.05,
+            execution_engine=PandasExecutionEngine(),
+        )
+        == 0.0
+    )
+
+
+def test_column_sketch_metric_sa(sa):
+    engine = build_sa_engine(
+        pd.DataFrame({"a": [1, 2, None, 4], "b": ["x", "y", "y", None]}), sa
+    )
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    desired_metric_b = MetricConfiguration(
+        metric_name="column.sketch",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs=None,
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric, desired_metric_b)
+    )
+
+    sketch = results[desired_metric.id]
+    assert sketch.row_count == 4
+    assert sketch.null_count == 1
+    assert sketch.get_metric_value("column.min") == 1
+    assert sketch.get_metric_value("column.max") == 4
+    assert sketch.get_metric_value("column.mean") == 7 / 3
+
+    sketch_b = results[desired_metric_b.id]
+    assert not sketch_b.is_numeric
+    assert sketch_b.null_count == 1
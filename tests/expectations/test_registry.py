@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.expectations.core.expect_column_values_to_be_in_set import (
     ExpectColumnValuesToBeInSet,
@@ -16,3 +19,39 @@ def test_registry_from_configuration():
         kwargs={"column": "PClass", "value_set": [1, 2, 3]},
     )
     assert configuration._get_expectation_impl() == ExpectColumnValuesToBeInSet
+
+
+def test_core_expectations_and_metrics_are_imported_only_when_referenced():
+    script: str = """
+import sys
+
+import great_expectations
+from great_expectations.expectations.registry import get_expectation_impl, get_metric_kwargs
+
+def lazy_modules():
+    return {
+        name
+        for name in sys.modules
+        if name.startswith("great_expectations.expectations.core.")
+        or name.startswith("great_expectations.expectations.metrics.column_map_metrics.")
+    }
+
+assert lazy_modules() == set(), lazy_modules()
+assert get_expectation_impl("expect_column_values_to_be_in_set").__name__ == "ExpectColumnValuesToBeInSet"
+assert get_metric_kwargs("column_values.in_set.unexpected_count")["metric_value_keys"] is not None
+assert lazy_modules() == {
+    "great_expectations.expectations.core.expect_column_values_to_be_in_set",
+    "great_expectations.expectations.metrics.column_map_metrics.column_values_in_set",
+}, lazy_modules()
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_lazy_package_attributes():
+    from great_expectations.expectations.core import ExpectColumnMaxToBeBetween
+    from great_expectations.expectations.metrics import ColumnMax
+
+    assert get_expectation_impl("expect_column_max_to_be_between") == (
+        ExpectColumnMaxToBeBetween
+    )
+    assert ColumnMax.metric_name == "column.max"
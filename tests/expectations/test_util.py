@@ -20,7 +20,10 @@ from great_expectations.core.expectation_diagnostics.supporting_types import (
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.expectations.metrics.util import column_reflection_fallback
-from great_expectations.expectations.util import render_evaluation_parameter_string
+from great_expectations.expectations.util import (
+    get_binomial_confidence_interval,
+    render_evaluation_parameter_string,
+)
 from great_expectations.render.types import RenderedStringTemplateContent
 from great_expectations.self_check.util import build_sa_validator_with_data
 from great_expectations.self_check.util import (
@@ -844,3 +847,22 @@ def test__should_we_generate_this_test__pandas():
     backend5 = "pandas"
 
     assert should_we_generate_this_test(backend5, test_case5) == False
+
+
+def test_get_binomial_confidence_interval():
+    lower, upper = get_binomial_confidence_interval(
+        successes=700, trials=1000, confidence=0.95
+    )
+    assert lower == pytest.approx(0.6708, abs=1e-4)
+    assert upper == pytest.approx(0.7275, abs=1e-4)
+
+    lower, upper = get_binomial_confidence_interval(
+        successes=1000, trials=1000, confidence=0.99
+    )
+    assert 0.99 < lower < 1.0
+    assert upper == pytest.approx(1.0)
+
+    assert get_binomial_confidence_interval(successes=0, trials=0, confidence=0.99) == (
+        0.0,
+        1.0,
+    )
@@ -16,12 +16,14 @@ import great_expectations.exceptions as ge_exceptions
 from great_expectations import DataContext
 from great_expectations.core import ExpectationSuite, ExpectationValidationResult
 from great_expectations.core.batch import BatchRequest
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.datasource import DataConnector, Datasource
 from great_expectations.expectations.registry import get_expectation_impl
 from great_expectations.rule_based_profiler.config.base import (
     RuleBasedProfilerConfig,
     ruleBasedProfilerConfigSchema,
 )
+from great_expectations.rule_based_profiler.rule import Rule
 from great_expectations.rule_based_profiler.rule_based_profiler import RuleBasedProfiler
 from great_expectations.validator.metric_configuration import MetricConfiguration
 from great_expectations.validator.validator import Validator
@@ -694,6 +696,125 @@ def test_bobby_profiler_user_workflow_multi_batch_row_count_range_rule_and_colum
     assert not usage_stats_invalid_messages_exist(messages=caplog.messages)
 
 
+def _build_bobby_profiler(
+    data_context: DataContext, bobby_columnar_table_multi_batch: dict
+) -> RuleBasedProfiler:
+    profiler_config: dict = yaml.load(
+        bobby_columnar_table_multi_batch["profiler_config"]
+    )
+
+    # Roundtrip through schema validation to remove any illegal fields add/or restore any missing fields.
+    deserialized_config: dict = ruleBasedProfilerConfigSchema.load(profiler_config)
+    serialized_config: dict = ruleBasedProfilerConfigSchema.dump(deserialized_config)
+
+    serialized_config.pop("class_name")
+    serialized_config.pop("module_name")
+
+    return RuleBasedProfiler(
+        **serialized_config,
+        data_context=data_context,
+    )
+
+
+@pytest.mark.skipif(
+    version.parse(np.version.version) < version.parse("1.21.0"),
+    reason="requires numpy version 1.21.0 or newer",
+)
+@freeze_time("09/26/2019 13:42:41")
+def test_bobby_profiler_user_workflow_multi_batch_with_concurrent_domains(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+    bobby_columnar_table_multi_batch,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+    data_context.config.concurrency = ConcurrencyConfig(enabled=True)
+    assert data_context.concurrency.enabled
+
+    profiler: RuleBasedProfiler = _build_bobby_profiler(
+        data_context=data_context,
+        bobby_columnar_table_multi_batch=bobby_columnar_table_multi_batch,
+    )
+
+    expectation_suite: ExpectationSuite = profiler.run(
+        expectation_suite_name=bobby_columnar_table_multi_batch[
+            "test_configuration_oneshot_estimator"
+        ]["expectation_suite_name"],
+        include_citation=True,
+    )
+
+    assert sorted(expectation_suite) == sorted(
+        bobby_columnar_table_multi_batch["test_configuration_oneshot_estimator"][
+            "expected_expectation_suite"
+        ]
+    )
+
+
+@pytest.mark.skipif(
+    version.parse(np.version.version) < version.parse("1.21.0"),
+    reason="requires numpy version 1.21.0 or newer",
+)
+@freeze_time("09/26/2019 13:42:41")
+def test_bobby_profiler_user_workflow_multi_batch_resolves_metrics_of_all_domains_in_advance(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+    bobby_columnar_table_multi_batch,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    def _run_profiler_and_count_metric_resolution_passes() -> Tuple[
+        ExpectationSuite, int
+    ]:
+        # noinspection PyProtectedMember
+        with mock.patch.object(
+            Validator,
+            "_resolve_metrics",
+            side_effect=Validator._resolve_metrics,
+        ) as mock_resolve_metrics:
+            profiler: RuleBasedProfiler = _build_bobby_profiler(
+                data_context=data_context,
+                bobby_columnar_table_multi_batch=bobby_columnar_table_multi_batch,
+            )
+            expectation_suite: ExpectationSuite = profiler.run(
+                expectation_suite_name=bobby_columnar_table_multi_batch[
+                    "test_configuration_oneshot_estimator"
+                ]["expectation_suite_name"],
+                include_citation=True,
+            )
+
+        num_metric_resolution_passes: int = len(
+            [
+                call
+                for call in mock_resolve_metrics.call_args_list
+                if call.kwargs["metrics_to_resolve"]
+            ]
+        )
+        return expectation_suite, num_metric_resolution_passes
+
+    expectation_suite: ExpectationSuite
+    num_metric_resolution_passes: int
+    (
+        expectation_suite,
+        num_metric_resolution_passes,
+    ) = _run_profiler_and_count_metric_resolution_passes()
+
+    with mock.patch.object(Rule, "_resolve_metrics_for_domains"):
+        (
+            expectation_suite_without_metrics_resolved_in_advance,
+            num_metric_resolution_passes_without_metrics_resolved_in_advance,
+        ) = _run_profiler_and_count_metric_resolution_passes()
+
+    assert sorted(expectation_suite) == sorted(
+        expectation_suite_without_metrics_resolved_in_advance
+    )
+    # Metrics of all domains of a rule are resolved together, rather than by every ParameterBuilder for every domain.
+    assert (
+        num_metric_resolution_passes
+        < num_metric_resolution_passes_without_metrics_resolved_in_advance
+    )
+
+
 @pytest.mark.skipif(
     version.parse(np.version.version) < version.parse("1.21.0"),
     reason="requires numpy version 1.21.0 or newer",
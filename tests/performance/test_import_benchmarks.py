@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+"""
+Test performance of importing great_expectations (e.g., at startup of short-lived containers running Checkpoints).
+"""
+
+import subprocess
+import sys
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def _import_great_expectations_in_new_interpreter() -> None:
+    subprocess.run([sys.executable, "-c", "import great_expectations"], check=True)
+
+
+def test_import_great_expectations_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+):
+    """Benchmark the import of great_expectations (including DataContext) by a new Python interpreter.
+
+    Core Expectations and metric providers are imported lazily, so that they do not contribute to this time.
+    """
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    benchmark.pedantic(
+        _import_great_expectations_in_new_interpreter,
+        iterations=1,
+        rounds=5,
+    )
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.
+    sys.exit(pytest.main(sys.argv))
@@ -1,4 +1,5 @@
 import json
+import os
 from collections import OrderedDict
 
 import pytest
@@ -637,3 +638,42 @@ def test_render_text():
         .replace("\t", "")
         .replace("\n", "")
     )
+
+
+def test_views_share_environment_and_memoize_content_blocks(tmp_path):
+    bytecode_cache_directory = str(tmp_path / "template_cache")
+    view = ge.render.view.view.DefaultJinjaComponentView(
+        bytecode_cache_directory=bytecode_cache_directory
+    )
+    assert (
+        ge.render.view.view.DefaultJinjaComponentView(
+            bytecode_cache_directory=bytecode_cache_directory
+        ).env
+        is view.env
+    )
+    assert (
+        DefaultJinjaPageView(bytecode_cache_directory=bytecode_cache_directory).env
+        is not view.env
+    )
+    assert ge.render.view.view.DefaultJinjaComponentView().env is not view.env
+
+    text_component_content = TextContent(
+        **{
+            "content_block_type": "text",
+            "text": ["hello", "goodbye"],
+        }
+    ).to_json_dict()
+    rendered = [
+        view.render(
+            {
+                "content_block": text_component_content,
+                "content_block_loop": {"index": index},
+            }
+        )
+        for index in (1, 1, 2)
+    ]
+    assert rendered[0] == rendered[1]
+    assert 'id="content-block-1"' in rendered[0]
+    assert 'id="content-block-2"' in rendered[2]
+    assert len(view._environment_cache._fragments) > 0
+    assert len(os.listdir(bytecode_cache_directory)) > 0
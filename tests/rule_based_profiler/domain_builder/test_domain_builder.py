@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 from ruamel.yaml import YAML
 
@@ -184,3 +184,49 @@ def test_column_domain_builder_with_simple_semantic_type_included(
             "details": {"inferred_semantic_domain_type": "numeric"},
         },
     ]
+
+
+def test_table_domain_builder_reuses_resolved_metrics_store(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    domain_builder: DomainBuilder = TableDomainBuilder(
+        batch_request=batch_request,
+        data_context=data_context,
+    )
+
+    resolved_metrics_store: Dict[Tuple[str, str, str], Any] = {}
+    domain_builder.resolved_metrics_store = resolved_metrics_store
+
+    table_row_counts: Dict[str, int] = domain_builder.get_table_row_counts()
+    assert len(table_row_counts) == 3
+    assert all([table_row_count > 0 for table_row_count in table_row_counts.values()])
+
+    metric_id: Tuple[str, str, str]
+    table_row_count_metric_ids: List[Tuple[str, str, str]] = [
+        metric_id
+        for metric_id in resolved_metrics_store.keys()
+        if metric_id[0] == "table.row_count"
+    ]
+    assert len(table_row_count_metric_ids) == 3
+
+    # Metrics available in the store are not computed again.
+    for metric_id in table_row_count_metric_ids:
+        resolved_metrics_store[metric_id] = -1
+
+    table_row_counts = domain_builder.get_table_row_counts()
+    assert list(table_row_counts.values()) == [-1, -1, -1]
+
+    # Without the store, metrics are computed anew.
+    domain_builder.resolved_metrics_store = None
+    table_row_counts = domain_builder.get_table_row_counts()
+    assert all([table_row_count > 0 for table_row_count in table_row_counts.values()])
@@ -1,9 +1,21 @@
 from typing import Dict, Optional
+from unittest import mock
 
 import numpy as np
+import pandas as pd
 
+from great_expectations.core.batch import Batch, BatchDefinition
+from great_expectations.core.batch_spec import (
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
+    SqlAlchemyDatasourceBatchSpec,
+)
+from great_expectations.core.id_dict import IDDict
 from great_expectations.data_context import DataContext
+from great_expectations.data_context.store import MetricSketchStore
+from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.rule_based_profiler.helpers.util import compute_metrics
 from great_expectations.rule_based_profiler.parameter_builder import (
     NumericMetricRangeMultiBatchParameterBuilder,
 )
@@ -13,6 +25,8 @@ from great_expectations.rule_based_profiler.types import (
     ParameterNode,
     get_parameter_value_by_fully_qualified_parameter_name,
 )
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
 
 
 def test_bootstrap_numeric_metric_range_multi_batch_parameter_builder_bobby(
@@ -102,3 +116,187 @@ def test_bootstrap_numeric_metric_range_multi_batch_parameter_builder_bobby(
         atol=atol,
         err_msg=f"Actual value of {actual_value} differs from expected value of {expected_value} by more than {atol + rtol * abs(expected_value)} tolerance.",
     )
+
+
+def test_oneshot_numeric_metric_range_multi_batch_parameter_builder_bobby_metric_sketch_store(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+    metric_sketch_store: MetricSketchStore = data_context.add_store(
+        "metric_sketch_store", {"class_name": "MetricSketchStore"}
+    )
+
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+    domain: Domain = Domain(
+        domain_type=MetricDomainTypes.COLUMN,
+        domain_kwargs={"column": "fare_amount"},
+    )
+
+    def build_value_range(metric_sketch_store_name: Optional[str]) -> list:
+        numeric_metric_range_parameter_builder: NumericMetricRangeMultiBatchParameterBuilder = NumericMetricRangeMultiBatchParameterBuilder(
+            name="fare_amount_mean_range",
+            metric_name="column.mean",
+            metric_domain_kwargs="$domain.domain_kwargs",
+            metric_sketch_store_name=metric_sketch_store_name,
+            estimator="oneshot",
+            false_positive_rate=1.0e-2,
+            data_context=data_context,
+            batch_request=batch_request,
+        )
+        parameter_container: ParameterContainer = ParameterContainer(
+            parameter_nodes=None
+        )
+        numeric_metric_range_parameter_builder.build_parameters(
+            parameter_container=parameter_container,
+            domain=domain,
+            parameters={domain.id: parameter_container},
+        )
+        return get_parameter_value_by_fully_qualified_parameter_name(
+            fully_qualified_parameter_name="$parameter.fare_amount_mean_range",
+            domain=domain,
+            parameters={domain.id: parameter_container},
+        )["value"]["value_range"]
+
+    expected_value_range: list = build_value_range(metric_sketch_store_name=None)
+
+    # Summaries of the column are computed for every Batch once, and are used for subsequent runs.
+    np.testing.assert_allclose(
+        actual=build_value_range(metric_sketch_store_name="metric_sketch_store"),
+        desired=expected_value_range,
+    )
+    assert len(metric_sketch_store.list_keys()) == 3
+
+    with mock.patch(
+        "great_expectations.validator.validator.Validator.compute_metrics"
+    ) as mock_compute_metrics:
+        np.testing.assert_allclose(
+            actual=build_value_range(metric_sketch_store_name="metric_sketch_store"),
+            desired=expected_value_range,
+        )
+
+    assert mock_compute_metrics.call_count == 0
+
+
+def test_metric_sketch_store_keys_runtime_batches_on_data_fingerprint():
+    metric_sketch_store: MetricSketchStore = MetricSketchStore()
+    execution_engine: PandasExecutionEngine = PandasExecutionEngine()
+
+    def compute_column_max(batch: Batch) -> float:
+        validator: Validator = Validator(
+            execution_engine=execution_engine, batches=[batch]
+        )
+        metric_configuration: MetricConfiguration = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"batch_id": batch.id, "column": "a"},
+            metric_value_kwargs=None,
+        )
+        return compute_metrics(
+            validator=validator,
+            metric_configurations=[metric_configuration],
+            metric_sketch_store=metric_sketch_store,
+        )[metric_configuration.id]
+
+    def build_runtime_batch(df: pd.DataFrame) -> Batch:
+        batch_spec: RuntimeDataBatchSpec = RuntimeDataBatchSpec(batch_data=df)
+        batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+            batch_spec=batch_spec
+        )
+        return Batch(
+            data=batch_data,
+            batch_definition=BatchDefinition(
+                datasource_name="my_datasource",
+                data_connector_name="my_runtime_data_connector",
+                data_asset_name="my_data_asset",
+                batch_identifiers=IDDict({"pipeline_stage_name": "core"}),
+            ),
+            batch_spec=batch_spec,
+            batch_markers=batch_markers,
+        )
+
+    # Runtime Batch objects with the same identifier, but different data, get different summaries.
+    first_batch: Batch = build_runtime_batch(pd.DataFrame({"a": [1, 2, 3]}))
+    second_batch: Batch = build_runtime_batch(pd.DataFrame({"a": [10, 20]}))
+    assert first_batch.id == second_batch.id
+    assert compute_column_max(batch=first_batch) == 3
+    assert compute_column_max(batch=second_batch) == 20
+    assert len(metric_sketch_store.list_keys()) == 2
+
+    # In-memory Batch objects without a data fingerprint are not summarized.
+    assert compute_column_max(batch=Batch(data=pd.DataFrame({"a": [5, 6]}))) == 6
+    assert len(metric_sketch_store.list_keys()) == 2
+
+    # Neither are Batch objects of data assets without a data fingerprint (e.g., whole database tables), whose data can
+    # change under the same identifier.
+    for batch_spec in [
+        PathBatchSpec(path="my_file.csv"),
+        SqlAlchemyDatasourceBatchSpec(table_name="my_table"),
+    ]:
+        batch: Batch = Batch(
+            data=pd.DataFrame({"a": [7, 8]}),
+            batch_definition=BatchDefinition(
+                datasource_name="my_datasource",
+                data_connector_name="my_data_connector",
+                data_asset_name="my_data_asset",
+                batch_identifiers=IDDict({"pipeline_stage_name": "core"}),
+            ),
+            batch_spec=batch_spec,
+        )
+        assert compute_column_max(batch=batch) == 8
+    assert len(metric_sketch_store.list_keys()) == 2
+
+
+def test_metric_sketch_store_does_not_key_on_sampled_data_fingerprints():
+    metric_sketch_store: MetricSketchStore = MetricSketchStore()
+    df: pd.DataFrame = pd.DataFrame({"a": range(10000)})
+    # The row is left out of the rows hashed by "sampled" fingerprints.
+    modified_df: pd.DataFrame = df.copy()
+    modified_df.loc[4000, "a"] = 20000
+
+    def compute_column_max(df: pd.DataFrame, data_fingerprint_method: str) -> float:
+        execution_engine: PandasExecutionEngine = PandasExecutionEngine(
+            data_fingerprint_method=data_fingerprint_method
+        )
+        batch_spec: RuntimeDataBatchSpec = RuntimeDataBatchSpec(batch_data=df)
+        batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+            batch_spec=batch_spec
+        )
+        batch: Batch = Batch(
+            data=batch_data,
+            batch_definition=BatchDefinition(
+                datasource_name="my_datasource",
+                data_connector_name="my_runtime_data_connector",
+                data_asset_name="my_data_asset",
+                batch_identifiers=IDDict({"pipeline_stage_name": "core"}),
+            ),
+            batch_spec=batch_spec,
+            batch_markers=batch_markers,
+        )
+        validator: Validator = Validator(
+            execution_engine=execution_engine, batches=[batch]
+        )
+        metric_configuration: MetricConfiguration = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"batch_id": batch.id, "column": "a"},
+            metric_value_kwargs=None,
+        )
+        return compute_metrics(
+            validator=validator,
+            metric_configurations=[metric_configuration],
+            metric_sketch_store=metric_sketch_store,
+        )[metric_configuration.id]
+
+    for data_fingerprint_method in ["sampled", "file"]:
+        assert compute_column_max(df, data_fingerprint_method) == 9999
+        assert compute_column_max(modified_df, data_fingerprint_method) == 20000
+    assert len(metric_sketch_store.list_keys()) == 0
+
+    # Changes of any row change "incremental" fingerprints, and so get new summaries.
+    assert compute_column_max(df, "incremental") == 9999
+    assert compute_column_max(modified_df, "incremental") == 20000
+    assert len(metric_sketch_store.list_keys()) == 2
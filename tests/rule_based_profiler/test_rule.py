@@ -3,6 +3,10 @@ from typing import Any
 import pytest
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.rule_based_profiler.parameter_builder import (
+    MetricMultiBatchParameterBuilder,
+)
+from great_expectations.rule_based_profiler.rule import Rule
 from great_expectations.rule_based_profiler.types import (
     get_parameter_value_by_fully_qualified_parameter_name,
 )
@@ -348,3 +352,51 @@ def test_get_parameter_value_by_fully_qualified_parameter_name_valid_parameter_n
             )
             == details
         )
+
+
+@pytest.mark.parametrize(
+    "metric_domain_kwargs,metric_value_kwargs,refers_to_parameters,",
+    [
+        pytest.param(
+            "$domain.domain_kwargs",
+            {"mostly": "$variables.mostly"},
+            False,
+            id="variables_and_domain_references",
+        ),
+        pytest.param(
+            "$domain.domain_kwargs",
+            {"regex": "^prefix_$parameter.suffix$"},
+            False,
+            id="parameter_key_inside_literal_value",
+        ),
+        pytest.param(
+            "$domain.domain_kwargs",
+            {"quantiles": ["$parameter.quantiles.value", 0.5]},
+            True,
+            id="nested_parameter_reference",
+        ),
+        pytest.param(
+            "$parameter.domain_kwargs.value",
+            None,
+            True,
+            id="parameter_reference",
+        ),
+    ],
+)
+def test_rule_refers_to_parameters(
+    metric_domain_kwargs,
+    metric_value_kwargs,
+    refers_to_parameters,
+):
+    parameter_builder = MetricMultiBatchParameterBuilder(
+        name="my_metric",
+        metric_name="column.quantile_values",
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+    )
+
+    # noinspection PyProtectedMember
+    assert (
+        Rule._refers_to_parameters(parameter_builder=parameter_builder)
+        == refers_to_parameters
+    )
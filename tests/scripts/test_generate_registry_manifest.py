@@ -0,0 +1,12 @@
+from scripts.generate_registry_manifest import (
+    MANIFEST_PATH,
+    build_registry_manifest,
+    render_registry_manifest,
+)
+
+
+def test_registry_manifest_is_up_to_date():
+    # If this test fails, then regenerate the manifest with "python scripts/generate_registry_manifest.py".
+    assert MANIFEST_PATH.read_text() == render_registry_manifest(
+        build_registry_manifest()
+    )
@@ -29,7 +29,9 @@ from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.core.expect_column_value_z_scores_to_be_less_than import (
     ExpectColumnValueZScoresToBeLessThan,
 )
+from great_expectations.expectations.expectation import ColumnMapExpectation
 from great_expectations.expectations.registry import get_expectation_impl
+from great_expectations.self_check.util import build_sa_validator_with_data
 from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metric_configuration import MetricConfiguration
 from great_expectations.validator.validation_graph import MetricEdge, ValidationGraph
@@ -1087,3 +1089,185 @@ def test_validator_docstrings(multi_batch_taxi_validator):
     assert expectation_impl.__doc__.startswith(
         "Expect each column value to be in a given set"
     )
+
+
+def test_validate_with_default_approximation_relative_error_reports_approximation():
+    df = pd.DataFrame({"a": [value % 3000 for value in range(10000)]})
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(), batches=[Batch(data=df)]
+    )
+
+    result = validator.expect_column_unique_value_count_to_be_between(
+        column="a", min_value=3000, max_value=3000, approximation_relative_error=0.05
+    )
+    assert result.success
+    # Pandas computes the number of unique values exactly, whatever the requested error.
+    assert result.result["details"] == {
+        "approximation": {"requested_relative_error": 0.05, "relative_error": 0.0}
+    }
+
+    validator.expect_column_median_to_be_between(
+        column="a", min_value=1333, max_value=1333
+    )
+    validator.expect_column_quantile_values_to_be_between(
+        column="a",
+        quantile_ranges={"quantiles": [0.5], "value_ranges": [[1333, 1333]]},
+        allow_relative_error="linear",
+    )
+    validator.set_default_expectation_argument("approximation_relative_error", 0.01)
+    results = validator.validate().results
+    assert all(result.success for result in results)
+    assert all(
+        result.result["details"]["approximation"]["relative_error"] == 0.0
+        for result in results
+    )
+
+
+def test_validate_with_invalid_approximation_relative_error_raises():
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=pd.DataFrame({"a": [1, 2, 3]}))],
+    )
+
+    with pytest.raises(ge_exceptions.InvalidExpectationConfigurationError):
+        validator.expect_column_median_to_be_between(
+            column="a", min_value=1, max_value=3, approximation_relative_error=True
+        )
+
+
+def test_validate_map_expectation_on_sample_decides_or_escalates_to_entire_data():
+    df = pd.DataFrame({"a": [0 if value % 10 < 3 else 1 for value in range(20000)]})
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(), batches=[Batch(data=df)]
+    )
+
+    # The success ratio (0.7) is far from "mostly", so that the sample decides the result.
+    result = validator.expect_column_values_to_be_in_set(
+        column="a", value_set=[1], mostly=0.9, sampling={"fraction": 0.1}
+    )
+    assert not result.success
+    assert result.result["element_count"] == 2000
+    assert result.result["details"]["sampling"]["confidence"] == 0.99
+    lower, upper = result.result["details"]["sampling"]["success_ratio_interval"]
+    assert lower < 0.7 < upper < 0.9
+
+    # The success ratio equals "mostly", so that the Expectation is validated on entire data.
+    result = validator.expect_column_values_to_be_in_set(
+        column="a", value_set=[1], mostly=0.7, sampling={"fraction": 0.1}
+    )
+    assert result.success
+    assert result.result["element_count"] == 20000
+    assert "details" not in result.result
+
+
+def test_validate_map_expectation_on_sample_sqlite():
+    df = pd.DataFrame(
+        {"a": [None if value % 10 == 0 else value for value in range(20000)]}
+    )
+    validator = build_sa_validator_with_data(df=df, sa_engine_name="sqlite")
+
+    result = validator.expect_column_values_to_not_be_null(
+        column="a", mostly=0.5, sampling={"fraction": 0.2, "confidence": 0.95}
+    )
+    assert result.success
+    assert 0 < result.result["element_count"] < 20000
+    assert result.result["details"]["sampling"]["success_ratio_interval"][0] >= 0.5
+
+
+def test_validate_map_expectation_on_sample_sqlite_is_reproducible_with_seed():
+    df = pd.DataFrame({"a": list(range(1000))})
+    validator = build_sa_validator_with_data(df=df, sa_engine_name="sqlite")
+
+    def get_sampled_unexpected_values(seed: int) -> List[int]:
+        result = validator.expect_column_values_to_be_between(
+            column="a",
+            min_value=0,
+            max_value=0,
+            mostly=0.5,
+            result_format="COMPLETE",
+            sampling={"fraction": 0.2, "seed": seed},
+        )
+        assert not result.success
+        return sorted(result.result["unexpected_list"])
+
+    # Samples are not kept between validations, and so are drawn again.
+    assert get_sampled_unexpected_values(seed=1) == get_sampled_unexpected_values(
+        seed=1
+    )
+    assert get_sampled_unexpected_values(seed=1) != get_sampled_unexpected_values(
+        seed=2
+    )
+
+
+def test_validate_map_expectation_on_sample_sqlite_draws_duplicate_rows_independently():
+    # Only two distinct rows, each of them duplicated thousands of times.
+    df = pd.DataFrame({"a": [0 if value % 10 < 3 else 1 for value in range(20000)]})
+    validator = build_sa_validator_with_data(df=df, sa_engine_name="sqlite")
+
+    result = validator.expect_column_values_to_be_in_set(
+        column="a", value_set=[1], mostly=0.5, sampling={"fraction": 0.1}
+    )
+    assert result.success
+    element_count: int = result.result["element_count"]
+    unexpected_count: int = result.result["unexpected_count"]
+    assert 0 < unexpected_count < element_count < 20000
+
+    # The success ratio of the sample, and that of entire data (0.7), are within the confidence interval.
+    lower, upper = result.result["details"]["sampling"]["success_ratio_interval"]
+    assert lower <= 1 - unexpected_count / element_count <= upper
+    assert lower < 0.7 < upper
+
+
+def test_validate_map_expectation_on_sample_without_temp_tables_uses_entire_data():
+    df = pd.DataFrame(
+        {"a": [None if value % 10 == 0 else value for value in range(20000)]}
+    )
+    validator = build_sa_validator_with_data(df=df, sa_engine_name="sqlite")
+    validator.execution_engine._create_temp_table = False
+
+    result = validator.expect_column_values_to_not_be_null(
+        column="a", mostly=0.5, sampling={"fraction": 0.2}
+    )
+    assert result.success
+    assert result.result["element_count"] == 20000
+    assert "details" not in result.result
+
+
+def test_validate_map_expectation_on_sample_sqlite_drops_sample_temp_tables():
+    df = pd.DataFrame({"a": list(range(1000))})
+    validator = build_sa_validator_with_data(df=df, sa_engine_name="sqlite")
+    engine = validator.execution_engine.engine
+
+    def get_temp_table_names() -> Set[str]:
+        return {
+            row[0]
+            for row in engine.execute(
+                "SELECT name FROM sqlite_temp_master WHERE type = 'table'"
+            ).fetchall()
+        }
+
+    temp_table_names: Set[str] = get_temp_table_names()
+    result = validator.expect_column_values_to_not_be_null(
+        column="a", mostly=0.5, sampling={"fraction": 0.2}
+    )
+    assert result.success
+    assert validator.execution_engine._sampled_batch_data == {}
+    assert get_temp_table_names() == temp_table_names
+
+
+def test_add_sampling_details_keeps_other_details():
+    result: dict = {"success": True, "result": {"details": {"value_counts": []}}}
+    ColumnMapExpectation._add_sampling_details(
+        result=result,
+        sampling={"fraction": 0.1, "confidence": 0.99, "seed": 0},
+        interval=(0.5, 0.75),
+    )
+    assert result["result"]["details"] == {
+        "value_counts": [],
+        "sampling": {
+            "fraction": 0.1,
+            "confidence": 0.99,
+            "seed": 0,
+            "success_ratio_interval": [0.5, 0.75],
+        },
+    }